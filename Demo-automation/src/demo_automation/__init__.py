@@ -18,49 +18,67 @@ SDK Integration (v0.2.0+):
 
 __version__ = "0.2.0"
 
-from .core.config import DemoConfiguration, FabricConfig
-from .core.errors import (
-    DemoAutomationError,
-    ConfigurationError,
-    FabricAPIError,
-    ValidationError,
-)
-from .platform import (
-    FabricClient,
-    OneLakeDataClient,
-    LakehouseClient,
-    EventhouseClient,
-)
-from .orchestrator import DemoOrchestrator
-from .validator import validate_demo_package, ValidationResult
-from .state_manager import SetupStateManager
-from .ontology import TTLToFabricConverter, parse_ttl_file, parse_ttl_content
+import importlib
+from typing import Any, List
 
-# =============================================================================
-# SDK Adapter for Fabric Ontology SDK integration
-# =============================================================================
-from .sdk_adapter import (
-    create_sdk_client,
-    create_ontology_builder,
-    create_validator,
-    map_ttl_type_to_sdk,
-    map_ttl_type_to_string,
-)
+# Public names are imported on first access (PEP 562) so that
+# ``import demo_automation`` - and with it every ``fabric-demo`` command -
+# does not pull in rdflib, the Fabric Ontology SDK, azure-identity,
+# azure-storage-file-datalake and the platform clients until they are used.
+_LAZY_IMPORTS = {
+    # Core
+    "DemoConfiguration": ".core.config",
+    "FabricConfig": ".core.config",
+    "DemoAutomationError": ".core.errors",
+    "ConfigurationError": ".core.errors",
+    "FabricAPIError": ".core.errors",
+    "ValidationError": ".core.errors",
+    # Platform clients
+    "FabricClient": ".platform",
+    "OneLakeDataClient": ".platform",
+    "LakehouseClient": ".platform",
+    "EventhouseClient": ".platform",
+    # Orchestration
+    "DemoOrchestrator": ".orchestrator",
+    "SetupStateManager": ".state_manager",
+    # Validation
+    "validate_demo_package": ".validator",
+    "ValidationResult": ".validator",
+    # TTL parsing
+    "TTLToFabricConverter": ".ontology",
+    "parse_ttl_file": ".ontology",
+    "parse_ttl_content": ".ontology",
+    # =========================================================================
+    # SDK Adapter for Fabric Ontology SDK integration
+    # =========================================================================
+    "create_sdk_client": ".sdk_adapter",
+    "create_ontology_builder": ".sdk_adapter",
+    "create_validator": ".sdk_adapter",
+    "map_ttl_type_to_sdk": ".sdk_adapter",
+    "map_ttl_type_to_string": ".sdk_adapter",
+    # SDK Converter for TTL to SDK builder conversion
+    "ttl_to_sdk_builder": ".ontology.sdk_converter",
+    "ttl_entity_to_sdk_info": ".ontology.sdk_converter",
+    "ttl_relationship_to_sdk_info": ".ontology.sdk_converter",
+    "create_bridge_from_ttl": ".ontology.sdk_converter",
+    # SDK Binding Bridge (recommended for new code)
+    "SDKBindingBridge": ".binding",
+    "EntityBindingConfig": ".binding",
+    "RelationshipContextConfig": ".binding",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not called again
+    return value
 
-# SDK Converter for TTL to SDK builder conversion
-from .ontology.sdk_converter import (
-    ttl_to_sdk_builder,
-    ttl_entity_to_sdk_info,
-    ttl_relationship_to_sdk_info,
-    create_bridge_from_ttl,
-)
 
-# SDK Binding Bridge (recommended for new code)
-from .binding import (
-    SDKBindingBridge,
-    EntityBindingConfig,
-    RelationshipContextConfig,
-)
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     "__version__",
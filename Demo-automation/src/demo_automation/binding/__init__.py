@@ -41,6 +41,21 @@ from .binding_builder import (
     build_binding_from_parsed,
 )
 
+# =============================================================================
+# Definition Diff and Parsed Definition (decode once, skip no-op updates)
+# =============================================================================
+from .definition_diff import (
+    DefinitionDiff,
+    diff_definition_parts,
+    extract_definition_parts,
+    payload_digest,
+)
+from .parsed_definition import (
+    ParsedDefinition,
+    ParsedPart,
+    PartKind,
+)
+
 # =============================================================================
 # Binding Parsers (Still used for parsing markdown/YAML binding configs)
 # =============================================================================
@@ -85,6 +100,17 @@ __all__ = [
     "SourceType",
     "build_binding_from_parsed",
     
+    # ==========================================================================
+    # Definition Diff
+    # ==========================================================================
+    "DefinitionDiff",
+    "diff_definition_parts",
+    "extract_definition_parts",
+    "payload_digest",
+    "ParsedDefinition",
+    "ParsedPart",
+    "PartKind",
+    
     # ==========================================================================
     # Parser Classes (Still Active)
     # ==========================================================================
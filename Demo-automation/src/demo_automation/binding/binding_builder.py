@@ -27,15 +27,16 @@ as well as relationship contextualizations between entities.
 """
 
 import warnings
-import base64
-import json
 import uuid
 import time
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from enum import Enum
 
+from .definition_diff import canonical_json
+from .parsed_definition import ParsedDefinition, ParsedPart, PartKind
+
 
 logger = logging.getLogger(__name__)
 
@@ -604,26 +605,31 @@ class OntologyBindingBuilder:
                 f"for relationship {parsed.relationship_name}"
             )
 
-    def build_definition_parts(
+    def build_parsed_definition(
         self,
-        existing_definition: Optional[Dict[str, Any]] = None,
-    ) -> List[Dict[str, Any]]:
+        existing_definition: Optional[Union[Dict[str, Any], ParsedDefinition]] = None,
+    ) -> ParsedDefinition:
         """
-        Build the definition parts with binding and contextualization configurations.
+        Build the merged definition with binding and contextualization parts.
 
         This merges binding parts with existing ontology definition parts,
         including both entity data bindings and relationship contextualizations.
+        Each existing part is decoded at most once; parts that are kept as-is
+        are passed through with their original payload, and only modified or
+        new parts are encoded.
         
         IMPORTANT: This also updates entity definitions to add entityIdParts
         if they're missing, based on the key_column from bindings.
 
         Args:
-            existing_definition: Existing ontology definition to merge with
+            existing_definition: Existing ontology definition (raw response
+                or ParsedDefinition) to merge with
 
         Returns:
-            List of definition parts ready for updateDefinition API
+            ParsedDefinition ready for updateDefinition (see ``to_parts``)
         """
-        parts = []
+        existing = ParsedDefinition.from_definition(existing_definition)
+        parts: List[ParsedPart] = []
         has_definition_json = False
         filtered_out_bindings = 0
         filtered_out_contextualizations = 0
@@ -643,19 +649,15 @@ class OntologyBindingBuilder:
                             break
                     break  # Only need first static binding for key
 
+        # Existing binding/contextualization IDs whose content matches a new
+        # one exactly. Reusing them keeps part paths stable across re-runs so
+        # an unchanged binding produces an identical definition part.
+        reusable_binding_ids: Dict[tuple, str] = {}  # (entity_id, config) -> binding_id
+        reusable_ctx_ids: Dict[tuple, str] = {}  # (rel_id, body) -> contextualization_id
+
         # Start with existing parts (if any)
-        if existing_definition:
-            # Handle both {"definition": {"parts": [...]}} and {"parts": [...]} structures
-            existing_parts = existing_definition.get("definition", {}).get("parts", [])
-            if not existing_parts:
-                existing_parts = existing_definition.get("parts", [])
-            
-            logger.info(f"Found {len(existing_parts)} existing parts to merge")
-            
-            # Log all existing parts for debugging
-            for p in existing_parts:
-                path = p.get("path", "")
-                logger.debug(f"Existing part: {path}")
+        if existing.parts:
+            logger.info(f"Found {len(existing)} existing parts to merge")
             
             # Determine which entity IDs and relationship IDs have new bindings/contextualizations
             rebound_entity_ids = set(self._bindings.keys())
@@ -665,130 +667,115 @@ class OntologyBindingBuilder:
             # so we only filter out bindings of the matching type
             rebound_entity_binding_types: Dict[str, set] = {}
             for eid, bindings_list in self._bindings.items():
-                types = set()
-                for b in bindings_list:
-                    types.add(b.binding_type.value)  # "NonTimeSeries" or "TimeSeries"
-                rebound_entity_binding_types[eid] = types
+                rebound_entity_binding_types[eid] = {b.binding_type.value for b in bindings_list}
             
             # Filter out old binding and contextualization parts only for entities/relationships
             # that are being re-bound AND only for matching binding types.
             # This preserves static bindings when only timeseries are being updated, and vice versa.
             # Also update entity definitions to add entityIdParts if missing
-            for p in existing_parts:
-                path = p.get("path", "")
-                # Only filter out binding parts for entities being re-bound with the same binding type
-                if "/DataBindings/" in path:
-                    # Extract entity ID from path like "EntityTypes/1000000000004/DataBindings/..."
-                    path_segments = path.split("/")
-                    entity_id_in_path = path_segments[1] if len(path_segments) >= 3 else ""
-                    if entity_id_in_path in rebound_entity_ids:
-                        # Check if the existing binding's type matches what we're adding
-                        should_filter = False
-                        new_types = rebound_entity_binding_types.get(entity_id_in_path, set())
-                        try:
-                            existing_payload = json.loads(
-                                base64.b64decode(p.get("payload", "")).decode("utf-8")
+            for part in existing:
+                logger.debug(f"Existing part: {part.path}")
+                
+                if part.kind == PartKind.DATA_BINDING and part.owner_id in rebound_entity_ids:
+                    new_types = rebound_entity_binding_types.get(part.owner_id, set())
+                    existing_payload = part.payload
+                    existing_type = part.binding_type
+                    # Same type - replace it; can't decode - safer to replace
+                    if existing_payload is None or existing_type in new_types:
+                        if isinstance(existing_payload, dict) and existing_payload.get("dataBindingConfiguration"):
+                            reusable_binding_ids.setdefault(
+                                (part.owner_id, canonical_json(existing_payload["dataBindingConfiguration"])),
+                                existing_payload.get("id") or part.child_id,
                             )
-                            existing_type = existing_payload.get("dataBindingConfiguration", {}).get("dataBindingType", "")
-                            if existing_type in new_types:
-                                should_filter = True  # Same type - replace it
-                            else:
-                                should_filter = False  # Different type - keep it
-                        except Exception:
-                            should_filter = True  # Can't decode, safer to replace
-                        
-                        if should_filter:
-                            filtered_out_bindings += 1
-                            logger.info(f"Filtering out old binding part ({existing_type}): {path}")
-                            continue
-                        else:
-                            logger.debug(f"Keeping existing binding (type={existing_type}, not in {new_types}): {path}")
-                    # Keep bindings for entities that are NOT being re-bound
-                if "/Contextualizations/" in path:
-                    path_segments = path.split("/")
-                    rel_id_in_path = path_segments[1] if len(path_segments) >= 3 else ""
-                    if rel_id_in_path in rebound_rel_ids:
-                        filtered_out_contextualizations += 1
-                        logger.info(f"Filtering out old contextualization part: {path}")
+                        filtered_out_bindings += 1
+                        logger.info(f"Filtering out old binding part ({existing_type}): {part.path}")
                         continue
-                # Track if definition.json exists
-                if path == "definition.json":
+                    logger.debug(f"Keeping existing binding (type={existing_type}, not in {new_types}): {part.path}")
+                
+                elif part.kind == PartKind.CONTEXTUALIZATION and part.owner_id in rebound_rel_ids:
+                    existing_ctx = part.payload
+                    if isinstance(existing_ctx, dict):
+                        ctx_body = {k: v for k, v in existing_ctx.items() if k != "id"}
+                        reusable_ctx_ids.setdefault(
+                            (part.owner_id, canonical_json(ctx_body)),
+                            existing_ctx.get("id") or part.child_id,
+                        )
+                    filtered_out_contextualizations += 1
+                    logger.info(f"Filtering out old contextualization part: {part.path}")
+                    continue
+                
+                elif part.kind == PartKind.ROOT:
                     has_definition_json = True
                 
-                # Check if this is an entity type definition that needs entityIdParts
-                if "EntityTypes/" in path and path.endswith("/definition.json"):
-                    # Extract entity ID from path like "EntityTypes/1000000000001/definition.json"
-                    path_parts = path.split("/")
-                    if len(path_parts) >= 2:
-                        entity_id = path_parts[1]
-                        key_prop_id = entity_key_property_ids.get(entity_id)
-                        
-                        if key_prop_id:
-                            # Decode, update, and re-encode the entity definition
-                            try:
-                                payload_b64 = p.get("payload", "")
-                                payload_json = base64.b64decode(payload_b64).decode("utf-8")
-                                entity_def = json.loads(payload_json)
-                                
-                                # Check if entityIdParts is missing or empty
-                                existing_parts_list = entity_def.get("entityIdParts", [])
-                                if not existing_parts_list:
-                                    entity_def["entityIdParts"] = [key_prop_id]
-                                    logger.info(f"Added entityIdParts [{key_prop_id}] to entity {entity_id} ({entity_def.get('name', 'unknown')})")
-                                    
-                                    # Re-encode the updated definition
-                                    updated_payload = base64.b64encode(
-                                        json.dumps(entity_def).encode("utf-8")
-                                    ).decode("utf-8")
-                                    p = {
-                                        "path": path,
-                                        "payload": updated_payload,
-                                        "payloadType": "InlineBase64",
-                                    }
-                            except Exception as e:
-                                logger.warning(f"Failed to update entity definition for {entity_id}: {e}")
+                elif part.kind == PartKind.ENTITY_TYPE:
+                    # Add entityIdParts to the entity definition if missing
+                    key_prop_id = entity_key_property_ids.get(part.owner_id)
+                    entity_def = part.payload
+                    if key_prop_id and isinstance(entity_def, dict) and not entity_def.get("entityIdParts"):
+                        part = part.with_payload({**entity_def, "entityIdParts": [key_prop_id]})
+                        logger.info(f"Added entityIdParts [{key_prop_id}] to entity {part.owner_id} ({entity_def.get('name', 'unknown')})")
                 
-                parts.append(p)
+                parts.append(part)
             
             logger.info(f"Filtered out {filtered_out_bindings} old bindings, {filtered_out_contextualizations} old contextualizations")
             logger.info(f"Keeping {len(parts)} parts after filtering bindings/contextualizations")
-        
+
         # CRITICAL: definition.json is REQUIRED by the updateDefinition API
         # If it wasn't in existing parts, add an empty one
         if not has_definition_json:
             logger.debug("Adding required definition.json part")
-            parts.insert(0, {
-                "path": "definition.json",
-                "payload": base64.b64encode(b"{}").decode("utf-8"),  # e30=
-                "payloadType": "InlineBase64",
-            })
+            parts.insert(0, ParsedPart.from_payload("definition.json", {}))  # e30=
 
         # Add binding parts for each entity (now supports multiple bindings per entity)
         for entity_id, bindings_list in self._bindings.items():
             for binding in bindings_list:
-                binding_part = {
-                    "path": f"EntityTypes/{entity_id}/DataBindings/{binding.binding_id}.json",
-                    "payload": base64.b64encode(
-                        json.dumps(binding.to_dict()).encode("utf-8")
-                    ).decode("utf-8"),
-                    "payloadType": "InlineBase64",
-                }
-                parts.append(binding_part)
+                binding_dict = binding.to_dict()
+                reuse_id = reusable_binding_ids.pop(
+                    (entity_id, canonical_json(binding_dict["dataBindingConfiguration"])), None
+                )
+                if reuse_id and reuse_id != binding.binding_id:
+                    logger.debug(f"Binding for entity {entity_id} unchanged, reusing ID {reuse_id}")
+                    binding.binding_id = reuse_id
+                    binding_dict["id"] = reuse_id
+                parts.append(ParsedPart.from_payload(
+                    f"EntityTypes/{entity_id}/DataBindings/{binding.binding_id}.json",
+                    binding_dict,
+                ))
                 logger.debug(f"Added binding part for entity {entity_id}: {binding.binding_id} ({binding.binding_type.value})")
 
         # Add contextualization parts for each relationship
         for rel_id, contextualization in self._contextualizations.items():
-            ctx_part = {
-                "path": f"RelationshipTypes/{rel_id}/Contextualizations/{contextualization.contextualization_id}.json",
-                "payload": base64.b64encode(
-                    json.dumps(contextualization.to_dict()).encode("utf-8")
-                ).decode("utf-8"),
-                "payloadType": "InlineBase64",
-            }
-            parts.append(ctx_part)
+            ctx_dict = contextualization.to_dict()
+            ctx_body = {k: v for k, v in ctx_dict.items() if k != "id"}
+            reuse_id = reusable_ctx_ids.pop((rel_id, canonical_json(ctx_body)), None)
+            if reuse_id and reuse_id != contextualization.contextualization_id:
+                logger.debug(f"Contextualization for relationship {rel_id} unchanged, reusing ID {reuse_id}")
+                contextualization.contextualization_id = reuse_id
+                ctx_dict["id"] = reuse_id
+            parts.append(ParsedPart.from_payload(
+                f"RelationshipTypes/{rel_id}/Contextualizations/{contextualization.contextualization_id}.json",
+                ctx_dict,
+            ))
             logger.debug(f"Added contextualization part for relationship {rel_id}")
 
-        return parts
+        return ParsedDefinition(parts)
+
+    def build_definition_parts(
+        self,
+        existing_definition: Optional[Union[Dict[str, Any], ParsedDefinition]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the definition parts with binding and contextualization configurations.
+
+        See :meth:`build_parsed_definition` for merge semantics.
+
+        Args:
+            existing_definition: Existing ontology definition to merge with
+
+        Returns:
+            List of definition parts ready for updateDefinition API
+        """
+        return self.build_parsed_definition(existing_definition).to_parts()
 
     def build_update_request(
         self,
@@ -0,0 +1,166 @@
+"""
+Definition Diff Engine for ontology binding updates.
+
+Compares a freshly built list of definition parts against the parts fetched
+from Fabric, keyed by part path and compared by a hash of the *decoded*
+payload. Two payloads that encode the same JSON document (regardless of key
+order or whitespace) hash identically, so re-running a binding step against
+an unchanged ontology produces an empty diff and the updateDefinition LRO
+can be skipped entirely.
+
+Note:
+    The Fabric ``updateDefinition`` API replaces the full item definition, so
+    when a diff *does* contain changes the caller must still submit the
+    complete part list. The diff decides *whether* to POST, not *what* to POST.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List
+
+
+logger = logging.getLogger(__name__)
+
+
+def extract_definition_parts(definition: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Get the parts list from an ontology definition.
+
+    Handles both ``{"definition": {"parts": [...]}}`` (getDefinition response)
+    and ``{"parts": [...]}`` structures.
+
+    Args:
+        definition: Ontology definition response or definition body
+
+    Returns:
+        List of definition parts (empty if none)
+    """
+    if not definition:
+        return []
+    parts = definition.get("definition", {}).get("parts", [])
+    if not parts:
+        parts = definition.get("parts", [])
+    return parts
+
+
+def canonical_json(value: Any) -> str:
+    """Serialize a JSON value deterministically (sorted keys, compact separators)."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def payload_digest(part: Dict[str, Any]) -> str:
+    """
+    Compute a content hash for a definition part.
+
+    The payload is base64-decoded and, if it is valid JSON, re-serialized in
+    canonical form before hashing. Non-JSON payloads are hashed as raw bytes.
+
+    Args:
+        part: Definition part with ``payload`` (InlineBase64)
+
+    Returns:
+        Hex SHA-256 digest of the decoded payload
+    """
+    payload_b64 = part.get("payload", "") or ""
+    try:
+        raw = base64.b64decode(payload_b64)
+    except Exception:
+        raw = payload_b64.encode("utf-8")
+
+    try:
+        data = canonical_json(json.loads(raw.decode("utf-8"))).encode("utf-8")
+    except Exception:
+        data = raw
+
+    return hashlib.sha256(data).hexdigest()
+
+
+@dataclass
+class DefinitionDiff:
+    """Result of comparing two lists of definition parts by path and payload hash."""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """True if any part was added, removed or modified."""
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def changed_paths(self) -> List[str]:
+        """Paths of all parts that differ (added, removed or modified)."""
+        return self.added + self.removed + self.changed
+
+    def summary(self) -> str:
+        """Human-readable one-line summary."""
+        return (
+            f"{len(self.added)} added, {len(self.changed)} changed, "
+            f"{len(self.removed)} removed, {len(self.unchanged)} unchanged"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "added": list(self.added),
+            "removed": list(self.removed),
+            "changed": list(self.changed),
+            "unchanged_count": len(self.unchanged),
+        }
+
+
+def _path_and_digest_source(item: Any) -> tuple:
+    """Return (path, item) for a raw part dict or a parsed part."""
+    if isinstance(item, dict):
+        return item.get("path", ""), item
+    return item.path, item
+
+
+def _digest(item: Any) -> str:
+    """Digest of a raw part dict, or the cached digest of a parsed part."""
+    if isinstance(item, dict):
+        return payload_digest(item)
+    return item.digest
+
+
+def diff_definition_parts(
+    existing_parts: Iterable[Any],
+    new_parts: Iterable[Any],
+) -> DefinitionDiff:
+    """
+    Compare new definition parts against existing ones.
+
+    Parts are matched by ``path``. A part present in both lists is unchanged
+    when it is the same object or its decoded payload hashes identically.
+    Accepts raw API part dicts or ``ParsedPart`` objects (whose digests are
+    cached, so nothing is decoded twice).
+
+    Args:
+        existing_parts: Parts fetched from the ontology (getDefinition)
+        new_parts: Parts about to be submitted (updateDefinition)
+
+    Returns:
+        DefinitionDiff describing added, removed, changed and unchanged paths
+    """
+    existing = dict(_path_and_digest_source(p) for p in existing_parts)
+    diff = DefinitionDiff()
+    seen = set()
+
+    for part in new_parts:
+        path, item = _path_and_digest_source(part)
+        seen.add(path)
+        old = existing.get(path)
+        if old is None:
+            diff.added.append(path)
+        elif old is item or _digest(old) == _digest(item):
+            diff.unchanged.append(path)
+        else:
+            diff.changed.append(path)
+
+    diff.removed = [path for path in existing if path not in seen]
+
+    logger.debug(f"Definition diff: {diff.summary()}")
+    return diff
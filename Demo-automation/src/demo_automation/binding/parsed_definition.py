@@ -0,0 +1,278 @@
+"""
+Parsed Ontology Definition model.
+
+Decodes each part of an ontology definition at most once and indexes the
+parts by entity ID, relationship ID and data binding type. Parts keep their
+original base64 payload, so only parts that are actually modified are
+re-encoded when the definition is written back.
+
+Path layout (Fabric ontology definition):
+    definition.json
+    EntityTypes/{entity_id}/definition.json
+    EntityTypes/{entity_id}/DataBindings/{binding_id}.json
+    RelationshipTypes/{relationship_id}/definition.json
+    RelationshipTypes/{relationship_id}/Contextualizations/{ctx_id}.json
+"""
+
+import base64
+import hashlib
+import json
+import logging
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional
+
+from .definition_diff import DefinitionDiff, canonical_json, diff_definition_parts
+
+
+logger = logging.getLogger(__name__)
+
+
+class PartKind(Enum):
+    """Kind of an ontology definition part, derived from its path."""
+    ROOT = "root"
+    ENTITY_TYPE = "entity_type"
+    DATA_BINDING = "data_binding"
+    RELATIONSHIP_TYPE = "relationship_type"
+    CONTEXTUALIZATION = "contextualization"
+    OTHER = "other"
+
+
+_UNDECODED = object()
+
+
+def _classify_path(path: str) -> tuple:
+    """Return (kind, owner_id, child_id) for a definition part path."""
+    if path == "definition.json":
+        return PartKind.ROOT, None, None
+
+    segments = path.split("/")
+    if len(segments) < 3:
+        return PartKind.OTHER, None, None
+
+    root, owner_id = segments[0], segments[1]
+    if root == "EntityTypes":
+        if len(segments) >= 4 and segments[2] == "DataBindings":
+            return PartKind.DATA_BINDING, owner_id, segments[3].replace(".json", "")
+        if segments[2] == "definition.json":
+            return PartKind.ENTITY_TYPE, owner_id, None
+    elif root == "RelationshipTypes":
+        if len(segments) >= 4 and segments[2] == "Contextualizations":
+            return PartKind.CONTEXTUALIZATION, owner_id, segments[3].replace(".json", "")
+        if segments[2] == "definition.json":
+            return PartKind.RELATIONSHIP_TYPE, owner_id, None
+
+    return PartKind.OTHER, owner_id, None
+
+
+class ParsedPart:
+    """
+    A single definition part with a lazily decoded, cached payload.
+
+    The base64 payload is decoded on first access and never again; the
+    payload of a part built from a dict is encoded on first access. Parts
+    are treated as immutable - use :meth:`with_payload` to modify.
+    """
+
+    __slots__ = (
+        "path", "payload_type", "kind", "owner_id", "child_id",
+        "_source", "_payload_b64", "_payload", "_digest",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        payload_b64: Optional[str] = None,
+        payload: Any = _UNDECODED,
+        payload_type: str = "InlineBase64",
+        source: Optional[Dict[str, Any]] = None,
+    ):
+        self.path = path
+        self.payload_type = payload_type
+        self.kind, self.owner_id, self.child_id = _classify_path(path)
+        self._source = source
+        self._payload_b64 = payload_b64
+        self._payload = payload
+        self._digest: Optional[str] = None
+
+    @classmethod
+    def from_part(cls, part: Dict[str, Any]) -> "ParsedPart":
+        """Wrap a raw API part without decoding it."""
+        return cls(
+            path=part.get("path", ""),
+            payload_b64=part.get("payload", "") or "",
+            payload_type=part.get("payloadType", "InlineBase64"),
+            source=part,
+        )
+
+    @classmethod
+    def from_payload(cls, path: str, payload: Any) -> "ParsedPart":
+        """Create a part from an already-decoded JSON payload."""
+        return cls(path=path, payload=payload)
+
+    @property
+    def payload(self) -> Any:
+        """Decoded JSON payload, or None if the payload is empty or not JSON."""
+        if self._payload is _UNDECODED:
+            try:
+                self._payload = json.loads(base64.b64decode(self._payload_b64).decode("utf-8"))
+            except Exception:
+                if self._payload_b64:
+                    logger.warning(f"Failed to decode payload for {self.path}")
+                self._payload = None
+        return self._payload
+
+    @property
+    def payload_b64(self) -> str:
+        """Base64 payload, encoded on first access for parts built from a dict."""
+        if self._payload_b64 is None:
+            self._payload_b64 = base64.b64encode(
+                json.dumps(self._payload).encode("utf-8")
+            ).decode("utf-8")
+        return self._payload_b64
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 of the canonical decoded payload (raw bytes if not JSON)."""
+        if self._digest is None:
+            payload = self.payload
+            if payload is not None:
+                data = canonical_json(payload).encode("utf-8")
+            else:
+                try:
+                    data = base64.b64decode(self._payload_b64 or "")
+                except Exception:
+                    data = (self._payload_b64 or "").encode("utf-8")
+            self._digest = hashlib.sha256(data).hexdigest()
+        return self._digest
+
+    @property
+    def binding_type(self) -> str:
+        """``dataBindingType`` of a DataBindings part ("" for other parts)."""
+        if self.kind != PartKind.DATA_BINDING or not isinstance(self.payload, dict):
+            return ""
+        return self.payload.get("dataBindingConfiguration", {}).get("dataBindingType", "")
+
+    def with_payload(self, payload: Any) -> "ParsedPart":
+        """Return a modified copy of this part (re-encoded on demand)."""
+        return ParsedPart(path=self.path, payload=payload, payload_type=self.payload_type)
+
+    def to_part(self) -> Dict[str, Any]:
+        """Convert to API format, reusing the original dict if unmodified."""
+        if self._source is not None:
+            return self._source
+        return {
+            "path": self.path,
+            "payload": self.payload_b64,
+            "payloadType": self.payload_type,
+        }
+
+    def __repr__(self) -> str:
+        return f"ParsedPart({self.path!r})"
+
+
+class ParsedDefinition:
+    """
+    An ontology definition decoded once and indexed for binding operations.
+
+    Example:
+        parsed = ParsedDefinition.from_definition(client.get_ontology_definition(ont_id))
+        machine_id = parsed.entity_name_to_id()["Machine"]
+        static = parsed.bindings_of_type("NonTimeSeries")
+    """
+
+    def __init__(self, parts: Optional[List[ParsedPart]] = None):
+        self.parts: List[ParsedPart] = list(parts or [])
+        self._by_path: Dict[str, ParsedPart] = {}
+        self.entities: Dict[str, ParsedPart] = {}
+        self.relationships: Dict[str, ParsedPart] = {}
+        self.data_bindings: Dict[str, List[ParsedPart]] = {}
+        self.contextualizations: Dict[str, List[ParsedPart]] = {}
+        self._bindings_by_type: Optional[Dict[str, List[ParsedPart]]] = None
+
+        for part in self.parts:
+            self._by_path[part.path] = part
+            if part.kind == PartKind.ENTITY_TYPE:
+                self.entities[part.owner_id] = part
+            elif part.kind == PartKind.RELATIONSHIP_TYPE:
+                self.relationships[part.owner_id] = part
+            elif part.kind == PartKind.DATA_BINDING:
+                self.data_bindings.setdefault(part.owner_id, []).append(part)
+            elif part.kind == PartKind.CONTEXTUALIZATION:
+                self.contextualizations.setdefault(part.owner_id, []).append(part)
+
+    @classmethod
+    def from_definition(cls, definition: Optional[Dict[str, Any]]) -> "ParsedDefinition":
+        """
+        Wrap a getDefinition response (or ``{"parts": [...]}`` body).
+
+        Handles both ``{"definition": {"parts": [...]}}`` and ``{"parts": [...]}``.
+        """
+        if isinstance(definition, ParsedDefinition):
+            return definition
+        definition = definition or {}
+        parts = definition.get("definition", {}).get("parts", [])
+        if not parts:
+            parts = definition.get("parts", [])
+        return cls([ParsedPart.from_part(p) for p in parts])
+
+    def __iter__(self) -> Iterator[ParsedPart]:
+        return iter(self.parts)
+
+    def __len__(self) -> int:
+        return len(self.parts)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._by_path
+
+    def get(self, path: str) -> Optional[ParsedPart]:
+        """Get a part by path."""
+        return self._by_path.get(path)
+
+    def bindings_of_type(self, binding_type: str) -> List[ParsedPart]:
+        """All DataBindings parts with the given ``dataBindingType``."""
+        if self._bindings_by_type is None:
+            self._bindings_by_type = {}
+            for bindings in self.data_bindings.values():
+                for part in bindings:
+                    self._bindings_by_type.setdefault(part.binding_type, []).append(part)
+        return self._bindings_by_type.get(binding_type, [])
+
+    def entity_name_to_id(self) -> Dict[str, str]:
+        """Map entity type name -> entity type ID."""
+        mapping = {}
+        for entity_id, part in self.entities.items():
+            payload = part.payload
+            if isinstance(payload, dict) and payload.get("id") and payload.get("name"):
+                mapping[payload["name"]] = payload["id"]
+        return mapping
+
+    def relationship_name_to_id(self) -> Dict[str, str]:
+        """Map relationship type name -> relationship type ID."""
+        mapping = {}
+        for rel_id, part in self.relationships.items():
+            payload = part.payload
+            if isinstance(payload, dict) and payload.get("id") and payload.get("name"):
+                mapping[payload["name"]] = payload["id"]
+        return mapping
+
+    def entity_properties(self, entity_id: str) -> Dict[str, str]:
+        """Map property name -> property ID (static and timeseries) for an entity."""
+        part = self.entities.get(entity_id)
+        payload = part.payload if part else None
+        if not isinstance(payload, dict):
+            return {}
+        props = {}
+        for prop in payload.get("properties", []) + payload.get("timeseriesProperties", []):
+            prop_name = prop.get("name", "")
+            prop_id = prop.get("id", "")
+            if prop_name and prop_id:
+                props[prop_name] = prop_id
+        return props
+
+    def to_parts(self) -> List[Dict[str, Any]]:
+        """Convert to API parts; unmodified parts are passed through as-is."""
+        return [part.to_part() for part in self.parts]
+
+    def diff(self, other: "ParsedDefinition") -> DefinitionDiff:
+        """Diff ``other`` (the new definition) against this one."""
+        return diff_definition_parts(self.parts, other.parts)
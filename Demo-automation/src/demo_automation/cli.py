@@ -6,12 +6,18 @@ Provides commands for:
 - init: Create demo.yaml template
 - validate: Validate demo package structure
 - setup: Run complete demo setup
+- setup-many: Set up several demos / workspaces concurrently
 - status: Check demo resource status
 - list: List demos in workspace
 - cleanup: Remove demo resources
+
+Heavy dependencies (orchestrator, Fabric SDK, Azure clients, rdflib) are
+imported inside the command handlers that need them, so commands such as
+``config show``, ``docs`` and ``--help`` start quickly.
 """
 
 import argparse
+import json
 import sys
 import logging
 from pathlib import Path
@@ -20,13 +26,10 @@ from enum import Enum
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.logging import RichHandler
-from rich.prompt import Prompt, Confirm
 
 from .core.config import DemoConfiguration, generate_demo_yaml_template
 from .core.global_config import GlobalConfig, get_config_file_path, config_file_exists, generate_config_template
 from .core.errors import DemoAutomationError, ConfigurationError
-from .orchestrator import DemoOrchestrator, print_setup_results
 
 
 console = Console()
@@ -41,6 +44,8 @@ class OutputFormat(Enum):
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging with rich handler."""
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
@@ -207,6 +212,81 @@ Examples:
         action="store_true",
         help="Clear any existing setup state before starting",
     )
+    setup_parser.add_argument(
+        "--binding-mode",
+        choices=["combined", "per_step"],
+        default=None,
+        help="Bind in one combined step (default) or as separate bind_* steps for debugging",
+    )
+    setup_parser.add_argument(
+        "--no-wait",
+        action="store_false",
+        dest="wait",
+        help="Start the graph refresh job without waiting for it (follow with 'status --watch')",
+    )
+
+    # setup-many command - several demos / workspaces concurrently
+    setup_many_parser = subparsers.add_parser(
+        "setup-many",
+        help="Set up several demos and/or workspaces concurrently",
+        description="""
+Run setup for several (demo folder, workspace) targets in one process.
+
+Targets come from --target pairs and/or a YAML file:
+
+  targets:
+    - demo_path: ./AutoManufacturing-SupplyChain
+      workspace_id: <guid>
+    - demo_path: ./TeaManufacturing-ISA95
+      workspace_id: <guid>
+
+Different demo folders run in parallel; targets that deploy the same folder to
+several workspaces run one after another (the setup state is stored per folder).
+All demos share one sign-in and one rate limiter per workspace.
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    setup_many_parser.add_argument(
+        "--target", "-t",
+        nargs=2,
+        action="append",
+        default=[],
+        metavar=("DEMO_PATH", "WORKSPACE_ID"),
+        help="Demo folder and workspace ID (repeatable)",
+    )
+    setup_many_parser.add_argument(
+        "--targets-file", "-f",
+        type=str,
+        help="YAML file with a 'targets' list of demo_path/workspace_id entries",
+    )
+    setup_many_parser.add_argument(
+        "--max-parallel", "-p",
+        type=int,
+        default=4,
+        help="Maximum demo folders set up at the same time (default: 4)",
+    )
+    setup_many_parser.add_argument(
+        "--dry-run", "-n",
+        action="store_true",
+        help="Preview actions without executing",
+    )
+    setup_many_parser.add_argument(
+        "--resume", "-r",
+        action="store_true",
+        help="Resume each target from its previous incomplete setup",
+    )
+    setup_many_parser.add_argument(
+        "--binding-mode",
+        choices=["combined", "per_step"],
+        default=None,
+        help="Bind in one combined step (default) or as separate bind_* steps",
+    )
+    setup_many_parser.add_argument(
+        "--no-wait",
+        action="store_false",
+        dest="wait",
+        help="Start graph refresh jobs without waiting for them",
+    )
 
     # run-step command - execute individual steps
     run_step_parser = subparsers.add_parser(
@@ -228,6 +308,8 @@ Available steps:
   10. bind_relationships - Bind relationship contextualizations
   11. verify           - Verify all bindings and resources in Fabric
   12. refresh_graph    - Refresh the ontology graph to sync bound data
+
+  configure_bindings   - Steps 8-10 in one pass (single ontology update)
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -252,6 +334,12 @@ Available steps:
         action="store_true",
         help="Force re-run even if step was previously completed",
     )
+    run_step_parser.add_argument(
+        "--no-wait",
+        action="store_false",
+        dest="wait",
+        help="refresh_graph only: return once the refresh job is started",
+    )
 
     # status command
     status_parser = subparsers.add_parser(
@@ -275,6 +363,11 @@ Available steps:
         default="text",
         help="Output format (default: text)",
     )
+    status_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Attach to a running graph refresh job and show live progress until it finishes",
+    )
 
     # cleanup command
     cleanup_parser = subparsers.add_parser(
@@ -387,6 +480,8 @@ def run_config(args: argparse.Namespace) -> int:
 
 def _config_init(args: argparse.Namespace) -> int:
     """Initialize global configuration interactively."""
+    from rich.prompt import Prompt, Confirm
+
     config_path = get_config_file_path()
     
     if config_file_exists() and not getattr(args, 'force', False):
@@ -524,7 +619,7 @@ def run_docs(args: argparse.Namespace) -> int:
 def run_recover(args: argparse.Namespace) -> int:
     """Recover state file from existing Fabric resources."""
     from pathlib import Path
-    from .platform import FabricClient
+    from .platform import FabricClient, ResourceDiscovery
     from .state_manager import SetupStateManager
     from .core.config import DemoConfiguration
     
@@ -569,66 +664,23 @@ def run_recover(args: argparse.Namespace) -> int:
             workspace_id=workspace_id,
             tenant_id=global_config.tenant_id,
         ) as client:
-            discovered = {}
-            
-            # Search for Lakehouse
-            console.print("Searching for Lakehouse...", end=" ")
-            lakehouses = client.list_lakehouses()
-            for lh in lakehouses:
-                if lh.get('displayName', '').startswith(demo_name):
-                    discovered["lakehouse"] = {
-                        "id": lh.get('id'),
-                        "name": lh.get('displayName'),
-                    }
-                    console.print(f"[green]Found: {lh.get('displayName')}[/green]")
-                    break
-            else:
-                console.print("[dim]Not found[/dim]")
-            
-            # Search for Eventhouse
-            console.print("Searching for Eventhouse...", end=" ")
-            eventhouses = client.list_eventhouses()
-            for eh in eventhouses:
-                if eh.get('displayName', '').startswith(demo_name):
-                    discovered["eventhouse"] = {
-                        "id": eh.get('id'),
-                        "name": eh.get('displayName'),
-                    }
-                    console.print(f"[green]Found: {eh.get('displayName')}[/green]")
-                    break
-            else:
-                console.print("[dim]Not found[/dim]")
+            # Look up all resource types concurrently (no per-table details needed)
+            console.print("Searching for resources...\n")
+            snapshot = ResourceDiscovery(client).discover(prefix=demo_name, include_details=False)
             
-            # Search for KQL Database (separate from eventhouse)
-            console.print("Searching for KQL Database...", end=" ")
-            try:
-                kql_dbs = client.list_kql_databases()
-                for db in kql_dbs:
-                    if db.get('displayName', '').startswith(demo_name):
-                        discovered["kql_database"] = {
-                            "id": db.get('id'),
-                            "name": db.get('displayName'),
-                        }
-                        console.print(f"[green]Found: {db.get('displayName')}[/green]")
-                        break
+            for resource_type, label in (
+                ("lakehouse", "Lakehouse"),
+                ("eventhouse", "Eventhouse"),
+                ("kql_database", "KQL Database"),
+                ("ontology", "Ontology"),
+            ):
+                item = snapshot.get(resource_type)
+                if item:
+                    console.print(f"  {label}: [green]Found: {item.get('displayName')}[/green]")
                 else:
-                    console.print("[dim]Not found[/dim]")
-            except Exception:
-                console.print("[dim]Not found[/dim]")
+                    console.print(f"  {label}: [dim]Not found[/dim]")
             
-            # Search for Ontology
-            console.print("Searching for Ontology...", end=" ")
-            ontologies = client.list_ontologies()
-            for ont in ontologies:
-                if ont.get('displayName', '').startswith(demo_name):
-                    discovered["ontology"] = {
-                        "id": ont.get('id'),
-                        "name": ont.get('displayName'),
-                    }
-                    console.print(f"[green]Found: {ont.get('displayName')}[/green]")
-                    break
-            else:
-                console.print("[dim]Not found[/dim]")
+            discovered = snapshot.to_state_resources()
             
             if not discovered:
                 console.print("\n[yellow]No matching resources found in workspace.[/yellow]")
@@ -876,6 +928,8 @@ def run_validate(args: argparse.Namespace) -> int:
 
 def run_setup(args: argparse.Namespace) -> int:
     """Run complete demo setup."""
+    from .orchestrator import DemoOrchestrator, print_setup_results
+
     demo_path = Path(args.demo_path).resolve()
 
     if not demo_path.is_dir():
@@ -895,6 +949,9 @@ def run_setup(args: argparse.Namespace) -> int:
         config.options.skip_existing = args.skip_existing
         config.options.dry_run = args.dry_run
         config.options.interactive = getattr(args, 'interactive', False)
+        if getattr(args, 'binding_mode', None):
+            config.options.binding_mode = args.binding_mode
+        config.options.wait_for_graph_refresh = getattr(args, 'wait', True)
 
         # Validate
         errors = config.validate()
@@ -953,8 +1010,9 @@ def run_setup(args: argparse.Namespace) -> int:
 
         console.print("\n[green]✓[/green] Demo setup completed successfully!")
 
-        # Clear state on successful completion
-        orchestrator.clear_state()
+        # Clear state on successful completion (kept while a --no-wait
+        # graph refresh runs, so `status --watch` can follow it)
+        orchestrator.clear_state(keep_pending_jobs=True)
 
         # Print resource summary
         state = orchestrator.get_state()
@@ -980,6 +1038,136 @@ def run_setup(args: argparse.Namespace) -> int:
         return 1
 
 
+# Setup steps per demo, used to estimate overall progress in setup-many
+SETUP_MANY_STEP_COUNT = 10
+
+
+def run_setup_many(args: argparse.Namespace) -> int:
+    """Set up several demo / workspace targets concurrently."""
+    import threading
+    from rich.progress import Progress, BarColumn, TextColumn, TaskProgressColumn, TimeElapsedColumn
+    from .multi_setup import DemoTarget, MultiDemoRunner, load_targets_file
+    from .platform import SharedClients
+    from .platform.fabric_client import RateLimitConfig
+
+    try:
+        targets = [
+            DemoTarget(Path(demo_path).resolve(), workspace_id)
+            for demo_path, workspace_id in args.target
+        ]
+        if args.targets_file:
+            targets.extend(load_targets_file(Path(args.targets_file)))
+    except ConfigurationError as e:
+        console.print(f"[red]Configuration error:[/red] {e}")
+        return 1
+
+    if not targets:
+        console.print("[red]Error:[/red] No targets given. Use --target DEMO_PATH WORKSPACE_ID or --targets-file")
+        return 1
+
+    missing = [t for t in targets if not t.demo_path.is_dir()]
+    if missing:
+        for target in missing:
+            console.print(f"[red]Error:[/red] Directory not found: {target.demo_path}")
+        return 1
+
+    global_config = GlobalConfig.load()
+    shared_clients = SharedClients(RateLimitConfig(
+        enabled=global_config.rate_limit_enabled,
+        requests_per_minute=global_config.rate_limit_requests_per_minute,
+        burst=global_config.rate_limit_burst,
+    ))
+
+    def configure(config: DemoConfiguration) -> None:
+        config.options.dry_run = args.dry_run
+        config.options.wait_for_graph_refresh = args.wait
+        if args.binding_mode:
+            config.options.binding_mode = args.binding_mode
+
+    console.print(Panel(f"Setting up [bold cyan]{len(targets)}[/bold cyan] demo targets"))
+
+    with Progress(
+        TextColumn("{task.fields[label]:<40}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TextColumn("[dim]{task.fields[step]}[/dim]"),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        tasks = {
+            id(target): progress.add_task("", total=100, label=target.label, step="queued")
+            for target in targets
+        }
+        completed_steps = {id(target): set() for target in targets}
+        lock = threading.Lock()
+
+        def on_progress(target, step: str, status: str, percent: float) -> None:
+            with lock:
+                done = completed_steps[id(target)]
+                if status in ("completed", "skipped"):
+                    done.add(step)
+                    percent = 0
+                overall = (len(done) + percent / 100) / SETUP_MANY_STEP_COUNT * 100
+                progress.update(tasks[id(target)], completed=min(overall, 99), step=step)
+
+        runner = MultiDemoRunner(
+            targets,
+            shared_clients=shared_clients,
+            max_parallel=args.max_parallel,
+            resume=args.resume,
+            configure=configure,
+            progress_callback=on_progress,
+        )
+        try:
+            outcomes = runner.run()
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Setup cancelled by user[/yellow]")
+            return 130
+
+        for outcome in outcomes:
+            progress.update(
+                tasks[id(outcome.target)],
+                completed=100,
+                step="done" if outcome.succeeded else "failed",
+            )
+
+    table = Table(title="Setup Results")
+    table.add_column("Target", style="cyan")
+    table.add_column("Status", style="bold")
+    table.add_column("Steps")
+    table.add_column("Duration")
+    table.add_column("Details")
+
+    for outcome in outcomes:
+        completed = sum(1 for r in outcome.results.values() if r.status.value in ("completed", "skipped"))
+        failed_steps = [name for name, r in outcome.results.items() if r.status.value == "failed"]
+        if outcome.succeeded:
+            status, details = "[green]✓ Completed[/green]", ""
+        else:
+            status = "[red]✗ Failed[/red]"
+            details = outcome.error or "; ".join(
+                f"{name}: {outcome.results[name].message}" for name in failed_steps
+            )
+        table.add_row(
+            outcome.target.label,
+            status,
+            f"{completed}/{len(outcome.results)}" if outcome.results else "-",
+            f"{outcome.duration_seconds:.1f}s",
+            details[:80],
+        )
+
+    console.print(table)
+
+    failures = [o for o in outcomes if not o.succeeded]
+    if failures:
+        console.print(f"\n[red]{len(failures)} of {len(outcomes)} targets failed[/red]")
+        console.print("[dim]Run setup-many again with --resume to continue failed targets[/dim]")
+        return 1
+
+    console.print(f"\n[green]✓[/green] All {len(outcomes)} targets set up successfully!")
+    return 0
+
+
 # Step mapping for run-step command (aligned with ResearchFixes.md 11 steps)
 STEP_MAPPING = {
     "1": "validate",
@@ -1007,13 +1195,15 @@ STEP_MAPPING = {
     "bind_relationships": "bind_relationships",
     "verify": "verify",
     "refresh_graph": "refresh_graph",
-    # Legacy mapping for configure_bindings (runs all binding steps)
+    # Combined binding step (steps 8-10 in one updateDefinition call)
     "configure_bindings": "configure_bindings",
 }
 
 
 def run_step(args: argparse.Namespace) -> int:
     """Run a single setup step independently."""
+    from .orchestrator import DemoOrchestrator
+
     demo_path = Path(args.demo_path).resolve()
 
     if not demo_path.is_dir():
@@ -1038,6 +1228,7 @@ def run_step(args: argparse.Namespace) -> int:
         console.print("  10. bind_relationships - Bind relationship contextualizations")
         console.print("  11. verify           - Verify all resources and bindings")
         console.print("  12. refresh_graph    - Refresh ontology graph to sync data")
+        console.print("  configure_bindings   - Steps 8-10 in one pass")
         return 1
 
     console.print(Panel(f"Running step: [bold cyan]{step_name}[/bold cyan]"))
@@ -1049,6 +1240,8 @@ def run_step(args: argparse.Namespace) -> int:
             workspace_id=args.workspace_id,
         )
 
+        config.options.wait_for_graph_refresh = getattr(args, 'wait', True)
+
         errors = config.validate()
         if errors and step_name != "validate":
             console.print("\n[red]Configuration errors:[/red]")
@@ -1123,8 +1316,8 @@ def run_status(args: argparse.Namespace) -> int:
         ("refresh_graph", "12. Refresh", "Refresh ontology graph to sync data"),
     ]
     
-    # Also check for legacy configure_bindings step (maps to bind_static+bind_timeseries+bind_relationships)
-    LEGACY_BINDING_STEP = "configure_bindings"
+    # Combined configure_bindings step covers bind_static+bind_timeseries+bind_relationships
+    COMBINED_BINDING_STEP = "configure_bindings"
 
     try:
         config = DemoConfiguration.from_demo_folder(
@@ -1137,7 +1330,9 @@ def run_status(args: argparse.Namespace) -> int:
             console.print(f"[red]Configuration error:[/red] {errors[0]}")
             return 1
 
-        console.print(Panel(f"Status: [bold cyan]{config.name}[/bold cyan]"))
+        json_output = args.output_format == "json"
+        if not json_output:
+            console.print(Panel(f"Status: [bold cyan]{config.name}[/bold cyan]"))
 
         # Check for setup state file
         from .state_manager import SetupStateManager, StepStatus as PersistentStepStatus
@@ -1166,10 +1361,22 @@ def run_status(args: argparse.Namespace) -> int:
                     in_progress_step = step_id
                     break
             
-            # Handle legacy configure_bindings step - if completed, mark all 3 binding steps as completed
-            if LEGACY_BINDING_STEP in completed_steps:
+            # Handle combined configure_bindings step - if completed, mark all 3 binding steps as completed
+            if COMBINED_BINDING_STEP in completed_steps:
                 completed_steps.extend(["bind_static", "bind_timeseries", "bind_relationships"])
 
+        if json_output:
+            return _print_status_json(
+                config,
+                state_manager,
+                setup_state,
+                step_ids=[step_id for step_id, _, _ in SETUP_STEPS],
+                completed_steps=completed_steps,
+                failed_step=failed_step,
+                in_progress_step=in_progress_step,
+                watch=getattr(args, 'watch', False),
+            )
+
         # Build step status table
         step_table = Table(title="Setup Progress (11 Steps)", show_header=True)
         step_table.add_column("#", style="dim", width=3)
@@ -1180,7 +1387,7 @@ def run_status(args: argparse.Namespace) -> int:
         completed_count = 0
         
         for step_id, step_name, step_desc in SETUP_STEPS:
-            # Check if step is completed (direct or via legacy configure_bindings)
+            # Check if step is completed (direct or via combined configure_bindings)
             is_completed = step_id in completed_steps
             
             if is_completed:
@@ -1188,10 +1395,12 @@ def run_status(args: argparse.Namespace) -> int:
                 completed_count += 1
                 # Get artifact info if available
                 details = ""
-                # Check direct step or legacy binding step for details
+                # Check direct step or combined binding step for details
                 check_step_id = step_id
                 if step_id in ("bind_static", "bind_timeseries", "bind_relationships"):
-                    check_step_id = LEGACY_BINDING_STEP if LEGACY_BINDING_STEP in (setup_state.steps if setup_state else {}) else step_id
+                    recorded_steps = setup_state.steps if setup_state else {}
+                    if step_id not in recorded_steps:
+                        check_step_id = COMBINED_BINDING_STEP if COMBINED_BINDING_STEP in recorded_steps else step_id
                 
                 if setup_state and check_step_id in setup_state.steps:
                     step_state = setup_state.steps[check_step_id]
@@ -1255,7 +1464,7 @@ def run_status(args: argparse.Namespace) -> int:
         
         # Resource status table
         console.print("\n")
-        from .platform import FabricClient
+        from .platform import FabricClient, ResourceDiscovery
 
         with FabricClient(
             workspace_id=config.fabric.workspace_id,
@@ -1267,81 +1476,58 @@ def run_status(args: argparse.Namespace) -> int:
             resource_table.add_column("ID", style="dim")
             resource_table.add_column("Tables/Entities", style="dim")
 
-            # Check Lakehouse
-            lh = client.find_lakehouse_by_name(config.resources.lakehouse.name)
-            if lh:
-                lh_id = lh.get("id", "")
-                # Try to get table count
-                table_info = ""
-                try:
-                    from .platform import LakehouseClient
-                    lh_client = LakehouseClient(fabric_client=client, workspace_id=config.fabric.workspace_id)
-                    tables = lh_client.list_tables(lh_id)
-                    table_info = f"{len(tables)} tables"
-                except Exception:
-                    table_info = "-"
-                resource_table.add_row(
-                    f"Lakehouse: {config.resources.lakehouse.name}",
-                    "[green]✓ Exists[/green]",
-                    lh_id[:12] + "..." if len(lh_id) > 12 else lh_id,
-                    table_info,
-                )
-            else:
-                resource_table.add_row(
-                    f"Lakehouse: {config.resources.lakehouse.name}",
-                    "[yellow]○ Not found[/yellow]",
-                    "-",
-                    "-",
-                )
-
-            # Check Eventhouse
-            eh = client.find_eventhouse_by_name(config.resources.eventhouse.name)
-            if eh:
-                eh_id = eh.get("id", "")
-                resource_table.add_row(
-                    f"Eventhouse: {config.resources.eventhouse.name}",
-                    "[green]✓ Exists[/green]",
-                    eh_id[:12] + "..." if len(eh_id) > 12 else eh_id,
-                    "-",
-                )
-            else:
-                resource_table.add_row(
-                    f"Eventhouse: {config.resources.eventhouse.name}",
-                    "[yellow]○ Not found[/yellow]",
-                    "-",
-                    "-",
+            # Look up all resources and their table/entity details concurrently
+            snapshot = ResourceDiscovery(client).discover(names={
+                "lakehouse": config.resources.lakehouse.name,
+                "eventhouse": config.resources.eventhouse.name,
+                "kql_database": config.resources.eventhouse.name,
+                "ontology": config.resources.ontology.name,
+            })
+
+            lakehouse_info = "-"
+            if snapshot.lakehouse_tables is not None:
+                lakehouse_info = f"{len(snapshot.lakehouse_tables)} tables"
+
+            eventhouse_info = "-"
+            if snapshot.kql_table_counts is not None:
+                total_rows = sum(snapshot.kql_table_counts.values())
+                eventhouse_info = f"{len(snapshot.kql_table_counts)} tables, {total_rows:,} rows"
+
+            ontology_info = "-"
+            if snapshot.ontology_entity_count is not None:
+                ontology_info = (
+                    f"{snapshot.ontology_entity_count} entities, "
+                    f"{snapshot.ontology_binding_count} bindings"
                 )
 
-            # Check Ontology
-            ont = client.find_ontology_by_name(config.resources.ontology.name)
-            if ont:
-                ont_id = ont.get("id", "")
-                # Try to get entity count
-                entity_info = ""
-                try:
-                    ont_def = client.get_ontology_definition(ont_id)
-                    parts = ont_def.get("definition", {}).get("parts", [])
-                    entity_count = sum(1 for p in parts if "EntityTypes/" in p.get("path", "") and p.get("path", "").endswith(".json"))
-                    binding_count = sum(1 for p in parts if "DataBindings" in p.get("path", ""))
-                    entity_info = f"{entity_count} entities, {binding_count} bindings"
-                except Exception:
-                    entity_info = "-"
-                resource_table.add_row(
-                    f"Ontology: {config.resources.ontology.name}",
-                    "[green]✓ Exists[/green]",
-                    ont_id[:12] + "..." if len(ont_id) > 12 else ont_id,
-                    entity_info,
-                )
-            else:
-                resource_table.add_row(
-                    f"Ontology: {config.resources.ontology.name}",
-                    "[yellow]○ Not found[/yellow]",
-                    "-",
-                    "-",
-                )
+            for resource_type, label, resource_name, info in (
+                ("lakehouse", "Lakehouse", config.resources.lakehouse.name, lakehouse_info),
+                ("eventhouse", "Eventhouse", config.resources.eventhouse.name, eventhouse_info),
+                ("ontology", "Ontology", config.resources.ontology.name, ontology_info),
+            ):
+                item = snapshot.get(resource_type)
+                if item:
+                    item_id = item.get("id", "")
+                    resource_table.add_row(
+                        f"{label}: {resource_name}",
+                        "[green]✓ Exists[/green]",
+                        item_id[:12] + "..." if len(item_id) > 12 else item_id,
+                        info,
+                    )
+                else:
+                    resource_table.add_row(
+                        f"{label}: {resource_name}",
+                        "[yellow]○ Not found[/yellow]",
+                        "-",
+                        "-",
+                    )
 
             console.print(resource_table)
 
+            _show_graph_refresh(
+                client, state_manager, setup_state, watch=getattr(args, 'watch', False)
+            )
+
         # Actionable next steps
         if failed_step:
             console.print(f"\n[red]⚠ Setup failed at step: {failed_step}[/red]")
@@ -1359,6 +1545,177 @@ def run_status(args: argparse.Namespace) -> int:
         return 1
 
 
+def _print_status_json(
+    config,
+    state_manager,
+    setup_state,
+    step_ids,
+    completed_steps,
+    failed_step,
+    in_progress_step,
+    watch: bool,
+) -> int:
+    """Print the status report (steps, resources, graph refresh) as one JSON document."""
+    from .platform import FabricClient, ResourceDiscovery
+
+    steps = {}
+    for step_id in step_ids:
+        if step_id in completed_steps:
+            steps[step_id] = "completed"
+        elif step_id == failed_step:
+            steps[step_id] = "failed"
+        elif step_id == in_progress_step:
+            steps[step_id] = "in_progress"
+        else:
+            steps[step_id] = "pending"
+
+    report = {
+        "demo": config.name,
+        "setup_id": setup_state.setup_id if setup_state else None,
+        "setup_status": setup_state.status.value if setup_state else None,
+        "steps": steps,
+        "resources": {},
+    }
+
+    names = {
+        "lakehouse": config.resources.lakehouse.name,
+        "eventhouse": config.resources.eventhouse.name,
+        "ontology": config.resources.ontology.name,
+    }
+    with FabricClient(
+        workspace_id=config.fabric.workspace_id,
+        tenant_id=config.fabric.tenant_id,
+    ) as client:
+        snapshot = ResourceDiscovery(client).discover(names={
+            **names,
+            "kql_database": config.resources.eventhouse.name,
+        })
+        for resource_type, resource_name in names.items():
+            item = snapshot.get(resource_type)
+            report["resources"][resource_type] = {
+                "name": resource_name,
+                "exists": bool(item),
+                "id": item.get("id") if item else None,
+            }
+        if snapshot.lakehouse_tables is not None:
+            report["resources"]["lakehouse"]["tables"] = len(snapshot.lakehouse_tables)
+        if snapshot.kql_table_counts is not None:
+            report["resources"]["eventhouse"]["table_rows"] = dict(snapshot.kql_table_counts)
+        if snapshot.ontology_entity_count is not None:
+            report["resources"]["ontology"]["entities"] = snapshot.ontology_entity_count
+            report["resources"]["ontology"]["bindings"] = snapshot.ontology_binding_count
+
+        report["graph_refresh"] = _graph_refresh_report(client, state_manager, setup_state, watch)
+
+    print(json.dumps(report, indent=2, default=str))
+    return 0
+
+
+def _pending_graph_refresh(setup_state):
+    """Return (JobHandle, graph name) for an unfinished background graph refresh, or None."""
+    from .platform.job_monitor import JobHandle, JOB_TERMINAL_STATUSES
+
+    step = setup_state.steps.get("refresh_graph") if setup_state else None
+    job = step.details.get("refresh_job") if step else None
+    if not job or step.details.get("refresh_status") in JOB_TERMINAL_STATUSES:
+        return None
+
+    handle = JobHandle.from_dict(job)
+    return handle, step.details.get("graph_name") or handle.item_id
+
+
+def _record_graph_refresh(state_manager, progress) -> None:
+    """Record a finished refresh so later status calls do not poll again."""
+    if progress.is_terminal:
+        state_manager.complete_step("refresh_graph", details={"refresh_status": progress.status})
+
+
+def _graph_refresh_report(client, state_manager, setup_state, watch: bool):
+    """Poll (or with ``watch``, wait for) a background graph refresh job for JSON output."""
+    from .platform.job_monitor import JobMonitor
+
+    pending = _pending_graph_refresh(setup_state)
+    if not pending:
+        return None
+
+    handle, graph_name = pending
+    monitor = JobMonitor(client, handle)
+    detached = False
+    if not watch:
+        progress = monitor.poll_once()
+    else:
+        try:
+            progress = monitor.wait()
+        except KeyboardInterrupt:
+            monitor.stop()
+            progress = monitor.progress
+            detached = True
+
+    _record_graph_refresh(state_manager, progress)
+    return {
+        "graph_name": graph_name,
+        "job": handle.to_dict(),
+        "status": progress.status,
+        "percent_complete": progress.percent_complete,
+        "failure_reason": progress.failure_reason,
+        "terminal": progress.is_terminal,
+        "succeeded": progress.succeeded,
+        "detached": detached,
+    }
+
+
+def _show_graph_refresh(client, state_manager, setup_state, watch: bool) -> None:
+    """Report a background graph refresh job, optionally following it live."""
+    from .platform.job_monitor import JobMonitor
+
+    pending = _pending_graph_refresh(setup_state)
+    if not pending:
+        return
+
+    handle, graph_name = pending
+    if not watch:
+        progress = JobMonitor(client, handle).poll_once()
+    else:
+        from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[cyan]Graph refresh[/cyan] {task.description}"),
+            TimeElapsedColumn(),
+            console=console,
+            transient=True,
+        ) as live:
+            task = live.add_task(graph_name)
+
+            def on_update(progress) -> None:
+                percent = (
+                    f" {progress.percent_complete:.0f}%"
+                    if progress.percent_complete is not None else ""
+                )
+                live.update(task, description=f"{graph_name}: {progress.status}{percent}")
+
+            monitor = JobMonitor(client, handle, on_update=on_update)
+            try:
+                progress = monitor.wait()
+            except KeyboardInterrupt:
+                monitor.stop()
+                console.print("[dim]Detached; the refresh job keeps running in Fabric[/dim]")
+                return
+
+    _record_graph_refresh(state_manager, progress)
+
+    if progress.succeeded:
+        console.print(f"\n[green]✓ Graph refresh {progress.status.lower()}:[/green] {graph_name}")
+    elif progress.is_terminal:
+        reason = f" - {progress.failure_reason}" if progress.failure_reason else ""
+        console.print(f"\n[red]✗ Graph refresh {progress.status.lower()}:[/red] {graph_name}{reason}")
+    else:
+        console.print(f"\n[yellow]◐ Graph refresh {progress.status}:[/yellow] {graph_name}")
+        console.print(
+            f"  Run [cyan]fabric-demo status {state_manager.demo_path} --watch[/cyan] to follow it"
+        )
+
+
 def run_cleanup(args: argparse.Namespace) -> int:
     """Remove demo resources that were created by setup.
     
@@ -1367,6 +1724,8 @@ def run_cleanup(args: argparse.Namespace) -> int:
     
     If --force-by-name is used, deletes by resource name (when state file missing).
     """
+    from rich.prompt import Confirm
+
     demo_path = Path(args.demo_path).resolve()
 
     if not demo_path.is_dir():
@@ -1532,6 +1891,7 @@ def main() -> int:
         "init": run_init,
         "validate": run_validate,
         "setup": run_setup,
+        "setup-many": run_setup_many,
         "run-step": run_step,
         "status": run_status,
         "list": run_list,
@@ -176,6 +176,17 @@ class DemoOptions:
     max_parallel_uploads: int = 4
     timeout_seconds: int = 600
     verbose: bool = False
+    # "combined": one configure_bindings step (single GET + single updateDefinition)
+    # "per_step": separate bind_static / bind_timeseries / bind_relationships
+    binding_mode: str = "combined"
+    # "bulk": upload all eventhouse CSVs concurrently, then multi-URI .ingest per table
+    # "per_table": upload and ingest one table at a time
+    ingest_mode: str = "bulk"
+    # Eventhouse CSVs above this size are split into parts before ingestion
+    # (KQL .ingest accepts roughly 200 MB per source file)
+    max_ingest_file_mb: int = 180
+    # False: start the graph refresh job and finish setup without waiting for it
+    wait_for_graph_refresh: bool = True
 
     def get_existing_action(self) -> ExistingResourceAction:
         """Get the action to take when a resource exists."""
@@ -321,6 +332,10 @@ class DemoConfiguration:
                 max_parallel_uploads=options_config.get("max_parallel_uploads", 4),
                 timeout_seconds=options_config.get("timeout_seconds", 600),
                 verbose=options_config.get("verbose", False),
+                binding_mode=options_config.get("binding_mode", "combined"),
+                ingest_mode=options_config.get("ingest_mode", "bulk"),
+                max_ingest_file_mb=options_config.get("max_ingest_file_mb", 180),
+                wait_for_graph_refresh=options_config.get("wait_for_graph_refresh", True),
             ),
             logging=LoggingConfig(
                 level=logging_config.get("level", "INFO"),
@@ -420,6 +435,24 @@ class DemoConfiguration:
                 "No data files found. Expected CSV files in data/lakehouse/ or data/eventhouse/"
             )
 
+        if self.options.binding_mode not in ("combined", "per_step"):
+            errors.append(
+                f"Invalid options.binding_mode '{self.options.binding_mode}'. "
+                "Expected 'combined' or 'per_step'"
+            )
+
+        if self.options.ingest_mode not in ("bulk", "per_table"):
+            errors.append(
+                f"Invalid options.ingest_mode '{self.options.ingest_mode}'. "
+                "Expected 'bulk' or 'per_table'"
+            )
+
+        if not isinstance(self.options.max_ingest_file_mb, int) or self.options.max_ingest_file_mb <= 0:
+            errors.append(
+                f"Invalid options.max_ingest_file_mb '{self.options.max_ingest_file_mb}'. "
+                "Expected a positive number of megabytes"
+            )
+
         return errors
 
     def to_dict(self) -> Dict[str, Any]:
@@ -0,0 +1,99 @@
+"""
+Size-aware CSV splitting for eventhouse ingestion.
+
+KQL ``.ingest`` from OneLake is limited to roughly 200 MB per source file.
+Oversized CSVs are split in a single streaming pass into parts of at most
+``max_bytes`` each, every part starting with the original header row.
+
+Records are split on line boundaries outside quoted fields, so quoted values
+containing newlines stay intact.
+"""
+
+import logging
+from pathlib import Path
+from typing import List
+
+
+logger = logging.getLogger(__name__)
+
+
+# Stay below the ~200 MB single-file ingestion limit
+DEFAULT_MAX_PART_BYTES = 180 * 1024 * 1024
+
+# Read/write buffer size for the streaming pass
+_BUFFER_SIZE = 1024 * 1024
+
+
+def _iter_records(f):
+    """Yield raw CSV records (bytes, including line endings) from a binary file."""
+    pending = b""
+    for line in f:
+        record = pending + line if pending else line
+        # An odd number of quotes means the newline is inside a quoted field
+        if record.count(b'"') % 2:
+            pending = record
+            continue
+        pending = b""
+        yield record
+    if pending:
+        yield pending
+
+
+def split_csv_by_size(
+    source: Path,
+    output_dir: Path,
+    max_bytes: int = DEFAULT_MAX_PART_BYTES,
+) -> List[Path]:
+    """
+    Split a CSV file into parts of at most ``max_bytes`` (header included).
+
+    Parts are named ``{stem}_part{N}.csv``. A file that already fits is
+    returned unchanged. A single record larger than the budget is written
+    to a part of its own.
+
+    Args:
+        source: CSV file with a header row
+        output_dir: Directory for the part files (created if needed)
+        max_bytes: Maximum size of each part in bytes
+
+    Returns:
+        List of part files in order (or ``[source]`` if no split was needed)
+    """
+    source = Path(source)
+    if source.stat().st_size <= max_bytes:
+        return [source]
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    parts: List[Path] = []
+    out = None
+    part_bytes = 0
+
+    with open(source, "rb", buffering=_BUFFER_SIZE) as f:
+        records = _iter_records(f)
+        header = next(records, b"")
+        if header and not header.endswith(b"\n"):
+            header += b"\n"
+
+        try:
+            for record in records:
+                if out is None or (part_bytes + len(record) > max_bytes and part_bytes > len(header)):
+                    if out is not None:
+                        out.close()
+                    part_path = output_dir / f"{source.stem}_part{len(parts) + 1}.csv"
+                    out = open(part_path, "wb", buffering=_BUFFER_SIZE)
+                    out.write(header)
+                    part_bytes = len(header)
+                    parts.append(part_path)
+                out.write(record)
+                part_bytes += len(record)
+        finally:
+            if out is not None:
+                out.close()
+
+    logger.info(
+        f"Split {source.name} ({source.stat().st_size / (1024 * 1024):.0f} MB) "
+        f"into {len(parts)} parts of at most {max_bytes / (1024 * 1024):.0f} MB"
+    )
+    return parts
@@ -0,0 +1,247 @@
+"""
+Concurrent setup of several demos / workspaces in one process.
+
+Used by ``fabric-demo setup-many``. Each (demo folder, workspace) target gets
+its own ``DemoOrchestrator``; all orchestrators share one ``SharedClients``
+registry (single sign-in, per-workspace rate limiters).
+
+Setup state is stored per demo folder (``.setup-state.yaml``), so targets that
+deploy the same folder to several workspaces run one after another within a
+single worker, while different folders run in parallel.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import yaml
+
+from .core.config import DemoConfiguration
+from .core.errors import ConfigurationError
+from .orchestrator import DemoOrchestrator, StepResult, StepStatus
+from .platform.shared_clients import SharedClients
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DemoTarget:
+    """One demo folder to set up in one workspace."""
+    demo_path: Path
+    workspace_id: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        """Short display label: demo folder name and workspace prefix."""
+        if self.workspace_id:
+            return f"{self.demo_path.name} @ {self.workspace_id[:8]}"
+        return self.demo_path.name
+
+
+@dataclass
+class DemoRunResult:
+    """Outcome of one target."""
+    target: DemoTarget
+    results: Dict[str, StepResult] = field(default_factory=dict)
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and not any(
+            r.status == StepStatus.FAILED for r in self.results.values()
+        )
+
+
+def load_targets_file(path: Path) -> List[DemoTarget]:
+    """
+    Load targets from a YAML file.
+
+    Format::
+
+        targets:
+          - demo_path: ../AutoManufacturing-SupplyChain
+            workspace_id: 11111111-...
+          - demo_path: ../TeaManufacturing-ISA95
+            workspace_id: 22222222-...
+
+    Relative demo paths are resolved against the file's directory.
+
+    Raises:
+        ConfigurationError: If the file is malformed
+    """
+    path = Path(path)
+    try:
+        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError) as e:
+        raise ConfigurationError(f"Cannot read targets file {path}: {e}")
+
+    entries = data.get("targets") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        raise ConfigurationError(f"Targets file {path} must contain a 'targets' list")
+
+    targets = []
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not entry.get("demo_path"):
+            raise ConfigurationError(f"Targets file {path}: entry {i + 1} needs a 'demo_path'")
+        demo_path = Path(entry["demo_path"])
+        if not demo_path.is_absolute():
+            demo_path = path.parent / demo_path
+        targets.append(DemoTarget(demo_path.resolve(), entry.get("workspace_id")))
+    return targets
+
+
+class MultiDemoRunner:
+    """
+    Run ``DemoOrchestrator.run_setup`` for several targets concurrently.
+
+    Example:
+        runner = MultiDemoRunner(targets, max_parallel=3)
+        for outcome in runner.run():
+            print(outcome.target.label, outcome.succeeded)
+    """
+
+    def __init__(
+        self,
+        targets: List[DemoTarget],
+        shared_clients: Optional[SharedClients] = None,
+        max_parallel: int = 4,
+        resume: bool = False,
+        configure: Optional[Callable[[DemoConfiguration], None]] = None,
+        progress_callback: Optional[Callable[[DemoTarget, str, str, float], None]] = None,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            targets: Demo folder / workspace pairs to set up
+            shared_clients: Shared token caches and rate limiters
+            max_parallel: Maximum demo folders set up at the same time
+            resume: Resume each target from its previous state
+            configure: Optional hook applied to every loaded configuration
+                       (CLI option overrides)
+            progress_callback: Optional callback(target, step_name, status, percent)
+        """
+        self.targets = targets
+        self.shared_clients = shared_clients or SharedClients()
+        self.max_parallel = max_parallel
+        self.resume = resume
+        self.configure = configure
+        self.progress_callback = progress_callback
+        self._cancelled = threading.Event()
+        self._running: Dict[int, DemoOrchestrator] = {}
+        self._running_lock = threading.Lock()
+
+    def cancel(self) -> None:
+        """Stop starting new targets and ask running orchestrators to stop."""
+        self._cancelled.set()
+        with self._running_lock:
+            running = list(self._running.values())
+        for orchestrator in running:
+            orchestrator.cancel()
+
+    def run(self) -> List[DemoRunResult]:
+        """
+        Set up all targets.
+
+        Returns:
+            One DemoRunResult per target, in input order
+
+        On KeyboardInterrupt, queued targets are cancelled, running
+        orchestrators are asked to stop and the interrupt is re-raised
+        without waiting for them.
+        """
+        # Targets sharing a demo folder share its state file: keep them on one worker
+        groups: Dict[Path, List[int]] = {}
+        for index, target in enumerate(self.targets):
+            groups.setdefault(target.demo_path.resolve(), []).append(index)
+
+        outcomes: List[Optional[DemoRunResult]] = [None] * len(self.targets)
+
+        def run_group(indices: List[int]) -> None:
+            failed = None
+            for index in indices:
+                target = self.targets[index]
+                if self._cancelled.is_set():
+                    outcomes[index] = DemoRunResult(target=target, error="Cancelled")
+                    continue
+                if failed is not None:
+                    # Keep the failed run's state so it can be resumed
+                    outcomes[index] = DemoRunResult(
+                        target=target,
+                        error=f"Skipped: {failed.label} failed and its state must be resumed first",
+                    )
+                    continue
+                outcomes[index] = self._run_target(target)
+                if not outcomes[index].succeeded:
+                    failed = target
+
+        workers = max(1, min(self.max_parallel, len(groups)))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="setup-many")
+        try:
+            futures = [executor.submit(run_group, g) for g in groups.values()]
+            # Surface the first worker exception (e.g. KeyboardInterrupt) at once
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                future.result()
+        except KeyboardInterrupt:
+            self.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+        return outcomes
+
+    def _run_target(self, target: DemoTarget) -> DemoRunResult:
+        """Load, validate and set up one target."""
+        start = time.time()
+        outcome = DemoRunResult(target=target)
+
+        def on_progress(step: str, status: str, percent: float) -> None:
+            if self.progress_callback:
+                self.progress_callback(target, step, status, percent)
+
+        try:
+            config = DemoConfiguration.from_demo_folder(
+                target.demo_path,
+                workspace_id=target.workspace_id,
+            )
+            # Prompts cannot be answered while several demos share the terminal
+            config.options.interactive = False
+            if self.configure:
+                self.configure(config)
+
+            errors = config.validate()
+            if errors:
+                raise ConfigurationError("; ".join(errors))
+
+            orchestrator = DemoOrchestrator(
+                config,
+                progress_callback=on_progress,
+                resume=self.resume,
+                shared_clients=self.shared_clients,
+            )
+            with self._running_lock:
+                self._running[id(orchestrator)] = orchestrator
+            if self._cancelled.is_set():
+                orchestrator.cancel()
+            try:
+                outcome.results = orchestrator.run_setup(dry_run=config.options.dry_run)
+            finally:
+                with self._running_lock:
+                    self._running.pop(id(orchestrator), None)
+            if outcome.succeeded and not config.options.dry_run:
+                # Same as `fabric-demo setup`: state is only kept for resuming
+                # or for following a background graph refresh
+                orchestrator.clear_state(keep_pending_jobs=True)
+        except Exception as e:
+            logger.error(f"Setup of {target.label} failed: {e}")
+            outcome.error = str(e)
+
+        outcome.duration_seconds = time.time() - start
+        return outcome
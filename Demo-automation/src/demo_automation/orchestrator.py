@@ -8,7 +8,10 @@ Manages the execution of all setup steps including:
 """
 
 import logging
+import re
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -24,10 +27,15 @@ from .core.errors import (
     DemoAutomationError,
     ResourceExistsError,
     CancellationRequestedError,
+    FabricAPIError,
 )
 from .core.global_config import GlobalConfig
 from .platform import FabricClient, OneLakeDataClient, LakehouseClient, EventhouseClient
 from .platform.fabric_client import RateLimitConfig
+from .platform.shared_clients import SharedClients
+from .platform.job_monitor import (
+    JobMonitor, JobProgress, JOB_STATUS_IN_PROGRESS, JOB_TERMINAL_STATUSES,
+)
 from .binding import (
     OntologyBindingBuilder,  # Legacy - deprecated, kept for backwards compatibility
     BindingType,
@@ -40,6 +48,9 @@ from .binding import (
     EntityBindingConfig,
     RelationshipContextConfig,
 )
+from .binding.definition_diff import DefinitionDiff
+from .binding.parsed_definition import ParsedDefinition
+from .csv_splitter import split_csv_by_size
 from .state_manager import SetupStateManager, SetupStatus as PersistentSetupStatus
 from .ontology import parse_ttl_file
 from .ontology.sdk_converter import (
@@ -63,6 +74,26 @@ from fabric_ontology.exceptions import ValidationError as SDKValidationError
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Lakehouse Files/ folder where eventhouse CSVs are staged for OneLake ingestion
+EVENTHOUSE_STAGING_FOLDER = "eventhouse"
+
+# Source data per multi-URI .ingest command (split part files are ~200 MB each)
+INGEST_BATCH_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def _batch_files_by_size(files: List[Path], max_bytes: int) -> List[List[Path]]:
+    """Group files, in order, into batches of at most max_bytes (at least one file each)."""
+    batches: List[List[Path]] = []
+    batch_bytes = 0
+    for file_path in files:
+        size = file_path.stat().st_size
+        if not batches or batch_bytes + size > max_bytes:
+            batches.append([])
+            batch_bytes = 0
+        batches[-1].append(file_path)
+        batch_bytes += size
+    return batches
+
 
 class StepStatus(Enum):
     """Status of an execution step."""
@@ -114,7 +145,7 @@ class DemoOrchestrator:
     5. Create Eventhouse (if enabled)
     6. Ingest data to KQL tables (skip if tables already exist)
     7. Create Ontology (if enabled)
-    8. Configure data bindings
+    8. Configure data bindings (single combined pass by default)
     9. Comprehensive verification
     10. Refresh graph (manual step to sync data)
     """
@@ -124,6 +155,7 @@ class DemoOrchestrator:
         config: DemoConfiguration,
         progress_callback: Optional[Callable[[str, str, float], None]] = None,
         resume: bool = False,
+        shared_clients: Optional[SharedClients] = None,
     ):
         """
         Initialize the orchestrator.
@@ -132,12 +164,15 @@ class DemoOrchestrator:
             config: Demo configuration
             progress_callback: Optional callback(step_name, status, percent)
             resume: If True, attempt to resume from previous state
+            shared_clients: Token caches and workspace rate limiters shared
+                            with other orchestrators in this process
         """
         self.config = config
         self.progress_callback = progress_callback
         self.state = SetupState()
         self._cancelled = False
         self._resume = resume
+        self._shared_clients = shared_clients
 
         # State manager for persistence
         self._state_manager = SetupStateManager(
@@ -228,7 +263,13 @@ class DemoOrchestrator:
     @property
     def fabric_client(self) -> FabricClient:
         """Get or create FabricClient."""
-        if self._fabric_client is None:
+        if self._fabric_client is None and self._shared_clients is not None:
+            self._fabric_client = self._shared_clients.create_fabric_client(
+                workspace_id=self.config.fabric.workspace_id,
+                tenant_id=self.config.fabric.tenant_id,
+                use_interactive_auth=self.config.fabric.use_interactive_auth,
+            )
+        elif self._fabric_client is None:
             # Load global config for rate limiting settings
             global_config = GlobalConfig.load()
             rate_limit_config = RateLimitConfig(
@@ -360,11 +401,19 @@ class DemoOrchestrator:
                     "create_ontology", self._step_create_ontology
                 )
 
-            # Step 8: Configure bindings
+            # Step 8: Configure bindings (one combined pass, or per kind for debugging)
             if self.state.ontology_id:
-                results["configure_bindings"] = self._run_step_with_state(
-                    "configure_bindings", self._step_configure_bindings
-                )
+                if self.config.options.binding_mode == "per_step":
+                    for step_name, step_func in (
+                        ("bind_static", self._step_bind_static),
+                        ("bind_timeseries", self._step_bind_timeseries),
+                        ("bind_relationships", self._step_bind_relationships),
+                    ):
+                        results[step_name] = self._run_step_with_state(step_name, step_func)
+                else:
+                    results["configure_bindings"] = self._run_step_with_state(
+                        "configure_bindings", self._step_configure_bindings
+                    )
 
             # Step 9: Verify setup
             results["verify"] = self._run_step_with_state("verify", self._step_verify_setup)
@@ -436,10 +485,7 @@ class DemoOrchestrator:
             )
         
         # Load existing state to restore resource IDs
-        if self._state_manager.has_existing_state():
-            existing_state = self._state_manager.load_state()
-            if existing_state:
-                self._handle_resume(existing_state)
+        self.restore_resource_ids()
         
         # Mark setup as in progress if not already
         if not self._state_manager.has_existing_state():
@@ -488,6 +534,9 @@ class DemoOrchestrator:
                 artifact_id=artifact_id,
             )
 
+        # Stop between steps once cancel() was requested
+        self._check_cancellation()
+
         # Mark step as started
         self._state_manager.start_step(step_name)
 
@@ -546,6 +595,20 @@ class DemoOrchestrator:
             self.state.ontology_id = existing_state.ontology_id
             self.state.ontology_name = existing_state.ontology_name
 
+    def restore_resource_ids(self) -> bool:
+        """
+        Restore resource IDs from the saved setup state, if any.
+        
+        Returns:
+            True if a saved state was found
+        """
+        if self._state_manager.has_existing_state():
+            existing_state = self._state_manager.load_state()
+            if existing_state:
+                self._handle_resume(existing_state)
+                return True
+        return False
+
     def has_resumable_state(self) -> bool:
         """Check if there's a resumable state from a previous run."""
         if self._state_manager.has_existing_state():
@@ -560,10 +623,31 @@ class DemoOrchestrator:
             return self._state_manager.get_resume_summary()
         return None
 
-    def clear_state(self) -> None:
-        """Clear any existing state file."""
+    def clear_state(self, keep_pending_jobs: bool = False) -> None:
+        """
+        Clear any existing state file.
+
+        Args:
+            keep_pending_jobs: Keep the state while a graph refresh started
+                with ``--no-wait`` is still running, so ``status --watch``
+                can find its job handle in the ``refresh_graph`` step
+        """
+        if keep_pending_jobs and self._has_pending_refresh_job():
+            logger.info("Keeping setup state: graph refresh job is still running")
+            return
         self._state_manager.clear_state()
 
+    def _has_pending_refresh_job(self) -> bool:
+        """Whether the saved state holds a graph refresh job without a final status."""
+        if not self._state_manager.has_existing_state():
+            return False
+        step = self._state_manager.state.steps.get("refresh_graph")
+        return bool(
+            step
+            and step.details.get("refresh_job")
+            and step.details.get("refresh_status") not in JOB_TERMINAL_STATUSES
+        )
+
     def _step_validate(self) -> StepResult:
         """Validate configuration."""
         start = time.time()
@@ -921,17 +1005,14 @@ class DemoOrchestrator:
         # Check which tables already exist (existence = ingestion was at least attempted)
         # KQL async ingestion means tables may have 0 rows while still processing
         existing_tables = set(self._get_existing_eventhouse_tables())
-        tables_with_data = {}
-        for table_name in existing_tables:
-            try:
-                count = self.eventhouse_client.get_table_count(
-                    eventhouse_id=self.state.eventhouse_id,
-                    database_name=self.state.kql_database_name,
-                    table_name=table_name,
-                )
-                tables_with_data[table_name] = count
-            except Exception:
-                tables_with_data[table_name] = 0  # Table exists but couldn't get count
+        try:
+            tables_with_data = self.eventhouse_client.get_table_counts(
+                eventhouse_id=self.state.eventhouse_id,
+                database_name=self.state.kql_database_name,
+                tables=sorted(existing_tables),
+            )
+        except Exception:
+            tables_with_data = {}  # Tables exist but couldn't get counts
 
         expected_tables = {tc.table_name for tc in table_configs}
         
@@ -950,18 +1031,15 @@ class DemoOrchestrator:
                 details={"existing_tables": tables_info},
             )
 
-        total_tables = len(table_configs)
         ingested_tables = []
         skipped_tables = []
         failed_tables = []
+        pending_row_checks = []  # Tables whose async ingestion was queued
+        table_files: Dict[str, List[Path]] = {}  # Tables to ingest -> source files
+        mapping_names: Dict[str, str] = {}
 
-        for i, table_config in enumerate(table_configs):
-            self._check_cancellation()
-            progress_pct = int((i / total_tables) * 100)
-            self._report_progress("ingest_data", "in_progress", progress_pct)
-
+        for table_config in table_configs:
             table_name = table_config.table_name
-            logger.info(f"Processing table: {table_name}")
 
             # Check if table already exists (ingestion was initiated - async may still be processing)
             if table_name in existing_tables:
@@ -971,99 +1049,48 @@ class DemoOrchestrator:
                 skipped_tables.append(table_name)
                 continue
 
-            # Find matching CSV file
-            csv_file = self._find_csv_for_table(csv_files, table_name)
-            if not csv_file:
+            # Find matching CSV file (or its split part files)
+            files = self._find_csv_files_for_table(csv_files, table_name)
+            if not files:
                 logger.warning(f"No CSV file found for table {table_name}")
                 failed_tables.append(table_name)
                 continue
 
+            self._check_cancellation()
             try:
-                # Step 1: Create the KQL table with schema (use .create-merge which is idempotent)
-                logger.info(f"Creating/updating KQL table: {table_name}")
-                create_cmd = table_config.to_kql_schema()
-                self.eventhouse_client.execute_kql_management(
-                    eventhouse_id=self.state.eventhouse_id,
-                    database_name=self.state.kql_database_name,
-                    command=create_cmd,
-                )
-
-                # Step 1b: Create CSV ingestion mapping so column order
-                # is handled correctly (CSV has Timestamp first, KQL has
-                # key column first).
-                mapping_name = f"{table_name}_csv"
-                mapping_cmd = table_config.to_csv_mapping_command(mapping_name)
-                logger.info(f"Creating CSV ingestion mapping: {mapping_name}")
-                self.eventhouse_client.execute_kql_management(
-                    eventhouse_id=self.state.eventhouse_id,
-                    database_name=self.state.kql_database_name,
-                    command=mapping_cmd,
-                )
-
-                # Step 2: Upload CSV to Lakehouse Files area for OneLake access
-                # KQL can ingest from OneLake paths
-                if self.state.lakehouse_id:
-                    logger.info(f"Uploading {csv_file.name} to Lakehouse for OneLake access")
-                    eventhouse_folder = "eventhouse"  # Upload to a separate folder
-                    
-                    # Upload to Lakehouse/Files/eventhouse/{file}.csv
-                    self.onelake_client.upload_file(
-                        item_id=self.state.lakehouse_id,
-                        local_file=csv_file,
-                        remote_path=f"{eventhouse_folder}/{csv_file.name}",
-                        item_name=self.state.lakehouse_name,
-                        item_type="Lakehouse",
-                        folder="Files",
-                    )
-
-                    # Step 3: Ingest from OneLake
-                    # OneLake path format: https://onelake.dfs.fabric.microsoft.com/{workspace_id}/{item_id}/Files/eventhouse/{file}.csv
-                    # The ;impersonate suffix tells KQL to use the caller's identity to access OneLake
-                    onelake_path = (
-                        f"https://onelake.dfs.fabric.microsoft.com/"
-                        f"{self.config.fabric.workspace_id}/"
-                        f"{self.state.lakehouse_id}/"
-                        f"Files/{eventhouse_folder}/{csv_file.name};impersonate"
-                    )
+                mapping_names[table_name] = self._prepare_kql_table(table_config)
+                table_files[table_name] = files
+            except Exception as e:
+                logger.error(f"Failed to create KQL table {table_name}: {e}")
+                failed_tables.append(table_name)
 
-                    logger.info(f"Ingesting data into {table_name} from OneLake")
-                    self.eventhouse_client.ingest_from_onelake(
-                        eventhouse_id=self.state.eventhouse_id,
-                        database_name=self.state.kql_database_name,
-                        table_name=table_name,
-                        onelake_path=onelake_path,
-                        file_format="csv",
-                        ignore_first_record=True,  # Skip CSV header
-                        mapping_name=mapping_name,  # Use CSV mapping for correct column order
-                    )
+        self._report_progress("ingest_data", "in_progress", 20)
 
-                    # Wait for async ingestion to complete (KQL ingestion is async)
-                    # Use exponential backoff: 2s, 4s, 8s, 16s, 32s = ~62s total
-                    row_count = 0
-                    wait_time = 2
-                    max_attempts = 6
-                    for attempt in range(max_attempts):
-                        time.sleep(wait_time)
-                        row_count = self.eventhouse_client.get_table_count(
-                            eventhouse_id=self.state.eventhouse_id,
-                            database_name=self.state.kql_database_name,
-                            table_name=table_name,
-                        )
-                        if row_count > 0:
-                            break
-                        logger.debug(f"Waiting for {table_name} ingestion (attempt {attempt + 1}/{max_attempts}, next wait: {wait_time * 2}s)")
-                        wait_time = min(wait_time * 2, 30)  # Cap at 30s
-                    
-                    if row_count > 0:
-                        logger.info(f"Table {table_name} now has {row_count} rows")
-                    else:
-                        logger.warning(f"Table {table_name} still shows 0 rows (async ingestion may still be processing)")
+        if table_files and not self.state.lakehouse_id:
+            # Nothing to stage the CSVs in: tables are created but stay empty
+            ingested_tables.extend(table_files)
+        elif table_files and self.config.options.ingest_mode == "per_table":
+            for i, (table_name, files) in enumerate(table_files.items()):
+                self._check_cancellation()
+                self._report_progress(
+                    "ingest_data", "in_progress", 20 + int(i / len(table_files) * 70)
+                )
+                ingested, failed = self.ingest_eventhouse_files(
+                    {table_name: files}, mapping_names, max_workers=1,
+                )
+                ingested_tables.extend(ingested)
+                failed_tables.extend(failed)
+        elif table_files:
+            ingested, failed = self.ingest_eventhouse_files(table_files, mapping_names)
+            ingested_tables.extend(ingested)
+            failed_tables.extend(failed)
 
-                ingested_tables.append(table_name)
+        if self.state.lakehouse_id:
+            # Row counts are checked for all tables together below
+            pending_row_checks = list(ingested_tables)
 
-            except Exception as e:
-                logger.error(f"Failed to ingest table {table_name}: {e}")
-                failed_tables.append(table_name)
+        if pending_row_checks:
+            self._wait_for_ingested_rows(pending_row_checks)
 
         self._report_progress("ingest_data", "completed", 100)
 
@@ -1094,6 +1121,237 @@ class DemoOrchestrator:
             details={"ingested_tables": ingested_tables},
         )
 
+    def _prepare_kql_table(self, table_config) -> str:
+        """
+        Create (or merge) a KQL table and its CSV ingestion mapping.
+        
+        Returns:
+            Name of the CSV ingestion mapping
+        """
+        table_name = table_config.table_name
+
+        # Use .create-merge which is idempotent
+        logger.info(f"Creating/updating KQL table: {table_name}")
+        self.eventhouse_client.execute_kql_management(
+            eventhouse_id=self.state.eventhouse_id,
+            database_name=self.state.kql_database_name,
+            command=table_config.to_kql_schema(),
+        )
+
+        # CSV ingestion mapping so column order is handled correctly
+        # (CSV has Timestamp first, KQL has key column first)
+        mapping_name = f"{table_name}_csv"
+        logger.info(f"Creating CSV ingestion mapping: {mapping_name}")
+        self.eventhouse_client.execute_kql_management(
+            eventhouse_id=self.state.eventhouse_id,
+            database_name=self.state.kql_database_name,
+            command=table_config.to_csv_mapping_command(mapping_name),
+        )
+        return mapping_name
+
+    def _onelake_staging_uri(self, file_name: str) -> str:
+        """
+        OneLake URI of a CSV staged in the Lakehouse for KQL ingestion.
+        
+        The ;impersonate suffix tells KQL to use the caller's identity to access OneLake.
+        """
+        return (
+            f"https://onelake.dfs.fabric.microsoft.com/"
+            f"{self.config.fabric.workspace_id}/"
+            f"{self.state.lakehouse_id}/"
+            f"Files/{EVENTHOUSE_STAGING_FOLDER}/{file_name};impersonate"
+        )
+
+    def ingest_eventhouse_files(
+        self,
+        table_files: Dict[str, List[Path]],
+        mapping_names: Optional[Dict[str, str]] = None,
+        max_workers: Optional[int] = None,
+        replace_existing: bool = False,
+    ) -> tuple:
+        """
+        Stage CSV files in the Lakehouse and ingest them into existing KQL tables.
+        
+        Files larger than ``options.max_ingest_file_mb`` are first split into
+        parts (streaming, header repeated in each part) in a temporary folder.
+        All files and parts are uploaded concurrently; then each table is loaded
+        with multi-URI ``.ingest`` commands (one per INGEST_BATCH_MAX_BYTES of
+        source data), with tables ingested in parallel.
+        
+        Args:
+            table_files: KQL table name -> local CSV files for that table
+            mapping_names: Optional KQL table name -> CSV ingestion mapping
+            max_workers: Parallel uploads/ingest commands
+                         (default: options.max_parallel_uploads)
+            replace_existing: Clear each table's rows before its first
+                              ``.ingest`` (only once its files are staged)
+            
+        Returns:
+            Tuple of (ingested table names, failed table names)
+        """
+        with tempfile.TemporaryDirectory(prefix="fabric-demo-parts-") as parts_dir:
+            table_files = self._split_oversized_files(table_files, Path(parts_dir))
+            return self._stage_and_ingest(
+                table_files, mapping_names or {}, max_workers, replace_existing
+            )
+
+    def _split_oversized_files(
+        self,
+        table_files: Dict[str, List[Path]],
+        parts_dir: Path,
+    ) -> Dict[str, List[Path]]:
+        """Replace files above the ingestion size limit with byte-budgeted parts."""
+        max_bytes = self.config.options.max_ingest_file_mb * 1024 * 1024
+        result: Dict[str, List[Path]] = {}
+        for table_name, files in table_files.items():
+            result[table_name] = []
+            for csv_file in files:
+                self._check_cancellation()
+                if csv_file.stat().st_size > max_bytes:
+                    logger.info(f"{csv_file.name} exceeds {self.config.options.max_ingest_file_mb} MB, splitting")
+                    result[table_name].extend(split_csv_by_size(csv_file, parts_dir, max_bytes))
+                else:
+                    result[table_name].append(csv_file)
+        return result
+
+    def _stage_and_ingest(
+        self,
+        table_files: Dict[str, List[Path]],
+        mapping_names: Dict[str, str],
+        max_workers: Optional[int],
+        replace_existing: bool = False,
+    ) -> tuple:
+        """Upload all files concurrently, then ingest tables in parallel."""
+        max_workers = max_workers or self.config.options.max_parallel_uploads
+        all_files = [f for files in table_files.values() for f in files]
+
+        upload_results = self.onelake_client.upload_files(
+            item_id=self.state.lakehouse_id,
+            files=all_files,
+            item_name=self.state.lakehouse_name,
+            item_type="Lakehouse",
+            folder=f"Files/{EVENTHOUSE_STAGING_FOLDER}",
+            max_workers=max_workers,
+        )
+        failed_uploads = {f["name"] for f in upload_results["failed"]}
+        for failed in upload_results["failed"]:
+            logger.error(f"Failed to upload {failed['name']}: {failed['error']}")
+
+        def ingest_table(table_name: str) -> None:
+            self._check_cancellation()
+            files = table_files[table_name]
+            if replace_existing:
+                # Upload succeeded, so the table is only emptied right before it is reloaded
+                logger.info(f"Clearing existing rows from {table_name}")
+                self.eventhouse_client.clear_table_data(
+                    eventhouse_id=self.state.eventhouse_id,
+                    database_name=self.state.kql_database_name,
+                    table_name=table_name,
+                )
+            for batch in _batch_files_by_size(files, INGEST_BATCH_MAX_BYTES):
+                logger.info(
+                    f"Ingesting {len(batch)} file(s) into {table_name} from OneLake"
+                )
+                self.eventhouse_client.ingest_from_onelake(
+                    eventhouse_id=self.state.eventhouse_id,
+                    database_name=self.state.kql_database_name,
+                    table_name=table_name,
+                    onelake_path=[self._onelake_staging_uri(f.name) for f in batch],
+                    file_format="csv",
+                    ignore_first_record=True,  # Skip CSV header
+                    mapping_name=mapping_names.get(table_name),
+                )
+
+        ingested, failed = [], []
+        ready = []
+        for table_name, files in table_files.items():
+            if any(f.name in failed_uploads for f in files):
+                failed.append(table_name)
+            else:
+                ready.append(table_name)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ready) or 1))) as executor:
+            futures = {executor.submit(ingest_table, t): t for t in ready}
+            for future in as_completed(futures):
+                table_name = futures[future]
+                try:
+                    future.result()
+                    ingested.append(table_name)
+                except CancellationRequestedError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Failed to ingest table {table_name}: {e}")
+                    failed.append(table_name)
+
+        return ingested, failed
+
+    def _wait_for_ingested_rows(self, table_names: List[str]) -> Dict[str, int]:
+        """
+        Wait for async KQL ingestion to show rows in the given tables.
+        
+        Polls all still-empty tables with one batched count query per attempt,
+        using exponential backoff: 2s, 4s, 8s, 16s, 30s, 30s (~90s total).
+        
+        Returns:
+            Dict mapping table name to its last observed row count
+        """
+        row_counts = {table_name: 0 for table_name in table_names}
+        pending = list(table_names)
+        wait_time = 2
+        max_attempts = 6
+        for attempt in range(max_attempts):
+            self._check_cancellation()
+            time.sleep(wait_time)
+            try:
+                counts = self.eventhouse_client.get_table_counts(
+                    eventhouse_id=self.state.eventhouse_id,
+                    database_name=self.state.kql_database_name,
+                    tables=pending,
+                )
+            except Exception as e:
+                logger.debug(f"Row count check failed (attempt {attempt + 1}/{max_attempts}): {e}")
+                counts = {}
+            
+            for table_name, count in counts.items():
+                row_counts[table_name] = count
+                if count > 0:
+                    logger.info(f"Table {table_name} now has {count} rows")
+            pending = [t for t in pending if row_counts[t] == 0]
+            if not pending:
+                break
+            logger.debug(f"Waiting for ingestion of {len(pending)} tables (attempt {attempt + 1}/{max_attempts}, next wait: {min(wait_time * 2, 30)}s)")
+            wait_time = min(wait_time * 2, 30)  # Cap at 30s
+        
+        for table_name in pending:
+            logger.warning(f"Table {table_name} still shows 0 rows (async ingestion may still be processing)")
+        
+        return row_counts
+
+    def _find_csv_files_for_table(self, csv_files: List[Path], table_name: str) -> List[Path]:
+        """
+        Find the CSV files to ingest into a KQL table.
+        
+        Split part files ({table}_part1.csv, {table}_part2.csv, ... in the
+        eventhouse data folder or its parts/ subfolder) contain the full data
+        set and take precedence over the single {table}.csv seed file.
+        """
+        candidates = list(csv_files)
+        eventhouse_dir = self.config.eventhouse_data_path
+        if eventhouse_dir and (eventhouse_dir / "parts").is_dir():
+            candidates.extend((eventhouse_dir / "parts").glob("*.csv"))
+
+        part_pattern = re.compile(rf"^{re.escape(table_name)}_part(\d+)$", re.IGNORECASE)
+        parts = []
+        for csv_file in candidates:
+            match = part_pattern.match(csv_file.stem)
+            if match:
+                parts.append((int(match.group(1)), csv_file))
+        if parts:
+            return [csv_file for _, csv_file in sorted(parts)]
+
+        csv_file = self._find_csv_for_table(csv_files, table_name)
+        return [csv_file] if csv_file else []
+
     def _find_csv_for_table(self, csv_files: List[Path], table_name: str) -> Optional[Path]:
         """Find the CSV file matching a table name."""
         # Exact match first
@@ -1438,29 +1696,32 @@ class DemoOrchestrator:
 
     def _step_configure_bindings(self) -> StepResult:
         """
-        Configure ontology bindings for lakehouse and eventhouse data sources.
+        Bind static, timeseries and relationship bindings in a single pass.
         
-        This step:
-        1. Parses bindings.yaml for entity and relationship bindings
-        2. Gets the ontology definition to extract entity/relationship IDs
-        3. Creates lakehouse (static) bindings for all lakehouse entities
-        4. Creates eventhouse (timeseries) bindings for all eventhouse entities
-        5. Creates relationship contextualizations
-        6. Uploads the binding definition to Fabric via updateDefinition API
-        7. Validates bindings were successfully created
-        """
-        import base64
-        import json
+        Combined binding mode (default for ``setup``):
+        - Fetches the ontology definition once
+        - Adds static, timeseries and relationship bindings to one builder
+          (same rules as bind_static / bind_timeseries / bind_relationships)
+        - Commits everything with a single updateDefinition LRO, skipped
+          entirely when the definition is unchanged
         
+        The separate bind_* steps remain available via ``run-step`` or
+        ``options.binding_mode: per_step`` for debugging.
+        """
         start = time.time()
         self._check_cancellation()
         self._report_progress("configure_bindings", "in_progress", 0)
-
+        
+        if not self.state.ontology_id:
+            return StepResult(
+                status=StepStatus.FAILED,
+                message="Ontology not created. Run create_ontology step first.",
+                duration_seconds=time.time() - start,
+            )
+        
         # Parse bindings.yaml (preferred) or fall back to markdown
         yaml_config = parse_bindings_yaml(self.config.demo_path)
-        
         if not yaml_config:
-            # Fall back to markdown parsing
             parsed_bindings = parse_demo_bindings(self.config.demo_path)
             if not parsed_bindings.get("static") and not parsed_bindings.get("timeseries"):
                 return StepResult(
@@ -1468,439 +1729,94 @@ class DemoOrchestrator:
                     message="No binding configurations found",
                     duration_seconds=time.time() - start,
                 )
-            # Convert markdown format to yaml config for unified processing
             yaml_config = self._convert_markdown_to_yaml_config(parsed_bindings)
-
-        self._report_progress("configure_bindings", "in_progress", 10)
-
-        # Get ontology definition to extract entity/relationship type IDs
+        
+        # Single GET of the ontology definition for all binding kinds
         try:
-            ont_definition = self.fabric_client.get_ontology_definition(self.state.ontology_id)
+            parsed_definition = ParsedDefinition.from_definition(
+                self.fabric_client.get_ontology_definition(self.state.ontology_id)
+            )
         except Exception as e:
-            logger.error(f"Failed to get ontology definition: {e}")
             return StepResult(
                 status=StepStatus.FAILED,
                 message=f"Failed to get ontology definition: {e}",
                 error=e,
                 duration_seconds=time.time() - start,
             )
-
-        self._report_progress("configure_bindings", "in_progress", 20)
-
-        # Build entity name -> ID mapping from ontology definition
-        entity_name_to_id = {}
-        entity_id_to_properties = {}  # entity_id -> {prop_name: prop_id}
-        relationship_name_to_id = {}
-        
-        # Track existing binding IDs to reuse (prevents duplicate bindings)
-        existing_entity_binding_ids = {}  # entity_id -> binding_id
-        existing_rel_contextualization_ids = {}  # relationship_id -> contextualization_id
-        
-        # Debug: log ontology definition structure
-        logger.debug(f"Ontology definition keys: {ont_definition.keys()}")
-        
-        parts = ont_definition.get("definition", {}).get("parts", [])
-        if not parts:
-            parts = ont_definition.get("parts", [])
         
-        logger.debug(f"Found {len(parts)} parts in ontology definition")
+        self._report_progress("configure_bindings", "in_progress", 20)
         
-        for part in parts:
-            path = part.get("path", "")
-            payload_b64 = part.get("payload", "")
-            
-            if not payload_b64:
-                continue
-            
-            try:
-                payload_json = base64.b64decode(payload_b64).decode("utf-8")
-                payload = json.loads(payload_json)
-            except Exception as e:
-                logger.warning(f"Failed to decode payload for {path}: {e}")
-                continue
-            
-            # Extract entity type mappings
-            if "EntityTypes/" in path and "DataBindings" not in path:
-                entity_id = payload.get("id", "")
-                entity_name = payload.get("name", "")
-                if entity_id and entity_name:
-                    entity_name_to_id[entity_name] = entity_id
-                    # Also store properties mapping (include both static and timeseries properties)
-                    props = {}
-                    for prop in payload.get("properties", []):
-                        prop_name = prop.get("name", "")
-                        prop_id = prop.get("id", "")
-                        if prop_name and prop_id:
-                            props[prop_name] = prop_id
-                    # Also include timeseries properties from timeseriesProperties array
-                    for prop in payload.get("timeseriesProperties", []):
-                        prop_name = prop.get("name", "")
-                        prop_id = prop.get("id", "")
-                        if prop_name and prop_id:
-                            props[prop_name] = prop_id
-                    entity_id_to_properties[entity_id] = props
-                    logger.debug(f"Mapped entity: {entity_name} -> {entity_id} with {len(props)} properties")
-            
-            # Extract relationship type mappings
-            elif "RelationshipTypes/" in path and "Contextualizations" not in path:
-                rel_id = payload.get("id", "")
-                rel_name = payload.get("name", "")
-                if rel_id and rel_name:
-                    relationship_name_to_id[rel_name] = rel_id
-                    logger.debug(f"Mapped relationship: {rel_name} -> {rel_id}")
-            
-            # Extract existing binding IDs (to reuse and avoid duplicates)
-            # Path format: EntityTypes/{entity_id}/DataBindings/{binding_id}.json
-            elif "/DataBindings/" in path:
-                parts_split = path.split("/")
-                # Expected: ['EntityTypes', 'entity_id', 'DataBindings', 'binding_id.json']
-                if len(parts_split) >= 4:
-                    entity_id = parts_split[1]
-                    binding_file = parts_split[3]  # e.g., "uuid.json"
-                    binding_id = binding_file.replace(".json", "")
-                    existing_entity_binding_ids[entity_id] = binding_id
-                    logger.info(f"Found existing binding for entity {entity_id}: {binding_id}")
-            
-            # Extract existing contextualization IDs
-            # Path format: RelationshipTypes/{rel_id}/Contextualizations/{ctx_id}.json
-            elif "/Contextualizations/" in path:
-                parts_split = path.split("/")
-                # Expected: ['RelationshipTypes', 'rel_id', 'Contextualizations', 'ctx_id.json']
-                if len(parts_split) >= 4:
-                    rel_id = parts_split[1]
-                    ctx_file = parts_split[3]  # e.g., "uuid.json"
-                    ctx_id = ctx_file.replace(".json", "")
-                    existing_rel_contextualization_ids[rel_id] = ctx_id
-                    logger.info(f"Found existing contextualization for relationship {rel_id}: {ctx_id}")
-
-        logger.info(f"Found {len(entity_name_to_id)} entities and {len(relationship_name_to_id)} relationships in ontology")
-        logger.info(f"Found {len(existing_entity_binding_ids)} existing entity bindings, {len(existing_rel_contextualization_ids)} existing contextualizations")
-
-        self._report_progress("configure_bindings", "in_progress", 30)
-
-        # Build bindings
         builder = OntologyBindingBuilder(
             workspace_id=self.config.fabric.workspace_id,
             ontology_id=self.state.ontology_id,
         )
-
-        lakehouse_binding_count = 0
-        eventhouse_binding_count = 0
-        relationship_binding_count = 0
-
-        # --- Add Lakehouse (static) bindings ---
+        static_count = timeseries_count = relationship_count = 0
+        skipped: List[str] = []
+        
         if self.state.lakehouse_id and yaml_config.lakehouse_entities:
-            for entity_binding in yaml_config.lakehouse_entities:
-                entity_name = entity_binding.entity_name
-                entity_id = entity_name_to_id.get(entity_name)
-                
-                if not entity_id:
-                    logger.warning(f"No entity ID found for '{entity_name}', skipping binding")
-                    continue
-                
-                # Get property mappings using entity property IDs
-                # Only include properties that have valid IDs in the ontology
-                entity_props = entity_id_to_properties.get(entity_id, {})
-                property_mappings = {}
-                skipped_props = []
-                
-                for pm in entity_binding.property_mappings:
-                    source_col = pm.source_column
-                    target_prop_name = pm.target_property
-                    # Only use property ID if it exists in ontology
-                    prop_id = entity_props.get(target_prop_name)
-                    if prop_id:
-                        property_mappings[source_col] = prop_id
-                    else:
-                        skipped_props.append(target_prop_name)
-                
-                if skipped_props:
-                    logger.warning(f"Skipped {len(skipped_props)} properties for '{entity_name}' (not in ontology): {skipped_props[:3]}...")
-                
-                if not property_mappings:
-                    logger.warning(f"No valid property mappings for '{entity_name}', skipping binding")
-                    continue
-                
-                # Reuse existing binding ID if available (prevents duplicate bindings)
-                existing_binding_id = existing_entity_binding_ids.get(entity_id)
-                if existing_binding_id:
-                    logger.info(f"Reusing existing binding ID for {entity_name} ({entity_id}): {existing_binding_id}")
-                else:
-                    logger.debug(f"No existing binding ID for {entity_name} ({entity_id}), will generate new UUID")
-                
-                builder.add_lakehouse_binding(
-                    entity_type_id=entity_id,
-                    lakehouse_id=self.state.lakehouse_id,
-                    table_name=entity_binding.table_name,
-                    key_column=entity_binding.key_column,
-                    property_mappings=property_mappings,
-                    binding_id=existing_binding_id,  # Reuse existing ID
-                )
-                
-                # Register key property for relationship contextualizations
-                key_prop_id = entity_props.get(entity_binding.key_column, entity_binding.key_column)
-                builder.register_entity_key_property(entity_name, key_prop_id)
-                
-                lakehouse_binding_count += 1
-                logger.info(f"Added lakehouse binding: {entity_name} -> {entity_binding.table_name}")
-
-        self._report_progress("configure_bindings", "in_progress", 50)
-
-        # --- Add Eventhouse (timeseries) bindings ---
-        if self.state.eventhouse_id and self.state.kql_database_id and yaml_config.eventhouse_entities:
-            # Get KQL database name
-            try:
-                kql_db = self.fabric_client.get_kql_database(self.state.kql_database_id)
-                database_name = kql_db.get("displayName", self.config.resources.eventhouse.name)
-            except Exception:
-                database_name = self.config.resources.eventhouse.name
-            cluster_uri = self._get_eventhouse_cluster_uri()
-            
-            for entity_binding in yaml_config.eventhouse_entities:
-                entity_name = entity_binding.entity_name
-                entity_id = entity_name_to_id.get(entity_name)
-                
-                if not entity_id:
-                    logger.warning(f"No entity ID found for '{entity_name}', skipping eventhouse binding")
-                    continue
-                
-                # Get property mappings - only include properties with valid IDs in ontology
-                entity_props = entity_id_to_properties.get(entity_id, {})
-                property_mappings = {}
-                skipped_props = []
-                
-                for pm in entity_binding.property_mappings:
-                    source_col = pm.source_column
-                    target_prop_name = pm.target_property
-                    prop_id = entity_props.get(target_prop_name)
-                    if prop_id:
-                        property_mappings[source_col] = prop_id
-                    else:
-                        skipped_props.append(target_prop_name)
-                
-                # Fabric API requires key property to be mapped in propertyBindings
-                # even for TimeSeries bindings - add it if not already present
-                key_col = entity_binding.key_column
-                key_prop_id = entity_props.get(key_col)
-                if key_prop_id and key_col not in property_mappings:
-                    property_mappings[key_col] = key_prop_id
-                    logger.debug(f"Added key property mapping: {key_col} -> {key_prop_id}")
-                
-                if skipped_props:
-                    logger.warning(f"Skipped {len(skipped_props)} properties for '{entity_name}' (not in ontology): {skipped_props[:3]}...")
-                
-                if not property_mappings:
-                    logger.warning(f"No valid property mappings for '{entity_name}', skipping eventhouse binding")
-                    continue
-                
-                # Get timestamp column from eventhouse table config
-                timestamp_col = "Timestamp"  # Default
-                for table_config in yaml_config.eventhouse_tables:
-                    if table_config.entity_name == entity_name:
-                        timestamp_col = table_config.timestamp_column
-                        break
-                
-                # For TimeSeries bindings, we should NOT reuse the existing binding ID
-                # if that ID belongs to a NonTimeSeries binding. Each binding type needs
-                # its own unique ID. Check if we've already added a Lakehouse binding.
-                eventhouse_binding_id = None  # Will generate a new ID
-                
-                # Check if entity already has a Lakehouse binding in this session
-                existing_bindings = builder.get_bindings().get(entity_id, [])
-                has_lakehouse_binding = any(
-                    b.binding_type.value == "NonTimeSeries" for b in existing_bindings
-                )
-                
-                if not has_lakehouse_binding and existing_entity_binding_ids.get(entity_id):
-                    # Entity has no Lakehouse binding in this session but has existing binding
-                    # This means it's an eventhouse-only entity, can reuse existing ID
-                    eventhouse_binding_id = existing_entity_binding_ids.get(entity_id)
-                    logger.info(f"Reusing existing binding ID for eventhouse-only entity {entity_name}: {eventhouse_binding_id}")
-                else:
-                    logger.debug(f"Generating new binding ID for {entity_name} TimeSeries binding (entity has Lakehouse binding)")
-                
-                builder.add_eventhouse_binding(
-                    entity_type_id=entity_id,
-                    eventhouse_id=self.state.eventhouse_id,
-                    database_name=database_name,
-                    table_name=entity_binding.table_name,
-                    key_column=entity_binding.key_column,
-                    timestamp_column=timestamp_col,
-                    property_mappings=property_mappings,
-                    binding_id=eventhouse_binding_id,  # New ID for entities with both binding types
-                    cluster_uri=cluster_uri,
-                )
-                eventhouse_binding_count += 1
-                logger.info(f"Added eventhouse binding: {entity_name} -> {entity_binding.table_name}")
-
-        self._report_progress("configure_bindings", "in_progress", 70)
-
-        # --- Add Relationship Contextualizations ---
+            static_count, static_skipped = self._add_static_bindings(
+                builder, yaml_config, parsed_definition
+            )
+            skipped.extend(static_skipped)
+        
+        self._report_progress("configure_bindings", "in_progress", 40)
+        
+        if self.state.eventhouse_id and yaml_config.eventhouse_entities:
+            timeseries_count, ts_skipped = self._add_timeseries_bindings(
+                builder, yaml_config, parsed_definition
+            )
+            skipped.extend(ts_skipped)
+        
+        self._report_progress("configure_bindings", "in_progress", 60)
+        
         if self.state.lakehouse_id and yaml_config.lakehouse_relationships:
-            for rel_binding in yaml_config.lakehouse_relationships:
-                rel_name = rel_binding.relationship_name
-                rel_id = relationship_name_to_id.get(rel_name)
-                
-                if not rel_id:
-                    logger.warning(f"No relationship ID found for '{rel_name}', skipping contextualization")
-                    continue
-                
-                # Get source and target entity key property IDs
-                source_entity_name = rel_binding.source_entity
-                target_entity_name = rel_binding.target_entity
-                
-                source_entity_id = entity_name_to_id.get(source_entity_name, "")
-                target_entity_id = entity_name_to_id.get(target_entity_name, "")
-                
-                source_props = entity_id_to_properties.get(source_entity_id, {})
-                target_props = entity_id_to_properties.get(target_entity_id, {})
-                
-                source_key_prop_id = source_props.get(rel_binding.source_key_column, rel_binding.source_key_column)
-                target_key_prop_id = target_props.get(rel_binding.target_key_column, rel_binding.target_key_column)
-                
-                # Reuse existing contextualization ID if available
-                existing_ctx_id = existing_rel_contextualization_ids.get(rel_id)
-                
-                builder.add_relationship_contextualization(
-                    relationship_type_id=rel_id,
-                    lakehouse_id=self.state.lakehouse_id,
-                    table_name=rel_binding.table_name,
-                    source_key_column=rel_binding.source_key_column,
-                    source_key_property_id=source_key_prop_id,
-                    target_key_column=rel_binding.target_key_column,
-                    target_key_property_id=target_key_prop_id,
-                    contextualization_id=existing_ctx_id,  # Reuse existing ID
-                )
-                relationship_binding_count += 1
-                logger.info(f"Added relationship contextualization: {rel_name} -> {rel_binding.table_name}")
-
-        self._report_progress("configure_bindings", "in_progress", 80)
-
-        # Build and upload the binding definition
-        total_bindings = lakehouse_binding_count + eventhouse_binding_count + relationship_binding_count
+            relationship_count, rel_skipped = self._add_relationship_bindings(
+                builder, yaml_config, parsed_definition
+            )
+            skipped.extend(rel_skipped)
         
-        if total_bindings == 0:
+        self._report_progress("configure_bindings", "in_progress", 70)
+        
+        if static_count + timeseries_count + relationship_count == 0:
             return StepResult(
                 status=StepStatus.SKIPPED,
-                message="No valid bindings could be configured (entity IDs not found in ontology)",
+                message=f"No valid bindings configured (skipped: {', '.join(skipped)})",
                 duration_seconds=time.time() - start,
             )
-
+        
+        # Single updateDefinition LRO for all binding kinds
         try:
-            # Build the definition parts with bindings
-            binding_parts = builder.build_definition_parts(ont_definition)
-            
-            logger.info(f"Built {len(binding_parts)} parts for update")
-            
-            # Check for duplicate STATIC bindings per entity
-            # Per Microsoft docs: Each entity supports ONE static binding, but MULTIPLE timeseries bindings
-            entity_static_counts = {}
-            entity_timeseries_counts = {}
-            
-            for part in binding_parts:
-                path = part.get('path', 'unknown')
-                logger.info(f"Part path: {path}")
-                # Track bindings per entity for debugging
-                if 'DataBindings' in path:
-                    # Extract entity ID from path like EntityTypes/1000000001/DataBindings/uuid.json
-                    parts = path.split('/')
-                    if len(parts) >= 2:
-                        entity_id = parts[1]
-                        # Decode to check binding type
-                        try:
-                            import base64
-                            decoded = base64.b64decode(part.get('payload', '')).decode('utf-8')
-                            import json
-                            binding_data = json.loads(decoded)
-                            binding_type = binding_data.get('dataBindingConfiguration', {}).get('dataBindingType', '')
-                            if binding_type == 'NonTimeSeries':
-                                entity_static_counts[entity_id] = entity_static_counts.get(entity_id, 0) + 1
-                            elif binding_type == 'TimeSeries':
-                                entity_timeseries_counts[entity_id] = entity_timeseries_counts.get(entity_id, 0) + 1
-                        except Exception:
-                            # If we can't decode, count conservatively as static
-                            entity_static_counts[entity_id] = entity_static_counts.get(entity_id, 0) + 1
-                # Decode and log binding content for debugging
-                if 'DataBindings' in path or 'Contextualizations' in path:
-                    try:
-                        import base64
-                        decoded = base64.b64decode(part.get('payload', '')).decode('utf-8')
-                        logger.debug(f"Part content: {decoded[:500]}...")
-                    except Exception:
-                        pass
-            
-            # Log entities with multiple STATIC bindings (this is the real constraint)
-            for entity_id, count in entity_static_counts.items():
-                ts_count = entity_timeseries_counts.get(entity_id, 0)
-                if count > 1:
-                    logger.error(f"Entity {entity_id} has {count} STATIC bindings - only 1 static allowed!")
-                else:
-                    logger.debug(f"Entity {entity_id}: {count} static binding(s), {ts_count} timeseries binding(s)")
-            
-            # Upload to Fabric
-            self.fabric_client.update_ontology_definition(
-                ontology_id=self.state.ontology_id,
-                definition={"parts": binding_parts},
-            )
-            logger.info(f"Successfully uploaded {total_bindings} bindings to ontology")
+            new_definition = builder.build_parsed_definition(parsed_definition)
+            definition_diff = self._commit_binding_parts(parsed_definition, new_definition)
         except Exception as e:
-            logger.error(f"Failed to upload bindings: {e}")
             return StepResult(
                 status=StepStatus.FAILED,
                 message=f"Failed to upload bindings: {e}",
                 error=e,
                 duration_seconds=time.time() - start,
             )
-
-        self._report_progress("configure_bindings", "in_progress", 90)
-
-        # Validate bindings were created
-        validation_errors = []
-        try:
-            updated_def = self.fabric_client.get_ontology_definition(self.state.ontology_id)
-            updated_parts = updated_def.get("definition", {}).get("parts", [])
-            if not updated_parts:
-                updated_parts = updated_def.get("parts", [])
-            
-            # Count binding parts in the updated definition
-            binding_part_count = sum(1 for p in updated_parts if "DataBindings" in p.get("path", ""))
-            ctx_part_count = sum(1 for p in updated_parts if "Contextualizations" in p.get("path", ""))
-            
-            if binding_part_count < (lakehouse_binding_count + eventhouse_binding_count):
-                validation_errors.append(
-                    f"Expected {lakehouse_binding_count + eventhouse_binding_count} entity bindings, found {binding_part_count}"
-                )
-            if ctx_part_count < relationship_binding_count:
-                validation_errors.append(
-                    f"Expected {relationship_binding_count} relationship contextualizations, found {ctx_part_count}"
-                )
-            
-            logger.info(f"Validation: Found {binding_part_count} entity bindings, {ctx_part_count} contextualizations")
-        except Exception as e:
-            logger.warning(f"Could not validate bindings: {e}")
-            validation_errors.append(f"Validation failed: {e}")
-
+        
         self.state.bindings_configured = True
         self._report_progress("configure_bindings", "completed", 100)
-
+        
         message = (
-            f"Configured {lakehouse_binding_count} lakehouse bindings, "
-            f"{eventhouse_binding_count} eventhouse bindings, "
-            f"{relationship_binding_count} relationship contextualizations"
+            f"Configured {static_count} static bindings, "
+            f"{timeseries_count} timeseries bindings, "
+            f"{relationship_count} relationship contextualizations"
         )
+        if not definition_diff.has_changes:
+            message += " (unchanged, update skipped)"
         
-        if validation_errors:
-            message += f" (validation warnings: {'; '.join(validation_errors)})"
-
         return StepResult(
             status=StepStatus.COMPLETED,
             message=message,
             duration_seconds=time.time() - start,
             details={
-                "lakehouse_bindings": lakehouse_binding_count,
-                "eventhouse_bindings": eventhouse_binding_count,
-                "relationship_contextualizations": relationship_binding_count,
-                "validation_errors": validation_errors,
+                "lakehouse_bindings": static_count,
+                "eventhouse_bindings": timeseries_count,
+                "relationship_contextualizations": relationship_count,
+                "skipped": skipped,
+                "definition_diff": definition_diff.to_dict(),
             }
         )
 
@@ -1921,9 +1837,6 @@ class DemoOrchestrator:
         - Ensures the key column (keyColumn) is defined
         - Validates all bindings are successful
         """
-        import base64
-        import json
-        
         start = time.time()
         self._check_cancellation()
         self._report_progress("bind_static", "in_progress", 0)
@@ -1953,7 +1866,9 @@ class DemoOrchestrator:
         
         # Get ontology definition to extract entity IDs and property IDs
         try:
-            ont_definition = self.fabric_client.get_ontology_definition(self.state.ontology_id)
+            parsed_definition = ParsedDefinition.from_definition(
+                self.fabric_client.get_ontology_definition(self.state.ontology_id)
+            )
         except Exception as e:
             return StepResult(
                 status=StepStatus.FAILED,
@@ -1962,10 +1877,6 @@ class DemoOrchestrator:
                 duration_seconds=time.time() - start,
             )
         
-        entity_name_to_id, entity_id_to_properties, _, existing_entity_binding_ids, _, \
-            existing_nontimeseries_binding_ids, _ = \
-            self._parse_ontology_mappings(ont_definition)
-        
         self._report_progress("bind_static", "in_progress", 30)
         
         # Build bindings
@@ -1973,59 +1884,7 @@ class DemoOrchestrator:
             workspace_id=self.config.fabric.workspace_id,
             ontology_id=self.state.ontology_id,
         )
-        
-        binding_count = 0
-        skipped = []
-        
-        for entity_binding in yaml_config.lakehouse_entities:
-            entity_name = entity_binding.entity_name
-            entity_id = entity_name_to_id.get(entity_name)
-            
-            if not entity_id:
-                logger.warning(f"No entity ID found for '{entity_name}', skipping binding")
-                skipped.append(entity_name)
-                continue
-            
-            # Validate key column is defined
-            if not entity_binding.key_column:
-                logger.warning(f"No key column defined for '{entity_name}', skipping")
-                skipped.append(entity_name)
-                continue
-            
-            # Get property mappings
-            entity_props = entity_id_to_properties.get(entity_id, {})
-            property_mappings = {}
-            
-            for pm in entity_binding.property_mappings:
-                prop_id = entity_props.get(pm.target_property)
-                if prop_id:
-                    property_mappings[pm.source_column] = prop_id
-            
-            if not property_mappings:
-                logger.warning(f"No valid property mappings for '{entity_name}', skipping")
-                skipped.append(entity_name)
-                continue
-            
-            # Reuse existing NonTimeSeries binding ID to update in-place
-            # (Fabric updateDefinition merges; fresh UUIDs create duplicates)
-            existing_binding_id = existing_nontimeseries_binding_ids.get(entity_id)
-            
-            builder.add_lakehouse_binding(
-                entity_type_id=entity_id,
-                lakehouse_id=self.state.lakehouse_id,
-                table_name=entity_binding.table_name,
-                key_column=entity_binding.key_column,
-                property_mappings=property_mappings,
-                binding_id=existing_binding_id,
-            )
-            
-            builder.register_entity_key_property(
-                entity_name,
-                entity_props.get(entity_binding.key_column, entity_binding.key_column)
-            )
-            
-            binding_count += 1
-            logger.info(f"Added static binding: {entity_name} -> {entity_binding.table_name} (key: {entity_binding.key_column})")
+        binding_count, skipped = self._add_static_bindings(builder, yaml_config, parsed_definition)
         
         self._report_progress("bind_static", "in_progress", 70)
         
@@ -2038,12 +1897,10 @@ class DemoOrchestrator:
         
         # Upload bindings
         try:
-            binding_parts = builder.build_definition_parts(ont_definition)
-            self.fabric_client.update_ontology_definition(
-                ontology_id=self.state.ontology_id,
-                definition={"parts": binding_parts},
-            )
-            logger.info(f"Uploaded {binding_count} static bindings")
+            new_definition = builder.build_parsed_definition(parsed_definition)
+            definition_diff = self._commit_binding_parts(parsed_definition, new_definition)
+            if definition_diff.has_changes:
+                logger.info(f"Uploaded {binding_count} static bindings")
         except Exception as e:
             return StepResult(
                 status=StepStatus.FAILED,
@@ -2055,13 +1912,18 @@ class DemoOrchestrator:
         self.state.bindings_configured = True
         self._report_progress("bind_static", "completed", 100)
         
+        message = f"Configured {binding_count} static (lakehouse) bindings"
+        if not definition_diff.has_changes:
+            message += " (unchanged, update skipped)"
+        
         return StepResult(
             status=StepStatus.COMPLETED,
-            message=f"Configured {binding_count} static (lakehouse) bindings",
+            message=message,
             duration_seconds=time.time() - start,
             details={
                 "binding_count": binding_count,
                 "skipped": skipped,
+                "definition_diff": definition_diff.to_dict(),
             }
         )
 
@@ -2073,9 +1935,6 @@ class DemoOrchestrator:
         - Binds eventhouse properties for all entities as per bindings.yaml
         - Validates all timeseries bindings are successful
         """
-        import base64
-        import json
-        
         start = time.time()
         self._check_cancellation()
         self._report_progress("bind_timeseries", "in_progress", 0)
@@ -2105,7 +1964,9 @@ class DemoOrchestrator:
         
         # Get ontology definition
         try:
-            ont_definition = self.fabric_client.get_ontology_definition(self.state.ontology_id)
+            parsed_definition = ParsedDefinition.from_definition(
+                self.fabric_client.get_ontology_definition(self.state.ontology_id)
+            )
         except Exception as e:
             return StepResult(
                 status=StepStatus.FAILED,
@@ -2114,83 +1975,14 @@ class DemoOrchestrator:
                 duration_seconds=time.time() - start,
             )
         
-        entity_name_to_id, entity_id_to_properties, _, existing_entity_binding_ids, _, \
-            _, _ = \
-            self._parse_ontology_mappings(ont_definition)
-        
         self._report_progress("bind_timeseries", "in_progress", 30)
         
-        # Get KQL database name
-        try:
-            kql_db = self.fabric_client.get_kql_database(self.state.kql_database_id)
-            database_name = kql_db.get("displayName", self.config.resources.eventhouse.name)
-        except Exception:
-            database_name = self.config.resources.eventhouse.name
-        cluster_uri = self._get_eventhouse_cluster_uri()
-        
         # Build bindings
         builder = OntologyBindingBuilder(
             workspace_id=self.config.fabric.workspace_id,
             ontology_id=self.state.ontology_id,
         )
-        
-        binding_count = 0
-        skipped = []
-        
-        for entity_binding in yaml_config.eventhouse_entities:
-            entity_name = entity_binding.entity_name
-            entity_id = entity_name_to_id.get(entity_name)
-            
-            if not entity_id:
-                logger.warning(f"No entity ID found for '{entity_name}', skipping")
-                skipped.append(entity_name)
-                continue
-            
-            entity_props = entity_id_to_properties.get(entity_id, {})
-            property_mappings = {}
-            
-            # Include the key column mapping (API requires all entity key properties to be mapped)
-            key_col = entity_binding.key_column
-            key_prop_id = entity_props.get(key_col)
-            if key_prop_id:
-                property_mappings[key_col] = key_prop_id
-            
-            for pm in entity_binding.property_mappings:
-                prop_id = entity_props.get(pm.target_property)
-                if prop_id:
-                    property_mappings[pm.source_column] = prop_id
-            
-            if not property_mappings:
-                logger.warning(f"No valid property mappings for '{entity_name}', skipping")
-                skipped.append(entity_name)
-                continue
-            
-            # Get timestamp column
-            timestamp_col = "Timestamp"
-            for table_config in yaml_config.eventhouse_tables:
-                if table_config.entity_name == entity_name:
-                    timestamp_col = table_config.timestamp_column
-                    break
-            
-            # For timeseries bindings, always generate fresh UUIDs.
-            # The builder's type-aware filter preserves existing static bindings,
-            # so we must not reuse their IDs. On re-run, old timeseries bindings
-            # are filtered out by type and new UUIDs are generated.
-            
-            builder.add_eventhouse_binding(
-                entity_type_id=entity_id,
-                eventhouse_id=self.state.eventhouse_id,
-                database_name=database_name,
-                table_name=entity_binding.table_name,
-                key_column=entity_binding.key_column,
-                timestamp_column=timestamp_col,
-                property_mappings=property_mappings,
-                binding_id=None,  # Always fresh UUID
-                cluster_uri=cluster_uri,
-            )
-            
-            binding_count += 1
-            logger.info(f"Added timeseries binding: {entity_name} -> {entity_binding.table_name}")
+        binding_count, skipped = self._add_timeseries_bindings(builder, yaml_config, parsed_definition)
         
         self._report_progress("bind_timeseries", "in_progress", 70)
         
@@ -2203,12 +1995,10 @@ class DemoOrchestrator:
         
         # Upload bindings
         try:
-            binding_parts = builder.build_definition_parts(ont_definition)
-            self.fabric_client.update_ontology_definition(
-                ontology_id=self.state.ontology_id,
-                definition={"parts": binding_parts},
-            )
-            logger.info(f"Uploaded {binding_count} timeseries bindings")
+            new_definition = builder.build_parsed_definition(parsed_definition)
+            definition_diff = self._commit_binding_parts(parsed_definition, new_definition)
+            if definition_diff.has_changes:
+                logger.info(f"Uploaded {binding_count} timeseries bindings")
         except Exception as e:
             return StepResult(
                 status=StepStatus.FAILED,
@@ -2220,13 +2010,18 @@ class DemoOrchestrator:
         self.state.bindings_configured = True
         self._report_progress("bind_timeseries", "completed", 100)
         
+        message = f"Configured {binding_count} timeseries (eventhouse) bindings"
+        if not definition_diff.has_changes:
+            message += " (unchanged, update skipped)"
+        
         return StepResult(
             status=StepStatus.COMPLETED,
-            message=f"Configured {binding_count} timeseries (eventhouse) bindings",
+            message=message,
             duration_seconds=time.time() - start,
             details={
                 "binding_count": binding_count,
                 "skipped": skipped,
+                "definition_diff": definition_diff.to_dict(),
             }
         )
 
@@ -2238,9 +2033,6 @@ class DemoOrchestrator:
         - Binds all relationships as per bindings.yaml
         - Validates all relationship bindings are successful
         """
-        import base64
-        import json
-        
         start = time.time()
         self._check_cancellation()
         self._report_progress("bind_relationships", "in_progress", 0)
@@ -2270,7 +2062,9 @@ class DemoOrchestrator:
         
         # Get ontology definition
         try:
-            ont_definition = self.fabric_client.get_ontology_definition(self.state.ontology_id)
+            parsed_definition = ParsedDefinition.from_definition(
+                self.fabric_client.get_ontology_definition(self.state.ontology_id)
+            )
         except Exception as e:
             return StepResult(
                 status=StepStatus.FAILED,
@@ -2279,10 +2073,6 @@ class DemoOrchestrator:
                 duration_seconds=time.time() - start,
             )
         
-        entity_name_to_id, entity_id_to_properties, relationship_name_to_id, _, existing_rel_ctx_ids, \
-            _, _ = \
-            self._parse_ontology_mappings(ont_definition)
-        
         self._report_progress("bind_relationships", "in_progress", 30)
         
         # Build contextualizations
@@ -2290,6 +2080,218 @@ class DemoOrchestrator:
             workspace_id=self.config.fabric.workspace_id,
             ontology_id=self.state.ontology_id,
         )
+        binding_count, skipped = self._add_relationship_bindings(builder, yaml_config, parsed_definition)
+        
+        self._report_progress("bind_relationships", "in_progress", 70)
+        
+        if binding_count == 0:
+            return StepResult(
+                status=StepStatus.SKIPPED,
+                message=f"No valid relationship bindings configured (skipped: {', '.join(skipped)})",
+                duration_seconds=time.time() - start,
+            )
+        
+        # Upload bindings
+        try:
+            new_definition = builder.build_parsed_definition(parsed_definition)
+            definition_diff = self._commit_binding_parts(parsed_definition, new_definition)
+            if definition_diff.has_changes:
+                logger.info(f"Uploaded {binding_count} relationship contextualizations")
+        except Exception as e:
+            return StepResult(
+                status=StepStatus.FAILED,
+                message=f"Failed to upload relationship bindings: {e}",
+                error=e,
+                duration_seconds=time.time() - start,
+            )
+        
+        self._report_progress("bind_relationships", "completed", 100)
+        
+        message = f"Configured {binding_count} relationship contextualizations"
+        if not definition_diff.has_changes:
+            message += " (unchanged, update skipped)"
+        
+        return StepResult(
+            status=StepStatus.COMPLETED,
+            message=message,
+            duration_seconds=time.time() - start,
+            details={
+                "binding_count": binding_count,
+                "skipped": skipped,
+                "definition_diff": definition_diff.to_dict(),
+            }
+        )
+
+    def _add_static_bindings(
+        self,
+        builder: OntologyBindingBuilder,
+        yaml_config: YamlBindingsConfig,
+        parsed_definition: ParsedDefinition,
+    ) -> tuple:
+        """
+        Add lakehouse (NonTimeSeries) bindings from bindings.yaml to a builder.
+        
+        Returns:
+            Tuple of (binding_count, skipped_entity_names)
+        """
+        entity_name_to_id, entity_id_to_properties, _, _, _, \
+            existing_nontimeseries_binding_ids, _ = \
+            self._parse_ontology_mappings(parsed_definition)
+        
+        binding_count = 0
+        skipped = []
+        
+        for entity_binding in yaml_config.lakehouse_entities:
+            entity_name = entity_binding.entity_name
+            entity_id = entity_name_to_id.get(entity_name)
+            
+            if not entity_id:
+                logger.warning(f"No entity ID found for '{entity_name}', skipping binding")
+                skipped.append(entity_name)
+                continue
+            
+            # Validate key column is defined
+            if not entity_binding.key_column:
+                logger.warning(f"No key column defined for '{entity_name}', skipping")
+                skipped.append(entity_name)
+                continue
+            
+            # Get property mappings
+            entity_props = entity_id_to_properties.get(entity_id, {})
+            property_mappings = {}
+            
+            for pm in entity_binding.property_mappings:
+                prop_id = entity_props.get(pm.target_property)
+                if prop_id:
+                    property_mappings[pm.source_column] = prop_id
+            
+            if not property_mappings:
+                logger.warning(f"No valid property mappings for '{entity_name}', skipping")
+                skipped.append(entity_name)
+                continue
+            
+            # Reuse existing NonTimeSeries binding ID to update in-place
+            # (Fabric updateDefinition merges; fresh UUIDs create duplicates)
+            existing_binding_id = existing_nontimeseries_binding_ids.get(entity_id)
+            
+            builder.add_lakehouse_binding(
+                entity_type_id=entity_id,
+                lakehouse_id=self.state.lakehouse_id,
+                table_name=entity_binding.table_name,
+                key_column=entity_binding.key_column,
+                property_mappings=property_mappings,
+                binding_id=existing_binding_id,
+            )
+            
+            builder.register_entity_key_property(
+                entity_name,
+                entity_props.get(entity_binding.key_column, entity_binding.key_column)
+            )
+            
+            binding_count += 1
+            logger.info(f"Added static binding: {entity_name} -> {entity_binding.table_name} (key: {entity_binding.key_column})")
+        
+        return binding_count, skipped
+
+    def _add_timeseries_bindings(
+        self,
+        builder: OntologyBindingBuilder,
+        yaml_config: YamlBindingsConfig,
+        parsed_definition: ParsedDefinition,
+    ) -> tuple:
+        """
+        Add eventhouse (TimeSeries) bindings from bindings.yaml to a builder.
+        
+        Returns:
+            Tuple of (binding_count, skipped_entity_names)
+        """
+        entity_name_to_id, entity_id_to_properties, _, _, _, _, _ = \
+            self._parse_ontology_mappings(parsed_definition)
+        
+        # Get KQL database name
+        try:
+            kql_db = self.fabric_client.get_kql_database(self.state.kql_database_id)
+            database_name = kql_db.get("displayName", self.config.resources.eventhouse.name)
+        except Exception:
+            database_name = self.config.resources.eventhouse.name
+        cluster_uri = self._get_eventhouse_cluster_uri()
+        
+        binding_count = 0
+        skipped = []
+        
+        for entity_binding in yaml_config.eventhouse_entities:
+            entity_name = entity_binding.entity_name
+            entity_id = entity_name_to_id.get(entity_name)
+            
+            if not entity_id:
+                logger.warning(f"No entity ID found for '{entity_name}', skipping")
+                skipped.append(entity_name)
+                continue
+            
+            entity_props = entity_id_to_properties.get(entity_id, {})
+            property_mappings = {}
+            
+            # Include the key column mapping (API requires all entity key properties to be mapped)
+            key_col = entity_binding.key_column
+            key_prop_id = entity_props.get(key_col)
+            if key_prop_id:
+                property_mappings[key_col] = key_prop_id
+            
+            for pm in entity_binding.property_mappings:
+                prop_id = entity_props.get(pm.target_property)
+                if prop_id:
+                    property_mappings[pm.source_column] = prop_id
+            
+            if not property_mappings:
+                logger.warning(f"No valid property mappings for '{entity_name}', skipping")
+                skipped.append(entity_name)
+                continue
+            
+            # Get timestamp column
+            timestamp_col = "Timestamp"
+            for table_config in yaml_config.eventhouse_tables:
+                if table_config.entity_name == entity_name:
+                    timestamp_col = table_config.timestamp_column
+                    break
+            
+            # For timeseries bindings, always generate fresh UUIDs.
+            # The builder's type-aware filter preserves existing static bindings,
+            # so we must not reuse their IDs. On re-run, old timeseries bindings
+            # are filtered out by type; the builder keeps the old ID for any
+            # binding whose content is unchanged so the definition diff is empty.
+            
+            builder.add_eventhouse_binding(
+                entity_type_id=entity_id,
+                eventhouse_id=self.state.eventhouse_id,
+                database_name=database_name,
+                table_name=entity_binding.table_name,
+                key_column=entity_binding.key_column,
+                timestamp_column=timestamp_col,
+                property_mappings=property_mappings,
+                binding_id=None,  # Always fresh UUID
+                cluster_uri=cluster_uri,
+            )
+            
+            binding_count += 1
+            logger.info(f"Added timeseries binding: {entity_name} -> {entity_binding.table_name}")
+        
+        return binding_count, skipped
+
+    def _add_relationship_bindings(
+        self,
+        builder: OntologyBindingBuilder,
+        yaml_config: YamlBindingsConfig,
+        parsed_definition: ParsedDefinition,
+    ) -> tuple:
+        """
+        Add lakehouse relationship contextualizations from bindings.yaml to a builder.
+        
+        Returns:
+            Tuple of (contextualization_count, skipped_relationship_names)
+        """
+        entity_name_to_id, entity_id_to_properties, relationship_name_to_id, _, existing_rel_ctx_ids, \
+            _, _ = \
+            self._parse_ontology_mappings(parsed_definition)
         
         binding_count = 0
         skipped = []
@@ -2329,132 +2331,82 @@ class DemoOrchestrator:
             binding_count += 1
             logger.info(f"Added relationship contextualization: {rel_name} -> {rel_binding.table_name}")
         
-        self._report_progress("bind_relationships", "in_progress", 70)
-        
-        if binding_count == 0:
-            return StepResult(
-                status=StepStatus.SKIPPED,
-                message=f"No valid relationship bindings configured (skipped: {', '.join(skipped)})",
-                duration_seconds=time.time() - start,
-            )
-        
-        # Upload bindings
-        try:
-            binding_parts = builder.build_definition_parts(ont_definition)
-            self.fabric_client.update_ontology_definition(
-                ontology_id=self.state.ontology_id,
-                definition={"parts": binding_parts},
-            )
-            logger.info(f"Uploaded {binding_count} relationship contextualizations")
-        except Exception as e:
-            return StepResult(
-                status=StepStatus.FAILED,
-                message=f"Failed to upload relationship bindings: {e}",
-                error=e,
-                duration_seconds=time.time() - start,
-            )
+        return binding_count, skipped
+
+    def _commit_binding_parts(
+        self,
+        existing_definition: ParsedDefinition,
+        new_definition: ParsedDefinition,
+    ) -> DefinitionDiff:
+        """
+        Upload binding parts only if they differ from the fetched definition.
         
-        self._report_progress("bind_relationships", "completed", 100)
+        Parts are compared by path and decoded-payload hash. When nothing
+        changed the updateDefinition LRO is skipped, so re-running a binding
+        step against an already-bound ontology costs a single GET.
         
-        return StepResult(
-            status=StepStatus.COMPLETED,
-            message=f"Configured {binding_count} relationship contextualizations",
-            duration_seconds=time.time() - start,
-            details={
-                "binding_count": binding_count,
-                "skipped": skipped,
-            }
+        Args:
+            existing_definition: Definition fetched at the start of the step
+            new_definition: Merged definition from build_parsed_definition
+            
+        Returns:
+            DefinitionDiff between the fetched and the new parts
+        """
+        definition_diff = existing_definition.diff(new_definition)
+        if not definition_diff.has_changes:
+            logger.info("Ontology definition unchanged, skipping updateDefinition")
+            return definition_diff
+        
+        logger.info(f"Ontology definition diff: {definition_diff.summary()}")
+        # updateDefinition replaces the whole definition, so send every part
+        self.fabric_client.update_ontology_definition(
+            ontology_id=self.state.ontology_id,
+            definition={"parts": new_definition.to_parts()},
         )
+        return definition_diff
 
-    def _parse_ontology_mappings(self, ont_definition: Dict) -> tuple:
+    def _parse_ontology_mappings(self, ont_definition) -> tuple:
         """
         Parse ontology definition to extract entity, relationship, and property mappings.
         
+        Args:
+            ont_definition: getDefinition response or an already-parsed ParsedDefinition
+        
         Returns:
             Tuple of (entity_name_to_id, entity_id_to_properties, relationship_name_to_id, 
-                     existing_entity_binding_ids, existing_rel_ctx_ids)
+                     existing_entity_binding_ids, existing_rel_ctx_ids,
+                     existing_nontimeseries_binding_ids, existing_timeseries_binding_ids)
         """
-        import base64
-        import json
+        parsed = ParsedDefinition.from_definition(ont_definition)
         
-        entity_name_to_id = {}
-        entity_id_to_properties = {}
-        relationship_name_to_id = {}
+        entity_name_to_id = parsed.entity_name_to_id()
+        entity_id_to_properties = {
+            entity_id: parsed.entity_properties(entity_id)
+            for entity_id in entity_name_to_id.values()
+        }
+        relationship_name_to_id = parsed.relationship_name_to_id()
         existing_entity_binding_ids = {}  # entity_id -> binding_id (last one found, legacy)
         existing_rel_ctx_ids = {}
-        # NEW: track binding IDs per type for proper reuse
+        # Track binding IDs per type for proper reuse
         existing_nontimeseries_binding_ids = {}  # entity_id -> binding_id
         existing_timeseries_binding_ids = {}  # entity_id -> [binding_id, ...]
         
-        parts = ont_definition.get("definition", {}).get("parts", [])
-        if not parts:
-            parts = ont_definition.get("parts", [])
-        
-        for part in parts:
-            path = part.get("path", "")
-            payload_b64 = part.get("payload", "")
-            
-            if not payload_b64:
-                continue
-            
-            try:
-                payload_json = base64.b64decode(payload_b64).decode("utf-8")
-                payload = json.loads(payload_json)
-            except Exception:
-                continue
-            
-            # Extract entity type mappings
-            if "EntityTypes/" in path and "DataBindings" not in path:
-                entity_id = payload.get("id", "")
-                entity_name = payload.get("name", "")
-                if entity_id and entity_name:
-                    entity_name_to_id[entity_name] = entity_id
-                    props = {}
-                    for prop in payload.get("properties", []):
-                        prop_name = prop.get("name", "")
-                        prop_id = prop.get("id", "")
-                        if prop_name and prop_id:
-                            props[prop_name] = prop_id
-                    # Also include timeseries properties
-                    for prop in payload.get("timeseriesProperties", []):
-                        prop_name = prop.get("name", "")
-                        prop_id = prop.get("id", "")
-                        if prop_name and prop_id:
-                            props[prop_name] = prop_id
-                    entity_id_to_properties[entity_id] = props
-            
-            # Extract relationship type mappings
-            elif "RelationshipTypes/" in path and "Contextualizations" not in path:
-                rel_id = payload.get("id", "")
-                rel_name = payload.get("name", "")
-                if rel_id and rel_name:
-                    relationship_name_to_id[rel_name] = rel_id
-            
-            # Extract existing binding IDs — track per type
-            elif "/DataBindings/" in path:
-                parts_split = path.split("/")
-                if len(parts_split) >= 4:
-                    entity_id = parts_split[1]
-                    binding_file = parts_split[3]
-                    binding_id = binding_file.replace(".json", "")
-                    existing_entity_binding_ids[entity_id] = binding_id  # legacy
-                    # Determine binding type from payload
-                    binding_type = payload.get("dataBindingConfiguration", {}).get("dataBindingType", "")
-                    if binding_type == "NonTimeSeries":
-                        existing_nontimeseries_binding_ids[entity_id] = binding_id
-                    elif binding_type == "TimeSeries":
-                        if entity_id not in existing_timeseries_binding_ids:
-                            existing_timeseries_binding_ids[entity_id] = []
-                        existing_timeseries_binding_ids[entity_id].append(binding_id)
-            
-            # Extract existing contextualization IDs
-            elif "/Contextualizations/" in path:
-                parts_split = path.split("/")
-                if len(parts_split) >= 4:
-                    rel_id = parts_split[1]
-                    ctx_file = parts_split[3]
-                    ctx_id = ctx_file.replace(".json", "")
-                    existing_rel_ctx_ids[rel_id] = ctx_id
+        for entity_id, binding_parts in parsed.data_bindings.items():
+            for part in binding_parts:
+                existing_entity_binding_ids[entity_id] = part.child_id  # legacy
+                if part.binding_type == "NonTimeSeries":
+                    existing_nontimeseries_binding_ids[entity_id] = part.child_id
+                elif part.binding_type == "TimeSeries":
+                    existing_timeseries_binding_ids.setdefault(entity_id, []).append(part.child_id)
+        
+        for rel_id, ctx_parts in parsed.contextualizations.items():
+            for part in ctx_parts:
+                existing_rel_ctx_ids[rel_id] = part.child_id
+        
+        logger.debug(
+            f"Found {len(entity_name_to_id)} entities, {len(relationship_name_to_id)} relationships, "
+            f"{len(existing_entity_binding_ids)} bound entities, {len(existing_rel_ctx_ids)} contextualizations"
+        )
         
         return (entity_name_to_id, entity_id_to_properties, relationship_name_to_id,
                 existing_entity_binding_ids, existing_rel_ctx_ids,
@@ -2651,21 +2603,18 @@ class DemoOrchestrator:
                         else:
                             checks_passed.append(f"✓ Eventhouse has all {len(expected_eh_tables)} expected tables")
                         
-                        # Check tables have data
+                        # Check tables have data (one batched count query)
                         tables_with_data = {}
                         empty_tables = []
-                        for table_name in existing_eh_tables & expected_eh_tables:
-                            try:
-                                count = self.eventhouse_client.get_table_count(
-                                    eventhouse_id=self.state.eventhouse_id,
-                                    database_name=self.state.kql_database_name,
-                                    table_name=table_name,
-                                )
-                                tables_with_data[table_name] = count
-                                if count == 0:
-                                    empty_tables.append(table_name)
-                            except Exception:
-                                pass
+                        try:
+                            tables_with_data = self.eventhouse_client.get_table_counts(
+                                eventhouse_id=self.state.eventhouse_id,
+                                database_name=self.state.kql_database_name,
+                                tables=sorted(existing_eh_tables & expected_eh_tables),
+                            )
+                            empty_tables = [t for t, count in tables_with_data.items() if count == 0]
+                        except Exception:
+                            pass
                         
                         if empty_tables:
                             checks_warnings.append(f"⚠ Eventhouse tables with no data: {', '.join(empty_tables)}")
@@ -2855,17 +2804,40 @@ class DemoOrchestrator:
             
             self._report_progress("refresh_graph", "in_progress", 30)
             
-            # Trigger refresh job
-            logger.info(f"Triggering refresh for graph: {graph_name}")
+            # Submit the refresh job; this returns as soon as Fabric accepts it
+            handle = self.fabric_client.start_graph_refresh(graph_id)
+            details = {
+                "graph_id": graph_id,
+                "graph_name": graph_name,
+                "refresh_job": handle.to_dict(),
+            }
+            
+            if not self.config.options.wait_for_graph_refresh or not handle.instance_url:
+                details["refresh_status"] = JOB_STATUS_IN_PROGRESS
+                self._report_progress("refresh_graph", "completed", 100)
+                return StepResult(
+                    status=StepStatus.COMPLETED,
+                    message=f"Graph '{graph_name}' refresh started in the background. "
+                            f"Run 'fabric-demo status {self.config.demo_path} --watch' to follow it",
+                    artifact_id=graph_id,
+                    artifact_name=graph_name,
+                    duration_seconds=time.time() - start,
+                    details=details,
+                )
             
-            def progress_callback(status: str, percent: float):
+            def on_update(progress: JobProgress):
+                percent = progress.percent_complete or 0
                 self._report_progress("refresh_graph", "in_progress", 30 + (percent * 0.6))
             
-            result = self.fabric_client.refresh_graph(
-                graph_id=graph_id,
-                timeout_seconds=600,
-                progress_callback=progress_callback,
-            )
+            monitor = JobMonitor(self.fabric_client, handle, on_update=on_update)
+            progress = monitor.wait(timeout=self.config.options.timeout_seconds)
+            details["refresh_status"] = progress.status
+            
+            if not progress.succeeded:
+                raise FabricAPIError(
+                    f"Graph refresh {progress.status.lower()}: "
+                    f"{progress.failure_reason or 'Unknown error'}"
+                )
             
             self._report_progress("refresh_graph", "completed", 100)
             
@@ -2875,11 +2847,7 @@ class DemoOrchestrator:
                 artifact_id=graph_id,
                 artifact_name=graph_name,
                 duration_seconds=time.time() - start,
-                details={
-                    "graph_id": graph_id,
-                    "graph_name": graph_name,
-                    "refresh_result": result,
-                },
+                details=details,
             )
             
         except Exception as e:
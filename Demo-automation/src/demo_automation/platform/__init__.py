@@ -6,6 +6,9 @@ from .fabric_client import FabricClient
 from .onelake_client import OneLakeDataClient
 from .lakehouse_client import LakehouseClient, LoadMode, LoadTableRequest
 from .eventhouse_client import EventhouseClient, KQLTableSchema
+from .resource_discovery import ResourceDiscovery, ResourceSnapshot
+from .job_monitor import JobHandle, JobMonitor, JobProgress
+from .shared_clients import SharedClients
 
 __all__ = [
     "FabricClient",
@@ -15,4 +18,10 @@ __all__ = [
     "LoadTableRequest",
     "EventhouseClient",
     "KQLTableSchema",
+    "ResourceDiscovery",
+    "ResourceSnapshot",
+    "JobHandle",
+    "JobMonitor",
+    "JobProgress",
+    "SharedClients",
 ]
@@ -8,7 +8,7 @@ using the Kusto REST API.
 import base64
 import logging
 import time
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Union
 from dataclasses import dataclass
 
 import requests
@@ -20,6 +20,10 @@ from demo_automation.core.errors import FabricAPIError, LROTimeoutError
 logger = logging.getLogger(__name__)
 
 
+# HTTP timeout for synchronous .ingest commands (large multi-file ingestions)
+INGEST_COMMAND_TIMEOUT = 900
+
+
 @dataclass
 class KQLTableSchema:
     """Schema definition for a KQL table."""
@@ -54,7 +58,7 @@ class EventhouseClient:
         """
         self.fabric = fabric_client
         self.workspace_id = workspace_id
-        self._kusto_tokens: Dict[str, str] = {}
+        self._kusto_endpoints: Dict[str, str] = {}
 
     def create_eventhouse(
         self,
@@ -197,7 +201,10 @@ class EventhouseClient:
     # --- Kusto Query/Management Operations ---
 
     def _get_kusto_endpoint(self, eventhouse_id: str) -> str:
-        """Get the Kusto query endpoint for an Eventhouse."""
+        """Get the Kusto query endpoint for an Eventhouse (cached per eventhouse)."""
+        if eventhouse_id in self._kusto_endpoints:
+            return self._kusto_endpoints[eventhouse_id]
+
         eventhouse = self.get_eventhouse(eventhouse_id)
         properties = eventhouse.get("properties", {})
 
@@ -207,6 +214,7 @@ class EventhouseClient:
                 "Could not determine Kusto query endpoint",
                 details={"eventhouse_id": eventhouse_id},
             )
+        self._kusto_endpoints[eventhouse_id] = query_uri
         return query_uri
 
     def _get_kusto_token(self, endpoint: str) -> str:
@@ -214,17 +222,15 @@ class EventhouseClient:
         # Kusto uses its own scope
         scope = f"{endpoint}/.default"
 
-        if scope not in self._kusto_tokens:
-            token = self.fabric._credential.get_token(scope)
-            self._kusto_tokens[scope] = token.token
-
-        return self._kusto_tokens[scope]
+        # Shared, expiry-aware cache: long bulk ingestions outlive a single token
+        return self.fabric._token_cache.get_token(scope)
 
     def execute_kql_management(
         self,
         eventhouse_id: str,
         database_name: str,
         command: str,
+        timeout: int = 120,
     ) -> Dict[str, Any]:
         """
         Execute a KQL management command (e.g., .create-merge table).
@@ -233,6 +239,7 @@ class EventhouseClient:
             eventhouse_id: Eventhouse ID
             database_name: Database name
             command: KQL management command
+            timeout: HTTP timeout in seconds
 
         Returns:
             Command result
@@ -251,7 +258,7 @@ class EventhouseClient:
         }
 
         logger.debug(f"Executing KQL management: {command[:100]}...")
-        response = requests.post(mgmt_url, json=body, headers=headers, timeout=120)
+        response = requests.post(mgmt_url, json=body, headers=headers, timeout=timeout)
 
         if response.status_code != 200:
             raise FabricAPIError(
@@ -325,6 +332,30 @@ class EventhouseClient:
             command=command,
         )
 
+    def clear_table_data(
+        self,
+        eventhouse_id: str,
+        database_name: str,
+        table_name: str,
+    ) -> Dict[str, Any]:
+        """
+        Delete all rows from a table, keeping its schema and mappings.
+
+        Args:
+            eventhouse_id: Eventhouse ID
+            database_name: Database name
+            table_name: Table name to clear
+
+        Returns:
+            Command result
+        """
+        command = f".clear table {table_name} data"
+        return self.execute_kql_management(
+            eventhouse_id=eventhouse_id,
+            database_name=database_name,
+            command=command,
+        )
+
     def create_table(
         self,
         eventhouse_id: str,
@@ -388,7 +419,7 @@ class EventhouseClient:
         eventhouse_id: str,
         database_name: str,
         table_name: str,
-        onelake_path: str,
+        onelake_path: Union[str, List[str]],
         file_format: str = "csv",
         ignore_first_record: bool = True,
         mapping_name: Optional[str] = None,
@@ -400,14 +431,17 @@ class EventhouseClient:
             eventhouse_id: Eventhouse ID
             database_name: Database name
             table_name: Target table name
-            onelake_path: Full OneLake path to the data file
+            onelake_path: Full OneLake path to the data file, or a list of
+                          paths ingested by a single multi-URI command
             file_format: File format (csv, parquet, json)
-            ignore_first_record: Skip header row for CSV
+            ignore_first_record: Skip header row for CSV (of every file)
             mapping_name: Optional ingestion mapping name
 
         Returns:
             Ingestion result
         """
+        paths = [onelake_path] if isinstance(onelake_path, str) else list(onelake_path)
+
         with_options = [f"format='{file_format}'"]
         if ignore_first_record:
             with_options.append("ignoreFirstRecord=true")
@@ -415,13 +449,15 @@ class EventhouseClient:
             with_options.append(f"ingestionMapping='{mapping_name}'")
 
         with_clause = ", ".join(with_options)
-        command = f".ingest into table {table_name} (h'{onelake_path}') with ({with_clause})"
+        sources = ", ".join(f"h'{path}'" for path in paths)
+        command = f".ingest into table {table_name} ({sources}) with ({with_clause})"
 
-        logger.info(f"Ingesting data into {table_name} from {onelake_path}")
+        logger.info(f"Ingesting data into {table_name} from {len(paths)} OneLake file(s)")
         return self.execute_kql_management(
             eventhouse_id=eventhouse_id,
             database_name=database_name,
             command=command,
+            timeout=INGEST_COMMAND_TIMEOUT,
         )
 
     def list_tables(
@@ -457,6 +493,75 @@ class EventhouseClient:
 
         return tables
 
+    def get_table_row_counts(
+        self,
+        eventhouse_id: str,
+        database_name: str,
+    ) -> Dict[str, int]:
+        """
+        Get row counts for all tables in a KQL database with one command.
+
+        Uses ``.show tables details`` (extent metadata), so the cost does not
+        grow with the number of tables.
+
+        Args:
+            eventhouse_id: Eventhouse ID
+            database_name: Database name
+
+        Returns:
+            Dict mapping table name to row count
+
+        Raises:
+            ValueError: If the response does not have the expected shape
+        """
+        result = self.execute_kql_management(
+            eventhouse_id=eventhouse_id,
+            database_name=database_name,
+            command=".show tables details | project TableName, TotalRowCount",
+        )
+
+        counts: Dict[str, int] = {}
+        try:
+            for frame in result.get("Tables", [])[:1]:
+                for row in frame.get("Rows", []):
+                    if row:
+                        counts[row[0]] = int(row[1] or 0)
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError) as e:
+            logger.debug(f"Unexpected .show tables details response: {result!r:.500}")
+            raise ValueError(f"Malformed table details response: {e}") from e
+
+        return counts
+
+    def get_table_counts(
+        self,
+        eventhouse_id: str,
+        database_name: str,
+        tables: List[str],
+    ) -> Dict[str, int]:
+        """
+        Get row counts for several tables with a single command.
+
+        Filters the result of :meth:`get_table_row_counts` instead of running
+        one ``T | count`` query per table.
+
+        Args:
+            eventhouse_id: Eventhouse ID
+            database_name: Database name
+            tables: Table names
+
+        Returns:
+            Dict mapping each requested table name to its row count
+            (0 for tables not in the database)
+
+        Raises:
+            ValueError: If the response does not have the expected shape
+        """
+        if not tables:
+            return {}
+
+        counts = self.get_table_row_counts(eventhouse_id, database_name)
+        return {table: counts.get(table, 0) for table in tables}
+
     def get_table_count(
         self,
         eventhouse_id: str,
@@ -17,11 +17,13 @@ Note on Ontology Operations:
 """
 
 import logging
+import threading
 import time
 from typing import Optional, Dict, Any, List, Callable
 from dataclasses import dataclass
 
 import requests
+from azure.core.credentials import TokenCredential
 from azure.identity import (
     DefaultAzureCredential,
     InteractiveBrowserCredential,
@@ -42,6 +44,7 @@ from demo_automation.core.errors import (
     ResourceExistsError,
     ResourceNotFoundError,
 )
+from .job_monitor import JobHandle, JobMonitor, JobProgress
 
 
 logger = logging.getLogger(__name__)
@@ -91,6 +94,7 @@ class TokenBucketRateLimiter:
             # Fallback to simple implementation
             self.tokens = burst
             self.last_refill = time.monotonic()
+            self._lock = threading.Lock()
             self._use_sdk = False
 
     def acquire(self, tokens: int = 1) -> None:
@@ -98,19 +102,22 @@ class TokenBucketRateLimiter:
         if self._use_sdk:
             self._sdk_limiter.acquire(tokens=tokens)
         else:
-            # Simple fallback implementation
-            now = time.monotonic()
-            elapsed = now - self.last_refill
-            self.tokens = min(self.burst, self.tokens + elapsed * (self.rate / self.per))
-            self.last_refill = now
-
-            if self.tokens < tokens:
-                sleep_time = (tokens - self.tokens) * (self.per / self.rate)
-                logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-                self.tokens = 0
-            else:
-                self.tokens -= tokens
+            # Simple fallback implementation (lock held while sleeping so
+            # concurrent callers queue up instead of overdrawing the bucket)
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self.last_refill
+                self.tokens = min(self.burst, self.tokens + elapsed * (self.rate / self.per))
+                self.last_refill = now
+
+                if self.tokens < tokens:
+                    sleep_time = (tokens - self.tokens) * (self.per / self.rate)
+                    logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
+                    time.sleep(sleep_time)
+                    self.tokens = 0
+                    self.last_refill = time.monotonic()
+                else:
+                    self.tokens -= tokens
     
     def handle_retry_after(self, seconds: float) -> None:
         """Honor a Retry-After header from API response."""
@@ -122,6 +129,58 @@ class TokenBucketRateLimiter:
             time.sleep(seconds)
 
 
+def create_credential(
+    tenant_id: Optional[str] = None,
+    client_id: Optional[str] = None,
+    client_secret: Optional[str] = None,
+    use_interactive_auth: bool = True,
+) -> TokenCredential:
+    """
+    Create the Azure credential for the configured authentication method.
+
+    Service principal if client ID/secret and tenant are given, otherwise
+    interactive browser auth or the default credential chain.
+    """
+    if client_id and client_secret and tenant_id:
+        logger.info("Using Service Principal authentication")
+        return ClientSecretCredential(
+            tenant_id=tenant_id,
+            client_id=client_id,
+            client_secret=client_secret,
+        )
+    if use_interactive_auth:
+        logger.info("Using Interactive Browser authentication")
+        return InteractiveBrowserCredential(tenant_id=tenant_id)
+    logger.info("Using Default Azure Credential chain")
+    return DefaultAzureCredential()
+
+
+class TokenCache:
+    """
+    Thread-safe access token cache for one Azure credential.
+
+    A FabricClient creates its own cache by default; clients that share a
+    cache (e.g. the demos of ``fabric-demo setup-many``) sign in once and
+    refresh each token once, however many threads request it.
+    """
+
+    def __init__(self, credential: TokenCredential):
+        self.credential = credential
+        self._tokens: Dict[str, tuple] = {}  # scope -> (token, expires_on)
+        self._lock = threading.Lock()
+
+    def get_token(self, scope: str = FABRIC_SCOPE) -> str:
+        """Get a valid access token for a scope, refreshing if needed."""
+        with self._lock:
+            cached = self._tokens.get(scope)
+            if cached and time.time() < cached[1] - 60:  # 60s buffer
+                return cached[0]
+
+            token = self.credential.get_token(scope)
+            self._tokens[scope] = (token.token, token.expires_on)
+            return token.token
+
+
 class FabricClient:
     """
     Base client for Microsoft Fabric REST APIs.
@@ -141,6 +200,8 @@ class FabricClient:
         client_secret: Optional[str] = None,
         use_interactive_auth: bool = True,
         rate_limit_config: Optional[RateLimitConfig] = None,
+        token_cache: Optional["TokenCache"] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
     ):
         """
         Initialize the Fabric client.
@@ -152,30 +213,29 @@ class FabricClient:
             client_secret: Service principal client secret (optional)
             use_interactive_auth: Use interactive browser auth if no SP credentials
             rate_limit_config: Rate limiting configuration
+            token_cache: Shared token cache (its credential replaces the
+                         tenant/client arguments)
+            rate_limiter: Shared rate limiter (replaces rate_limit_config)
         """
         self.workspace_id = workspace_id
         self.tenant_id = tenant_id
-        self._token: Optional[str] = None
-        self._token_expiry: float = 0
 
         # Setup credential
-        if client_id and client_secret and tenant_id:
-            self._credential = ClientSecretCredential(
+        if token_cache is None:
+            token_cache = TokenCache(create_credential(
                 tenant_id=tenant_id,
                 client_id=client_id,
                 client_secret=client_secret,
-            )
-            logger.info("Using Service Principal authentication")
-        elif use_interactive_auth:
-            self._credential = InteractiveBrowserCredential(tenant_id=tenant_id)
-            logger.info("Using Interactive Browser authentication")
-        else:
-            self._credential = DefaultAzureCredential()
-            logger.info("Using Default Azure Credential chain")
+                use_interactive_auth=use_interactive_auth,
+            ))
+        self._token_cache = token_cache
+        self._credential = token_cache.credential
 
         # Setup rate limiter
         self._rate_limit_config = rate_limit_config or RateLimitConfig()
-        if self._rate_limit_config.enabled:
+        if rate_limiter is not None:
+            self._rate_limiter = rate_limiter
+        elif self._rate_limit_config.enabled:
             self._rate_limiter = TokenBucketRateLimiter(
                 rate=self._rate_limit_config.requests_per_minute,
                 per=60.0,
@@ -189,15 +249,8 @@ class FabricClient:
 
     def _get_token(self) -> str:
         """Get a valid access token, refreshing if needed."""
-        now = time.time()
-        if self._token and now < self._token_expiry - 60:  # 60s buffer
-            return self._token
-
         try:
-            token = self._credential.get_token(FABRIC_SCOPE)
-            self._token = token.token
-            self._token_expiry = token.expires_on
-            return self._token
+            return self._token_cache.get_token(FABRIC_SCOPE)
         except Exception as e:
             raise AuthenticationError(f"Failed to acquire token: {e}", cause=e)
 
@@ -847,6 +900,65 @@ class FabricClient:
         
         return None
 
+    # --- Job Scheduler Operations ---
+
+    def start_item_job(self, item_id: str, job_type: str = "DefaultJob") -> JobHandle:
+        """
+        Submit an on-demand job for an item without waiting for it.
+
+        POST /workspaces/{workspaceId}/items/{itemId}/jobs/{jobType}/instances
+
+        Args:
+            item_id: Item ID (GUID)
+            job_type: Job type (e.g. DefaultJob)
+
+        Returns:
+            JobHandle with the job instance URL (from the Location header)
+        """
+        url = self._build_url(f"items/{item_id}/jobs/{job_type}/instances")
+        response = self._make_request("POST", url)
+
+        if response.status_code != 202:
+            self._handle_response(response)
+
+        handle = JobHandle(
+            item_id=item_id,
+            job_type=job_type,
+            instance_url=response.headers.get("Location"),
+            retry_after=int(response.headers.get("Retry-After", 30)),
+        )
+        logger.info(f"{job_type} job started for item {item_id}, tracking at: {handle.instance_url}")
+        return handle
+
+    def get_job_instance(self, instance_url: str) -> Dict[str, Any]:
+        """
+        Get the current state of a job instance.
+
+        Args:
+            instance_url: Job instance URL (JobHandle.instance_url)
+
+        Returns:
+            Job instance (status, startTimeUtc, endTimeUtc, failureReason, ...)
+        """
+        response = self._make_request("GET", instance_url)
+        return self._handle_response(response)
+
+    def start_graph_refresh(self, graph_id: str) -> JobHandle:
+        """
+        Trigger an on-demand refresh job for a graph item and return immediately.
+
+        Use ``JobMonitor`` to follow the job, or persist ``handle.to_dict()``
+        and attach later.
+
+        Args:
+            graph_id: Graph item ID (GUID)
+
+        Returns:
+            JobHandle for the refresh job
+        """
+        logger.info(f"Triggering refresh for graph: {graph_id}")
+        return self.start_item_job(graph_id, job_type="DefaultJob")
+
     def refresh_graph(
         self,
         graph_id: str,
@@ -854,9 +966,9 @@ class FabricClient:
         progress_callback: Optional[Callable[[str, float], None]] = None,
     ) -> Dict[str, Any]:
         """
-        Trigger an on-demand refresh job for a graph item.
+        Trigger an on-demand refresh job for a graph item and wait for it.
         
-        This uses the Fabric Job Scheduler API to run a refresh job.
+        Blocking wrapper around ``start_graph_refresh`` + ``JobMonitor``.
         
         Args:
             graph_id: Graph item ID (GUID)
@@ -865,32 +977,25 @@ class FabricClient:
             
         Returns:
             Job result or status
+
+        Raises:
+            LROTimeoutError: If the job does not finish within the timeout
+            FabricAPIError: If the job fails or is cancelled
         """
-        logger.info(f"Triggering refresh for graph: {graph_id}")
-        
-        # Use the job scheduler API to run on-demand refresh
-        # POST /workspaces/{workspaceId}/items/{itemId}/jobs/{jobType}/instances
-        url = self._build_url(f"items/{graph_id}/jobs/DefaultJob/instances")
-        
-        response = self._make_request("POST", url)
-        
-        if response.status_code == 202:
-            # Job accepted, get the location header for status tracking
-            operation_url = response.headers.get("Location")
-            retry_after = int(response.headers.get("Retry-After", 60))
-            
-            if operation_url:
-                logger.info(f"Graph refresh job started, tracking at: {operation_url}")
-                return self._wait_for_lro(
-                    operation_url,
-                    timeout_seconds=timeout_seconds,
-                    progress_callback=progress_callback,
-                    poll_interval=retry_after,
-                )
-            else:
-                return {"status": "accepted", "message": "Refresh job started"}
-        
-        return self._handle_response(response)
+        handle = self.start_graph_refresh(graph_id)
+        if not handle.instance_url:
+            return {"status": "accepted", "message": "Refresh job started"}
+
+        def on_update(progress: JobProgress) -> None:
+            if progress_callback:
+                progress_callback(progress.status, progress.percent_complete or 0)
+
+        progress = JobMonitor(self, handle, on_update=on_update).wait(timeout=timeout_seconds)
+        if not progress.succeeded:
+            raise FabricAPIError(
+                f"Graph refresh {progress.status.lower()}: {progress.failure_reason or 'Unknown error'}"
+            )
+        return progress.result
 
     def close(self) -> None:
         """Close the client and release resources."""
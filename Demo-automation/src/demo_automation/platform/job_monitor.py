@@ -0,0 +1,249 @@
+"""
+Non-blocking monitoring of Fabric item jobs (e.g. graph refresh).
+
+``FabricClient.start_graph_refresh`` submits a job and returns a ``JobHandle``
+immediately. A ``JobMonitor`` polls the job instance on a background thread
+with exponential backoff (starting from the service's Retry-After), so callers
+can either block on ``wait()``, stream progress through a callback, or persist
+the handle and re-attach later (``fabric-demo status --watch``).
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
+
+from demo_automation.core.errors import FabricAPIError, LROTimeoutError
+
+if TYPE_CHECKING:
+    from .fabric_client import FabricClient
+
+
+logger = logging.getLogger(__name__)
+
+
+# Job instance statuses reported by the Fabric Job Scheduler API
+JOB_STATUS_NOT_STARTED = "NotStarted"
+JOB_STATUS_IN_PROGRESS = "InProgress"
+JOB_STATUS_COMPLETED = "Completed"
+JOB_STATUS_FAILED = "Failed"
+JOB_STATUS_CANCELLED = "Cancelled"
+JOB_STATUS_DEDUPED = "Deduped"
+
+JOB_TERMINAL_STATUSES = (
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    JOB_STATUS_CANCELLED,
+    JOB_STATUS_DEDUPED,
+)
+
+# LRO-style spellings sometimes returned by the same endpoints
+_STATUS_ALIASES = {
+    "notstarted": JOB_STATUS_NOT_STARTED,
+    "running": JOB_STATUS_IN_PROGRESS,
+    "inprogress": JOB_STATUS_IN_PROGRESS,
+    "completed": JOB_STATUS_COMPLETED,
+    "succeeded": JOB_STATUS_COMPLETED,
+    "failed": JOB_STATUS_FAILED,
+    "cancelled": JOB_STATUS_CANCELLED,
+    "canceled": JOB_STATUS_CANCELLED,
+    "deduped": JOB_STATUS_DEDUPED,
+}
+
+
+def normalize_job_status(status: Optional[str]) -> str:
+    """Map a job/LRO status string onto the Job Scheduler spelling."""
+    if not status:
+        return JOB_STATUS_NOT_STARTED
+    return _STATUS_ALIASES.get(status.replace("_", "").lower(), status)
+
+
+@dataclass
+class JobHandle:
+    """Reference to a submitted job instance (serializable into setup state)."""
+    item_id: str
+    job_type: str
+    instance_url: Optional[str]
+    retry_after: int = 30
+    started_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary for state persistence."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobHandle":
+        """Create from a persisted dictionary."""
+        return cls(
+            item_id=data["item_id"],
+            job_type=data.get("job_type", "DefaultJob"),
+            instance_url=data.get("instance_url"),
+            retry_after=int(data.get("retry_after", 30)),
+            started_at=data.get("started_at", ""),
+        )
+
+
+@dataclass
+class JobProgress:
+    """Latest observed state of a job instance."""
+    status: str = JOB_STATUS_NOT_STARTED
+    percent_complete: Optional[float] = None
+    failure_reason: Optional[str] = None
+    polls: int = 0
+    result: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in JOB_TERMINAL_STATUSES
+
+    @property
+    def succeeded(self) -> bool:
+        # Deduped means an equivalent job already ran; the item is up to date
+        return self.status in (JOB_STATUS_COMPLETED, JOB_STATUS_DEDUPED)
+
+
+class JobMonitor:
+    """
+    Background poller for a single job instance.
+
+    Example:
+        handle = client.start_graph_refresh(graph_id)
+        monitor = JobMonitor(client, handle, on_update=print).start()
+        progress = monitor.wait(timeout=600)
+    """
+
+    def __init__(
+        self,
+        fabric_client: "FabricClient",
+        handle: JobHandle,
+        min_poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        backoff_factor: float = 1.5,
+        on_update: Optional[Callable[[JobProgress], None]] = None,
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            fabric_client: Fabric client used for polling
+            handle: Job handle returned when the job was submitted
+            min_poll_interval: Shortest delay between polls (seconds)
+            max_poll_interval: Longest delay between polls (seconds)
+            backoff_factor: Multiplier applied to the delay after each poll
+            on_update: Optional callback invoked with every polled JobProgress
+        """
+        self.fabric = fabric_client
+        self.handle = handle
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff_factor = backoff_factor
+        self.on_update = on_update
+
+        self._progress = JobProgress()
+        self._error: Optional[Exception] = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def progress(self) -> JobProgress:
+        """Latest observed progress (safe to read from any thread)."""
+        with self._lock:
+            return self._progress
+
+    @property
+    def done(self) -> bool:
+        """Whether the job reached a terminal status (or polling failed)."""
+        return self._done.is_set()
+
+    def poll_once(self) -> JobProgress:
+        """Fetch the job instance once and record its progress."""
+        if not self.handle.instance_url:
+            # Job was accepted without a tracking URL; nothing to poll
+            progress = JobProgress(status=JOB_STATUS_IN_PROGRESS, polls=self._progress.polls + 1)
+        else:
+            instance = self.fabric.get_job_instance(self.handle.instance_url)
+            failure = instance.get("failureReason") or instance.get("error") or {}
+            progress = JobProgress(
+                status=normalize_job_status(instance.get("status")),
+                percent_complete=instance.get("percentComplete"),
+                failure_reason=failure.get("message") if isinstance(failure, dict) else str(failure),
+                polls=self._progress.polls + 1,
+                result=instance,
+            )
+
+        with self._lock:
+            self._progress = progress
+        if self.on_update:
+            try:
+                self.on_update(progress)
+            except Exception as e:
+                logger.debug(f"Job progress callback failed: {e}")
+        return progress
+
+    def start(self) -> "JobMonitor":
+        """Start polling on a daemon thread. Returns self for chaining."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"job-monitor-{self.handle.item_id[:8]}",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop polling (the job itself keeps running in Fabric)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def wait(self, timeout: Optional[float] = None) -> JobProgress:
+        """
+        Block until the job reaches a terminal status.
+
+        Starts the monitor if it is not running yet.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Final JobProgress
+
+        Raises:
+            LROTimeoutError: If the job is still running after ``timeout``
+            FabricAPIError: If polling the job instance failed
+        """
+        self.start()
+        if not self._done.wait(timeout):
+            self._stop.set()
+            raise LROTimeoutError(
+                f"Job {self.handle.job_type} on {self.handle.item_id} still "
+                f"{self.progress.status} after {timeout:.0f}s",
+                operation_id=self.handle.instance_url,
+                elapsed_seconds=timeout,
+            )
+        if self._error is not None:
+            raise self._error
+        return self.progress
+
+    def _run(self) -> None:
+        # Honor the service's Retry-After for the first poll, then back off
+        delay = min(max(float(self.handle.retry_after), self.min_poll_interval), self.max_poll_interval)
+        try:
+            while not self._stop.is_set():
+                progress = self.poll_once()
+                if progress.is_terminal or not self.handle.instance_url:
+                    break
+                if self._stop.wait(delay):
+                    break
+                delay = min(delay * self.backoff_factor, self.max_poll_interval)
+        except Exception as e:
+            logger.debug(f"Polling job {self.handle.instance_url} failed: {e}")
+            self._error = e if isinstance(e, FabricAPIError) else FabricAPIError(
+                f"Polling job failed: {e}"
+            )
+        finally:
+            self._done.set()
@@ -0,0 +1,201 @@
+"""
+Concurrent discovery of a demo's Fabric resources.
+
+Used by ``fabric-demo status`` and ``fabric-demo recover`` to build a complete
+resource snapshot without issuing one lookup at a time:
+
+1. List lakehouses, eventhouses, KQL databases, ontologies and graphs in
+   parallel, then match the demo's resources by exact name or prefix.
+2. Fetch per-resource details in parallel: lakehouse tables, KQL table row
+   counts (a single ``.show tables details`` command instead of one
+   ``| count`` query per table) and ontology entity/binding counts.
+
+The wall time is therefore about two API round trips, regardless of the
+number of resources and tables.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .fabric_client import FabricClient
+from .lakehouse_client import LakehouseClient
+from .eventhouse_client import EventhouseClient
+
+
+logger = logging.getLogger(__name__)
+
+
+# Resource kinds in display order, with the FabricClient list method for each
+RESOURCE_LISTERS = {
+    "lakehouse": "list_lakehouses",
+    "eventhouse": "list_eventhouses",
+    "kql_database": "list_kql_databases",
+    "ontology": "list_ontologies",
+    "graph": "list_graphs",
+}
+
+
+@dataclass
+class ResourceSnapshot:
+    """Resources of one demo found in a workspace, with optional details."""
+    resources: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    lakehouse_tables: Optional[List[str]] = None
+    kql_table_counts: Optional[Dict[str, int]] = None
+    ontology_entity_count: Optional[int] = None
+    ontology_binding_count: Optional[int] = None
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def get(self, kind: str) -> Optional[Dict[str, Any]]:
+        """Get the matched item for a resource kind (None if not found)."""
+        return self.resources.get(kind)
+
+    def to_state_resources(self) -> Dict[str, Dict[str, Any]]:
+        """Resource IDs/names in the format used by ``SetupStateManager.recover_from_fabric``."""
+        return {
+            kind: {"id": item.get("id"), "name": item.get("displayName")}
+            for kind, item in self.resources.items()
+            if kind != "graph"
+        }
+
+
+def _match_item(
+    items: List[Dict[str, Any]],
+    name: Optional[str],
+    prefix: Optional[str],
+) -> Optional[Dict[str, Any]]:
+    """Find an item by exact display name, falling back to a name prefix."""
+    if name:
+        for item in items:
+            if item.get("displayName") == name:
+                return item
+    if prefix:
+        for item in items:
+            if item.get("displayName", "").startswith(prefix):
+                return item
+    return None
+
+
+class ResourceDiscovery:
+    """
+    Fan-out discovery of a demo's resources in a Fabric workspace.
+
+    Example:
+        discovery = ResourceDiscovery(client)
+        snapshot = discovery.discover(
+            names={"lakehouse": "MyDemo_Lakehouse", "ontology": "MyDemo_Ontology"},
+        )
+    """
+
+    def __init__(self, fabric_client: FabricClient, max_workers: int = 6):
+        """
+        Initialize resource discovery.
+
+        Args:
+            fabric_client: Fabric client (shared by all worker threads)
+            max_workers: Maximum concurrent API calls
+        """
+        self.fabric = fabric_client
+        self.max_workers = max_workers
+
+    def discover(
+        self,
+        names: Optional[Dict[str, str]] = None,
+        prefix: Optional[str] = None,
+        include_details: bool = True,
+    ) -> ResourceSnapshot:
+        """
+        Discover resources and (optionally) their table and entity details.
+
+        Args:
+            names: Expected display name per resource kind (exact match)
+            prefix: Display name prefix used when no exact match is found
+                    (e.g. the demo name, as used by ``recover``)
+            include_details: Also fetch table lists, KQL row counts and
+                             ontology entity counts
+
+        Returns:
+            ResourceSnapshot with matched items, details and per-lookup errors
+        """
+        names = names or {}
+        snapshot = ResourceSnapshot()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Phase 1: list every resource type at once
+            listings = self._run_all(executor, snapshot, {
+                kind: getattr(self.fabric, lister)
+                for kind, lister in RESOURCE_LISTERS.items()
+            })
+
+            for kind, items in listings.items():
+                match_prefix = prefix
+                if kind == "graph" and names.get("ontology"):
+                    # Graph items are named {OntologyName}_graph_{ontologyId}
+                    match_prefix = f"{names['ontology']}_graph_"
+                item = _match_item(items or [], names.get(kind), match_prefix)
+                if item:
+                    snapshot.resources[kind] = item
+
+            if not include_details:
+                return snapshot
+
+            # Phase 2: per-resource details, all at once
+            detail_tasks: Dict[str, Callable[[], Any]] = {}
+            lakehouse = snapshot.get("lakehouse")
+            if lakehouse:
+                detail_tasks["lakehouse_tables"] = lambda: self._lakehouse_tables(lakehouse["id"])
+            eventhouse = snapshot.get("eventhouse")
+            if eventhouse:
+                kql_db = snapshot.get("kql_database")
+                database_name = kql_db.get("displayName") if kql_db else eventhouse.get("displayName")
+                detail_tasks["kql_table_counts"] = lambda: self._kql_table_counts(
+                    eventhouse["id"], database_name
+                )
+            ontology = snapshot.get("ontology")
+            if ontology:
+                detail_tasks["ontology_counts"] = lambda: self._ontology_counts(ontology["id"])
+
+            details = self._run_all(executor, snapshot, detail_tasks)
+
+        if "lakehouse_tables" in details:
+            snapshot.lakehouse_tables = details["lakehouse_tables"]
+        if "kql_table_counts" in details:
+            snapshot.kql_table_counts = details["kql_table_counts"]
+        if "ontology_counts" in details:
+            snapshot.ontology_entity_count, snapshot.ontology_binding_count = details["ontology_counts"]
+
+        return snapshot
+
+    @staticmethod
+    def _run_all(
+        executor: ThreadPoolExecutor,
+        snapshot: ResourceSnapshot,
+        tasks: Dict[str, Callable[[], Any]],
+    ) -> Dict[str, Any]:
+        """Run tasks concurrently; failed lookups are recorded in ``snapshot.errors``."""
+        futures = {key: executor.submit(task) for key, task in tasks.items()}
+        results: Dict[str, Any] = {}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                logger.debug(f"Discovery lookup '{key}' failed: {e}")
+                snapshot.errors[key] = str(e)
+        return results
+
+    def _lakehouse_tables(self, lakehouse_id: str) -> List[str]:
+        lh_client = LakehouseClient(fabric_client=self.fabric, workspace_id=self.fabric.workspace_id)
+        return [t.get("name", "") for t in lh_client.list_tables(lakehouse_id)]
+
+    def _kql_table_counts(self, eventhouse_id: str, database_name: str) -> Dict[str, int]:
+        eh_client = EventhouseClient(fabric_client=self.fabric, workspace_id=self.fabric.workspace_id)
+        return eh_client.get_table_row_counts(eventhouse_id, database_name)
+
+    def _ontology_counts(self, ontology_id: str) -> tuple:
+        # Imported lazily: the binding package is only needed for this lookup
+        from ..binding.parsed_definition import ParsedDefinition
+
+        parsed = ParsedDefinition.from_definition(self.fabric.get_ontology_definition(ontology_id))
+        binding_count = sum(len(b) for b in parsed.data_bindings.values())
+        return len(parsed.entities), binding_count
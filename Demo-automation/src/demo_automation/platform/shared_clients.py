@@ -0,0 +1,95 @@
+"""
+Authentication and rate limiting shared by concurrent orchestrators.
+
+``fabric-demo setup-many`` runs several ``DemoOrchestrator`` instances in one
+process. Each orchestrator still gets its own ``FabricClient`` (and HTTP
+session), but they draw on:
+
+- one ``TokenCache`` per (tenant, auth method), so the user signs in once and
+  tokens are refreshed once for all demos;
+- one rate limiter per workspace, so demos deploying to the same workspace
+  share its request budget while different workspaces are throttled
+  independently.
+"""
+
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from .fabric_client import (
+    FabricClient,
+    RateLimitConfig,
+    TokenBucketRateLimiter,
+    TokenCache,
+    create_credential,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class SharedClients:
+    """
+    Registry of token caches and workspace rate limiters.
+
+    Example:
+        shared = SharedClients(RateLimitConfig(requests_per_minute=30))
+        client_a = shared.create_fabric_client("workspace-a")
+        client_b = shared.create_fabric_client("workspace-b")
+    """
+
+    def __init__(self, rate_limit_config: Optional[RateLimitConfig] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            rate_limit_config: Rate limit applied to each workspace
+        """
+        self.rate_limit_config = rate_limit_config or RateLimitConfig()
+        self._token_caches: Dict[Tuple[Optional[str], bool], TokenCache] = {}
+        self._rate_limiters: Dict[str, TokenBucketRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def token_cache(
+        self,
+        tenant_id: Optional[str] = None,
+        use_interactive_auth: bool = True,
+    ) -> TokenCache:
+        """Get (or create) the token cache for a tenant and auth method."""
+        key = (tenant_id, use_interactive_auth)
+        with self._lock:
+            if key not in self._token_caches:
+                self._token_caches[key] = TokenCache(create_credential(
+                    tenant_id=tenant_id,
+                    use_interactive_auth=use_interactive_auth,
+                ))
+            return self._token_caches[key]
+
+    def rate_limiter(self, workspace_id: str) -> Optional[TokenBucketRateLimiter]:
+        """Get (or create) the rate limiter for a workspace (None if disabled)."""
+        if not self.rate_limit_config.enabled:
+            return None
+        with self._lock:
+            if workspace_id not in self._rate_limiters:
+                self._rate_limiters[workspace_id] = TokenBucketRateLimiter(
+                    rate=self.rate_limit_config.requests_per_minute,
+                    per=60.0,
+                    burst=self.rate_limit_config.burst,
+                )
+            return self._rate_limiters[workspace_id]
+
+    def create_fabric_client(
+        self,
+        workspace_id: str,
+        tenant_id: Optional[str] = None,
+        use_interactive_auth: bool = True,
+    ) -> FabricClient:
+        """Create a FabricClient that uses the shared token cache and workspace limiter."""
+        return FabricClient(
+            workspace_id=workspace_id,
+            tenant_id=tenant_id,
+            use_interactive_auth=use_interactive_auth,
+            rate_limit_config=self.rate_limit_config,
+            token_cache=self.token_cache(tenant_id, use_interactive_auth),
+            rate_limiter=self.rate_limiter(workspace_id),
+        )
@@ -3,8 +3,22 @@ Setup State Manager for resume capability.
 
 Manages setup progress state persistence to enable resuming
 after partial failures or interruptions.
+
+Persistence layout:
+- ``.setup-state.yaml`` holds a snapshot of the full state. It is written
+  as JSON (a subset of YAML, so existing YAML readers keep working) via
+  temp file + fsync + rename, so a crash never leaves a half-written file.
+  Older YAML snapshots are still loaded.
+- ``.setup-state.yaml.journal`` is an append-only JSON Lines log of step
+  transitions since the last snapshot. Each event carries the full state of
+  one step and a sequence number, so replaying it is idempotent. The journal
+  is compacted into a new snapshot every JOURNAL_COMPACT_THRESHOLD events.
 """
 
+import json
+import os
+import tempfile
+import threading
 import uuid
 import shutil
 import logging
@@ -23,8 +37,59 @@ logger = logging.getLogger(__name__)
 # State file name (gitignored)
 STATE_FILE_NAME = ".setup-state.yaml"
 STATE_BACKUP_SUFFIX = ".backup"
+STATE_JOURNAL_SUFFIX = ".journal"
 STATE_SCHEMA_VERSION = "1.0"
 
+# Number of journaled step events before they are compacted into a snapshot
+JOURNAL_COMPACT_THRESHOLD = 32
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry so a completed rename survives a crash (POSIX only)."""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """
+    Write a text file atomically.
+
+    The content is written to a temp file in the same folder, fsynced and
+    renamed over the target, so readers see either the old or the new file.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(path.parent)
+
+
+def _parse_state_text(text: str) -> Optional[Dict[str, Any]]:
+    """Parse a state snapshot: JSON first, falling back to legacy YAML."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return yaml.safe_load(text)
+
 
 class StepStatus(Enum):
     """Status of a single setup step."""
@@ -235,8 +300,13 @@ class SetupStateManager:
     """
     Manages setup state persistence for resume capability.
     
-    State is saved to `.setup-state.yaml` in the demo folder after each step.
-    On startup, existing state is loaded to enable resuming from where we left off.
+    Step transitions are appended to a journal next to `.setup-state.yaml`;
+    setup-level changes (status, resource IDs) and journal compaction write a
+    full snapshot atomically. On startup, the snapshot is loaded and the
+    journal replayed to resume from where we left off.
+    
+    All state mutations are serialized with a re-entrant lock, so a manager
+    can be shared by concurrent orchestrator workers.
     """
 
     def __init__(self, demo_path: Path, workspace_id: str, demo_name: str):
@@ -250,16 +320,22 @@ class SetupStateManager:
         """
         self.demo_path = Path(demo_path)
         self.state_file = self.demo_path / STATE_FILE_NAME
+        self.journal_file = self.demo_path / f"{STATE_FILE_NAME}{STATE_JOURNAL_SUFFIX}"
         self.workspace_id = workspace_id
         self.demo_name = demo_name
         self._state: Optional[SetupState] = None
+        self._lock = threading.RLock()
+        self._seq = 0  # Sequence number of the last persisted change
+        self._journal_events = 0  # Events appended since the last snapshot
+        self._snapshot_current = False  # On-disk snapshot belongs to self._state
 
     @property
     def state(self) -> SetupState:
         """Get or create the current state."""
-        if self._state is None:
-            self._state = self._create_new_state()
-        return self._state
+        with self._lock:
+            if self._state is None:
+                self._state = self._create_new_state()
+            return self._state
 
     def _create_new_state(self) -> SetupState:
         """Create a new setup state."""
@@ -282,50 +358,123 @@ class SetupStateManager:
         Returns:
             SetupState if file exists, None otherwise
         """
-        if not self.state_file.exists():
-            return None
-        
-        try:
-            with open(self.state_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            
-            if not data:
+        with self._lock:
+            if not self.state_file.exists():
                 return None
             
-            self._state = SetupState.from_dict(data)
-            logger.info(f"Loaded existing state: {self._state.setup_id}")
-            return self._state
-            
-        except Exception as e:
-            logger.warning(f"Failed to load state file: {e}")
-            return None
+            try:
+                data = _parse_state_text(self.state_file.read_text(encoding="utf-8"))
+                
+                if not data:
+                    return None
+                
+                self._seq = int(data.get("journal_seq", 0))
+                events = [e for e in self._read_journal() if e.get("seq", 0) > self._seq]
+                for event in events:
+                    data.setdefault("steps", {})[event["step"]] = event["state"]
+                    self._seq = event["seq"]
+                self._journal_events = len(events)
+                
+                self._state = SetupState.from_dict(data)
+                self._snapshot_current = True
+                logger.info(f"Loaded existing state: {self._state.setup_id}")
+                if events:
+                    logger.debug(f"Replayed {len(events)} journaled step events")
+                return self._state
+                
+            except Exception as e:
+                logger.warning(f"Failed to load state file: {e}")
+                return None
 
-    def save_state(self, create_backup: bool = True) -> None:
+    def save_state(self, create_backup: bool = False) -> None:
         """
-        Save current state to file.
+        Save a full snapshot of the current state and compact the journal.
+        
+        Step details that are not JSON-serializable are stored as strings
+        rather than dropping the transition.
         
         Args:
-            create_backup: If True, create a backup before saving (default: True)
+            create_backup: If True, back up the previous snapshot before
+                saving. Only journal compaction does this (default: False)
+        """
+        with self._lock:
+            if self._state is None:
+                return
+            
+            try:
+                # Create backup of existing state file
+                if create_backup and self.state_file.exists():
+                    self._create_backup()
+                
+                data = self._state.to_dict()
+                data["journal_seq"] = self._seq
+                _atomic_write_text(
+                    self.state_file,
+                    json.dumps(data, indent=2, ensure_ascii=False, default=str),
+                )
+                
+                # Journal events up to _seq are now part of the snapshot
+                self._remove_journal()
+                self._snapshot_current = True
+                logger.debug(f"Saved state to {self.state_file}")
+            except Exception as e:
+                logger.error(f"Failed to save state: {e}")
+
+    def _record_step(self, step_name: str) -> None:
         """
-        if self._state is None:
+        Persist a single step transition.
+        
+        Appends the step's state to the journal, or writes a full snapshot if
+        the on-disk snapshot is missing or stale, or the journal is due for
+        compaction.
+        """
+        if not self._snapshot_current:
+            self.save_state()
+            return
+        if self._journal_events >= JOURNAL_COMPACT_THRESHOLD:
+            self.save_state(create_backup=True)
             return
         
+        self._seq += 1
+        event = {
+            "seq": self._seq,
+            "step": step_name,
+            "state": self._state.steps[step_name].to_dict(),
+        }
         try:
-            # Create backup of existing state file
-            if create_backup and self.state_file.exists():
-                self._create_backup()
-            
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    self.state.to_dict(),
-                    f,
-                    default_flow_style=False,
-                    sort_keys=False,
-                    allow_unicode=True,
-                )
-            logger.debug(f"Saved state to {self.state_file}")
+            with open(self.journal_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(event, separators=(",", ":"), ensure_ascii=False, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_events += 1
         except Exception as e:
-            logger.error(f"Failed to save state: {e}")
+            logger.warning(f"Failed to append to state journal, writing snapshot: {e}")
+            self.save_state()
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        """Read journaled step events, ignoring a torn trailing line."""
+        if not self.journal_file.exists():
+            return []
+        
+        events = []
+        with open(self.journal_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Ignoring incomplete entry in {self.journal_file}")
+                    break
+                if isinstance(event, dict) and "step" in event and "state" in event:
+                    events.append(event)
+        return events
+
+    def _remove_journal(self) -> None:
+        """Delete the journal file (after compaction or when state is reset)."""
+        try:
+            self.journal_file.unlink()
+        except FileNotFoundError:
+            pass
+        self._journal_events = 0
 
     def _create_backup(self) -> None:
         """Create a backup of the current state file."""
@@ -351,15 +500,18 @@ class SetupStateManager:
             logger.warning("No backup file found to restore")
             return False
         
-        try:
-            shutil.copy2(backup_file, self.state_file)
-            self._state = None  # Force reload
-            self.load_state()
-            logger.info(f"Restored state from backup: {backup_file}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to restore from backup: {e}")
-            return False
+        with self._lock:
+            try:
+                _atomic_write_text(self.state_file, backup_file.read_text(encoding="utf-8"))
+                self._remove_journal()  # Journal belongs to the replaced snapshot
+                self._state = None  # Force reload
+                self._snapshot_current = False
+                self.load_state()
+                logger.info(f"Restored state from backup: {backup_file}")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to restore from backup: {e}")
+                return False
 
     def has_backup(self) -> bool:
         """Check if a backup file exists."""
@@ -367,57 +519,69 @@ class SetupStateManager:
         return backup_file.exists()
 
     def clear_state(self) -> None:
-        """Remove the state file."""
-        if self.state_file.exists():
-            self.state_file.unlink()
-            logger.info(f"Cleared state file: {self.state_file}")
-        self._state = None
+        """Remove the state file and its journal."""
+        with self._lock:
+            if self.state_file.exists():
+                self.state_file.unlink()
+                logger.info(f"Cleared state file: {self.state_file}")
+            self._remove_journal()
+            self._state = None
+            self._seq = 0
+            self._snapshot_current = False
 
     def mark_cleaned_up(self) -> None:
         """Mark state as cleaned up, clearing resource IDs but preserving audit trail."""
-        self.state.status = SetupStatus.CLEANED_UP
-        self.state.completed_at = datetime.now(timezone.utc).isoformat()
-        
-        # Clear resource IDs (they no longer exist)
-        self.state.lakehouse_id = None
-        self.state.lakehouse_name = None
-        self.state.eventhouse_id = None
-        self.state.eventhouse_name = None
-        self.state.kql_database_id = None
-        self.state.kql_database_name = None
-        self.state.ontology_id = None
-        self.state.ontology_name = None
-        
-        self.save_state()
+        with self._lock:
+            self.state.status = SetupStatus.CLEANED_UP
+            self.state.completed_at = datetime.now(timezone.utc).isoformat()
+            
+            # Clear resource IDs (they no longer exist)
+            self.state.lakehouse_id = None
+            self.state.lakehouse_name = None
+            self.state.eventhouse_id = None
+            self.state.eventhouse_name = None
+            self.state.kql_database_id = None
+            self.state.kql_database_name = None
+            self.state.ontology_id = None
+            self.state.ontology_name = None
+            
+            self.save_state()
         logger.info("Marked state as cleaned up")
 
     def start_setup(self) -> None:
         """Mark setup as started."""
-        self.state.status = SetupStatus.IN_PROGRESS
-        self.state.started_at = datetime.now(timezone.utc).isoformat()
-        self.save_state()
+        with self._lock:
+            self.state.status = SetupStatus.IN_PROGRESS
+            self.state.started_at = datetime.now(timezone.utc).isoformat()
+            self.save_state()
 
     def complete_setup(self, success: bool = True) -> None:
         """Mark setup as completed or failed."""
-        self.state.status = SetupStatus.COMPLETED if success else SetupStatus.FAILED
-        self.state.completed_at = datetime.now(timezone.utc).isoformat()
-        self.save_state()
+        with self._lock:
+            self.state.status = SetupStatus.COMPLETED if success else SetupStatus.FAILED
+            self.state.completed_at = datetime.now(timezone.utc).isoformat()
+            self.save_state()
 
     def cancel_setup(self) -> None:
         """Mark setup as cancelled."""
-        self.state.status = SetupStatus.CANCELLED
-        self.state.completed_at = datetime.now(timezone.utc).isoformat()
-        self.save_state()
+        with self._lock:
+            self.state.status = SetupStatus.CANCELLED
+            self.state.completed_at = datetime.now(timezone.utc).isoformat()
+            self.save_state()
 
-    def start_step(self, step_name: str) -> None:
-        """Mark a step as started."""
+    def _get_or_create_step(self, step_name: str) -> StepState:
+        """Get a step's state, creating it if needed (caller holds the lock)."""
         if step_name not in self.state.steps:
             self.state.steps[step_name] = StepState(name=step_name)
-        
-        step = self.state.steps[step_name]
-        step.status = StepStatus.IN_PROGRESS
-        step.started_at = datetime.now(timezone.utc).isoformat()
-        self.save_state()
+        return self.state.steps[step_name]
+
+    def start_step(self, step_name: str) -> None:
+        """Mark a step as started."""
+        with self._lock:
+            step = self._get_or_create_step(step_name)
+            step.status = StepStatus.IN_PROGRESS
+            step.started_at = datetime.now(timezone.utc).isoformat()
+            self._record_step(step_name)
 
     def complete_step(
         self,
@@ -427,19 +591,17 @@ class SetupStateManager:
         details: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Mark a step as completed."""
-        if step_name not in self.state.steps:
-            self.state.steps[step_name] = StepState(name=step_name)
-        
-        step = self.state.steps[step_name]
-        step.status = StepStatus.COMPLETED
-        step.completed_at = datetime.now(timezone.utc).isoformat()
-        if artifact_id:
-            step.artifact_id = artifact_id
-        if artifact_name:
-            step.artifact_name = artifact_name
-        if details:
-            step.details.update(details)
-        self.save_state()
+        with self._lock:
+            step = self._get_or_create_step(step_name)
+            step.status = StepStatus.COMPLETED
+            step.completed_at = datetime.now(timezone.utc).isoformat()
+            if artifact_id:
+                step.artifact_id = artifact_id
+            if artifact_name:
+                step.artifact_name = artifact_name
+            if details:
+                step.details.update(details)
+            self._record_step(step_name)
 
     def skip_step(
         self,
@@ -449,45 +611,43 @@ class SetupStateManager:
         reason: Optional[str] = None,
     ) -> None:
         """Mark a step as skipped."""
-        if step_name not in self.state.steps:
-            self.state.steps[step_name] = StepState(name=step_name)
-        
-        step = self.state.steps[step_name]
-        step.status = StepStatus.SKIPPED
-        step.completed_at = datetime.now(timezone.utc).isoformat()
-        if artifact_id:
-            step.artifact_id = artifact_id
-        if artifact_name:
-            step.artifact_name = artifact_name
-        if reason:
-            step.details["skip_reason"] = reason
-        self.save_state()
+        with self._lock:
+            step = self._get_or_create_step(step_name)
+            step.status = StepStatus.SKIPPED
+            step.completed_at = datetime.now(timezone.utc).isoformat()
+            if artifact_id:
+                step.artifact_id = artifact_id
+            if artifact_name:
+                step.artifact_name = artifact_name
+            if reason:
+                step.details["skip_reason"] = reason
+            self._record_step(step_name)
 
     def fail_step(self, step_name: str, error_message: str) -> None:
         """Mark a step as failed."""
-        if step_name not in self.state.steps:
-            self.state.steps[step_name] = StepState(name=step_name)
-        
-        step = self.state.steps[step_name]
-        step.status = StepStatus.FAILED
-        step.completed_at = datetime.now(timezone.utc).isoformat()
-        step.error_message = error_message
-        self.save_state()
+        with self._lock:
+            step = self._get_or_create_step(step_name)
+            step.status = StepStatus.FAILED
+            step.completed_at = datetime.now(timezone.utc).isoformat()
+            step.error_message = error_message
+            self._record_step(step_name)
 
     def is_step_completed(self, step_name: str) -> bool:
         """Check if a step is already completed."""
-        if step_name not in self.state.steps:
-            return False
-        return self.state.steps[step_name].status in (
-            StepStatus.COMPLETED,
-            StepStatus.SKIPPED,
-        )
+        with self._lock:
+            if step_name not in self.state.steps:
+                return False
+            return self.state.steps[step_name].status in (
+                StepStatus.COMPLETED,
+                StepStatus.SKIPPED,
+            )
 
     def get_step_artifact_id(self, step_name: str) -> Optional[str]:
         """Get the artifact ID from a completed step."""
-        if step_name not in self.state.steps:
-            return None
-        return self.state.steps[step_name].artifact_id
+        with self._lock:
+            if step_name not in self.state.steps:
+                return None
+            return self.state.steps[step_name].artifact_id
 
     def update_resource_ids(
         self,
@@ -500,24 +660,30 @@ class SetupStateManager:
         ontology_id: Optional[str] = None,
         ontology_name: Optional[str] = None,
     ) -> None:
-        """Update resource IDs in state."""
-        if lakehouse_id:
-            self.state.lakehouse_id = lakehouse_id
-        if lakehouse_name:
-            self.state.lakehouse_name = lakehouse_name
-        if eventhouse_id:
-            self.state.eventhouse_id = eventhouse_id
-        if eventhouse_name:
-            self.state.eventhouse_name = eventhouse_name
-        if kql_database_id:
-            self.state.kql_database_id = kql_database_id
-        if kql_database_name:
-            self.state.kql_database_name = kql_database_name
-        if ontology_id:
-            self.state.ontology_id = ontology_id
-        if ontology_name:
-            self.state.ontology_name = ontology_name
-        self.save_state()
+        """
+        Update resource IDs in state.
+        
+        Changes are written as a full snapshot (so external readers of the
+        state file see them); unchanged IDs do not trigger a write.
+        """
+        updates = {
+            "lakehouse_id": lakehouse_id,
+            "lakehouse_name": lakehouse_name,
+            "eventhouse_id": eventhouse_id,
+            "eventhouse_name": eventhouse_name,
+            "kql_database_id": kql_database_id,
+            "kql_database_name": kql_database_name,
+            "ontology_id": ontology_id,
+            "ontology_name": ontology_name,
+        }
+        with self._lock:
+            changed = False
+            for attr, value in updates.items():
+                if value and getattr(self.state, attr) != value:
+                    setattr(self.state, attr, value)
+                    changed = True
+            if changed or not self._snapshot_current:
+                self.save_state()
 
     def get_resume_summary(self) -> Dict[str, Any]:
         """Get a summary of what will be resumed."""
@@ -607,7 +773,7 @@ class SetupStateManager:
             )
         
         # Save the recovered state
-        manager.save_state(create_backup=False)
+        manager.save_state()
         logger.info(f"Created recovered state file for {demo_name}")
         
         return manager
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Tests for bulk eventhouse ingestion (concurrent staging + multi-URI .ingest).
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from demo_automation.orchestrator import DemoOrchestrator, _batch_files_by_size
+
+
+def _write(path: Path, size: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    return path
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    config = MagicMock()
+    config.demo_path = tmp_path
+    config.name = "TestDemo"
+    config.fabric.workspace_id = "ws-1"
+    config.eventhouse_data_path = tmp_path / "Data" / "Eventhouse"
+    config.options.max_parallel_uploads = 4
+    config.options.max_ingest_file_mb = 180
+    orch = DemoOrchestrator(config)
+    orch.state.lakehouse_id = "lh-1"
+    orch.state.eventhouse_id = "eh-1"
+    orch.state.kql_database_name = "db"
+    orch._onelake_client = MagicMock()
+    orch._onelake_client.upload_files.return_value = {"success": [], "failed": []}
+    orch._eventhouse_client = MagicMock()
+    return orch
+
+
+class TestBulkIngest:
+    """Tests for DemoOrchestrator.ingest_eventhouse_files."""
+
+    def test_uploads_once_and_ingests_each_table_with_one_command(self, orchestrator, tmp_path):
+        data = tmp_path / "Data" / "Eventhouse"
+        table_files = {
+            "Telemetry": [_write(data / f"Telemetry_part{i}.csv", 10) for i in (1, 2, 3)],
+            "Alarms": [_write(data / "Alarms.csv", 10)],
+        }
+
+        ingested, failed = orchestrator.ingest_eventhouse_files(
+            table_files, {"Telemetry": "Telemetry_csv"}
+        )
+
+        assert sorted(ingested) == ["Alarms", "Telemetry"] and failed == []
+        orchestrator.onelake_client.upload_files.assert_called_once()
+        assert len(orchestrator.onelake_client.upload_files.call_args.kwargs["files"]) == 4
+
+        calls = {
+            c.kwargs["table_name"]: c.kwargs
+            for c in orchestrator.eventhouse_client.ingest_from_onelake.call_args_list
+        }
+        assert len(calls["Telemetry"]["onelake_path"]) == 3
+        assert calls["Telemetry"]["onelake_path"][0].endswith(
+            "/ws-1/lh-1/Files/eventhouse/Telemetry_part1.csv;impersonate"
+        )
+        assert calls["Telemetry"]["mapping_name"] == "Telemetry_csv"
+
+    def test_failed_upload_fails_only_its_table(self, orchestrator, tmp_path):
+        data = tmp_path / "Data" / "Eventhouse"
+        orchestrator.onelake_client.upload_files.return_value = {
+            "success": [],
+            "failed": [{"name": "Alarms.csv", "error": "boom"}],
+        }
+
+        ingested, failed = orchestrator.ingest_eventhouse_files({
+            "Telemetry": [_write(data / "Telemetry.csv", 10)],
+            "Alarms": [_write(data / "Alarms.csv", 10)],
+        })
+
+        assert ingested == ["Telemetry"]
+        assert failed == ["Alarms"]
+
+    def test_replace_existing_clears_only_staged_tables_before_ingest(self, orchestrator, tmp_path):
+        data = tmp_path / "Data" / "Eventhouse"
+        orchestrator.onelake_client.upload_files.return_value = {
+            "success": [],
+            "failed": [{"name": "Alarms.csv", "error": "boom"}],
+        }
+
+        orchestrator.ingest_eventhouse_files({
+            "Telemetry": [_write(data / "Telemetry.csv", 10)],
+            "Alarms": [_write(data / "Alarms.csv", 10)],
+        }, replace_existing=True)
+
+        # The table whose upload failed keeps its rows
+        calls = [(c[0], c.kwargs["table_name"]) for c in orchestrator.eventhouse_client.mock_calls]
+        assert calls == [
+            ("clear_table_data", "Telemetry"),
+            ("ingest_from_onelake", "Telemetry"),
+        ]
+
+    def test_oversized_files_are_split_before_upload(self, orchestrator, tmp_path):
+        source = tmp_path / "Data" / "Eventhouse" / "Telemetry.csv"
+        source.parent.mkdir(parents=True)
+        source.write_text("Timestamp,Value\n" + "2025-01-01,1\n" * 200_000)
+        orchestrator.config.options.max_ingest_file_mb = 1
+
+        ingested, _ = orchestrator.ingest_eventhouse_files({"Telemetry": [source]})
+
+        uploaded = orchestrator.onelake_client.upload_files.call_args.kwargs["files"]
+        assert ingested == ["Telemetry"]
+        assert [f.name for f in uploaded] == ["Telemetry_part1.csv", "Telemetry_part2.csv", "Telemetry_part3.csv"]
+        paths = orchestrator.eventhouse_client.ingest_from_onelake.call_args.kwargs["onelake_path"]
+        assert len(paths) == 3
+
+    def test_part_files_replace_seed_file(self, orchestrator, tmp_path):
+        data = tmp_path / "Data" / "Eventhouse"
+        seed = _write(data / "Telemetry.csv", 10)
+        part2 = _write(data / "parts" / "Telemetry_part2.csv", 10)
+        part10 = _write(data / "parts" / "Telemetry_part10.csv", 10)
+        part1 = _write(data / "parts" / "Telemetry_part1.csv", 10)
+        other = _write(data / "Alarms.csv", 10)
+
+        csv_files = [seed, other]
+        assert orchestrator._find_csv_files_for_table(csv_files, "Telemetry") == [part1, part2, part10]
+        assert orchestrator._find_csv_files_for_table(csv_files, "Alarms") == [other]
+
+    def test_batches_respect_byte_budget(self, tmp_path):
+        files = [_write(tmp_path / f"f{i}.csv", size) for i, size in enumerate((40, 40, 40, 150))]
+
+        batches = _batch_files_by_size(files, max_bytes=100)
+
+        assert [len(b) for b in batches] == [2, 1, 1]
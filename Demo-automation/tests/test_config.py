@@ -123,6 +123,38 @@ class TestDemoConfiguration:
 
         assert any("workspace_id" in e for e in errors)
 
+    def test_binding_mode_defaults_to_combined(self, tmp_path):
+        """Test bindings run as one combined step unless configured otherwise."""
+        demo_path = tmp_path / "TestDemo"
+        demo_path.mkdir()
+
+        config = DemoConfiguration.from_demo_folder(demo_path, workspace_id="ws")
+
+        assert config.options.binding_mode == "combined"
+
+    def test_validate_invalid_binding_mode(self, tmp_path):
+        """Test validation rejects unknown binding modes."""
+        demo_path = tmp_path / "TestDemo"
+        demo_path.mkdir()
+        (demo_path / "demo.yaml").write_text("options:\n  binding_mode: sometimes\n")
+
+        config = DemoConfiguration.from_demo_folder(demo_path, workspace_id="ws")
+        errors = config.validate()
+
+        assert any("binding_mode" in e for e in errors)
+
+    def test_validate_invalid_ingest_mode(self, tmp_path):
+        """Test validation rejects unknown eventhouse ingestion modes."""
+        demo_path = tmp_path / "TestDemo"
+        demo_path.mkdir()
+        (demo_path / "demo.yaml").write_text("options:\n  ingest_mode: streaming\n")
+
+        config = DemoConfiguration.from_demo_folder(demo_path, workspace_id="ws")
+        errors = config.validate()
+
+        assert config.options.ingest_mode == "streaming"
+        assert any("ingest_mode" in e for e in errors)
+
 
 class TestGenerateDemoYamlTemplate:
     """Tests for demo.yaml template generation."""
@@ -0,0 +1,134 @@
+"""
+Tests for the combined configure_bindings step (single GET, single diffed update).
+"""
+
+import base64
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from demo_automation.orchestrator import DemoOrchestrator, StepStatus
+
+
+BINDINGS_YAML = """\
+lakehouse:
+  entities:
+    - entity: Machine
+      sourceTable: DimMachine
+      keyColumn: MachineId
+      properties:
+        - property: MachineId
+          column: MachineId
+          type: string
+  relationships:
+    - relationship: feeds
+      sourceEntity: Machine
+      targetEntity: Machine
+      sourceTable: EdgeFeeds
+      sourceKeyColumn: SourceId
+      targetKeyColumn: TargetId
+
+eventhouse:
+  entities:
+    - entity: Machine
+      sourceTable: MachineTelemetry
+      keyColumn: MachineId
+      timestampColumn: Timestamp
+      properties:
+        - property: Temperature
+          column: Temperature
+          type: double
+"""
+
+
+def _part(path, payload):
+    return {
+        "path": path,
+        "payload": base64.b64encode(json.dumps(payload).encode("utf-8")).decode("utf-8"),
+        "payloadType": "InlineBase64",
+    }
+
+
+def _ontology_definition():
+    """Ontology with one entity and one relationship, no bindings."""
+    return {
+        "definition": {
+            "parts": [
+                _part("definition.json", {}),
+                _part("EntityTypes/100/definition.json", {
+                    "id": "100",
+                    "name": "Machine",
+                    "entityIdParts": ["101"],
+                    "properties": [
+                        {"id": "101", "name": "MachineId"},
+                        {"id": "102", "name": "Temperature"},
+                    ],
+                }),
+                _part("RelationshipTypes/200/definition.json", {
+                    "id": "200",
+                    "name": "feeds",
+                    "source": {"entityTypeId": "100"},
+                    "target": {"entityTypeId": "100"},
+                }),
+            ]
+        }
+    }
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    (tmp_path / "Bindings").mkdir()
+    (tmp_path / "Bindings" / "bindings.yaml").write_text(BINDINGS_YAML)
+
+    config = MagicMock()
+    config.demo_path = tmp_path
+    config.name = "TestDemo"
+    config.fabric.workspace_id = "ws-1"
+    config.resources.eventhouse.name = "db"
+    orch = DemoOrchestrator(config)
+    orch.state.ontology_id = "ont-1"
+    orch.state.lakehouse_id = "lh-1"
+    orch.state.eventhouse_id = "eh-1"
+    orch.state.kql_database_id = "kql-1"
+    orch._fabric_client = MagicMock()
+    orch._fabric_client.get_kql_database.return_value = {"displayName": "db"}
+    orch._fabric_client.get_eventhouse.return_value = {
+        "properties": {"queryServiceUri": "https://kusto.example"},
+    }
+    orch._fabric_client.get_ontology_definition.return_value = _ontology_definition()
+    return orch
+
+
+class TestConfigureBindings:
+    """Tests for DemoOrchestrator._step_configure_bindings."""
+
+    def test_binds_all_kinds_with_one_fetch_and_one_update(self, orchestrator):
+        fabric = orchestrator.fabric_client
+
+        result = orchestrator._step_configure_bindings()
+
+        assert result.status == StepStatus.COMPLETED, result.message
+        assert result.details["lakehouse_bindings"] == 1
+        assert result.details["eventhouse_bindings"] == 1
+        assert result.details["relationship_contextualizations"] == 1
+        fabric.get_ontology_definition.assert_called_once_with("ont-1")
+        fabric.update_ontology_definition.assert_called_once()
+        assert orchestrator.state.bindings_configured
+
+    def test_unchanged_definition_skips_update(self, orchestrator):
+        fabric = orchestrator.fabric_client
+        orchestrator._step_configure_bindings()
+        committed = fabric.update_ontology_definition.call_args.kwargs["definition"]
+
+        # Second run against the definition committed by the first
+        fabric.reset_mock()
+        fabric.get_ontology_definition.return_value = {"definition": committed}
+        result = orchestrator._step_configure_bindings()
+
+        assert result.status == StepStatus.COMPLETED, result.message
+        assert "unchanged, update skipped" in result.message
+        assert result.details["definition_diff"]["added"] == []
+        assert result.details["definition_diff"]["changed"] == []
+        fabric.get_ontology_definition.assert_called_once()
+        fabric.update_ontology_definition.assert_not_called()
@@ -0,0 +1,57 @@
+"""
+Tests for size-aware CSV splitting.
+"""
+
+import csv
+
+from demo_automation.csv_splitter import split_csv_by_size
+
+
+HEADER = "Timestamp,EquipmentId,Note\n"
+
+
+def _write_csv(path, rows):
+    path.write_text(HEADER + "".join(rows), encoding="utf-8", newline="")
+    return path
+
+
+def _read_rows(paths):
+    rows = []
+    for path in paths:
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            assert next(reader) == ["Timestamp", "EquipmentId", "Note"]
+            rows.extend(reader)
+    return rows
+
+
+class TestSplitCsvBySize:
+    """Tests for split_csv_by_size."""
+
+    def test_small_file_is_not_split(self, tmp_path):
+        source = _write_csv(tmp_path / "Small.csv", ["2025-01-01,EQ-1,ok\n"])
+
+        assert split_csv_by_size(source, tmp_path / "parts", max_bytes=1024) == [source]
+        assert not (tmp_path / "parts").exists()
+
+    def test_parts_respect_budget_and_keep_header(self, tmp_path):
+        rows = [f"2025-01-01T00:00:{i % 60:02d},EQ-{i},value {i}\n" for i in range(500)]
+        source = _write_csv(tmp_path / "Telemetry.csv", rows)
+
+        parts = split_csv_by_size(source, tmp_path / "parts", max_bytes=2048)
+
+        assert len(parts) > 1
+        assert [p.name for p in parts[:2]] == ["Telemetry_part1.csv", "Telemetry_part2.csv"]
+        assert all(p.stat().st_size <= 2048 for p in parts)
+        assert _read_rows(parts) == _read_rows([source])
+
+    def test_quoted_newlines_are_not_split(self, tmp_path):
+        rows = [f'2025-01-01,EQ-{i},"line one\nline two, ""quoted"""\n' for i in range(100)]
+        source = _write_csv(tmp_path / "Notes.csv", rows)
+
+        parts = split_csv_by_size(source, tmp_path / "parts", max_bytes=512)
+
+        assert len(parts) > 1
+        split_rows = _read_rows(parts)
+        assert len(split_rows) == 100
+        assert split_rows[0][2] == 'line one\nline two, "quoted"'
@@ -0,0 +1,214 @@
+"""
+Tests for the definition diff engine, the parsed definition model and
+stable binding IDs.
+
+Re-running a binding step against an already-bound ontology must produce an
+identical definition so the updateDefinition call can be skipped.
+"""
+
+import base64
+import json
+import warnings
+
+import pytest
+
+from demo_automation.binding import (
+    OntologyBindingBuilder,
+    ParsedDefinition,
+    PartKind,
+    diff_definition_parts,
+    extract_definition_parts,
+    payload_digest,
+)
+
+
+def _part(path, payload):
+    return {
+        "path": path,
+        "payload": base64.b64encode(json.dumps(payload).encode("utf-8")).decode("utf-8"),
+        "payloadType": "InlineBase64",
+    }
+
+
+def _builder():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        return OntologyBindingBuilder(workspace_id="ws-1", ontology_id="ont-1")
+
+
+@pytest.fixture
+def base_definition():
+    """Ontology definition with one entity and one relationship, no bindings."""
+    return {
+        "definition": {
+            "parts": [
+                _part("definition.json", {}),
+                _part("EntityTypes/100/definition.json", {
+                    "id": "100",
+                    "name": "Machine",
+                    "entityIdParts": ["101"],
+                    "properties": [{"id": "101", "name": "MachineId"}],
+                }),
+                _part("RelationshipTypes/200/definition.json", {"id": "200", "name": "feeds"}),
+            ]
+        }
+    }
+
+
+def _add_all_bindings(builder):
+    builder.add_lakehouse_binding(
+        entity_type_id="100",
+        lakehouse_id="lh-1",
+        table_name="DimMachine",
+        key_column="MachineId",
+        property_mappings={"MachineId": "101"},
+    )
+    builder.add_eventhouse_binding(
+        entity_type_id="100",
+        eventhouse_id="eh-1",
+        database_name="db",
+        table_name="MachineTelemetry",
+        key_column="MachineId",
+        timestamp_column="Timestamp",
+        property_mappings={"MachineId": "101"},
+    )
+    builder.add_relationship_contextualization(
+        relationship_type_id="200",
+        lakehouse_id="lh-1",
+        table_name="EdgeFeeds",
+        source_key_column="SourceId",
+        source_key_property_id="101",
+        target_key_column="TargetId",
+        target_key_property_id="101",
+    )
+
+
+class TestPayloadDigest:
+    """Tests for decoded-payload hashing."""
+
+    def test_key_order_does_not_matter(self):
+        a = {"path": "x", "payload": base64.b64encode(b'{"a": 1, "b": 2}').decode()}
+        b = {"path": "x", "payload": base64.b64encode(b'{"b":2,"a":1}').decode()}
+        assert payload_digest(a) == payload_digest(b)
+
+    def test_different_content_differs(self):
+        assert payload_digest(_part("x", {"a": 1})) != payload_digest(_part("x", {"a": 2}))
+
+    def test_non_json_payload(self):
+        part = {"path": "x", "payload": base64.b64encode(b"not json").decode()}
+        assert len(payload_digest(part)) == 64
+
+
+class TestDiffDefinitionParts:
+    """Tests for diff_definition_parts."""
+
+    def test_identical_parts_have_no_changes(self, base_definition):
+        parts = extract_definition_parts(base_definition)
+        diff = diff_definition_parts(parts, list(parts))
+        assert not diff.has_changes
+        assert len(diff.unchanged) == 3
+
+    def test_added_changed_removed(self):
+        existing = [_part("a", {"v": 1}), _part("b", {"v": 1}), _part("c", {"v": 1})]
+        new = [_part("a", {"v": 1}), _part("b", {"v": 2}), _part("d", {"v": 1})]
+        diff = diff_definition_parts(existing, new)
+        assert diff.has_changes
+        assert diff.added == ["d"]
+        assert diff.changed == ["b"]
+        assert diff.removed == ["c"]
+        assert diff.unchanged == ["a"]
+
+    def test_extract_handles_flat_structure(self):
+        assert extract_definition_parts({"parts": [{"path": "a"}]}) == [{"path": "a"}]
+        assert extract_definition_parts({}) == []
+
+
+class TestStableRebinding:
+    """Re-binding identical configuration must yield an unchanged definition."""
+
+    def test_rebinding_is_a_no_op(self, base_definition):
+        first = _builder()
+        _add_all_bindings(first)
+        bound_parts = first.build_definition_parts(base_definition)
+        bound_definition = {"definition": {"parts": bound_parts}}
+
+        # Second run: fresh builder, fresh UUIDs, same configuration
+        second = _builder()
+        _add_all_bindings(second)
+        rebound_parts = second.build_definition_parts(bound_definition)
+
+        diff = diff_definition_parts(bound_parts, rebound_parts)
+        assert not diff.has_changes, diff.summary()
+
+    def test_changed_binding_is_detected(self, base_definition):
+        first = _builder()
+        _add_all_bindings(first)
+        bound_definition = {"definition": {"parts": first.build_definition_parts(base_definition)}}
+
+        second = _builder()
+        _add_all_bindings(second)
+        second.add_eventhouse_binding(
+            entity_type_id="100",
+            eventhouse_id="eh-1",
+            database_name="db",
+            table_name="MachineAlarms",
+            key_column="MachineId",
+            timestamp_column="Timestamp",
+            property_mappings={"MachineId": "101"},
+        )
+        diff = diff_definition_parts(
+            extract_definition_parts(bound_definition),
+            second.build_definition_parts(bound_definition),
+        )
+        assert diff.has_changes
+        assert len(diff.added) == 1
+        assert not diff.removed
+
+
+class TestParsedDefinition:
+    """Tests for the decoded-once ParsedDefinition model."""
+
+    def test_indexes(self, base_definition):
+        builder = _builder()
+        _add_all_bindings(builder)
+        parsed = builder.build_parsed_definition(base_definition)
+
+        assert set(parsed.entities) == {"100"}
+        assert set(parsed.relationships) == {"200"}
+        assert len(parsed.data_bindings["100"]) == 2
+        assert len(parsed.contextualizations["200"]) == 1
+        assert len(parsed.bindings_of_type("NonTimeSeries")) == 1
+        assert len(parsed.bindings_of_type("TimeSeries")) == 1
+        assert parsed.entity_name_to_id() == {"Machine": "100"}
+        assert parsed.relationship_name_to_id() == {"feeds": "200"}
+        assert parsed.entity_properties("100") == {"MachineId": "101"}
+        assert parsed.get("definition.json").kind == PartKind.ROOT
+
+    def test_unmodified_parts_pass_through(self, base_definition):
+        raw_parts = extract_definition_parts(base_definition)
+        parsed = ParsedDefinition.from_definition(base_definition)
+        for raw, out in zip(raw_parts, parsed.to_parts()):
+            assert raw is out
+
+    def test_only_modified_entity_is_reencoded(self):
+        definition = {"parts": [
+            _part("definition.json", {}),
+            _part("EntityTypes/100/definition.json", {
+                "id": "100", "name": "Machine", "properties": [{"id": "101", "name": "MachineId"}],
+            }),
+            _part("EntityTypes/300/definition.json", {"id": "300", "name": "Line"}),
+        ]}
+        builder = _builder()
+        builder.add_lakehouse_binding(
+            entity_type_id="100",
+            lakehouse_id="lh-1",
+            table_name="DimMachine",
+            key_column="MachineId",
+            property_mappings={"MachineId": "101"},
+        )
+        out = builder.build_definition_parts(definition)
+        by_path = {p["path"]: p for p in out}
+
+        assert by_path["EntityTypes/300/definition.json"] is definition["parts"][2]
+        patched = json.loads(base64.b64decode(by_path["EntityTypes/100/definition.json"]["payload"]))
+        assert patched["entityIdParts"] == ["101"]
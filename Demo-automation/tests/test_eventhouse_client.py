@@ -0,0 +1,85 @@
+"""
+Tests for EventhouseClient batched row counts.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from demo_automation.platform.eventhouse_client import EventhouseClient
+
+
+def _client():
+    return EventhouseClient(fabric_client=MagicMock(), workspace_id="ws-1")
+
+
+class TestGetTableCounts:
+    """Tests for get_table_counts."""
+
+    def test_single_command_for_all_tables(self):
+        client = _client()
+        result = {"Tables": [{"Rows": [["Telemetry", 1200], ["Alarms", 7], ["Other", 3]]}]}
+        with patch.object(client, "execute_kql_management", return_value=result) as mgmt:
+            counts = client.get_table_counts("eh-1", "db", ["Telemetry", "Alarms", "Empty"])
+
+        mgmt.assert_called_once()
+        # Only the requested tables; tables not in the database count as empty
+        assert counts == {"Telemetry": 1200, "Alarms": 7, "Empty": 0}
+
+    def test_no_tables_means_no_query(self):
+        client = _client()
+        with patch.object(client, "execute_kql_management") as mgmt:
+            assert client.get_table_counts("eh-1", "db", []) == {}
+        mgmt.assert_not_called()
+
+    def test_malformed_response_raises(self):
+        client = _client()
+        with patch.object(client, "execute_kql_management", return_value={"Tables": [None]}):
+            with pytest.raises(ValueError, match="Malformed table details"):
+                client.get_table_counts("eh-1", "db", ["Telemetry"])
+
+    def test_kusto_endpoint_is_cached(self):
+        client = _client()
+        client.fabric.get_eventhouse.return_value = {
+            "properties": {"queryServiceUri": "https://kusto.example"},
+        }
+        assert client._get_kusto_endpoint("eh-1") == "https://kusto.example"
+        assert client._get_kusto_endpoint("eh-1") == "https://kusto.example"
+        client.fabric.get_eventhouse.assert_called_once()
+
+
+class TestGetTableRowCounts:
+    """Tests for get_table_row_counts."""
+
+    def test_counts_from_table_details(self):
+        client = _client()
+        result = {"Tables": [{"Rows": [["Telemetry", 1200], ["Empty", None]]}]}
+        with patch.object(client, "execute_kql_management", return_value=result):
+            assert client.get_table_row_counts("eh-1", "db") == {"Telemetry": 1200, "Empty": 0}
+
+    def test_malformed_response_raises(self):
+        client = _client()
+        result = {"Tables": [{"Rows": [["Telemetry", "n/a"]]}]}
+        with patch.object(client, "execute_kql_management", return_value=result):
+            with pytest.raises(ValueError, match="Malformed table details"):
+                client.get_table_row_counts("eh-1", "db")
+
+
+class TestIngestFromOneLake:
+    """Tests for multi-URI .ingest commands."""
+
+    def test_multiple_paths_in_one_command(self):
+        client = _client()
+        with patch.object(client, "execute_kql_management") as mgmt:
+            client.ingest_from_onelake(
+                "eh-1", "db", "Telemetry",
+                onelake_path=["https://onelake/a.csv;impersonate", "https://onelake/b.csv;impersonate"],
+                mapping_name="Telemetry_csv",
+            )
+
+        command = mgmt.call_args.kwargs["command"]
+        assert command.startswith(
+            ".ingest into table Telemetry "
+            "(h'https://onelake/a.csv;impersonate', h'https://onelake/b.csv;impersonate')"
+        )
+        assert "ingestionMapping='Telemetry_csv'" in command
@@ -0,0 +1,197 @@
+"""
+Tests for non-blocking job monitoring (graph refresh).
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from demo_automation.core.errors import LROTimeoutError
+from demo_automation.platform.job_monitor import (
+    JobHandle,
+    JobMonitor,
+    normalize_job_status,
+)
+
+
+def _handle():
+    return JobHandle(
+        item_id="graph-1",
+        job_type="DefaultJob",
+        instance_url="https://api.example/jobs/instances/1",
+        retry_after=0,
+    )
+
+
+def _client(*statuses):
+    client = MagicMock()
+    client.get_job_instance.side_effect = [{"status": s} for s in statuses]
+    return client
+
+
+class TestJobMonitor:
+    """Tests for JobMonitor."""
+
+    def test_polls_until_terminal_status(self):
+        client = _client("NotStarted", "InProgress", "Completed")
+        updates = []
+
+        progress = JobMonitor(
+            client, _handle(), min_poll_interval=0.01, on_update=lambda p: updates.append(p.status)
+        ).wait(timeout=5)
+
+        assert progress.succeeded
+        assert updates == ["NotStarted", "InProgress", "Completed"]
+        assert client.get_job_instance.call_count == 3
+
+    def test_failure_reason_is_reported(self):
+        client = MagicMock()
+        client.get_job_instance.return_value = {
+            "status": "Failed",
+            "failureReason": {"message": "Source table missing"},
+        }
+
+        progress = JobMonitor(client, _handle(), min_poll_interval=0.01).wait(timeout=5)
+
+        assert progress.is_terminal
+        assert not progress.succeeded
+        assert progress.failure_reason == "Source table missing"
+
+    def test_wait_times_out_without_blocking_on_job(self):
+        client = MagicMock()
+        client.get_job_instance.return_value = {"status": "InProgress"}
+        monitor = JobMonitor(client, _handle(), min_poll_interval=0.05)
+
+        start = time.monotonic()
+        with pytest.raises(LROTimeoutError):
+            monitor.wait(timeout=0.2)
+
+        assert time.monotonic() - start < 1
+        assert not monitor.progress.is_terminal
+
+    def test_handle_round_trips_through_state(self):
+        handle = _handle()
+        assert JobHandle.from_dict(handle.to_dict()) == handle
+
+    def test_lro_status_spellings_are_normalized(self):
+        assert normalize_job_status("succeeded") == "Completed"
+        assert normalize_job_status("Running") == "InProgress"
+        assert normalize_job_status("canceled") == "Cancelled"
+
+
+class TestNoWaitGraphRefresh:
+    """`setup --no-wait` followed by `status` reports the background refresh."""
+
+    def test_status_reports_job_after_successful_setup(self, tmp_path, capsys):
+        from demo_automation.cli import create_parser, run_setup, run_status
+        from demo_automation.platform.resource_discovery import ResourceSnapshot
+        from demo_automation.state_manager import SetupStateManager
+
+        config = MagicMock()
+        config.demo_path = tmp_path
+        config.name = "TestDemo"
+        config.fabric.workspace_id = "ws-1"
+        config.validate.return_value = []
+
+        fabric = MagicMock()
+        fabric.find_ontology_graph.return_value = {"id": "graph-1", "displayName": "Demo_graph"}
+        fabric.start_graph_refresh.return_value = _handle()
+        fabric.get_job_instance.return_value = {"status": "InProgress"}
+
+        def fake_run_setup(orchestrator, dry_run=False):
+            # Only the refresh step matters here; it runs with real state handling
+            orchestrator._fabric_client = fabric
+            orchestrator.state.ontology_id = "ont-1"
+            orchestrator.state.ontology_name = "Demo_Ontology"
+            orchestrator._state_manager.start_setup()
+            result = orchestrator._run_step_with_state(
+                "refresh_graph", orchestrator._step_refresh_graph
+            )
+            orchestrator._state_manager.complete_setup(success=True)
+            return {"refresh_graph": result}
+
+        parser = create_parser()
+        with patch(
+            "demo_automation.cli.DemoConfiguration.from_demo_folder", return_value=config,
+        ), patch(
+            "demo_automation.orchestrator.DemoOrchestrator.run_setup", fake_run_setup,
+        ):
+            assert run_setup(parser.parse_args(["setup", str(tmp_path), "--no-wait"])) == 0
+
+        assert config.options.wait_for_graph_refresh is False
+        state_manager = SetupStateManager(demo_path=tmp_path, workspace_id="ws-1", demo_name="TestDemo")
+        assert state_manager.has_existing_state()
+
+        capsys.readouterr()
+        with patch(
+            "demo_automation.cli.DemoConfiguration.from_demo_folder", return_value=config,
+        ), patch("demo_automation.platform.FabricClient") as client_cls, patch(
+            "demo_automation.platform.ResourceDiscovery",
+        ) as discovery_cls:
+            client_cls.return_value.__enter__.return_value = fabric
+            discovery_cls.return_value.discover.return_value = ResourceSnapshot()
+            assert run_status(parser.parse_args(["status", str(tmp_path)])) == 0
+
+        out = capsys.readouterr().out
+        assert "Graph refresh InProgress" in out
+        assert "Demo_graph" in out
+        fabric.get_job_instance.assert_called_once_with(_handle().instance_url)
+
+    def test_status_watch_json_outputs_refresh_state(self, tmp_path, capsys):
+        import json
+
+        from demo_automation.cli import create_parser, run_status
+        from demo_automation.platform.resource_discovery import ResourceSnapshot
+        from demo_automation.state_manager import SetupStateManager
+
+        config = MagicMock()
+        config.demo_path = tmp_path
+        config.name = "TestDemo"
+        config.fabric.workspace_id = "ws-1"
+        config.validate.return_value = []
+
+        state_manager = SetupStateManager(demo_path=tmp_path, workspace_id="ws-1", demo_name="TestDemo")
+        state_manager.start_setup()
+        state_manager.complete_step("refresh_graph", details={
+            "refresh_job": _handle().to_dict(),
+            "refresh_status": "InProgress",
+            "graph_name": "Demo_graph",
+        })
+        fabric = _client("Completed")
+
+        parser = create_parser()
+        with patch(
+            "demo_automation.cli.DemoConfiguration.from_demo_folder", return_value=config,
+        ), patch("demo_automation.platform.FabricClient") as client_cls, patch(
+            "demo_automation.platform.ResourceDiscovery",
+        ) as discovery_cls:
+            client_cls.return_value.__enter__.return_value = fabric
+            discovery_cls.return_value.discover.return_value = ResourceSnapshot()
+            args = parser.parse_args(["status", str(tmp_path), "--watch", "-o", "json"])
+            assert run_status(args) == 0
+
+        report = json.loads(capsys.readouterr().out)
+        assert report["steps"]["refresh_graph"] == "completed"
+        assert report["graph_refresh"]["graph_name"] == "Demo_graph"
+        assert report["graph_refresh"]["status"] == "Completed"
+        assert report["graph_refresh"]["succeeded"] is True
+        fabric.get_job_instance.assert_called_once_with(_handle().instance_url)
+
+    def test_state_cleared_once_refresh_finished(self, tmp_path):
+        from demo_automation.orchestrator import DemoOrchestrator
+
+        config = MagicMock()
+        config.demo_path = tmp_path
+        config.name = "TestDemo"
+        config.fabric.workspace_id = "ws-1"
+        orchestrator = DemoOrchestrator(config)
+        orchestrator._state_manager.start_setup()
+        orchestrator._state_manager.complete_step("refresh_graph", details={
+            "refresh_job": _handle().to_dict(),
+            "refresh_status": "Completed",
+        })
+
+        orchestrator.clear_state(keep_pending_jobs=True)
+
+        assert not orchestrator._state_manager.has_existing_state()
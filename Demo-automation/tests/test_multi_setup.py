@@ -0,0 +1,187 @@
+"""
+Tests for concurrent multi-demo setup (setup-many).
+"""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from demo_automation.cli import create_parser
+from demo_automation.multi_setup import DemoTarget, MultiDemoRunner, load_targets_file
+from demo_automation.orchestrator import StepResult, StepStatus
+from demo_automation.platform.fabric_client import RateLimitConfig
+from demo_automation.platform.shared_clients import SharedClients
+
+
+RUN_DELAY = 0.2
+
+
+class FakeOrchestrator:
+    """Records concurrency; fails for demo folders named 'Broken*'."""
+
+    active = 0
+    max_active = 0
+    calls = []
+    instances = []
+    lock = threading.Lock()
+
+    def __init__(self, config, progress_callback=None, resume=False, shared_clients=None):
+        self.config = config
+        self.progress_callback = progress_callback
+        self.cancelled = threading.Event()
+        FakeOrchestrator.instances.append(self)
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run_setup(self, dry_run=False):
+        cls = FakeOrchestrator
+        if self.config.demo_path.name.startswith("Interrupt"):
+            raise KeyboardInterrupt
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+            cls.calls.append((self.config.demo_path.name, self.config.fabric.workspace_id))
+        time.sleep(RUN_DELAY)
+        self.progress_callback("validate", "completed", 100)
+        with cls.lock:
+            cls.active -= 1
+        status = StepStatus.FAILED if self.config.demo_path.name.startswith("Broken") else StepStatus.COMPLETED
+        return {"validate": StepResult(status=status, message="")}
+
+    def clear_state(self, keep_pending_jobs=False):
+        pass
+
+
+def _config(demo_path, workspace_id=None):
+    config = MagicMock()
+    config.demo_path = Path(demo_path)
+    config.fabric.workspace_id = workspace_id
+    config.options.dry_run = False
+    config.validate.return_value = []
+    return config
+
+
+@pytest.fixture
+def fake_setup():
+    FakeOrchestrator.active = 0
+    FakeOrchestrator.max_active = 0
+    FakeOrchestrator.calls = []
+    FakeOrchestrator.instances = []
+    with patch("demo_automation.multi_setup.DemoOrchestrator", FakeOrchestrator), patch(
+        "demo_automation.multi_setup.DemoConfiguration.from_demo_folder", side_effect=_config,
+    ):
+        yield FakeOrchestrator
+
+
+class TestMultiDemoRunner:
+    """Tests for MultiDemoRunner."""
+
+    def test_demo_folders_run_concurrently(self, fake_setup, tmp_path):
+        targets = [DemoTarget(tmp_path / name, "ws-1") for name in ("Auto", "Tea", "Zava")]
+        progress = []
+
+        start = time.monotonic()
+        outcomes = MultiDemoRunner(
+            targets,
+            shared_clients=MagicMock(),
+            progress_callback=lambda t, step, status, pct: progress.append(t.label),
+        ).run()
+
+        assert time.monotonic() - start < 2 * RUN_DELAY
+        assert fake_setup.max_active == 3
+        assert [o.target for o in outcomes] == targets
+        assert all(o.succeeded for o in outcomes)
+        assert sorted(progress) == sorted(t.label for t in targets)
+
+    def test_same_folder_runs_sequentially_per_workspace(self, fake_setup, tmp_path):
+        targets = [DemoTarget(tmp_path / "Tea", ws) for ws in ("ws-1", "ws-2")]
+
+        MultiDemoRunner(targets, shared_clients=MagicMock()).run()
+
+        assert fake_setup.max_active == 1
+        assert fake_setup.calls == [("Tea", "ws-1"), ("Tea", "ws-2")]
+
+    def test_failure_skips_later_targets_of_same_folder(self, fake_setup, tmp_path):
+        targets = [
+            DemoTarget(tmp_path / "Broken", "ws-1"),
+            DemoTarget(tmp_path / "Broken", "ws-2"),
+            DemoTarget(tmp_path / "Tea", "ws-1"),
+        ]
+
+        outcomes = MultiDemoRunner(targets, shared_clients=MagicMock()).run()
+
+        assert [o.succeeded for o in outcomes] == [False, False, True]
+        assert "Skipped" in outcomes[1].error
+        assert ("Broken", "ws-2") not in fake_setup.calls
+
+    def test_interrupt_cancels_pending_and_running_targets(self, fake_setup, tmp_path):
+        targets = [
+            DemoTarget(tmp_path / "Tea", "ws-1"),
+            DemoTarget(tmp_path / "Interrupt", "ws-1"),
+            DemoTarget(tmp_path / "Zava", "ws-1"),
+        ]
+
+        start = time.monotonic()
+        with pytest.raises(KeyboardInterrupt):
+            MultiDemoRunner(targets, shared_clients=MagicMock(), max_parallel=2).run()
+
+        # Returns without waiting for the running Tea setup to finish
+        assert time.monotonic() - start < RUN_DELAY
+        tea = next(o for o in fake_setup.instances if o.config.demo_path.name == "Tea")
+        assert tea.cancelled.is_set()
+        # Zava was still queued: never started
+        time.sleep(RUN_DELAY * 1.5)
+        assert ("Zava", "ws-1") not in fake_setup.calls
+
+    def test_cancel_stops_between_steps(self, tmp_path):
+        from demo_automation.core.errors import CancellationRequestedError
+        from demo_automation.orchestrator import DemoOrchestrator
+
+        config = MagicMock()
+        config.demo_path = tmp_path
+        config.name = "TestDemo"
+        config.fabric.workspace_id = "ws-1"
+        orchestrator = DemoOrchestrator(config)
+        orchestrator.cancel()
+        step = MagicMock()
+
+        with pytest.raises(CancellationRequestedError):
+            orchestrator._run_step_with_state("validate", step)
+        step.assert_not_called()
+
+
+class TestSharedClients:
+    """Tests for the shared token cache and workspace rate limiters."""
+
+    def test_clients_share_token_cache_and_workspace_limiter(self):
+        with patch("demo_automation.platform.shared_clients.create_credential") as create_credential:
+            shared = SharedClients(RateLimitConfig(requests_per_minute=30))
+            a1 = shared.create_fabric_client("ws-a")
+            a2 = shared.create_fabric_client("ws-a")
+            b = shared.create_fabric_client("ws-b")
+
+        create_credential.assert_called_once()
+        assert a1._token_cache is a2._token_cache is b._token_cache
+        assert a1._rate_limiter is a2._rate_limiter
+        assert a1._rate_limiter is not b._rate_limiter
+
+
+class TestSetupManyCli:
+    """Tests for setup-many target parsing."""
+
+    def test_targets_from_arguments_and_file(self, tmp_path):
+        targets_file = tmp_path / "targets.yaml"
+        targets_file.write_text(
+            "targets:\n  - demo_path: Tea\n    workspace_id: ws-2\n", encoding="utf-8"
+        )
+
+        args = create_parser().parse_args([
+            "setup-many", "--target", "Auto", "ws-1", "--targets-file", str(targets_file),
+        ])
+
+        assert args.target == [["Auto", "ws-1"]]
+        assert load_targets_file(targets_file) == [DemoTarget((tmp_path / "Tea").resolve(), "ws-2")]
@@ -0,0 +1,95 @@
+"""
+Tests for concurrent resource discovery used by status and recover.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from demo_automation.platform.resource_discovery import ResourceDiscovery
+
+
+LOOKUP_DELAY = 0.2
+
+
+def _slow(value):
+    """Return a fake API call that takes LOOKUP_DELAY seconds."""
+    def call(*args, **kwargs):
+        time.sleep(LOOKUP_DELAY)
+        return value
+    return call
+
+
+@pytest.fixture
+def fabric_client():
+    client = MagicMock()
+    client.workspace_id = "ws-1"
+    client.list_lakehouses.side_effect = _slow([
+        {"id": "lh-1", "displayName": "Demo_Lakehouse"},
+    ])
+    client.list_eventhouses.side_effect = _slow([
+        {"id": "eh-0", "displayName": "Other_Eventhouse"},
+        {"id": "eh-1", "displayName": "Demo_Eventhouse"},
+    ])
+    client.list_kql_databases.side_effect = _slow([
+        {"id": "db-1", "displayName": "Demo_Eventhouse"},
+    ])
+    client.list_ontologies.side_effect = _slow([
+        {"id": "ont-1", "displayName": "Demo_Ontology"},
+    ])
+    client.list_graphs.side_effect = _slow([
+        {"id": "g-1", "displayName": "Demo_Ontology_graph_ont1"},
+    ])
+    client.get_ontology_definition.side_effect = _slow({"definition": {"parts": []}})
+    return client
+
+
+class TestResourceDiscovery:
+    """Tests for ResourceDiscovery."""
+
+    def test_lookups_run_concurrently(self, fabric_client):
+        with patch(
+            "demo_automation.platform.resource_discovery.LakehouseClient.list_tables",
+            side_effect=_slow([{"name": "DimMachine"}, {"name": "DimLine"}]),
+        ), patch(
+            "demo_automation.platform.resource_discovery.EventhouseClient.get_table_row_counts",
+            side_effect=_slow({"Telemetry": 100, "Alarms": 5}),
+        ):
+            start = time.monotonic()
+            snapshot = ResourceDiscovery(fabric_client).discover(names={
+                "lakehouse": "Demo_Lakehouse",
+                "eventhouse": "Demo_Eventhouse",
+                "kql_database": "Demo_Eventhouse",
+                "ontology": "Demo_Ontology",
+            })
+            elapsed = time.monotonic() - start
+
+        # 5 listings + 3 detail lookups would take 8 * LOOKUP_DELAY serially
+        assert elapsed < 4 * LOOKUP_DELAY
+        assert snapshot.get("eventhouse")["id"] == "eh-1"
+        assert snapshot.get("graph")["id"] == "g-1"
+        assert snapshot.lakehouse_tables == ["DimMachine", "DimLine"]
+        assert snapshot.kql_table_counts == {"Telemetry": 100, "Alarms": 5}
+        assert snapshot.ontology_entity_count == 0
+        assert not snapshot.errors
+
+    def test_prefix_match_for_recover(self, fabric_client):
+        snapshot = ResourceDiscovery(fabric_client).discover(prefix="Demo", include_details=False)
+
+        assert snapshot.to_state_resources() == {
+            "lakehouse": {"id": "lh-1", "name": "Demo_Lakehouse"},
+            "eventhouse": {"id": "eh-1", "name": "Demo_Eventhouse"},
+            "kql_database": {"id": "db-1", "name": "Demo_Eventhouse"},
+            "ontology": {"id": "ont-1", "name": "Demo_Ontology"},
+        }
+        fabric_client.get_ontology_definition.assert_not_called()
+
+    def test_failed_lookup_is_recorded(self, fabric_client):
+        fabric_client.list_graphs.side_effect = RuntimeError("not supported")
+
+        snapshot = ResourceDiscovery(fabric_client).discover(prefix="Demo", include_details=False)
+
+        assert snapshot.get("graph") is None
+        assert snapshot.get("ontology") is not None
+        assert "not supported" in snapshot.errors["graph"]
@@ -0,0 +1,173 @@
+"""
+Tests for setup state persistence (snapshot + journal).
+"""
+
+import json
+import threading
+from pathlib import Path
+
+import yaml
+
+from demo_automation.state_manager import (
+    JOURNAL_COMPACT_THRESHOLD,
+    SetupStateManager,
+    SetupStatus,
+    StepStatus,
+)
+
+
+def _manager(tmp_path):
+    return SetupStateManager(tmp_path, workspace_id="ws-1", demo_name="TestDemo")
+
+
+def _reload(tmp_path):
+    manager = _manager(tmp_path)
+    return manager, manager.load_state()
+
+
+class TestSnapshot:
+    """Tests for the atomic state snapshot."""
+
+    def test_snapshot_is_json_and_valid_yaml(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.start_setup()
+        manager.update_resource_ids(lakehouse_id="lh-1", lakehouse_name="TestDemo_Lakehouse")
+
+        text = manager.state_file.read_text(encoding="utf-8")
+        assert json.loads(text)["resources"]["lakehouse"]["id"] == "lh-1"
+        assert yaml.safe_load(text)["resources"]["lakehouse"]["id"] == "lh-1"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_unserializable_details_are_stored_as_strings(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.start_setup()
+        manager.complete_step("validate", details={"path": Path("Bindings")})
+        manager.save_state()
+
+        _, state = _reload(tmp_path)
+        assert state.steps["validate"].details == {"path": "Bindings"}
+
+    def test_loads_legacy_yaml_state(self, tmp_path):
+        legacy = {
+            "schema_version": "1.0",
+            "setup_id": "abc",
+            "demo_name": "TestDemo",
+            "workspace_id": "ws-1",
+            "started_at": "2024-01-01T00:00:00+00:00",
+            "status": "in_progress",
+            "steps": {"validate": {"status": "completed"}},
+        }
+        (tmp_path / ".setup-state.yaml").write_text(yaml.dump(legacy), encoding="utf-8")
+
+        _, state = _reload(tmp_path)
+
+        assert state.setup_id == "abc"
+        assert state.get_completed_steps() == ["validate"]
+
+
+class TestJournal:
+    """Tests for journaled step transitions."""
+
+    def test_step_transitions_are_journaled_and_replayed(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.start_setup()
+        manager.start_step("validate")
+        manager.complete_step("validate", details={"files": 3})
+        manager.fail_step("create_lakehouse", "boom")
+
+        assert manager.journal_file.exists()
+        snapshot = json.loads(manager.state_file.read_text(encoding="utf-8"))
+        assert snapshot["steps"] == {}
+
+        _, state = _reload(tmp_path)
+        assert state.status == SetupStatus.IN_PROGRESS
+        assert state.steps["validate"].status == StepStatus.COMPLETED
+        assert state.steps["validate"].details == {"files": 3}
+        assert state.get_failed_step() == "create_lakehouse"
+
+    def test_torn_trailing_line_is_ignored(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.start_setup()
+        manager.complete_step("validate")
+        with open(manager.journal_file, "a", encoding="utf-8") as f:
+            f.write('{"seq": 99, "step": "create_lak')
+
+        _, state = _reload(tmp_path)
+        assert state.get_completed_steps() == ["validate"]
+
+    def test_compaction_folds_journal_into_snapshot(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.start_setup()
+        for i in range(JOURNAL_COMPACT_THRESHOLD + 1):
+            manager.complete_step(f"step_{i}")
+
+        snapshot = json.loads(manager.state_file.read_text(encoding="utf-8"))
+        assert len(snapshot["steps"]) == JOURNAL_COMPACT_THRESHOLD + 1
+        assert not manager.journal_file.exists()
+        assert manager.has_backup()
+
+    def test_snapshots_outside_compaction_do_not_back_up(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.start_setup()
+        manager.update_resource_ids(lakehouse_id="lh-1")
+        manager.complete_step("validate")
+        manager.complete_setup()
+
+        assert not manager.has_backup()
+
+    def test_unchanged_resource_ids_do_not_rewrite_snapshot(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.start_setup()
+        manager.update_resource_ids(lakehouse_id="lh-1")
+        manager.complete_step("create_lakehouse")
+
+        manager.update_resource_ids(lakehouse_id="lh-1")
+
+        assert manager.journal_file.exists()
+
+    def test_events_already_in_snapshot_are_not_replayed(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.start_setup()
+        manager.fail_step("validate", "boom")
+        stale_journal = manager.journal_file.read_text(encoding="utf-8")
+
+        manager.complete_step("validate")
+        manager.save_state()
+        # Simulate a crash between snapshot rename and journal removal
+        manager.journal_file.write_text(stale_journal, encoding="utf-8")
+
+        _, state = _reload(tmp_path)
+        assert state.steps["validate"].status == StepStatus.COMPLETED
+
+    def test_fresh_state_does_not_journal_onto_old_snapshot(self, tmp_path):
+        old = _manager(tmp_path)
+        old.start_setup()
+        old_setup_id = old.state.setup_id
+
+        new = _manager(tmp_path)
+        new.complete_step("validate")
+
+        _, state = _reload(tmp_path)
+        assert state.setup_id != old_setup_id
+        assert state.get_completed_steps() == ["validate"]
+
+
+class TestThreadSafety:
+    """State updates from concurrent workers must not be lost."""
+
+    def test_concurrent_step_updates(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.start_setup()
+
+        def worker(worker_id):
+            for i in range(10):
+                manager.complete_step(f"w{worker_id}_s{i}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        _, state = _reload(tmp_path)
+        assert len(state.get_completed_steps()) == 80
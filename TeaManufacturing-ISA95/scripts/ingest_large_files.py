@@ -1,30 +1,44 @@
 #!/usr/bin/env python3
 """
-Ingest large Eventhouse CSV parts into Fabric.
+Ingest large Eventhouse CSVs into Fabric.
 
-Uploads the split part files to OneLake and runs .ingest for each,
-working around the ~200MB single-file ingestion limit.
+Uses the demo automation bulk ingestion path: CSVs above the ~200MB
+single-file ingestion limit are split automatically (see the
+max_ingest_file_mb option), all files are uploaded to OneLake concurrently,
+then each table is loaded with multi-URI .ingest commands.
 
 Usage:
-    python3 scripts/ingest_large_files.py
+    python3 scripts/ingest_large_files.py [--append] [--max-parallel N]
 
 Prerequisites:
     - az login (or DefaultAzureCredential)
     - The main demo setup must have completed first (Eventhouse + KQL tables exist)
-    - Part files must exist in Data/Eventhouse/ (*_part*.csv)
+    - Full CSVs in Data/Eventhouse/ (e.g. from transform_real_data.py);
+      existing part files (*_part*.csv, also in parts/) take precedence
 
-Configuration is read from ~/.fabric-demo/config.yaml (workspace_id)
-and from the deployment's state or hardcoded IDs below.
+Only tables with part files or CSVs above max_ingest_file_mb are loaded; the
+small CSVs were ingested in full by the setup. A table's seed rows are cleared
+only once its files are uploaded, right before its .ingest commands.
+
+Workspace and resource IDs are read from the demo configuration
+(~/.fabric-demo/config.yaml, demo.yaml) and the setup state file.
+
+Note: new setups ingest the full CSVs directly (the ingest_data step splits
+oversized files itself); this script is for demos that were deployed with
+the seed files only.
 """
 
+import argparse
 import logging
+import re
 import sys
-import time
 from pathlib import Path
 
-import yaml
-from azure.identity import DefaultAzureCredential
-from azure.storage.filedatalake import DataLakeServiceClient
+DEMO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DEMO_DIR.parent / "Demo-automation" / "src"))
+
+from demo_automation.core.config import DemoConfiguration  # noqa: E402
+from demo_automation.orchestrator import DemoOrchestrator  # noqa: E402
 
 logging.basicConfig(
     level=logging.INFO,
@@ -32,212 +46,77 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
-# ---------------------------------------------------------------------------
-# Configuration — update these after the initial deployment
-# ---------------------------------------------------------------------------
-WORKSPACE_ID = None  # Will be read from config
-LAKEHOUSE_ID = None  # Lakehouse where eventhouse CSVs are staged
-EVENTHOUSE_ID = None  # Eventhouse to ingest into
-DATABASE_NAME = "TeaManufacturingDB"
-
-ONELAKE_URL = "https://onelake.dfs.fabric.microsoft.com"
-
-# The seed files (deployed by the automation tool) contain the first N data rows.
-# The part files contain ALL data including those seed rows.
-# We ingest parts that start AFTER the seed to avoid duplicates.
-SEED_ROWS = {
-    "MachineStateTelemetry": 75000,       # seed = first 75K rows
-    "ProductionCounterTelemetry": 50000,   # seed = first 50K rows
-}
-
-# Map: KQL table name -> list of part file globs (from full_data split)
-TABLES = {
-    "MachineStateTelemetry": "MachineStateTelemetry_part*.csv",
-    "ProductionCounterTelemetry": "ProductionCounterTelemetry_part*.csv",
-}
+PART_PATTERN = re.compile(r"^(?P<table>.+)_part(?P<index>\d+)$")
 
-DEMO_DIR = Path(__file__).resolve().parent.parent
-DATA_DIR = DEMO_DIR / "Data" / "Eventhouse" / "parts"
-
-
-def load_config():
-    """Load workspace ID from ~/.fabric-demo/config.yaml."""
-    global WORKSPACE_ID, LAKEHOUSE_ID, EVENTHOUSE_ID
-
-    config_path = Path.home() / ".fabric-demo" / "config.yaml"
-    if config_path.exists():
-        with open(config_path) as f:
-            cfg = yaml.safe_load(f)
-        WORKSPACE_ID = cfg.get("defaults", {}).get("workspace_id")
-        log.info(f"Workspace ID from config: {WORKSPACE_ID}")
-    
-    if not WORKSPACE_ID:
-        log.error("No workspace_id found in ~/.fabric-demo/config.yaml")
-        sys.exit(1)
-
-    # Try to read IDs from the setup state file or prompt
-    state_path = DEMO_DIR / ".setup-state.yaml"
-    if state_path.exists():
-        with open(state_path) as f:
-            state = yaml.safe_load(f)
-        LAKEHOUSE_ID = state.get("lakehouse_id")
-        EVENTHOUSE_ID = state.get("eventhouse_id")
-
-    if not LAKEHOUSE_ID or not EVENTHOUSE_ID:
-        # Prompt user for IDs
-        print("\nThe Lakehouse and Eventhouse IDs are needed.")
-        print("You can find these in the Fabric portal URL or from the setup output.\n")
-        if not LAKEHOUSE_ID:
-            LAKEHOUSE_ID = input("Lakehouse ID (GUID): ").strip()
-        if not EVENTHOUSE_ID:
-            EVENTHOUSE_ID = input("Eventhouse ID (GUID): ").strip()
-
-
-def upload_file(fs_client, local_file: Path, remote_name: str) -> str:
-    """Upload a single file to OneLake eventhouse staging folder."""
-    dir_path = f"{LAKEHOUSE_ID}/Files/eventhouse"
-    dir_client = fs_client.get_directory_client(dir_path)
-
-    try:
-        dir_client.create_directory()
-    except Exception:
-        pass
-
-    file_client = dir_client.get_file_client(remote_name)
-    file_size = local_file.stat().st_size
-    size_mb = file_size / (1024 * 1024)
-
-    log.info(f"Uploading {remote_name} ({size_mb:.1f} MB)...")
-
-    chunk_size = 4 * 1024 * 1024  # 4MB
-    file_client.create_file()
-
-    offset = 0
-    with open(local_file, "rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            file_client.append_data(chunk, offset=offset)
-            offset += len(chunk)
-            pct = offset / file_size * 100
-            if offset % (20 * 1024 * 1024) < chunk_size:  # Log every ~20MB
-                log.info(f"  {remote_name}: {pct:.0f}% ({offset // (1024*1024)} MB)")
-
-    file_client.flush_data(offset)
-    full_path = f"https://onelake.dfs.fabric.microsoft.com/{WORKSPACE_ID}/{dir_path}/{remote_name};impersonate"
-    log.info(f"Uploaded: {remote_name}")
-    return full_path
-
-
-def ingest_from_onelake(credential, table_name: str, onelake_path: str):
-    """Run .ingest KQL command to pull data from OneLake into a KQL table."""
-    import requests
-
-    # Get token for Kusto
-    token = credential.get_token("https://api.fabric.microsoft.com/.default")
-
-    # Build .ingest command
-    command = (
-        f".ingest into table {table_name} "
-        f"(h'{onelake_path}') "
-        f"with (format='csv', ignoreFirstRecord=true)"
-    )
 
-    # Find the Kusto query endpoint
-    query_url = f"https://api.fabric.microsoft.com/v1/workspaces/{WORKSPACE_ID}/eventhouses/{EVENTHOUSE_ID}/kqlDatabases"
-    headers = {
-        "Authorization": f"Bearer {token.token}",
-        "Content-Type": "application/json",
-    }
-
-    # Get database ID
-    resp = requests.get(query_url, headers=headers)
-    resp.raise_for_status()
-    databases = resp.json().get("value", [])
-    
-    db_id = None
-    for db in databases:
-        if db.get("databaseName", "") == DATABASE_NAME or db.get("displayName", "") == DATABASE_NAME:
-            db_id = db.get("id")
-            break
-    
-    if not db_id:
-        log.error(f"Database '{DATABASE_NAME}' not found. Available: {[d.get('displayName', d.get('databaseName')) for d in databases]}")
-        return False
-
-    # Execute management command via Kusto REST API
-    mgmt_url = f"https://api.fabric.microsoft.com/v1/workspaces/{WORKSPACE_ID}/kqlDatabases/{db_id}/executeManagementCommand"
-    
-    payload = {"command": command}
-    log.info(f"Ingesting into {table_name} from OneLake...")
-    
-    resp = requests.post(mgmt_url, headers=headers, json=payload, timeout=600)
-    
-    if resp.status_code == 200:
-        log.info(f"Successfully ingested into {table_name}")
-        return True
-    else:
-        log.error(f"Ingestion failed for {table_name}: {resp.status_code} - {resp.text[:500]}")
-        return False
+def find_table_files(data_dir: Path, min_bytes: int) -> dict:
+    """Map KQL table names to their part files (by part number) or, failing that,
+    their full CSV if it is larger than *min_bytes*."""
+    tables = {csv_file.stem: [csv_file] for csv_file in data_dir.glob("*.csv")
+              if not PART_PATTERN.match(csv_file.stem) and csv_file.stat().st_size > min_bytes}
+    parts = {}
+    for folder in (data_dir, data_dir / "parts"):
+        if not folder.is_dir():
+            continue
+        for csv_file in folder.glob("*_part*.csv"):
+            match = PART_PATTERN.match(csv_file.stem)
+            if match:
+                parts.setdefault(match["table"], []).append((int(match["index"]), csv_file))
+    tables.update({table: [f for _, f in sorted(files)] for table, files in parts.items()})
+    return dict(sorted(tables.items()))
 
 
 def main():
-    load_config()
-
-    credential = DefaultAzureCredential()
-    service_client = DataLakeServiceClient(
-        account_url=ONELAKE_URL,
-        credential=credential,
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="Keep existing table data (by default the seed rows are cleared "
+             "before each table is reloaded, since the CSVs contain them)",
+    )
+    parser.add_argument("--max-parallel", type=int, default=4, help="Parallel uploads/ingestions")
+    args = parser.parse_args()
+
+    config = DemoConfiguration.from_demo_folder(DEMO_DIR)
+    orchestrator = DemoOrchestrator(config)
+    if not orchestrator.restore_resource_ids():
+        log.error("No setup state found - run the main demo setup first")
+        return 1
+
+    state = orchestrator.get_state()
+    if not state.lakehouse_id or not state.eventhouse_id:
+        log.error("Lakehouse/Eventhouse IDs missing from setup state - run 'fabric-demo recover' first")
+        return 1
+    if not state.kql_database_name:
+        kql_db = orchestrator.eventhouse_client.get_default_database_for_eventhouse(state.eventhouse_id)
+        if not kql_db:
+            log.error("Could not find the KQL database for the Eventhouse")
+            return 1
+        state.kql_database_name = kql_db.get("displayName")
+
+    table_files = find_table_files(
+        config.eventhouse_data_path or DEMO_DIR / "Data" / "Eventhouse",
+        min_bytes=config.options.max_ingest_file_mb * 1024 * 1024,
+    )
+    if not table_files:
+        log.warning("No Eventhouse part files or oversized CSVs found")
+        return 0
+
+    for table_name, files in table_files.items():
+        log.info(f"{table_name}: {len(files)} file(s)")
+
+    ingested, failed = orchestrator.ingest_eventhouse_files(
+        table_files,
+        mapping_names={table: f"{table}_csv" for table in table_files},
+        max_workers=args.max_parallel,
+        replace_existing=not args.append,
     )
-    fs_client = service_client.get_file_system_client(WORKSPACE_ID)
-
-    total_success = 0
-    total_failed = 0
-
-    for table_name, glob_pattern in TABLES.items():
-        part_files = sorted(DATA_DIR.glob(glob_pattern))
 
-        if not part_files:
-            log.warning(f"No part files found for {table_name} (pattern: {glob_pattern})")
-            continue
+    log.info(f"DONE: {len(ingested)} tables ingested, {len(failed)} failed")
+    for table_name in failed:
+        log.error(f"  Failed: {table_name}")
 
-        log.info(f"\n{'='*60}")
-        log.info(f"Processing {table_name}: {len(part_files)} parts")
-        log.info(f"{'='*60}")
-
-        for i, part_file in enumerate(part_files, 1):
-            log.info(f"\n--- Part {i}/{len(part_files)}: {part_file.name} ---")
-
-            # Step 1: Upload to OneLake
-            try:
-                onelake_path = upload_file(fs_client, part_file, part_file.name)
-            except Exception as e:
-                log.error(f"Upload failed for {part_file.name}: {e}")
-                total_failed += 1
-                continue
-
-            # Step 2: Ingest into KQL table
-            try:
-                success = ingest_from_onelake(credential, table_name, onelake_path)
-                if success:
-                    total_success += 1
-                else:
-                    total_failed += 1
-            except Exception as e:
-                log.error(f"Ingestion failed for {part_file.name}: {e}")
-                total_failed += 1
-
-            # Brief pause between parts
-            if i < len(part_files):
-                log.info("Waiting 5s before next part...")
-                time.sleep(5)
-
-    log.info(f"\n{'='*60}")
-    log.info(f"DONE: {total_success} parts ingested, {total_failed} failed")
-    log.info(f"{'='*60}")
-
-    return 0 if total_failed == 0 else 1
+    return 0 if not failed else 1
 
 
 if __name__ == "__main__":
@@ -9,16 +9,37 @@ Produces 4 Eventhouse CSVs covering July 2025 – July 2026:
   4. EquipmentTelemetry.csv       (synthetic, ~200K+ rows for 15 equipment items)
 
 Also produces an expanded DimEquipment.csv with WorkUnit-level machines.
+
+The two real-data tables are built tile by tile in parallel worker processes.
+Each worker streams the source CSV in chunks, transforms whole columns at a
+time as NumPy arrays (remap functions run once per distinct value) and
+writes its tile to a fragment file;
+fragments are concatenated in tile order, so the output does not depend on
+the number of workers. The synthetic tables are generated as whole NumPy
+arrays per segment / equipment item.
+
+Usage:
+    python3 scripts/transform_real_data.py [--workers N]
+
+Requires numpy (pip install numpy).
 """
 
+import argparse
+import concurrent.futures
 import csv
+import itertools
 import os
-import random
 import math
+import shutil
+import tempfile
+import zlib
 from datetime import datetime, timedelta
 from collections import defaultdict
+from functools import lru_cache
+
+import numpy as np
 
-random.seed(42)
+RNG = np.random.default_rng(42)
 
 # ── paths ──────────────────────────────────────────────────────────────────────
 BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -41,6 +62,29 @@ ORIG_SPAN_SEC = (ORIG_END - ORIG_START).total_seconds()
 # Number of times to tile the original data to fill the demo window
 TILE_COUNT = math.ceil(DEMO_SPAN_SEC / ORIG_SPAN_SEC)  # ~13
 
+# Source rows transformed per chunk (one column list per field)
+CHUNK_ROWS = 50_000
+
+# Sampling interval of the synthetic tables
+SYNTHETIC_INTERVAL_MIN = 30
+
+
+def synthetic_timeline():
+    """Timestamps (datetime64[m]) of the synthetic readings over the demo window."""
+    total_minutes = int(DEMO_SPAN_SEC / 60)
+    minutes = np.arange(total_minutes // SYNTHETIC_INTERVAL_MIN) * SYNTHETIC_INTERVAL_MIN
+    times = np.datetime64(DEMO_START, "m") + minutes.astype("timedelta64[m]")
+    return times[times < np.datetime64(DEMO_END, "m")]
+
+
+def format_timestamps(times) -> list:
+    return np.datetime_as_string(times.astype("datetime64[s]"), unit="s").tolist()
+
+
+def format_1dp(values) -> list:
+    """Format floats with one decimal place (like f"{v:.1f}")."""
+    return np.char.mod("%.1f", values).tolist()
+
 # ── Line mapping  (11 real lines → 11 fictional) ──────────────────────────────
 LINE_MAP = {
     "Line 1":  "PackLine-Alpha",
@@ -159,8 +203,8 @@ def remap_sku_name(orig: str) -> str:
         return orig
     if orig in SKU_MAP:
         return SKU_MAP[orig]
-    # Deterministic mapping: hash-based index
-    idx = hash(orig) % len(GOLDEN_LEAF_PRODUCTS)
+    # Deterministic mapping: stable hash, identical in every process and run
+    idx = zlib.crc32(orig.encode("utf-8")) % len(GOLDEN_LEAF_PRODUCTS)
     SKU_MAP[orig] = GOLDEN_LEAF_PRODUCTS[idx]
     return SKU_MAP[orig]
 
@@ -192,6 +236,7 @@ STATE_CLEAN = {
 }
 
 
+@lru_cache(maxsize=None)
 def remap_line(orig: str) -> str:
     return LINE_MAP.get(orig.strip(), orig.strip())
 
@@ -208,6 +253,8 @@ LOCATION_MAP = {
 
 
 # ── Timestamp shifting ────────────────────────────────────────────────────────
+# Many rows share a timestamp (one per machine), so parsed results are cached
+@lru_cache(maxsize=1 << 16)
 def shift_timestamp(orig_str: str, tile_idx: int) -> str:
     """Shift an original timestamp into the demo window.
     
@@ -234,6 +281,36 @@ def shift_timestamp(orig_str: str, tile_idx: int) -> str:
     return new_dt.strftime("%Y-%m-%dT%H:%M:%S")
 
 
+@lru_cache(maxsize=None)
+def parse_source_time(orig_str: str) -> np.datetime64:
+    """Source timestamp as datetime64[s] (NaT if empty or unparseable)."""
+    value = orig_str.strip()
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%d/%m/%Y"):
+        try:
+            return np.datetime64(datetime.strptime(value, fmt), "s")
+        except ValueError:
+            pass
+    return np.datetime64("NaT", "s")
+
+
+def shift_timestamps(values, tile_idx: int) -> np.ndarray:
+    """shift_timestamp() for a whole column: object array, None = drop the row.
+
+    Each distinct value is parsed once; the shift, the DEMO_END cut-off and
+    the formatting run on datetime64 arrays.
+    """
+    uniques, inverse = np.unique(np.asarray(values), return_inverse=True)
+    parsed = np.array([parse_source_time(u) for u in uniques.tolist()], dtype="datetime64[s]")
+    offset = np.timedelta64(int(tile_idx * ORIG_SPAN_SEC), "s")
+    shifted = np.datetime64(DEMO_START, "s") + (parsed - np.datetime64(ORIG_START, "s")) + offset
+    out = np.datetime_as_string(shifted, unit="s").astype(object)
+    out[shifted >= np.datetime64(DEMO_END, "s")] = None
+    # Empty / NULL → "", anything else unparseable passes through unchanged
+    for i in np.flatnonzero(np.isnat(parsed)).tolist():
+        out[i] = shift_timestamp(uniques[i], tile_idx)
+    return out[inverse]
+
+
 def shift_date_only(orig_str: str, tile_idx: int) -> str:
     """Shift a date string (DD/MM/YYYY or YYYY-MM-DD)."""
     if not orig_str or orig_str.strip() in ("", "NULL"):
@@ -285,45 +362,160 @@ def assign_batch(tile_idx: int, row_idx: int) -> str:
     return BATCH_IDS[(tile_idx * 1000 + row_idx) % len(BATCH_IDS)]
 
 
+def assign_batches(tile_idx: int, first_row_idx: int, count: int) -> np.ndarray:
+    """assign_batch() for `count` consecutive rows starting at first_row_idx."""
+    start = tile_idx * 1000 + first_row_idx
+    return np.array(BATCH_IDS)[np.arange(start, start + count) % len(BATCH_IDS)]
+
+
+# ── Chunked column transforms ─────────────────────────────────────────────────
+def clean_value(val: str, default: str) -> str:
+    """Stripped value, or `default` for empty / NULL."""
+    v = val.strip() if val else ""
+    return v if v and v != "NULL" else default
+
+
+def clean_values(values, default: str) -> np.ndarray:
+    """clean_value() for a whole column."""
+    v = np.char.strip(np.asarray(values))
+    return np.where((v == "") | (v == "NULL"), default, v)
+
+
+def map_values(values, fn) -> np.ndarray:
+    """Apply fn once per distinct value and gather the results for the column."""
+    uniques, inverse = np.unique(np.asarray(values), return_inverse=True)
+    return np.array([fn(u) for u in uniques.tolist()], dtype=object)[inverse]
+
+
+def read_chunks(path: str):
+    """Yield (first_row_idx, columns, row_count) for CHUNK_ROWS-row chunks of a CSV.
+
+    `columns` maps header name → tuple of values. Row numbering matches
+    csv.DictReader (blank lines skipped); short rows are padded with "".
+    """
+    with open(path, "r", newline="") as fin:
+        reader = filter(None, csv.reader(fin))
+        header = next(reader)
+        width = len(header)
+        first_row_idx = 0
+        while True:
+            rows = list(itertools.islice(reader, CHUNK_ROWS))
+            if not rows:
+                return
+            for row in rows:
+                if len(row) < width:
+                    row.extend([""] * (width - len(row)))
+            yield first_row_idx, dict(zip(header, zip(*rows))), len(rows)
+            first_row_idx += len(rows)
+
+
+def build_equipment_ids(path: str) -> dict:
+    """Map each source MachineName to its equipment ID, in first-seen order."""
+    eqp_ids = {}
+    for _, cols, _ in read_chunks(path):
+        for name in cols["MachineName"]:
+            if name not in eqp_ids:
+                eqp_ids[name] = get_equipment_id(remap_machine_name(name))
+    return eqp_ids
+
+
+def machine_state_columns(cols, count, tile_idx, first_row_idx, eqp_ids):
+    return [
+        shift_timestamps(cols["TIMESTAMP_String"], tile_idx),
+        map_values(cols["MachineName"], eqp_ids.__getitem__),
+        map_values(cols["Line"], remap_line),
+        clean_values(cols["Shift"], "Day"),
+        map_values(cols["MachineState"], lambda v: STATE_CLEAN.get(v.strip(), "Idle")),
+        clean_values(cols["Error_Code"], "0"),
+        clean_values(cols["TimeSpan_Sec"], "0"),
+        assign_batches(tile_idx, first_row_idx, count),
+    ]
+
+
+def production_counter_columns(cols, count, tile_idx, first_row_idx, eqp_ids):
+    def numbers(name):
+        return clean_values(cols.get(name, ("",) * count), "0")
+
+    return [
+        shift_timestamps(cols["TIMESTAMP"], tile_idx),
+        map_values(cols["MachineName"], eqp_ids.__getitem__),
+        map_values(cols["Line"], remap_line),
+        map_values(cols["SKU_Name"], remap_sku_name),
+        clean_values(cols.get("Shift", ("",) * count), "Day"),
+        numbers("New_Count"),
+        numbers("Count_Difference"),
+        numbers("Diff_Tea_Produced_Gram"),
+        numbers("Teabags_Rejected"),
+        numbers("Tea_Rejected_Gram"),
+        numbers("SUM_VOT"),
+        numbers("SUM_LT"),
+        numbers("SUM_OEE"),
+        assign_batches(tile_idx, first_row_idx, count),
+    ]
+
+
+# Tiled tables: name → (source CSV, column transform)
+TILED_TABLES = {
+    "MachineStateTelemetry": (SRC_MS, machine_state_columns),
+    "ProductionCounterTelemetry": (SRC_OEE, production_counter_columns),
+}
+
+
+def transform_tile(table: str, tile_idx: int, out_path: str, eqp_ids: dict) -> int:
+    """Write one tile of a tiled table (no header) to out_path. Runs in a worker process."""
+    source, columns = TILED_TABLES[table]
+    written = 0
+    with open(out_path, "w", newline="") as fout:
+        writer = csv.writer(fout)
+        for first_row_idx, cols, count in read_chunks(source):
+            tile_columns = columns(cols, count, tile_idx, first_row_idx, eqp_ids)
+            keep = np.not_equal(tile_columns[0], None)  # timestamp None = past demo end
+            writer.writerows(zip(*(column[keep].tolist() for column in tile_columns)))
+            written += int(keep.sum())
+    return written
+
+
+def write_tiled_table(pool, table: str, header: list, eqp_ids: dict, row_cap: int) -> int:
+    """Transform all tiles of `table` on the pool and concatenate them in tile order."""
+    out_path = os.path.join(OUT_EH, f"{table}.csv")
+    total_written = 0
+    with tempfile.TemporaryDirectory(prefix=f"{table}-tiles-", dir=OUT_EH) as tmp:
+        fragments = [os.path.join(tmp, f"tile{tile:02d}.csv") for tile in range(TILE_COUNT)]
+        futures = [
+            pool.submit(transform_tile, table, tile, fragment, eqp_ids)
+            for tile, fragment in enumerate(fragments)
+        ]
+        try:
+            with open(out_path, "w", newline="") as fout:
+                csv.writer(fout).writerow(header)
+                for tile, (future, fragment) in enumerate(zip(futures, fragments)):
+                    total_written += future.result()
+                    with open(fragment, "r", newline="") as fin:
+                        shutil.copyfileobj(fin, fout, 1024 * 1024)
+                    os.remove(fragment)
+                    print(f"  Tile {tile+1}/{TILE_COUNT} done — {total_written:,} rows so far")
+                    if total_written > row_cap:
+                        break  # safety cap
+        finally:
+            # Tiles past the cap are not needed; let running ones finish before cleanup
+            for future in futures:
+                future.cancel()
+            concurrent.futures.wait(futures)
+    return total_written
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # 1. MachineStateTelemetry  (from real Machine State CSV)
 # ══════════════════════════════════════════════════════════════════════════════
-def generate_machine_state_telemetry():
+def generate_machine_state_telemetry(pool):
     print("Generating MachineStateTelemetry.csv ...")
-    out_path = os.path.join(OUT_EH, "MachineStateTelemetry.csv")
     out_header = [
         "Timestamp", "EquipmentId", "LineName", "Shift",
         "MachineState", "ErrorCode", "DurationSec", "BatchId"
     ]
 
-    total_written = 0
-    with open(out_path, "w", newline="") as fout:
-        writer = csv.writer(fout)
-        writer.writerow(out_header)
-
-        for tile in range(TILE_COUNT):
-            with open(SRC_MS, "r", newline="") as fin:
-                reader = csv.DictReader(fin)
-                for row_idx, row in enumerate(reader):
-                    ts = shift_timestamp(row["TIMESTAMP_String"], tile)
-                    if ts is None:
-                        continue  # past demo end
-
-                    line = remap_line(row["Line"])
-                    machine = remap_machine_name(row["MachineName"])
-                    eqp_id = get_equipment_id(machine)
-                    shift = row["Shift"].strip() if row["Shift"].strip() not in ("", "NULL") else "Day"
-                    state = STATE_CLEAN.get(row["MachineState"].strip(), "Idle")
-                    error = row["Error_Code"].strip() if row["Error_Code"].strip() not in ("", "NULL") else "0"
-                    dur = row["TimeSpan_Sec"].strip() if row["TimeSpan_Sec"].strip() not in ("", "NULL") else "0"
-                    batch = assign_batch(tile, row_idx)
-
-                    writer.writerow([ts, eqp_id, line, shift, state, error, dur, batch])
-                    total_written += 1
-
-            print(f"  Tile {tile+1}/{TILE_COUNT} done — {total_written:,} rows so far")
-            if total_written > 6_500_000:
-                break  # safety cap
+    eqp_ids = build_equipment_ids(SRC_MS)
+    total_written = write_tiled_table(pool, "MachineStateTelemetry", out_header, eqp_ids, 6_500_000)
 
     print(f"  ✓ MachineStateTelemetry.csv → {total_written:,} rows")
     return total_written
@@ -332,9 +524,8 @@ def generate_machine_state_telemetry():
 # ══════════════════════════════════════════════════════════════════════════════
 # 2. ProductionCounterTelemetry  (from real OEE CSV)
 # ══════════════════════════════════════════════════════════════════════════════
-def generate_production_counter_telemetry():
+def generate_production_counter_telemetry(pool):
     print("Generating ProductionCounterTelemetry.csv ...")
-    out_path = os.path.join(OUT_EH, "ProductionCounterTelemetry.csv")
     out_header = [
         "Timestamp", "EquipmentId", "LineName", "SKU", "Shift",
         "BagCount", "BagCountDelta", "TeaProducedGram",
@@ -342,50 +533,8 @@ def generate_production_counter_telemetry():
         "VOT", "LoadingTime", "OEE", "BatchId"
     ]
 
-    total_written = 0
-    with open(out_path, "w", newline="") as fout:
-        writer = csv.writer(fout)
-        writer.writerow(out_header)
-
-        for tile in range(TILE_COUNT):
-            with open(SRC_OEE, "r", newline="") as fin:
-                reader = csv.DictReader(fin)
-                for row_idx, row in enumerate(reader):
-                    ts = shift_timestamp(row["TIMESTAMP"], tile)
-                    if ts is None:
-                        continue
-
-                    line = remap_line(row["Line"])
-                    machine = remap_machine_name(row["MachineName"])
-                    eqp_id = get_equipment_id(machine)
-                    sku = remap_sku_name(row["SKU_Name"])
-                    shift = row["Shift"].strip() if row.get("Shift", "").strip() not in ("", "NULL") else "Day"
-
-                    def safe_num(val, default="0"):
-                        v = val.strip() if val else ""
-                        return v if v and v != "NULL" else default
-
-                    bag_count = safe_num(row.get("New_Count", ""))
-                    bag_delta = safe_num(row.get("Count_Difference", ""))
-                    tea_gram = safe_num(row.get("Diff_Tea_Produced_Gram", ""))
-                    bags_rej = safe_num(row.get("Teabags_Rejected", ""))
-                    tea_rej_gram = safe_num(row.get("Tea_Rejected_Gram", ""))
-                    vot = safe_num(row.get("SUM_VOT", ""))
-                    lt = safe_num(row.get("SUM_LT", ""))
-                    oee = safe_num(row.get("SUM_OEE", ""))
-                    batch = assign_batch(tile, row_idx)
-
-                    writer.writerow([
-                        ts, eqp_id, line, sku, shift,
-                        bag_count, bag_delta, tea_gram,
-                        bags_rej, tea_rej_gram,
-                        vot, lt, oee, batch
-                    ])
-                    total_written += 1
-
-            print(f"  Tile {tile+1}/{TILE_COUNT} done — {total_written:,} rows so far")
-            if total_written > 13_500_000:
-                break
+    eqp_ids = build_equipment_ids(SRC_OEE)
+    total_written = write_tiled_table(pool, "ProductionCounterTelemetry", out_header, eqp_ids, 13_500_000)
 
     print(f"  ✓ ProductionCounterTelemetry.csv → {total_written:,} rows")
     return total_written
@@ -419,11 +568,18 @@ def generate_process_segment_telemetry():
         ("SEG-029", "Blending"), ("SEG-030", "Blending"),
     ]
 
-    # Generate one reading every 15 minutes for 365 days → ~35K readings per segment
-    # With 30 segments that would be ~1M. Let's do every 30 min to get ~500K
-    INTERVAL_MIN = 30
-    total_minutes = int(DEMO_SPAN_SEC / 60)
-    readings_per_seg = total_minutes // INTERVAL_MIN  # ~17,520
+    # One reading every 30 minutes for 365 days → 17,520 per segment × 30 = ~525K
+    times = synthetic_timeline()
+    n = len(times)
+    timestamps = format_timestamps(times)
+    index = np.arange(n)
+    hours = (times - times.astype("datetime64[D]")).astype(int) // 60
+    days = (times.astype("datetime64[D]") - np.datetime64(DEMO_START, "D")).astype(int)
+
+    # Hour-of-day effect (warmer in day shifts)
+    hour_factor = np.sin((hours - 6) * math.pi / 12) * 0.03
+    # Seasonal drift (slightly warmer in summer)
+    season_factor = np.sin(days / 365 * 2 * math.pi) * 0.02
 
     total_written = 0
     with open(out_path, "w", newline="") as fout:
@@ -432,45 +588,29 @@ def generate_process_segment_telemetry():
 
         for seg_id, seg_type in segments:
             prof = PROFILES[seg_type]
-            t_base = random.uniform(*prof["temp"])
-            m_base = random.uniform(*prof["moisture"])
-            c_base = random.uniform(*prof["cycle"])
-
-            # Add slow drift + daily seasonality + noise
-            for i in range(readings_per_seg):
-                dt = DEMO_START + timedelta(minutes=i * INTERVAL_MIN)
-                if dt >= DEMO_END:
-                    break
-
-                # Hour-of-day effect (warmer in day shifts)
-                hour_factor = math.sin((dt.hour - 6) * math.pi / 12) * 0.03
-
-                # Seasonal drift (slightly warmer in summer)
-                month_offset = (dt - DEMO_START).days / 365
-                season_factor = math.sin(month_offset * 2 * math.pi) * 0.02
-
-                # Random walk component (persistent noise)
-                drift = random.gauss(0, 0.005) 
-
-                temp = t_base * (1 + hour_factor + season_factor + drift)
-                moist = m_base * (1 - hour_factor * 0.5 + random.gauss(0, 0.02))
-                cycle = c_base * (1 + random.gauss(0, 0.03))
-
-                # Inject anomalies for SEG-013 and SEG-025 (correlated with quality failures)
-                if seg_id == "SEG-013" and 100 < i < 200:
-                    temp -= 5 + random.gauss(0, 1)
-                    moist += 2 + random.gauss(0, 0.3)
-                if seg_id == "SEG-025" and 300 < i < 400:
-                    moist += 3 + random.gauss(0, 0.5)
-
-                writer.writerow([
-                    dt.strftime("%Y-%m-%dT%H:%M:%S"),
-                    seg_id,
-                    f"{temp:.1f}",
-                    f"{moist:.1f}",
-                    f"{cycle:.1f}",
-                ])
-                total_written += 1
+            t_base = RNG.uniform(*prof["temp"])
+            m_base = RNG.uniform(*prof["moisture"])
+            c_base = RNG.uniform(*prof["cycle"])
+
+            # Slow drift + daily seasonality + noise
+            drift = RNG.normal(0, 0.005, n)
+            temp = t_base * (1 + hour_factor + season_factor + drift)
+            moist = m_base * (1 - hour_factor * 0.5 + RNG.normal(0, 0.02, n))
+            cycle = c_base * (1 + RNG.normal(0, 0.03, n))
+
+            # Inject anomalies for SEG-013 and SEG-025 (correlated with quality failures)
+            if seg_id == "SEG-013":
+                window = (index > 100) & (index < 200)
+                temp[window] -= 5 + RNG.normal(0, 1, window.sum())
+                moist[window] += 2 + RNG.normal(0, 0.3, window.sum())
+            if seg_id == "SEG-025":
+                window = (index > 300) & (index < 400)
+                moist[window] += 3 + RNG.normal(0, 0.5, window.sum())
+
+            writer.writerows(zip(
+                timestamps, [seg_id] * n, format_1dp(temp), format_1dp(moist), format_1dp(cycle),
+            ))
+            total_written += n
 
             print(f"  {seg_id} ({seg_type}) — {total_written:,} rows")
 
@@ -504,11 +644,24 @@ def generate_equipment_telemetry():
         ("EQP-015", "Supplier", 400),        # Nile Valley
     ]
 
-    # Generate 1 reading per hour for 365 days → 8,760 per equipment × 15 = ~131K
-    # Use 30 min for more data → 17,520 × 15 = ~263K
-    INTERVAL_MIN = 30
-    total_minutes = int(DEMO_SPAN_SEC / 60)
-    readings_per_equip = total_minutes // INTERVAL_MIN
+    # One reading every 30 minutes for 365 days → 17,520 per equipment × 15 = ~263K
+    times = synthetic_timeline()
+    n = len(times)
+    timestamps = format_timestamps(times)
+    hours = (times - times.astype("datetime64[D]")).astype(int) // 60
+    days = times.astype("datetime64[D]")
+    months = days.astype("datetime64[M]").astype(int) % 12 + 1
+
+    # Production hours: 6am-10pm weekdays, reduced weekends
+    is_weekend = (days.astype(int) - 4) % 7 >= 5  # 1970-01-01 was a Thursday
+    is_production = (hours >= 6) & (hours <= 22)
+    is_weekday_production = ~is_weekend & is_production
+
+    # Seasonal energy (heating in winter, cooling in summer)
+    season_factor = np.select(
+        [np.isin(months, (11, 12, 1, 2)), np.isin(months, (6, 7, 8))], [1.15, 1.08], 1.0,
+    )
+    humidity_cycle = 41.0 + np.sin((hours - 8) * math.pi / 10) * 3
 
     total_written = 0
     with open(out_path, "w", newline="") as fout:
@@ -516,51 +669,30 @@ def generate_equipment_telemetry():
         writer.writerow(["Timestamp", "EquipmentId", "EnergyConsumption", "Humidity", "ProductionRate"])
 
         for eqp_id, eqp_type, base_energy in equipment:
-            for i in range(readings_per_equip):
-                dt = DEMO_START + timedelta(minutes=i * INTERVAL_MIN)
-                if dt >= DEMO_END:
-                    break
-
-                # Production hours: 6am-10pm weekdays, reduced weekends
-                is_weekend = dt.weekday() >= 5
-                is_production = 6 <= dt.hour <= 22
-
-                if is_weekend:
-                    energy_factor = 0.3 if is_production else 0.1
-                    prod_rate = random.gauss(30, 10) if is_production else 0
-                elif is_production:
-                    energy_factor = 0.7 + random.gauss(0.2, 0.05)
-                    prod_rate = random.gauss(120, 20)
-                else:
-                    energy_factor = 0.15
-                    prod_rate = 0
-
-                # Seasonal energy (heating in winter, cooling in summer)
-                month = dt.month
-                if month in (11, 12, 1, 2):
-                    energy_factor *= 1.15
-                elif month in (6, 7, 8):
-                    energy_factor *= 1.08
-
-                energy = base_energy * energy_factor + random.gauss(0, base_energy * 0.02)
-                energy = max(0, energy)
-                humidity = 41.0 + math.sin((dt.hour - 8) * math.pi / 10) * 3 + random.gauss(0, 1.5)
-                humidity = max(20, min(75, humidity))
-                prod_rate = max(0, prod_rate)
-
-                # Supplier sites have different patterns (just energy, no prod rate)
-                if eqp_type == "Supplier":
-                    prod_rate = 0
-                    humidity = 35 + random.gauss(0, 5)
-
-                writer.writerow([
-                    dt.strftime("%Y-%m-%dT%H:%M:%S"),
-                    eqp_id,
-                    f"{energy:.1f}",
-                    f"{humidity:.1f}",
-                    f"{prod_rate:.1f}",
-                ])
-                total_written += 1
+            energy_factor = np.where(
+                is_weekend,
+                np.where(is_production, 0.3, 0.1),
+                np.where(is_production, 0.7 + RNG.normal(0.2, 0.05, n), 0.15),
+            ) * season_factor
+            prod_rate = np.select(
+                [is_weekend & is_production, is_weekday_production],
+                [RNG.normal(30, 10, n), RNG.normal(120, 20, n)],
+                0.0,
+            )
+
+            energy = np.maximum(0, base_energy * energy_factor + RNG.normal(0, base_energy * 0.02, n))
+            humidity = np.clip(humidity_cycle + RNG.normal(0, 1.5, n), 20, 75)
+            prod_rate = np.maximum(0, prod_rate)
+
+            # Supplier sites have different patterns (just energy, no prod rate)
+            if eqp_type == "Supplier":
+                prod_rate = np.zeros(n)
+                humidity = 35 + RNG.normal(0, 5, n)
+
+            writer.writerows(zip(
+                timestamps, [eqp_id] * n, format_1dp(energy), format_1dp(humidity), format_1dp(prod_rate),
+            ))
+            total_written += n
 
         print(f"  ✓ EquipmentTelemetry.csv → {total_written:,} rows")
     return total_written
@@ -648,6 +780,11 @@ def generate_expanded_equipment():
 # MAIN
 # ══════════════════════════════════════════════════════════════════════════════
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Transform real factory data into the demo dataset")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Worker processes for the tiled tables (default: CPU count)")
+    args = parser.parse_args()
+
     os.makedirs(OUT_EH, exist_ok=True)
     os.makedirs(OUT_LH, exist_ok=True)
 
@@ -655,11 +792,12 @@ if __name__ == "__main__":
     print("Golden Leaf Tea Co. — Data Transformation")
     print(f"Demo window: {DEMO_START.date()} → {DEMO_END.date()}")
     print(f"Source span: {ORIG_START} → {ORIG_END}  ({ORIG_SPAN_SEC/86400:.1f} days)")
-    print(f"Tile count:  {TILE_COUNT}")
+    print(f"Tile count:  {TILE_COUNT}  (workers: {args.workers})")
     print("=" * 70)
 
-    n1 = generate_machine_state_telemetry()
-    n2 = generate_production_counter_telemetry()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.workers) as pool:
+        n1 = generate_machine_state_telemetry(pool)
+        n2 = generate_production_counter_telemetry(pool)
     n3 = generate_process_segment_telemetry()
     n4 = generate_equipment_telemetry()
     n5 = generate_expanded_equipment()
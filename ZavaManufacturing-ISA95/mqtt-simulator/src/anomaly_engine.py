@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+import time
 from typing import Any, Dict, List
 
 from .config import AnomalyConfig, AnomalyScenario, SimulatorConfig
@@ -67,14 +68,33 @@ class AnomalyEngine:
         )
 
         while True:
-            # Wait for the next anomaly window
-            jitter = random.randint(0, max(1, interval // 4))
-            await asyncio.sleep(interval + jitter)
-
-            # Pick a random enabled scenario
-            scenario = random.choice(enabled_scenarios)
+            if self._cfg.sharding.count > 1:
+                scenario = await self._next_coordinated(enabled_scenarios, interval)
+            else:
+                # Wait for the next anomaly window
+                jitter = random.randint(0, max(1, interval // 4))
+                await asyncio.sleep(interval + jitter)
+
+                # Pick a random enabled scenario
+                scenario = random.choice(enabled_scenarios)
             await self._execute_scenario(scenario)
 
+    async def _next_coordinated(
+        self, scenarios: List[AnomalyScenario], interval: int,
+    ) -> AnomalyScenario:
+        """Wait for the next wall-clock anomaly window (sharded replicas).
+
+        Jitter and scenario are drawn from an RNG seeded with the window
+        number, so every replica injects the same scenario at the same time
+        and each applies it to its own slice of the fleet.
+        """
+        interval = max(1, interval)
+        window = int(time.time() // interval) + 1
+        rng = random.Random(window)
+        start = window * interval + rng.randint(0, max(1, interval // 4))
+        await asyncio.sleep(max(0.0, start - time.time()))
+        return rng.choice(scenarios)
+
     async def _execute_scenario(self, scenario: AnomalyScenario) -> None:
         stream_slug = _STREAM_ATTR_MAP.get(scenario.stream, scenario.stream)
         stream = self._streams.get(stream_slug)
@@ -100,7 +120,10 @@ class AnomalyEngine:
             "Phase": "START",
             "Overrides": scenario.overrides,
         }
-        await self._client.publish(topic, event)
+        # Sharded replicas apply every scenario; replica 0 announces it
+        announce = self._cfg.sharding.index == 0
+        if announce:
+            await self._client.publish(topic, event)
 
         # Apply overrides to the stream (Q9: uses BaseStream ABC method)
         if stream:
@@ -124,6 +147,7 @@ class AnomalyEngine:
                 "Phase": "END",
                 "Overrides": {},
             }
-            await self._client.publish(topic, end_event)
+            if announce:
+                await self._client.publish(topic, end_event)
 
             logger.info("ANOMALY [%s]: ended — overrides reverted", scenario.name)
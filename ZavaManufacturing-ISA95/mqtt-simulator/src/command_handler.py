@@ -12,6 +12,9 @@ Supported commands (JSON payloads published to the command topic):
     {"action": "set", "path": "anomalies.scenarioIntervalMin", "value": 1}
     {"action": "list-streams"}
     {"action": "list-anomalies"}
+
+With replica sharding every pod subscribes to the command topic and applies
+each command to its own slice; ``status`` responses carry a ``shard`` field.
 """
 
 from __future__ import annotations
@@ -20,12 +23,16 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from .config import SimulatorConfig
+from .mqtt_client import MqttClient
+from .mqtt_pool import MqttClientPool
 from .streams.base import MessageSink
 from .streams.base import BaseStream
 from .anomaly_engine import AnomalyEngine
+from .scheduler import TickScheduler
+from .site_workers import FORWARDED_ACTIONS, SiteWorkerPool
 from .utils import utcnow
 
 logger = logging.getLogger(__name__)
@@ -59,12 +66,20 @@ class CommandHandler:
         streams: Dict[str, BaseStream],
         anomaly: AnomalyEngine,
         start_time: float,
+        scheduler: TickScheduler | None = None,
+        site_workers: SiteWorkerPool | None = None,
+        site_handlers: List[CommandHandler] | None = None,
+        task_prefix: str = "stream-",
     ) -> None:
         self._cfg = cfg
         self._client = client
         self._streams = streams
         self._anomaly = anomaly
         self._start_time = start_time
+        self._scheduler = scheduler
+        self._site_workers = site_workers
+        self._site_handlers = site_handlers or []  # in-process cloned sites (workers: 0)
+        self._task_prefix = task_prefix  # stream task names: <prefix><slug>
         self._queue: asyncio.Queue[dict] = asyncio.Queue()
         self._loop: asyncio.AbstractEventLoop | None = None
         self._stream_tasks: Dict[str, asyncio.Task] = {}  # B2: track re-enabled tasks
@@ -85,7 +100,7 @@ class CommandHandler:
         while True:
             cmd = await self._queue.get()
             try:
-                resp = await self._handle(cmd)
+                resp = await self.handle(cmd)
                 await self._client.publish(STATUS_TOPIC, resp)
             except Exception as exc:
                 logger.error("Command error: %s", exc)
@@ -116,7 +131,12 @@ class CommandHandler:
     # Command dispatch
     # ------------------------------------------------------------------
 
-    async def _handle(self, cmd: dict) -> dict:
+    async def handle(self, cmd: dict) -> dict:
+        """Apply *cmd* and return the status response.
+
+        Config-changing commands are also applied to the cloned sites, via
+        the site workers or the in-process site handlers.
+        """
         action = cmd.get("action", "").lower().strip()
         handler = {
             "status": self._cmd_status,
@@ -140,7 +160,15 @@ class CommandHandler:
                     "trigger-anomaly", "set",
                 }),
             }
-        return await handler(cmd)
+        resp = await handler(cmd)
+        if action in FORWARDED_ACTIONS and resp.get("status") == "ok":
+            if self._site_workers:
+                self._site_workers.send_command(cmd)
+            for site_handler in self._site_handlers:
+                site_resp = await site_handler.handle(cmd)
+                if site_resp.get("status") != "ok":
+                    logger.warning("Command %s failed for a cloned site: %s", cmd, site_resp.get("error"))
+        return resp
 
     # ------------------------------------------------------------------
     # Individual command handlers
@@ -170,6 +198,11 @@ class CommandHandler:
             "anomalies_enabled": self._cfg.anomalies.enabled,
             "anomaly_interval_min": self._cfg.anomalies.scenario_interval_min,
             "streams": stream_info,
+            **({"mqtt_publish": self._client.publish_stats()}
+               if isinstance(self._client, (MqttClient, MqttClientPool)) else {}),
+            **({"tick_lateness": self._scheduler.stats()} if self._scheduler else {}),
+            **({"site_workers": self._site_workers.stats()} if self._site_workers else {}),
+            **({"shard": self._cfg.sharding.model_dump()} if self._cfg.sharding.count > 1 else {}),
         }
 
     async def _cmd_list_streams(self, _cmd: dict) -> dict:
@@ -226,7 +259,7 @@ class CommandHandler:
         # Restart the stream task
         stream = self._streams.get(slug)
         if stream:
-            task = asyncio.create_task(stream.safe_run(), name=f"stream-{slug}")
+            task = asyncio.create_task(stream.safe_run(), name=f"{self._task_prefix}{slug}")
             self._stream_tasks[slug] = task
             logger.info("Stream %s enabled and restarted", slug)
 
@@ -251,7 +284,7 @@ class CommandHandler:
         scfg.enabled = False
         # Cancel running task
         for task in asyncio.all_tasks():
-            if task.get_name() == f"stream-{slug}":
+            if task.get_name() == f"{self._task_prefix}{slug}":
                 task.cancel()
                 logger.info("Stream %s disabled and cancelled", slug)
                 break
@@ -33,6 +33,17 @@ class MqttConfig(BaseModel):
     keep_alive: int = Field(60, alias="keepAlive")
     reconnect_delay_sec: int = Field(5, alias="reconnectDelaySec")
     qos: int = 1
+    # Parallel broker connections (clientIds "<clientId>-<n>"); topics are
+    # sharded across them by consistent hash, commands use the first one
+    connections: int = 1
+    # Flow control: QoS 1/2 messages on the wire awaiting PUBACK (paho limit) and
+    # messages handed to paho but not yet acknowledged (our publish buffer)
+    max_in_flight: int = Field(20, alias="maxInFlight")
+    max_queued: int = Field(10000, alias="maxQueued")
+    # When maxQueued is reached: "block" = publishers wait (backpressure),
+    # "drop" = discard new messages, "sample" = keep 1 in overflowSampleEvery
+    overflow_policy: Literal["block", "drop", "sample"] = Field("block", alias="overflowPolicy")
+    overflow_sample_every: int = Field(10, ge=1, alias="overflowSampleEvery")
 
     model_config = {"populate_by_name": True}
 
@@ -92,6 +103,8 @@ class SimulationConfig(BaseModel):
     tick_interval_sec: int = Field(1, alias="tickIntervalSec")
     time_mode: Literal["realtime", "accelerated"] = Field("realtime", alias="timeMode")
     acceleration_factor: int = Field(10, alias="accelerationFactor")
+    # Offset periodic streams within their interval to smooth publish bursts
+    phase_spreading: bool = Field(True, alias="phaseSpreading")
     shifts: ShiftConfig = ShiftConfig()
     active_batches: List[ActiveBatch] = Field(default_factory=list, alias="activeBatches")
     model_config = {"populate_by_name": True}
@@ -437,6 +450,21 @@ class SiteProfile(BaseModel):
 class MultiSiteConfig(BaseModel):
     enabled: bool = False
     sites: List[SiteProfile] = Field(default_factory=list)
+    # 0 = run all sites on the main event loop; N = shard sites over N worker processes
+    workers: int = 0
+    model_config = {"populate_by_name": True}
+
+
+# ---------------------------------------------------------------------------
+# Sharding (horizontal scale-out across replicas)
+# ---------------------------------------------------------------------------
+
+class ShardingConfig(BaseModel):
+    # This replica's slice of the fleet: lines, site-level entities and
+    # additional sites are partitioned over ``count`` replicas.  Overridden by
+    # SIMULATOR_SHARD_INDEX / SIMULATOR_SHARD_COUNT or the StatefulSet ordinal.
+    index: int = 0
+    count: int = 1
     model_config = {"populate_by_name": True}
 
 
@@ -486,10 +514,16 @@ class EventHubConfig(BaseModel):
     # Batching settings
     max_batch_size: int = Field(100, alias="maxBatchSize")
     max_wait_time_sec: float = Field(1.0, alias="maxWaitTimeSec")
-    # Partition key strategy: "topic" = use topic name, "stream" = use stream slug, "none" = round-robin
+    # Partition key strategy: "topic" = use topic name, "stream" = use stream slug, "none" = round-robin.
+    # Events are queued and batched per key, so every event keeps its own key's partition.
     partition_key_mode: Literal["topic", "stream", "none"] = Field(
         "topic", alias="partitionKeyMode"
     )
+    # Sender pipeline: concurrent batch sends and the publish buffer
+    max_in_flight_batches: int = Field(8, alias="maxInFlightBatches")
+    max_buffered_events: int = Field(10000, alias="maxBufferedEvents")
+    # When the buffer is full: "block" = publishers wait (backpressure), "drop" = discard new events
+    overflow_policy: Literal["block", "drop"] = Field("block", alias="overflowPolicy")
     model_config = {"populate_by_name": True}
 
 
@@ -562,6 +596,7 @@ class SimulatorConfig(BaseModel):
     multi_site: MultiSiteConfig = Field(
         default_factory=MultiSiteConfig, alias="multiSite"
     )
+    sharding: ShardingConfig = Field(default_factory=ShardingConfig)
 
     anomalies: AnomalyConfig = Field(default_factory=AnomalyConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
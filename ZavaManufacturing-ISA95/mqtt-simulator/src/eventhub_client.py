@@ -1,6 +1,7 @@
 """Azure Event Hub client — drop-in alternative to MqttClient.
 
-Implements the same async ``publish(topic, payload)`` interface so that
+Implements the same async ``publish(topic, payload)`` and
+``publish_many(items)`` interface so that
 ``BaseStream`` can target either MQTT or Event Hub without changes.
 """
 
@@ -10,12 +11,16 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 from .config import EventHubConfig
 
 logger = logging.getLogger(__name__)
 
+# Reused encoder — ``json.dumps(..., default=str)`` builds a new one per call
+_to_json = json.JSONEncoder(default=str).encode
+
 # Lazy-import the SDK so the rest of the simulator can run without
 # azure-eventhub installed when outputMode == "mqtt".
 _EventHubProducerClient = None
@@ -49,7 +54,18 @@ def _ensure_sdk() -> None:
 
 
 class EventHubClient:
-    """Async-friendly Azure Event Hub producer with the same publish() API as MqttClient."""
+    """Async-friendly Azure Event Hub producer with the same publish() API as MqttClient.
+
+    ``publish()`` only appends to an in-memory buffer (one FIFO per partition
+    key); it never waits on the network.  ``maxInFlightBatches`` sender tasks
+    take partition keys that are due — a full batch is buffered, or
+    ``maxWaitTimeSec`` has passed — and send their batches concurrently, one
+    batch per key at a time so per-partition order is kept.
+
+    When ``maxBufferedEvents`` are waiting, ``overflowPolicy`` decides:
+    ``block`` makes publishers wait for room (backpressure on the streams),
+    ``drop`` discards the new event.  See :meth:`sender_stats`.
+    """
 
     _MAX_FLUSH_RETRIES = 3  # B5: max retries before dropping events
 
@@ -59,10 +75,22 @@ class EventHubClient:
         self._producer = None
         self._credential = None
         self._msg_count = 0
-        self._pending: list = []
-        self._pending_lock = asyncio.Lock()
+        # One FIFO per partition key (None = round-robin), each sent as its own batch
+        self._pending: Dict[Optional[str], Deque[Any]] = {}
+        self._pending_count = 0
+        # Keys that are due for sending; a key is queued at most once (_scheduled)
+        self._ready: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        self._scheduled: Set[Optional[str]] = set()
+        self._has_room = asyncio.Event()
+        self._has_room.set()
+        self._senders: List[asyncio.Task] = []
+        self._in_flight = 0
         self._flush_task: asyncio.Task | None = None
-        self._flush_failures = 0  # B5: consecutive failure counter
+        self._flush_failures: Dict[Optional[str], int] = {}  # B5: consecutive failures per key
+        # Exported counters (see sender_stats)
+        self._dropped_overflow = 0
+        self._dropped_failed = 0
+        self._blocked_publishes = 0
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -99,23 +127,29 @@ class EventHubClient:
                 self._cfg.eventhub_name,
             )
 
-        # Start background flush loop
+        # Start the sender pool and the background flush loop
+        self._senders = [
+            asyncio.create_task(self._sender_loop(), name=f"eventhub-sender-{i}")
+            for i in range(max(1, self._cfg.max_in_flight_batches))
+        ]
         self._flush_task = asyncio.create_task(
             self._flush_loop(), name="eventhub-flush"
         )
 
     async def disconnect(self) -> None:
         """Flush remaining events and close."""
-        # Flush remaining events first (before cancelling flush loop)
-        async with self._pending_lock:
-            await self._flush_pending()
+        # Flush remaining events first (before stopping the senders)
+        if self._senders:
+            await self._drain()
 
-        if self._flush_task:
-            self._flush_task.cancel()
-            try:
-                await self._flush_task
-            except asyncio.CancelledError:
-                pass
+        for task in [*self._senders, self._flush_task]:
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._senders = []
 
         if self._producer:
             await self._producer.close()
@@ -146,14 +180,30 @@ class EventHubClient:
         if self._producer is None:
             raise RuntimeError("EventHubClient not connected")
 
-        data = json.dumps(payload, default=str)
-        event = _EventData(data)  # type: ignore[misc]
-        event.properties = {"mqtt_topic": topic}
+        key = self._resolve_partition_key(topic, payload)
+        event = self._make_event(topic, payload)
+        if await self._reserve():
+            self._enqueue(key, event)
+
+    async def publish_many(
+        self,
+        items: Iterable[Tuple[str, dict[str, Any]]],
+        *,
+        qos: int | None = None,     # ignored — kept for API compat
+        retain: bool = False,        # ignored — kept for API compat
+    ) -> None:
+        """Queue a batch of ``(topic, payload)`` events.
+
+        With ``overflowPolicy: block`` this waits whenever the buffer is full.
+        """
+        if self._producer is None:
+            raise RuntimeError("EventHubClient not connected")
 
-        async with self._pending_lock:
-            self._pending.append(event)
-            if len(self._pending) >= self._cfg.max_batch_size:
-                await self._flush_pending()
+        for topic, payload in items:
+            key = self._resolve_partition_key(topic, payload)
+            event = self._make_event(topic, payload)
+            if await self._reserve():
+                self._enqueue(key, event)
 
     def subscribe(
         self,
@@ -175,10 +225,29 @@ class EventHubClient:
     def message_count(self) -> int:
         return self._msg_count
 
+    def sender_stats(self) -> Dict[str, int]:
+        """Sender pipeline counters (buffer level, in-flight batches, drops)."""
+        return {
+            "sent": self._msg_count,
+            "buffered": self._pending_count,
+            "maxBuffered": self._cfg.max_buffered_events,
+            "inFlightBatches": self._in_flight,
+            "blockedPublishes": self._blocked_publishes,
+            "droppedOverflow": self._dropped_overflow,
+            "droppedFailed": self._dropped_failed,
+        }
+
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _make_event(topic: str, payload: dict[str, Any]) -> Any:
+        """Serialize *payload*, keeping the MQTT topic as an event property."""
+        event = _EventData(_to_json(payload))  # type: ignore[misc]
+        event.properties = {"mqtt_topic": topic}
+        return event
+
     def _resolve_partition_key(self, topic: str, payload: dict) -> str | None:
         mode = self._cfg.partition_key_mode
         if mode == "topic":
@@ -188,60 +257,144 @@ class EventHubClient:
         return None  # round-robin
 
     async def _flush_loop(self) -> None:
-        """Periodically flush pending events so they don't sit too long."""
+        """Periodically mark every buffered key as due so events don't sit too long."""
         interval = self._cfg.max_wait_time_sec
         while True:
             await asyncio.sleep(interval)
-            async with self._pending_lock:
-                await self._flush_pending()
-
-    async def _flush_pending(self) -> None:
-        """Send all pending events as a batch. Caller must hold _pending_lock."""
-        if not self._pending or self._producer is None:
-            return
-        count = len(self._pending)
-        try:
-            # B6: resolve partition key from the first event's mqtt_topic property
-            partition_key = None
-            if self._pending:
-                first_ev = self._pending[0]
-                topic = (first_ev.properties or {}).get("mqtt_topic", "")
-                partition_key = self._resolve_partition_key(topic, {})
-
-            batch = await self._producer.create_batch(
-                partition_key=partition_key,
-            )
-            sent = 0
-            while self._pending:
-                ev = self._pending[0]
-                try:
-                    batch.add(ev)
-                    self._pending.pop(0)
-                    sent += 1
-                except ValueError:
-                    # Batch full — send what we have, start a new one
-                    await self._producer.send_batch(batch)
-                    batch = await self._producer.create_batch(
-                        partition_key=partition_key,
-                    )
-                    # Don't pop — retry this event in the new batch
-            if batch.size_in_bytes > 0:
-                await self._producer.send_batch(batch)
-            self._msg_count += sent  # B4: count only actually sent events
-            self._flush_failures = 0  # reset on success
-            logger.debug("Flushed %d events to Event Hub", sent)
-        except Exception as exc:
-            self._flush_failures += 1
-            if self._flush_failures >= self._MAX_FLUSH_RETRIES:
-                logger.error(
-                    "Event Hub send failed %d times — dropping %d events: %s",
-                    self._flush_failures, len(self._pending), exc,
-                )
-                self._pending.clear()
-                self._flush_failures = 0
-            else:
+            self._schedule_all()
+
+    async def _drain(self) -> None:
+        """Send everything buffered; failing keys are retried, then dropped (B5)."""
+        for _ in range(self._MAX_FLUSH_RETRIES):
+            if not self._pending_count:
+                return
+            self._schedule_all()
+            await self._ready.join()
+
+    # --- Buffer (publisher side, never awaits the network) ---
+
+    async def _reserve(self) -> bool:
+        """Make room for one event; ``False`` means drop it (overflow policy)."""
+        limit = self._cfg.max_buffered_events
+        if self._pending_count < limit:
+            return True
+        if self._cfg.overflow_policy == "drop":
+            self._dropped_overflow += 1
+            if self._dropped_overflow == 1 or self._dropped_overflow % 10_000 == 0:
                 logger.warning(
-                    "Event Hub send failed (attempt %d/%d, %d events kept for retry): %s",
-                    self._flush_failures, self._MAX_FLUSH_RETRIES,
-                    len(self._pending), exc,
+                    "Event Hub buffer full (%d events) — %d events dropped so far",
+                    limit, self._dropped_overflow,
                 )
+            return False
+        self._blocked_publishes += 1
+        while self._pending_count >= limit:
+            self._has_room.clear()
+            self._schedule_all()  # don't wait for the flush interval to make room
+            await self._has_room.wait()
+        return True
+
+    def _enqueue(self, key: str | None, event: Any) -> None:
+        """Append *event* to its partition queue; a full batch makes the key due."""
+        queue = self._pending.get(key)
+        if queue is None:
+            queue = self._pending[key] = deque()
+        queue.append(event)
+        self._pending_count += 1
+        if len(queue) >= self._cfg.max_batch_size:
+            self._schedule(key)
+
+    def _schedule(self, key: str | None) -> None:
+        if key not in self._scheduled:
+            self._scheduled.add(key)
+            self._ready.put_nowait(key)
+
+    def _schedule_all(self) -> None:
+        for key, queue in self._pending.items():
+            if queue:
+                self._schedule(key)
+
+    def _release(self, count: int) -> None:
+        self._pending_count -= count
+        if self._pending_count < self._cfg.max_buffered_events:
+            self._has_room.set()
+
+    # --- Senders ---
+
+    async def _sender_loop(self) -> None:
+        """Take due partition keys and send their next batch."""
+        while True:
+            key = await self._ready.get()
+            try:
+                sent = await self._send_next_batch(key)
+            except Exception as exc:
+                sent = False
+                self._on_send_failure(key, exc)
+            finally:
+                self._scheduled.discard(key)
+                self._ready.task_done()
+
+            queue = self._pending.get(key)
+            if queue and sent:
+                self._schedule(key)  # keep draining what is already buffered
+            elif queue is not None and not queue:
+                del self._pending[key]  # forget drained keys so one-off topics don't accumulate
+
+    async def _send_next_batch(self, key: str | None) -> bool:
+        """Send one batch from the front of *key*'s queue.
+
+        Events leave the queue only once their batch was sent, so a failed
+        send keeps them for the next attempt.
+        """
+        queue = self._pending.get(key)
+        if not queue or self._producer is None:
+            return False
+
+        batch = await self._producer.create_batch(partition_key=key)
+        count = 0
+        for event in queue:
+            try:
+                batch.add(event)
+            except ValueError:
+                break  # batch full — the rest goes in the next one
+            count += 1
+
+        if count == 0:
+            # A single event larger than an empty batch can never be sent
+            queue.popleft()
+            self._release(1)
+            self._dropped_failed += 1
+            logger.warning("Dropping event too large for an Event Hub batch (partition key %s)", key)
+            return True
+
+        self._in_flight += 1
+        try:
+            await self._producer.send_batch(batch)
+        finally:
+            self._in_flight -= 1
+        for _ in range(count):
+            queue.popleft()
+        self._release(count)
+        self._msg_count += count  # B4: count only actually sent events
+        self._flush_failures.pop(key, None)  # reset on success
+        logger.debug("Flushed %d events to Event Hub (partition key %s)", count, key)
+        return True
+
+    def _on_send_failure(self, key: str | None, exc: Exception) -> None:
+        queue = self._pending.get(key) or deque()
+        failures = self._flush_failures.get(key, 0) + 1
+        if failures >= self._MAX_FLUSH_RETRIES:
+            logger.error(
+                "Event Hub send failed %d times — dropping %d events (partition key %s): %s",
+                failures, len(queue), key, exc,
+            )
+            self._dropped_failed += len(queue)
+            self._release(len(queue))
+            queue.clear()
+            self._flush_failures.pop(key, None)
+        else:
+            logger.warning(
+                "Event Hub send failed (attempt %d/%d, %d events kept for retry, "
+                "partition key %s): %s",
+                failures, self._MAX_FLUSH_RETRIES, len(queue), key, exc,
+            )
+            self._flush_failures[key] = failures
@@ -0,0 +1,79 @@
+"""Columnar machine-fleet state for the per-machine streams.
+
+Per-machine Python objects (and a ``random`` call per machine per tick)
+don't scale to fleets of tens of thousands of machines.  :class:`FleetState`
+keeps one NumPy array per attribute instead — dwell time, state code, error
+code, health score, degrading flag — so streams update the whole fleet with
+vectorized operations and only build payloads for the rows they publish.
+
+String attributes are stored as small integer codes into per-fleet tables
+(``state_names``, ``error_names``) that grow as new values are seen, so
+anomaly overrides may introduce states (e.g. ``Maintenance``) at runtime.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+# Error code for "no error" (code 0 in every fleet's error table)
+NO_ERROR = "0"
+
+
+class FleetState:
+    """Struct-of-arrays state for a list of ``(eqp_id, line, name, …)`` machines."""
+
+    def __init__(self, machines: Sequence[Tuple[str, str, str, int]], initial_state: str = "Running") -> None:
+        self.eqp_ids: List[str] = [m[0] for m in machines]
+        self.line_names: List[str] = [m[1] for m in machines]
+        self.machine_names: List[str] = [m[2] for m in machines]
+        self._rows: Dict[str, int] = {eqp: i for i, eqp in enumerate(self.eqp_ids)}
+
+        self.state_names: List[str] = []
+        self.error_names: List[str] = []
+        self._state_codes: Dict[str, int] = {}
+        self._error_codes: Dict[str, int] = {}
+
+        n = len(self.eqp_ids)
+        self.state = np.full(n, self.state_codes([initial_state])[0], dtype=np.int16)
+        self.error = np.full(n, self.error_codes([NO_ERROR])[0], dtype=np.int16)
+        self.dwell = np.zeros(n, dtype=np.float64)      # seconds until next transition
+        self.duration = np.zeros(n, dtype=np.int64)     # seconds in current state
+        self.health = np.ones(n, dtype=np.float64)      # 1.0 = healthy
+        self.degrading = np.zeros(n, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.eqp_ids)
+
+    # ------------------------------------------------------------------
+    # Code tables
+    # ------------------------------------------------------------------
+
+    def state_codes(self, names: Iterable[str]) -> np.ndarray:
+        """Codes for state *names*, adding unseen names to the table."""
+        return _intern(names, self._state_codes, self.state_names)
+
+    def error_codes(self, names: Iterable[str]) -> np.ndarray:
+        """Codes for error *names*, adding unseen names to the table."""
+        return _intern(names, self._error_codes, self.error_names)
+
+    # ------------------------------------------------------------------
+    # Row lookup
+    # ------------------------------------------------------------------
+
+    def rows_for(self, eqp_ids: Iterable[str]) -> np.ndarray:
+        """Row indices of the known machines among *eqp_ids*."""
+        rows = self._rows
+        return np.fromiter((rows[e] for e in eqp_ids if e in rows), dtype=np.intp)
+
+
+def _intern(names: Iterable[str], codes: Dict[str, int], table: List[str]) -> np.ndarray:
+    out = []
+    for name in names:
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = len(table)
+            table.append(name)
+        out.append(code)
+    return np.array(out, dtype=np.int16)
@@ -16,15 +16,19 @@ import signal
 import sys
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from .config import SimulatorConfig, load_config
+from .config import SimulatorConfig, SiteProfile, load_config
 from .mqtt_client import MqttClient
+from .mqtt_pool import MqttClientPool
 from .eventhub_client import EventHubClient
 from .anomaly_engine import AnomalyEngine
 from .command_handler import CommandHandler
 from .state_registry import StateRegistry
+from .scheduler import TickScheduler
 from .site_cloner import clone_config_for_site
+from .sharding import apply_sharding
+from .site_workers import SiteWorkerPool
 from .streams.base import BaseStream, MessageSink
 from .streams.equipment_telemetry import EquipmentTelemetryStream
 from .streams.machine_state import MachineStateTelemetryStream
@@ -81,24 +85,79 @@ def _build_streams(
     cfg: SimulatorConfig,
     client: MessageSink,
     registry: StateRegistry,
+    scheduler: TickScheduler,
+    site_id: Optional[str] = None,
 ) -> Dict[str, BaseStream]:
     """Instantiate all stream classes, keyed by stream_slug."""
+    kwargs = {"registry": registry, "scheduler": scheduler, "site_id": site_id}
     all_streams: List[BaseStream] = [
-        EquipmentTelemetryStream(cfg, client, registry=registry),
-        MachineStateTelemetryStream(cfg, client, registry=registry),
-        ProcessSegmentTelemetryStream(cfg, client, registry=registry),
-        ProductionCounterTelemetryStream(cfg, client, registry=registry),
-        SafetyIncidentStream(cfg, client, registry=registry),
-        PredictiveMaintenanceStream(cfg, client, registry=registry),
-        DigitalTwinStream(cfg, client, registry=registry),
-        MaterialConsumptionStream(cfg, client, registry=registry),
-        QualityVisionStream(cfg, client, registry=registry),
-        SupplyChainStream(cfg, client, registry=registry),
-        BatchLifecycleStream(cfg, client, registry=registry),
+        EquipmentTelemetryStream(cfg, client, **kwargs),
+        MachineStateTelemetryStream(cfg, client, **kwargs),
+        ProcessSegmentTelemetryStream(cfg, client, **kwargs),
+        ProductionCounterTelemetryStream(cfg, client, **kwargs),
+        SafetyIncidentStream(cfg, client, **kwargs),
+        PredictiveMaintenanceStream(cfg, client, **kwargs),
+        DigitalTwinStream(cfg, client, **kwargs),
+        MaterialConsumptionStream(cfg, client, **kwargs),
+        QualityVisionStream(cfg, client, **kwargs),
+        SupplyChainStream(cfg, client, **kwargs),
+        BatchLifecycleStream(cfg, client, **kwargs),
     ]
     return {s.stream_slug: s for s in all_streams}
 
 
+def _start_site_streams(
+    cfg: SimulatorConfig,
+    client: MessageSink,
+    scheduler: TickScheduler,
+    sites: List[SiteProfile],
+) -> Tuple[Dict[str, Tuple[SimulatorConfig, Dict[str, BaseStream]]], List[asyncio.Task]]:
+    """Clone *cfg* for each site and start its enabled streams.
+
+    Returns ``{site_id: (site_cfg, streams)}`` and the started tasks.
+    """
+    site_streams: Dict[str, Tuple[SimulatorConfig, Dict[str, BaseStream]]] = {}
+    tasks: List[asyncio.Task] = []
+    for site_prof in sites:
+        site_cfg = clone_config_for_site(cfg, site_prof)
+        site_reg = StateRegistry()
+        s_streams = _build_streams(site_cfg, client, site_reg, scheduler, site_prof.site_id)
+        site_streams[site_prof.site_id] = (site_cfg, s_streams)
+
+        # Filter by enabledStreams if specified
+        allowed = set(site_prof.enabled_streams) if site_prof.enabled_streams else None
+        s_enabled = [
+            slug for slug, s in s_streams.items()
+            if s.is_enabled() and (allowed is None or slug in allowed)
+        ]
+        for slug in s_enabled:
+            tasks.append(asyncio.create_task(
+                s_streams[slug].safe_run(),
+                name=f"site-{site_prof.site_id}-{slug}",
+            ))
+        logger.info(
+            "Multi-site '%s': %d streams started (offset=%d, scale=%.1f)",
+            site_prof.site_id, len(s_enabled),
+            site_prof.equipment_id_offset, site_prof.scale,
+        )
+    return site_streams, tasks
+
+
+def _site_command_handlers(
+    site_streams: Dict[str, Tuple[SimulatorConfig, Dict[str, BaseStream]]],
+    client: MessageSink,
+    start_time: float,
+) -> List[CommandHandler]:
+    """One command handler per cloned site, applying forwarded commands to its config."""
+    return [
+        CommandHandler(
+            s_cfg, client, s_streams, AnomalyEngine(s_cfg, client, s_streams),
+            start_time=start_time, task_prefix=f"site-{site_id}-",
+        )
+        for site_id, (s_cfg, s_streams) in site_streams.items()
+    ]
+
+
 def _file_hash(path: Path) -> Optional[str]:
     """Return SHA-256 hex digest of a file, or None if unreadable."""
     try:
@@ -132,8 +191,14 @@ async def _config_watcher(
             return
 
 
-async def _metrics_loop(cfg: SimulatorConfig, client: MessageSink, start: float) -> None:
-    """Periodically log throughput metrics."""
+async def _metrics_loop(
+    cfg: SimulatorConfig,
+    client: MessageSink,
+    scheduler: TickScheduler,
+    start: float,
+    site_workers: Optional[SiteWorkerPool] = None,
+) -> None:
+    """Periodically log throughput, sender, site-worker and tick-lateness metrics."""
     if not cfg.logging.publish_metrics:
         return
     interval = cfg.logging.metrics_interval_sec
@@ -147,6 +212,49 @@ async def _metrics_loop(cfg: SimulatorConfig, client: MessageSink, start: float)
             rate,
             elapsed,
         )
+        if isinstance(client, (MqttClient, MqttClientPool)):
+            flow = client.publish_stats()
+            logger.info(
+                "Metrics: MQTT %d/%d unacknowledged, ack latency mean %.0fms max %.0fms, "
+                "%d publishes blocked, %d dropped (overflow)",
+                flow["outstanding"],
+                flow["maxQueued"],
+                flow["ackLatencyMeanMs"],
+                flow["ackLatencyMaxMs"],
+                flow["blockedPublishes"],
+                flow["droppedOverflow"],
+            )
+        elif isinstance(client, EventHubClient):
+            sender = client.sender_stats()
+            logger.info(
+                "Metrics: Event Hub buffer %d/%d, %d batches in flight, "
+                "%d publishes blocked, %d dropped (overflow), %d dropped (send failures)",
+                sender["buffered"],
+                sender["maxBuffered"],
+                sender["inFlightBatches"],
+                sender["blockedPublishes"],
+                sender["droppedOverflow"],
+                sender["droppedFailed"],
+            )
+        if site_workers is not None:
+            workers = site_workers.stats()
+            logger.info(
+                "Metrics: site workers %d/%d alive, %d messages sent (%.1f msg/s)",
+                workers["alive"],
+                workers["workers"],
+                workers["messages"],
+                workers["messages"] / elapsed if elapsed > 0 else 0,
+            )
+        worst = scheduler.worst()
+        if worst:
+            name, stats = worst
+            logger.info(
+                "Metrics: tick lateness worst '%s' max %.0fms mean %.0fms (%d skipped)",
+                name,
+                stats.max_lateness * 1000,
+                stats.mean_lateness * 1000,
+                stats.skipped,
+            )
 
 
 async def run(cfg: SimulatorConfig, config_path: Optional[Path] = None) -> bool:
@@ -157,6 +265,9 @@ async def run(cfg: SimulatorConfig, config_path: Optional[Path] = None) -> bool:
     """
     reload_event = asyncio.Event()
 
+    # Replica sharding: restrict this pod to its slice (no-op for one replica)
+    site_base = apply_sharding(cfg)
+
     # ------ Choose output sink based on outputMode ------
     client: MessageSink
     if cfg.output_mode == "eventHub":
@@ -164,13 +275,19 @@ async def run(cfg: SimulatorConfig, config_path: Optional[Path] = None) -> bool:
         client = EventHubClient(cfg.eventhub)
     else:
         logger.info("Output mode: MQTT broker")
-        client = MqttClient(cfg.mqtt)
+        client = MqttClientPool(cfg.mqtt) if cfg.mqtt.connections > 1 else MqttClient(cfg.mqtt)
     await client.connect()
 
     registry = StateRegistry()
-    streams = _build_streams(cfg, client, registry)
+    scheduler = TickScheduler(phase_spreading=cfg.simulation.phase_spreading)
+    streams = _build_streams(cfg, client, registry, scheduler)
     anomaly = AnomalyEngine(cfg, client, streams)
-    cmd_handler = CommandHandler(cfg, client, streams, anomaly, start_time=time.monotonic())
+
+    # Multi-site sharding: additional sites run in worker processes
+    site_workers: Optional[SiteWorkerPool] = None
+    site_handlers: List[CommandHandler] = []
+    if cfg.multi_site.enabled and cfg.multi_site.sites and cfg.multi_site.workers > 0:
+        site_workers = SiteWorkerPool(site_base, cfg.multi_site.workers)
 
     # Log which streams are enabled
     enabled = [slug for slug, s in streams.items() if s.is_enabled()]
@@ -189,37 +306,27 @@ async def run(cfg: SimulatorConfig, config_path: Optional[Path] = None) -> bool:
         tasks.append(asyncio.create_task(stream.safe_run(), name=f"stream-{slug}"))
 
     # ── Multi-site: clone streams for each additional site ────────
-    site_streams: Dict[str, Dict[str, BaseStream]] = {}
-    if cfg.multi_site.enabled and cfg.multi_site.sites:
-        for site_prof in cfg.multi_site.sites:
-            site_cfg = clone_config_for_site(cfg, site_prof)
-            site_reg = StateRegistry()
-            s_streams = _build_streams(site_cfg, client, site_reg)
-            site_streams[site_prof.site_id] = s_streams
-
-            # Filter by enabledStreams if specified
-            allowed = set(site_prof.enabled_streams) if site_prof.enabled_streams else None
-            s_enabled = [
-                slug for slug, s in s_streams.items()
-                if s.is_enabled() and (allowed is None or slug in allowed)
-            ]
-            for slug in s_enabled:
-                tasks.append(asyncio.create_task(
-                    s_streams[slug].safe_run(),
-                    name=f"site-{site_prof.site_id}-{slug}",
-                ))
-            logger.info(
-                "Multi-site '%s': %d streams started (offset=%d, scale=%.1f)",
-                site_prof.site_id, len(s_enabled),
-                site_prof.equipment_id_offset, site_prof.scale,
-            )
+    if site_workers is not None:
+        site_workers.start()
+        tasks.append(asyncio.create_task(site_workers.run(), name="site-workers"))
+    elif cfg.multi_site.enabled and cfg.multi_site.sites:
+        site_streams, site_tasks = _start_site_streams(site_base, client, scheduler, cfg.multi_site.sites)
+        tasks.extend(site_tasks)
+        site_handlers = _site_command_handlers(site_streams, client, start_time)
+
+    cmd_handler = CommandHandler(
+        cfg, client, streams, anomaly, start_time=start_time, scheduler=scheduler,
+        site_workers=site_workers, site_handlers=site_handlers,
+    )
 
     # Start anomaly engine
     if anomaly.is_enabled():
         tasks.append(asyncio.create_task(anomaly.run(), name="anomaly-engine"))
 
     # Start metrics logger
-    tasks.append(asyncio.create_task(_metrics_loop(cfg, client, start_time), name="metrics"))
+    tasks.append(asyncio.create_task(
+        _metrics_loop(cfg, client, scheduler, start_time, site_workers), name="metrics",
+    ))
 
     # Start command handler
     tasks.append(asyncio.create_task(cmd_handler.run(), name="command-handler"))
@@ -271,14 +378,11 @@ async def run(cfg: SimulatorConfig, config_path: Optional[Path] = None) -> bool:
         if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError):
             logger.warning("Task %s raised during shutdown: %s", t.get_name(), result)
 
-    # Drain the output queue (MQTT only — Event Hub flushes in disconnect)
-    if isinstance(client, MqttClient) and client._client is not None:
-        try:
-            # Give paho time to flush outgoing messages
-            await asyncio.sleep(0.5)
-        except asyncio.CancelledError:
-            pass
+    if site_workers is not None:
+        await asyncio.get_running_loop().run_in_executor(None, site_workers.stop)
 
+    # Flushes queued output: MQTT waits for outstanding acks, Event Hub
+    # sends its pending batches
     await client.disconnect()
 
     if is_reload:
@@ -320,7 +424,8 @@ def main() -> None:
         logger.info("Zava MQTT Simulator starting")
         logger.info("Output mode: %s", cfg.output_mode)
         if cfg.output_mode == "mqtt":
-            logger.info("Broker: %s:%d", cfg.mqtt.broker, cfg.mqtt.port)
+            logger.info("Broker: %s:%d (%d connection(s))",
+                        cfg.mqtt.broker, cfg.mqtt.port, cfg.mqtt.connections)
         else:
             logger.info("Event Hub: %s", cfg.eventhub.eventhub_name or "(from connection string)")
         logger.info("Topic mode: %s", cfg.topic_mode)
@@ -1,4 +1,4 @@
-"""MQTT client wrapper with reconnect, TLS, and SAT auth support."""
+"""MQTT client wrapper with reconnect, TLS, SAT auth and publish flow control."""
 
 from __future__ import annotations
 
@@ -6,8 +6,10 @@ import asyncio
 import json
 import logging
 import ssl
+import threading
+import time
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
 import paho.mqtt.client as mqtt
 from paho.mqtt.properties import Properties
@@ -20,9 +22,25 @@ logger = logging.getLogger(__name__)
 # Kubernetes-mounted SAT token path
 _SAT_TOKEN_PATH = Path("/var/run/secrets/tokens/mqtt-client-token")
 
+# Reused encoder — ``json.dumps(..., default=str)`` builds a new one per call
+_to_json = json.JSONEncoder(default=str).encode
+
+
+def _accepted(rc: mqtt.MQTTErrorCode, qos: int) -> bool:
+    """Whether paho took the message (QoS 1/2 is kept for resend while disconnected)."""
+    return rc == mqtt.MQTT_ERR_SUCCESS or (rc == mqtt.MQTT_ERR_NO_CONN and qos > 0)
+
 
 class MqttClient:
-    """Thin async-friendly wrapper around paho-mqtt v2."""
+    """Thin async-friendly wrapper around paho-mqtt v2.
+
+    Every message handed to paho counts as *outstanding* until paho reports
+    it published (``on_publish``: PUBACK for QoS 1, written for QoS 0).  Once
+    ``maxQueued`` messages are outstanding, ``overflowPolicy`` applies:
+    ``block`` makes :meth:`publish` wait for acknowledgements (backpressure
+    on the streams), ``drop`` discards new messages and ``sample`` keeps one
+    in ``overflowSampleEvery``.  See :meth:`publish_stats`.
+    """
 
     def __init__(self, cfg: MqttConfig) -> None:
         self._cfg = cfg
@@ -32,6 +50,20 @@ class MqttClient:
         self._msg_count = 0
         self._subscriptions: Dict[str, Callable[[str], None]] = {}
         self._connect_properties: Properties | None = None
+        # Flow control — acks arrive on paho's network thread, guarded by _ack_lock
+        self._ack_lock = threading.Lock()
+        self._sent_at: Dict[int, float] = {}   # mid → publish time
+        self._early_acks: set[int] = set()     # acked before publish() saw the mid
+        self._outstanding = 0
+        self._has_room = asyncio.Event()
+        self._has_room.set()
+        self._waiting_for_room = False
+        self._acked = 0
+        self._ack_latency_total = 0.0
+        self._ack_latency_max = 0.0
+        self._blocked_publishes = 0
+        self._dropped_overflow = 0
+        self._overflow_seen = 0
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -77,6 +109,8 @@ class MqttClient:
             self._connect_properties = None
             logger.info("Using no authentication")
 
+        self._client.max_inflight_messages_set(self._cfg.max_in_flight)
+
         # --- TLS ---
         if self._cfg.use_tls:
             ctx = ssl.create_default_context()
@@ -87,6 +121,7 @@ class MqttClient:
         self._client.on_connect = self._on_connect
         self._client.on_disconnect = self._on_disconnect
         self._client.on_message = self._on_message
+        self._client.on_publish = self._on_publish
         # Re-read the SAT token before every reconnect attempt
         self._client.on_pre_connect = self._on_pre_connect
 
@@ -109,12 +144,26 @@ class MqttClient:
                 self._cfg.port,
             )
 
-    async def disconnect(self) -> None:
+    async def disconnect(self, drain_timeout: float = 5.0) -> None:
         if self._client:
+            await self._drain(drain_timeout)
             self._client.loop_stop()
             self._client.disconnect()
             logger.info("Disconnected from MQTT broker (published %d messages total)", self._msg_count)
 
+    async def _drain(self, timeout: float) -> None:
+        """Wait (up to *timeout* s) for paho to settle the outstanding messages."""
+        deadline = time.monotonic() + timeout
+        while self.is_connected and time.monotonic() < deadline:
+            with self._ack_lock:
+                if self._outstanding == 0:
+                    return
+            await asyncio.sleep(0.05)
+        with self._ack_lock:
+            left = self._outstanding
+        if left:
+            logger.warning("Disconnecting with %d unacknowledged messages", left)
+
     # ------------------------------------------------------------------
     # Publishing
     # ------------------------------------------------------------------
@@ -127,22 +176,71 @@ class MqttClient:
         qos: int | None = None,
         retain: bool = False,
     ) -> None:
-        """Publish a JSON payload to `topic`."""
+        """Publish a JSON payload to `topic`.
+
+        Waits for room when ``maxQueued`` messages are unacknowledged and
+        the overflow policy is ``block``.
+        """
         if self._client is None:
             raise RuntimeError("MqttClient not connected")
 
-        data = json.dumps(payload, default=str)
+        if not await self._reserve():
+            return
+        data = _to_json(payload)
         q = qos if qos is not None else self._cfg.qos
 
         try:
             info = self._client.publish(topic, data, qos=q, retain=retain)
-            if info.rc != mqtt.MQTT_ERR_SUCCESS:
+            if not _accepted(info.rc, q):
                 logger.warning("Publish failed (rc=%s) on topic %s", info.rc, topic)
             else:
+                self._track(info.mid)
                 self._msg_count += 1
         except Exception as exc:
             logger.error("Publish error on topic %s: %s", topic, exc)
 
+    async def publish_many(
+        self,
+        items: Iterable[Tuple[str, dict[str, Any]]],
+        *,
+        qos: int | None = None,
+        retain: bool = False,
+    ) -> None:
+        """Publish a batch of ``(topic, payload)`` pairs as JSON.
+
+        Same semantics as :meth:`publish` for every item (including flow
+        control), but failures are logged once per batch instead of once
+        per message.
+        """
+        if self._client is None:
+            raise RuntimeError("MqttClient not connected")
+
+        q = qos if qos is not None else self._cfg.qos
+        publish = self._client.publish
+        sent = failed = 0
+        last_error: object = None
+
+        for topic, payload in items:
+            if not await self._reserve():
+                continue
+            try:
+                info = publish(topic, _to_json(payload), qos=q, retain=retain)
+            except Exception as exc:
+                failed += 1
+                last_error = exc
+                continue
+            if not _accepted(info.rc, q):
+                failed += 1
+                last_error = f"rc={info.rc}"
+            else:
+                self._track(info.mid)
+                sent += 1
+
+        self._msg_count += sent
+        if failed:
+            logger.warning("Batch publish: %d of %d messages failed (last: %s)",
+                           failed, sent + failed, last_error)
+
     def subscribe(
         self,
         topic: str,
@@ -166,6 +264,71 @@ class MqttClient:
     def message_count(self) -> int:
         return self._msg_count
 
+    def publish_stats(self) -> Dict[str, Any]:
+        """Flow-control counters and publish-to-ack latency."""
+        with self._ack_lock:
+            acked = self._acked
+            mean = self._ack_latency_total / acked if acked else 0.0
+            return {
+                "outstanding": self._outstanding,
+                "maxQueued": self._cfg.max_queued,
+                "acked": acked,
+                "ackLatencyMeanMs": round(mean * 1000, 1),
+                "ackLatencyMaxMs": round(self._ack_latency_max * 1000, 1),
+                "blockedPublishes": self._blocked_publishes,
+                "droppedOverflow": self._dropped_overflow,
+            }
+
+    # ------------------------------------------------------------------
+    # Flow control
+    # ------------------------------------------------------------------
+
+    async def _reserve(self) -> bool:
+        """Apply the overflow policy; ``False`` means skip this message."""
+        if self._outstanding < self._cfg.max_queued:
+            return True
+
+        policy = self._cfg.overflow_policy
+        if policy == "block":
+            self._blocked_publishes += 1
+            while True:
+                # Re-check under the lock so an ack can't slip between check and wait
+                with self._ack_lock:
+                    if self._outstanding < self._cfg.max_queued:
+                        return True
+                    self._has_room.clear()
+                    self._waiting_for_room = True
+                await self._has_room.wait()
+
+        self._overflow_seen += 1
+        # Keep the 1st, (every+1)th, ... overflowing message
+        if policy == "sample" and (self._overflow_seen - 1) % self._cfg.overflow_sample_every == 0:
+            return True
+        self._dropped_overflow += 1
+        if self._dropped_overflow == 1 or self._dropped_overflow % 10_000 == 0:
+            logger.warning(
+                "MQTT publish queue full (%d unacknowledged) — %d messages dropped so far",
+                self._cfg.max_queued, self._dropped_overflow,
+            )
+        return False
+
+    def _track(self, mid: int) -> None:
+        """Count a message handed to paho as outstanding until it is acked."""
+        with self._ack_lock:
+            if mid in self._early_acks:
+                self._early_acks.discard(mid)
+                self._record_ack(0.0)
+            else:
+                self._sent_at[mid] = time.monotonic()
+                self._outstanding += 1
+
+    def _record_ack(self, latency: float) -> None:
+        """Caller must hold _ack_lock."""
+        self._acked += 1
+        self._ack_latency_total += latency
+        if latency > self._ack_latency_max:
+            self._ack_latency_max = latency
+
     # ------------------------------------------------------------------
     # Internal callbacks
     # ------------------------------------------------------------------
@@ -228,6 +391,29 @@ class MqttClient:
         if self._loop:
             self._loop.call_soon_threadsafe(self._connected.clear)
 
+    def _on_publish(
+        self,
+        client: mqtt.Client,
+        userdata: Any,
+        mid: int,
+        rc: mqtt.ReasonCode,
+        properties: mqtt.Properties | None,
+    ) -> None:
+        """Paho network thread: a message was acknowledged (or written, for QoS 0)."""
+        with self._ack_lock:
+            sent_at = self._sent_at.pop(mid, None)
+            if sent_at is None:
+                # Ack raced ahead of _track(); it settles the message there
+                self._early_acks.add(mid)
+                return
+            self._outstanding -= 1
+            self._record_ack(time.monotonic() - sent_at)
+            wake = self._waiting_for_room and self._outstanding < self._cfg.max_queued
+            if wake:
+                self._waiting_for_room = False
+        if wake and self._loop:
+            self._loop.call_soon_threadsafe(self._has_room.set)
+
     def _on_message(
         self,
         client: mqtt.Client,
@@ -0,0 +1,145 @@
+"""Pool of MQTT connections for high-rate publishing.
+
+A single paho client is limited to one TCP connection and one network
+thread.  :class:`MqttClientPool` opens ``mqtt.connections`` clients, each with
+its own derived ``clientId`` (``<clientId>-<n>``), and exposes the same
+``publish`` / ``publish_many`` / ``subscribe`` interface as
+:class:`MqttClient`.
+
+Topics are mapped onto connections by consistent hashing, so every topic
+always uses the same connection and per-topic ordering is preserved.
+Subscriptions (the command topic) stay on connection 0.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import hashlib
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from .config import MqttConfig
+from .mqtt_client import MqttClient
+
+logger = logging.getLogger(__name__)
+
+# Points per connection on the hash ring — smooths the topic distribution
+_VIRTUAL_NODES = 160
+
+
+def _ring_hash(key: str) -> int:
+    """Stable 64-bit hash (``hash()`` is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class MqttClientPool:
+    """N ``MqttClient`` connections behind the ``MqttClient`` publish API."""
+
+    def __init__(self, cfg: MqttConfig) -> None:
+        self._cfg = cfg
+        self._clients: List[MqttClient] = [
+            MqttClient(cfg.model_copy(update={"client_id": f"{cfg.client_id}-{i}"}))
+            for i in range(max(1, cfg.connections))
+        ]
+        ring = sorted(
+            (_ring_hash(f"{cfg.client_id}-{i}#{v}"), i)
+            for i in range(len(self._clients))
+            for v in range(_VIRTUAL_NODES)
+        )
+        self._ring_hashes = [h for h, _ in ring]
+        self._ring_clients = [i for _, i in ring]
+        self._topic_client: Dict[str, MqttClient] = {}
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def connect(self) -> None:
+        await asyncio.gather(*(c.connect() for c in self._clients))
+        logger.info("MQTT pool: %d connections to %s:%s",
+                    len(self._clients), self._cfg.broker, self._cfg.port)
+
+    async def disconnect(self) -> None:
+        await asyncio.gather(*(c.disconnect() for c in self._clients))
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    async def publish(
+        self,
+        topic: str,
+        payload: dict[str, Any],
+        *,
+        qos: int | None = None,
+        retain: bool = False,
+    ) -> None:
+        """Publish on the connection that owns *topic*."""
+        await self._client_for(topic).publish(topic, payload, qos=qos, retain=retain)
+
+    async def publish_many(
+        self,
+        items: Iterable[Tuple[str, dict[str, Any]]],
+        *,
+        qos: int | None = None,
+        retain: bool = False,
+    ) -> None:
+        """Split the batch by connection and publish the parts concurrently."""
+        parts: Dict[MqttClient, List[Tuple[str, dict[str, Any]]]] = {}
+        for topic, payload in items:
+            parts.setdefault(self._client_for(topic), []).append((topic, payload))
+        await asyncio.gather(*(
+            client.publish_many(part, qos=qos, retain=retain)
+            for client, part in parts.items()
+        ))
+
+    def subscribe(
+        self,
+        topic: str,
+        *,
+        qos: int = 1,
+        callback: Callable[[str], None] | None = None,
+    ) -> None:
+        """Subscribe on the designated command connection (connection 0)."""
+        self._clients[0].subscribe(topic, qos=qos, callback=callback)
+
+    @property
+    def is_connected(self) -> bool:
+        return all(c.is_connected for c in self._clients)
+
+    @property
+    def message_count(self) -> int:
+        return sum(c.message_count for c in self._clients)
+
+    def publish_stats(self) -> Dict[str, Any]:
+        """Flow-control counters summed over all connections."""
+        per_client = [c.publish_stats() for c in self._clients]
+        acked = sum(s["acked"] for s in per_client)
+        mean = (
+            sum(s["ackLatencyMeanMs"] * s["acked"] for s in per_client) / acked
+            if acked else 0.0
+        )
+        return {
+            "connections": len(self._clients),
+            "outstanding": sum(s["outstanding"] for s in per_client),
+            "maxQueued": sum(s["maxQueued"] for s in per_client),
+            "acked": acked,
+            "ackLatencyMeanMs": round(mean, 1),
+            "ackLatencyMaxMs": max(s["ackLatencyMaxMs"] for s in per_client),
+            "blockedPublishes": sum(s["blockedPublishes"] for s in per_client),
+            "droppedOverflow": sum(s["droppedOverflow"] for s in per_client),
+        }
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _client_for(self, topic: str) -> MqttClient:
+        """Connection owning *topic*: first ring point clockwise of its hash."""
+        client = self._topic_client.get(topic)
+        if client is None:
+            pos = bisect.bisect(self._ring_hashes, _ring_hash(topic))
+            index = self._ring_clients[pos % len(self._ring_clients)]
+            client = self._topic_client[topic] = self._clients[index]
+        return client
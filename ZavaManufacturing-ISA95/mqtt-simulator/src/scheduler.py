@@ -0,0 +1,168 @@
+"""Shared tick scheduler for periodic simulator streams.
+
+Streams used to end every loop with ``await asyncio.sleep(interval)``, so each
+period drifted by the loop body's runtime and hundreds of cloned site streams
+woke at uncorrelated times.  Instead, each stream gets a :class:`Ticker` that
+waits for **absolute** deadlines ``anchor + phase + k × interval``:
+
+- no drift — a slow loop body shortens the next wait instead of delaying
+  every following tick;
+- no catch-up bursts — if a body overruns a whole period, the missed ticks
+  are skipped (and counted);
+- optional phase spreading — tickers are offset by a low-discrepancy
+  fraction of their interval so publish bursts of many streams interleave.
+
+All tickers share one :class:`TickScheduler`: a heap of deadlines served by
+a single event-loop timer.  Per-stream lateness (wake-up time − deadline)
+is tracked for the metrics log and the ``status`` command.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Fractional part of the golden ratio — consecutive multiples are evenly spread
+_GOLDEN_FRACTION = 0.6180339887498949
+
+
+@dataclass
+class TickStats:
+    """Lateness statistics for one ticker (seconds)."""
+    ticks: int = 0
+    skipped: int = 0
+    total_lateness: float = 0.0
+    max_lateness: float = 0.0
+
+    def record(self, lateness: float) -> None:
+        lateness = max(0.0, lateness)
+        self.ticks += 1
+        self.total_lateness += lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+
+    @property
+    def mean_lateness(self) -> float:
+        return self.total_lateness / self.ticks if self.ticks else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "ticks": self.ticks,
+            "skipped": self.skipped,
+            "meanLatenessMs": round(self.mean_lateness * 1000, 1),
+            "maxLatenessMs": round(self.max_lateness * 1000, 1),
+        }
+
+
+class Ticker:
+    """Drift-free periodic wait for one stream (see module docstring)."""
+
+    def __init__(
+        self,
+        scheduler: TickScheduler,
+        name: str,
+        interval: float,
+        phase: float,
+        stats: TickStats,
+    ) -> None:
+        self.name = name
+        self.interval = interval
+        self.phase = phase
+        self.stats = stats
+        self._scheduler = scheduler
+        self._next: float | None = None
+
+    async def wait(self, interval: float | None = None) -> None:
+        """Sleep until the next tick deadline.
+
+        Passing a different *interval* (e.g. after a ``set-interval``
+        command) re-anchors the ticker at the current time.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if interval is not None and interval != self.interval:
+            self.interval = interval
+            self._next = None
+
+        if self._next is None:
+            self._next = now + self.phase + self.interval
+        elif now >= self._next + self.interval:
+            # The body overran at least one full period: skip, don't burst
+            missed = int((now - self._next) // self.interval)
+            self._next += missed * self.interval
+            self.stats.skipped += missed
+
+        deadline = self._next
+        self._next += self.interval
+        await self._scheduler.sleep_until(deadline)
+        self.stats.record(loop.time() - deadline)
+
+
+class TickScheduler:
+    """Heap of tick deadlines served by a single event-loop timer."""
+
+    def __init__(self, *, phase_spreading: bool = True) -> None:
+        self.phase_spreading = phase_spreading
+        self._heap: List[Tuple[float, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_when = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stats: Dict[str, TickStats] = {}
+        self._ticker_count = 0
+
+    def ticker(self, name: str, interval: float) -> Ticker:
+        """Create a ticker; tickers with the same *name* share statistics."""
+        phase = 0.0
+        if self.phase_spreading:
+            phase = (self._ticker_count * _GOLDEN_FRACTION) % 1.0 * interval
+        self._ticker_count += 1
+        stats = self._stats.setdefault(name, TickStats())
+        return Ticker(self, name, interval, phase, stats)
+
+    async def sleep_until(self, deadline: float) -> None:
+        """Sleep until ``loop.time() >= deadline``."""
+        self._loop = asyncio.get_running_loop()
+        future = self._loop.create_future()
+        heapq.heappush(self._heap, (deadline, next(self._seq), future))
+        self._arm()
+        await future
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-ticker lateness statistics, keyed by ticker name."""
+        return {name: s.to_dict() for name, s in sorted(self._stats.items())}
+
+    def worst(self) -> Tuple[str, TickStats] | None:
+        """The ticker with the highest maximum lateness, if any ticked."""
+        ticked = [(n, s) for n, s in self._stats.items() if s.ticks]
+        return max(ticked, key=lambda item: item[1].max_lateness) if ticked else None
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _arm(self) -> None:
+        """Keep the timer armed for the earliest pending deadline."""
+        if not self._heap:
+            return
+        when = self._heap[0][0]
+        if self._timer is not None:
+            if self._timer_when <= when:
+                return
+            self._timer.cancel()
+        self._timer = self._loop.call_at(when, self._fire)
+        self._timer_when = when
+
+    def _fire(self) -> None:
+        self._timer = None
+        now = self._loop.time()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, future = heapq.heappop(self._heap)
+            if not future.done():  # cancelled waiters are simply dropped
+                future.set_result(None)
+        self._arm()
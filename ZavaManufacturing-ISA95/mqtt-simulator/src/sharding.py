@@ -0,0 +1,133 @@
+"""Replica sharding — partition the generated fleet across simulator pods.
+
+With ``sharding.count > 1`` every replica runs the same config but publishes
+only its own slice, so the generated load scales with the pod count:
+
+- production lines (and every machine on them) are assigned round-robin in
+  ``LINE_MACHINE_MAP`` order — a line never spans pods, so machine state,
+  counters, twins, maintenance and vision stay correlated per line;
+- site-level entities (equipment, segments, cameras, shipments) are
+  assigned round-robin by list position;
+- additional sites (``multiSite.sites``) are assigned whole, round-robin;
+- the batch lifecycle and the anomaly events are published by replica 0;
+- the MQTT ``clientId`` gets a ``-shard<index>`` suffix.
+
+The shard is resolved at startup from, in order of precedence,
+``SIMULATOR_SHARD_INDEX`` / ``SIMULATOR_SHARD_COUNT``, the StatefulSet pod
+ordinal (trailing ``-<n>`` of ``HOSTNAME``) and the ``sharding`` config.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+from typing import List, Sequence, TypeVar
+
+from .config import ShardingConfig, SimulatorConfig
+from .utils import LINE_MACHINE_MAP
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+ENV_SHARD_INDEX = "SIMULATOR_SHARD_INDEX"
+ENV_SHARD_COUNT = "SIMULATOR_SHARD_COUNT"
+
+# StatefulSet pods are named "<statefulset>-<ordinal>"
+_ORDINAL_RE = re.compile(r"-(\d+)$")
+
+_LINE_POSITION = {name: i for i, name in enumerate(LINE_MACHINE_MAP)}
+
+
+# ------------------------------------------------------------------
+# Ownership
+# ------------------------------------------------------------------
+
+def owns_position(shard: ShardingConfig, position: int) -> bool:
+    """Whether the entity at list *position* belongs to this replica."""
+    return position % shard.count == shard.index
+
+
+def owns_line(shard: ShardingConfig, line_name: str) -> bool:
+    """Whether production line *line_name* belongs to this replica.
+
+    Known lines are dealt round-robin (even split); other names fall back
+    to a stable hash (``hash()`` is salted per process).
+    """
+    if shard.count <= 1:
+        return True
+    position = _LINE_POSITION.get(line_name)
+    if position is None:
+        position = int.from_bytes(hashlib.blake2b(line_name.encode(), digest_size=8).digest(), "big")
+    return owns_position(shard, position)
+
+
+def select(shard: ShardingConfig, items: Sequence[T]) -> List[T]:
+    """The items of a site-level list that belong to this replica."""
+    return [item for i, item in enumerate(items) if owns_position(shard, i)]
+
+
+# ------------------------------------------------------------------
+# Startup
+# ------------------------------------------------------------------
+
+def resolve_shard(cfg: ShardingConfig) -> ShardingConfig:
+    """Apply the env / StatefulSet ordinal overrides to *cfg*."""
+    # Empty values count as unset (e.g. a pod-index label the cluster lacks)
+    count = int(os.environ.get(ENV_SHARD_COUNT) or cfg.count)
+    index = cfg.index
+    if os.environ.get(ENV_SHARD_INDEX):
+        index = int(os.environ[ENV_SHARD_INDEX])
+    elif count > 1:
+        match = _ORDINAL_RE.search(os.environ.get("HOSTNAME", ""))
+        if match:
+            index = int(match.group(1))
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard {index}/{count}: need 0 <= index < count")
+    return ShardingConfig(index=index, count=count)
+
+
+def apply_sharding(cfg: SimulatorConfig) -> SimulatorConfig:
+    """Resolve this replica's shard and restrict *cfg* (in place) to its slice.
+
+    Returns the config additional sites are cloned from: an unrestricted
+    copy of the site (sites are owned whole) listing only this replica's
+    sites.  Without sharding this is *cfg* itself.
+    """
+    shard = resolve_shard(cfg.sharding)
+    cfg.sharding = shard
+    if shard.count == 1:
+        return cfg
+
+    cfg.mqtt.client_id = f"{cfg.mqtt.client_id}-shard{shard.index}"
+    cfg.multi_site.sites = select(shard, cfg.multi_site.sites)
+
+    site_base = cfg.model_copy(deep=True)
+    site_base.sharding = ShardingConfig()
+
+    # Primary site: lines (machine-based streams filter via
+    # BaseStream.fleet_machines) and site-level entity lists
+    ms = cfg.machine_state_telemetry
+    ms.lines = [ln for ln in ms.lines if owns_line(shard, ln.name)]
+    qv = cfg.quality_vision_events
+    qv.stations = [st for st in qv.stations if owns_line(shard, st.line_name)]
+    eq = cfg.equipment_telemetry
+    eq.equipment = select(shard, eq.equipment)
+    ps = cfg.process_segment_telemetry
+    ps.segments = select(shard, ps.segments)
+    si = cfg.safety_incident_events
+    si.cameras = select(shard, si.cameras)
+    sc = cfg.supply_chain_alerts
+    sc.active_shipments = select(shard, sc.active_shipments)
+    if shard.index != 0:
+        cfg.batch_lifecycle.enabled = False
+
+    logger.info(
+        "Shard %d/%d: lines %s, %d equipment, %d segments, %d sites",
+        shard.index, shard.count,
+        ", ".join(n for n in LINE_MACHINE_MAP if owns_line(shard, n)) or "-",
+        len(eq.equipment), len(ps.segments), len(cfg.multi_site.sites),
+    )
+    return site_base
@@ -0,0 +1,283 @@
+"""Multi-process site sharding — run cloned sites in worker processes.
+
+With ``multiSite.workers > 0`` the main process keeps the primary site, the
+anomaly engine and the command handler, and distributes the additional
+sites round-robin over that many worker processes.  Each worker has its own
+event loop, output sink (``clientId`` suffixed ``-w<n>``) and tick
+scheduler, so site generation is no longer limited to a single core.
+
+The main process supervises the workers:
+
+- a worker that dies is restarted (with exponential backoff);
+- config-changing commands (``enable``, ``disable``, ``set-interval``,
+  ``set``) are forwarded to every worker and applied to each of its sites,
+  and replayed to a restarted worker before its streams run;
+- workers send a metrics snapshot every ``logging.metricsIntervalSec``,
+  which the main process aggregates for the metrics log and ``status``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing as mp
+import os
+import queue
+import signal
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from .config import SimulatorConfig, SiteProfile
+
+logger = logging.getLogger(__name__)
+
+# Commands that change stream configuration and must reach the site workers
+FORWARDED_ACTIONS = frozenset({"enable", "disable", "set-interval", "set"})
+
+# Spawned (not forked) workers: paho and asyncio state must not be inherited
+_MP = mp.get_context("spawn")
+
+# How often an idle worker checks that its parent process is still alive
+_PARENT_POLL_SEC = 1.0
+
+
+class _Worker:
+    """Bookkeeping for one worker process (parent side)."""
+
+    def __init__(self, index: int, sites: List[SiteProfile]) -> None:
+        self.index = index
+        self.sites = sites
+        self.process: Optional[mp.process.BaseProcess] = None
+        self.commands: Any = None
+        self.restarts = 0
+        self.restart_at = 0.0
+        self.snapshot: Dict[str, Any] = {}
+        self.messages_before_restart = 0  # keeps totals monotonic across restarts
+
+    @property
+    def messages(self) -> int:
+        return self.messages_before_restart + self.snapshot.get("messages", 0)
+
+
+class SiteWorkerPool:
+    """Start, supervise and talk to the site worker processes."""
+
+    def __init__(self, cfg: SimulatorConfig, workers: int) -> None:
+        self._cfg = cfg
+        sites = cfg.multi_site.sites
+        count = max(1, min(workers, len(sites)))
+        self._workers = [_Worker(i, sites[i::count]) for i in range(count)]
+        self._metrics: Any = _MP.Queue()
+        self._stopping = False
+        self._forwarded: List[dict] = []  # replayed to restarted workers
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        for worker in self._workers:
+            self._spawn(worker)
+
+    async def run(self) -> None:
+        """Collect worker metrics and restart dead workers until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                snapshot = await loop.run_in_executor(None, self._metrics.get, True, 1.0)
+            except queue.Empty:
+                snapshot = None
+            if snapshot is not None:
+                self._workers[snapshot["worker"]].snapshot = snapshot
+            self._supervise()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Ask every worker to shut down; terminate stragglers."""
+        self._stopping = True
+        for worker in self._workers:
+            if worker.process is not None and worker.process.is_alive():
+                worker.commands.put(None)
+        deadline = time.monotonic() + timeout
+        for worker in self._workers:
+            if worker.process is None:
+                continue
+            worker.process.join(max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                logger.warning("Site worker %d did not stop — terminating", worker.index)
+                worker.process.terminate()
+                worker.process.join(1.0)
+
+    # ------------------------------------------------------------------
+    # Commands and metrics
+    # ------------------------------------------------------------------
+
+    def send_command(self, cmd: dict) -> None:
+        """Forward *cmd* to every running worker."""
+        self._forwarded.append(cmd)
+        for worker in self._workers:
+            if worker.process is not None and worker.process.is_alive():
+                worker.commands.put(cmd)
+
+    @property
+    def message_count(self) -> int:
+        return sum(w.messages for w in self._workers)
+
+    def stats(self) -> Dict[str, Any]:
+        """Latest snapshot of every worker plus totals."""
+        return {
+            "workers": len(self._workers),
+            "alive": sum(1 for w in self._workers if w.process is not None and w.process.is_alive()),
+            "messages": self.message_count,
+            "perWorker": [
+                {
+                    "worker": w.index,
+                    "pid": w.process.pid if w.process is not None else None,
+                    "sites": [s.site_id for s in w.sites],
+                    "restarts": w.restarts,
+                    **{k: v for k, v in w.snapshot.items() if k not in ("worker", "sites")},
+                    "messages": w.messages,
+                }
+                for w in self._workers
+            ],
+        }
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _spawn(self, worker: _Worker) -> None:
+        worker.commands = _MP.Queue()
+        worker.process = _MP.Process(
+            target=worker_main,
+            args=(worker.index, self._cfg, worker.sites, worker.commands, self._metrics,
+                  list(self._forwarded)),
+            name=f"site-worker-{worker.index}",
+            daemon=True,
+        )
+        worker.process.start()
+        logger.info(
+            "Site worker %d started (pid %d): %s",
+            worker.index, worker.process.pid, ", ".join(s.site_id for s in worker.sites),
+        )
+
+    def _supervise(self) -> None:
+        if self._stopping:
+            return
+        now = time.monotonic()
+        for worker in self._workers:
+            if worker.process is None or worker.process.is_alive():
+                continue
+            if not worker.restart_at:
+                backoff = min(2 ** worker.restarts, 60)
+                worker.restart_at = now + backoff
+                logger.error(
+                    "Site worker %d exited (code %s) — restarting in %ds",
+                    worker.index, worker.process.exitcode, backoff,
+                )
+            elif now >= worker.restart_at:
+                worker.restarts += 1
+                worker.restart_at = 0.0
+                worker.messages_before_restart = worker.messages
+                worker.snapshot = {}
+                self._spawn(worker)
+
+
+# ----------------------------------------------------------------------
+# Worker process
+# ----------------------------------------------------------------------
+
+def worker_main(
+    index: int,
+    cfg: SimulatorConfig,
+    sites: List[SiteProfile],
+    commands: Any,
+    metrics: Any,
+    replay: Sequence[dict] = (),
+) -> None:
+    """Process entry point: run *sites* on a fresh event loop."""
+    # Shutdown is driven by the main process (sentinel on the command queue)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Don't block exit on metrics the main process no longer reads
+    metrics.cancel_join_thread()
+    asyncio.run(_run_worker(index, cfg, sites, commands, metrics, replay))
+
+
+async def _run_worker(
+    index: int,
+    cfg: SimulatorConfig,
+    sites: List[SiteProfile],
+    commands: Any,
+    metrics: Any,
+    replay: Sequence[dict] = (),
+) -> None:
+    # Imported here: main imports this module
+    from .eventhub_client import EventHubClient
+    from .main import _setup_logging, _site_command_handlers, _start_site_streams
+    from .mqtt_client import MqttClient
+    from .mqtt_pool import MqttClientPool
+    from .scheduler import TickScheduler
+
+    _setup_logging(cfg)
+
+    cfg = cfg.model_copy(deep=True)
+    cfg.mqtt.client_id = f"{cfg.mqtt.client_id}-w{index}"
+    if cfg.output_mode == "eventHub":
+        client = EventHubClient(cfg.eventhub)
+    else:
+        client = MqttClientPool(cfg.mqtt) if cfg.mqtt.connections > 1 else MqttClient(cfg.mqtt)
+    await client.connect()
+
+    scheduler = TickScheduler(phase_spreading=cfg.simulation.phase_spreading)
+    site_streams, tasks = _start_site_streams(cfg, client, scheduler, sites)
+    start = time.monotonic()
+
+    # One command handler per site, applying forwarded commands to its clone
+    handlers = _site_command_handlers(site_streams, client, start)
+
+    # A restarted worker first re-applies the commands forwarded so far; the
+    # handlers don't yield, so this completes before any stream task runs
+    for cmd in replay:
+        for handler in handlers:
+            await handler.handle(cmd)
+    if replay:
+        logger.info("Site worker %d replayed %d commands", index, len(replay))
+
+    async def report() -> None:
+        while True:
+            await asyncio.sleep(cfg.logging.metrics_interval_sec)
+            worst = scheduler.worst()
+            metrics.put({
+                "worker": index,
+                "pid": os.getpid(),
+                "messages": client.message_count,
+                "uptimeSec": round(time.monotonic() - start),
+                "tickWorstMaxMs": round(worst[1].max_lateness * 1000, 1) if worst else 0.0,
+            })
+
+    tasks.append(asyncio.create_task(report(), name="worker-metrics"))
+    logger.info("Site worker %d running %d sites, %d tasks", index, len(site_streams), len(tasks))
+
+    # Poll the command queue so an orphaned worker (parent killed without
+    # sending the stop sentinel) notices and exits instead of publishing forever
+    parent = os.getppid()
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            cmd = await loop.run_in_executor(None, commands.get, True, _PARENT_POLL_SEC)
+        except queue.Empty:
+            if os.getppid() != parent:
+                logger.warning("Site worker %d: parent process exited — stopping", index)
+                break
+            continue
+        if cmd is None:
+            break
+        for handler in handlers:
+            resp = await handler.handle(cmd)
+            if resp.get("status") != "ok":
+                logger.warning("Site worker %d: command %s failed: %s", index, cmd, resp.get("error"))
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await client.disconnect()
+    logger.info("Site worker %d stopped", index)
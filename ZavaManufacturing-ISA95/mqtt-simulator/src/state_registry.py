@@ -76,6 +76,10 @@ class StateRegistry:
         """True if machine is *currently* in Maintenance state."""
         return eqp_id in self._in_maintenance
 
+    def machines_in_maintenance(self) -> frozenset[str]:
+        """All machines *currently* in Maintenance state."""
+        return frozenset(self._in_maintenance)
+
     def all_machine_states(self) -> Dict[str, MachineState]:
         return dict(self._machine_states)
 
@@ -5,18 +5,24 @@ from __future__ import annotations
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterable, List, Tuple, Union
 
 from ..config import SimulatorConfig
 from ..mqtt_client import MqttClient
+from ..mqtt_pool import MqttClientPool
 from ..eventhub_client import EventHubClient
+from ..scheduler import Ticker, TickScheduler
+from ..sharding import owns_line
 from ..state_registry import StateRegistry
-from ..utils import resolve_uns_topic
+from ..utils import UnsTopicIndex, iter_machines
 
 logger = logging.getLogger(__name__)
 
-# Either output sink exposes the same publish() / subscribe() interface.
-MessageSink = Union[MqttClient, EventHubClient]
+# Either output sink exposes the same publish() / publish_many() / subscribe() interface.
+MessageSink = Union[MqttClient, MqttClientPool, EventHubClient]
+
+# One pending message for ``publish_many``: (topic, payload)
+TopicPayload = Tuple[str, Dict[str, Any]]
 
 
 class BaseStream(ABC):
@@ -34,10 +40,18 @@ class BaseStream(ABC):
         client: MessageSink,
         *,
         registry: StateRegistry | None = None,
+        scheduler: TickScheduler | None = None,
+        site_id: str | None = None,
     ) -> None:
         self.cfg = cfg
         self.client = client
         self.registry: StateRegistry = registry or StateRegistry()
+        self.scheduler: TickScheduler = scheduler or TickScheduler(
+            phase_spreading=cfg.simulation.phase_spreading,
+        )
+        self.site_id = site_id
+        self._topic_index: UnsTopicIndex | None = None
+        self._ticker: Ticker | None = None
 
     # ------------------------------------------------------------------
     # Subclass interface
@@ -81,6 +95,9 @@ class BaseStream(ABC):
         """
         backoff = 1
         while True:
+            # Fresh topic index and tick anchor per (re)start
+            self._topic_index = UnsTopicIndex(self.cfg.uns)
+            self._ticker = None
             try:
                 await self.run()
             except asyncio.CancelledError:
@@ -94,6 +111,30 @@ class BaseStream(ABC):
                 await asyncio.sleep(backoff)
                 backoff = min(backoff * 2, 60)
 
+    # ------------------------------------------------------------------
+    # Tick scheduling
+    # ------------------------------------------------------------------
+
+    async def next_tick(self, interval: float) -> None:
+        """Wait for this stream's next drift-free tick (every *interval* seconds)."""
+        if self._ticker is None:
+            name = f"{self.site_id}/{self.stream_slug}" if self.site_id else self.stream_slug
+            self._ticker = self.scheduler.ticker(name, interval)
+        await self._ticker.wait(interval)
+
+    # ------------------------------------------------------------------
+    # Fleet
+    # ------------------------------------------------------------------
+
+    def fleet_machines(
+        self, machines: Iterable[Tuple[str, str, str, int]] | None = None,
+    ) -> List[Tuple[str, str, str, int]]:
+        """*machines* (default ``iter_machines()``) restricted to the lines this replica owns."""
+        shard = self.cfg.sharding
+        if machines is None:
+            machines = iter_machines()
+        return [m for m in machines if owns_line(shard, m[1])]
+
     # ------------------------------------------------------------------
     # Topic resolution helpers
     # ------------------------------------------------------------------
@@ -114,12 +155,13 @@ class BaseStream(ABC):
         shipment_id: str | None = None,
     ) -> str:
         """Build the hierarchical UNS topic for a specific entity."""
-        return resolve_uns_topic(
-            self.cfg.uns,
-            stream_slug=self.stream_slug,
-            equipment_id_val=equipment_id,
+        if self._topic_index is None:
+            self._topic_index = UnsTopicIndex(self.cfg.uns)
+        return self._topic_index.topic(
+            self.stream_slug,
+            equipment_id=equipment_id,
             line_name=line_name,
-            machine_name_val=machine_name,
+            machine_name=machine_name,
             station_id=station_id,
             shipment_id=shipment_id,
         )
@@ -176,6 +218,21 @@ class BaseStream(ABC):
         await self.client.publish(t, payload, retain=retain)
         logger.debug("[%s] → %s", self.stream_slug, t)
 
+    async def publish_many(
+        self,
+        items: List[TopicPayload],
+        *,
+        retain: bool = False,
+    ) -> None:
+        """Publish one tick's ``(topic, payload)`` pairs as a single batch.
+
+        Build topics with :meth:`resolve_topic`.
+        """
+        if not items:
+            return
+        await self.client.publish_many(items, retain=retain)
+        logger.debug("[%s] → %d messages", self.stream_slug, len(items))
+
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
@@ -16,7 +16,6 @@ can correlate across all streams.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import random
 from dataclasses import dataclass, field
@@ -24,7 +23,6 @@ from typing import Dict, List, Optional
 
 from ..config import SimulatorConfig
 from ..mqtt_client import MqttClient
-from ..state_registry import StateRegistry
 from ..utils import (
     utcnow, utcnow_dt, random_id, rand_float, rand_int,
     random_lot_number, material_name, random_serial,
@@ -66,10 +64,9 @@ class BatchLifecycleStream(BaseStream):
         self,
         cfg: SimulatorConfig,
         client: MqttClient,
-        *,
-        registry: StateRegistry | None = None,
+        **kwargs,
     ) -> None:
-        super().__init__(cfg, client, registry=registry)
+        super().__init__(cfg, client, **kwargs)
         self._scfg = cfg.batch_lifecycle
         self._runs: List[BatchRun] = []
         self._batch_counter = 100
@@ -129,7 +126,7 @@ class BatchLifecycleStream(BaseStream):
             for b in completed:
                 self._runs.remove(b)
 
-            await asyncio.sleep(scfg.interval_sec)
+            await self.next_tick(scfg.interval_sec)
 
     async def _advance(self, batch: BatchRun) -> None:
         """Execute the current phase for this batch."""
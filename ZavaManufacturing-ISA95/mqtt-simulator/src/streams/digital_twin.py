@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import random
 from dataclasses import dataclass
@@ -10,7 +9,8 @@ from typing import Dict, List
 
 from ..config import SimulatorConfig
 from ..mqtt_client import MqttClient
-from ..utils import utcnow, utcnow_dt, random_operator, weighted_choice, iter_machines, equipment_id as fmt_eqp
+from ..utils import utcnow, utcnow_dt, random_operator, weighted_choice, equipment_id as fmt_eqp
+from ..sharding import select
 from .base import BaseStream
 
 logger = logging.getLogger(__name__)
@@ -42,7 +42,7 @@ class DigitalTwinStream(BaseStream):
             return
 
         # Site-level equipment (EQP-001, 002, 003)
-        for n in [1, 2, 3]:
+        for n in select(self.cfg.sharding, [1, 2, 3]):
             eid = fmt_eqp(n)
             self._twins.append(TwinState(
                 eqp_id=eid, line_name="", machine_name=eid,
@@ -50,7 +50,7 @@ class DigitalTwinStream(BaseStream):
             ))
 
         # WorkUnit machines
-        for eqp_id, line, name, _ in iter_machines():
+        for eqp_id, line, name, _ in self.fleet_machines():
             self._twins.append(TwinState(
                 eqp_id=eqp_id, line_name=line, machine_name=name,
                 status="Producing", last_change=utcnow(),
@@ -85,6 +85,7 @@ class DigitalTwinStream(BaseStream):
         logger.info("DigitalTwinStream started — heartbeat every %ds, retain=%s", interval, retain)
 
         while True:
+            messages = []
             for tw in self._twins:
                 # Mirror state from machine-state stream via registry (B2: cross-stream correlation)
                 reg_state = self.registry.get_machine_state(tw.eqp_id)
@@ -131,12 +132,12 @@ class DigitalTwinStream(BaseStream):
                     "LastStateChange": tw.last_change,
                 }
 
-                await self.publish(
-                    payload,
-                    retain=retain,
+                topic = self.resolve_topic(
                     equipment_id=tw.eqp_id,
                     line_name=tw.line_name,
                     machine_name=tw.machine_name,
                 )
+                messages.append((topic, payload))
 
-            await asyncio.sleep(interval)
+            await self.publish_many(messages, retain=retain)
+            await self.next_tick(interval)
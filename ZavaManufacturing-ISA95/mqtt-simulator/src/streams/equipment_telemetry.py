@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
 from ..config import SimulatorConfig
@@ -40,6 +39,7 @@ class EquipmentTelemetryStream(BaseStream):
         logger.info("EquipmentTelemetry started — %d equipment, every %ds", len(self._scfg.equipment), interval)
 
         while True:
+            messages = []
             for eq in self._scfg.equipment:
                 # Production rate can be a fixed int or a [lo, hi] range
                 if isinstance(eq.production_rate, list):
@@ -58,6 +58,7 @@ class EquipmentTelemetryStream(BaseStream):
                     "ProductionRate": prod_rate,
                 }
 
-                await self.publish(payload, equipment_id=eq.id)
+                messages.append((self.resolve_topic(equipment_id=eq.id), payload))
 
-            await asyncio.sleep(interval)
+            await self.publish_many(messages)
+            await self.next_tick(interval)
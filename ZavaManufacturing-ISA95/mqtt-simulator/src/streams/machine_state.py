@@ -2,41 +2,32 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import random
-from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 from ..config import SimulatorConfig
+from ..fleet_state import NO_ERROR, FleetState
 from ..mqtt_client import MqttClient
 from ..utils import (
-    utcnow, current_shift, weighted_choice, rand_int,
-    iter_machines, equipment_id as fmt_eqp,
+    utcnow, current_shift,
+    equipment_id as fmt_eqp, machine_name as mk_name,
 )
 from .base import BaseStream
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class MachineRuntime:
-    eqp_id: str
-    line_name: str
-    machine_name: str
-    state: str = "Running"
-    dwell_remaining: float = 0.0
-    error_code: str = "0"
-    duration_sec: int = 0
-
-
 class MachineStateTelemetryStream(BaseStream):
     stream_slug = "machine-state"
 
     def __init__(self, cfg: SimulatorConfig, client: MqttClient, **kwargs) -> None:
         super().__init__(cfg, client, **kwargs)
         self._scfg = cfg.machine_state_telemetry
-        self._machines: List[MachineRuntime] = []
+        self._fleet: FleetState | None = None
+        self._rng = np.random.default_rng()
 
     def is_enabled(self) -> bool:
         return self._scfg.enabled
@@ -46,50 +37,55 @@ class MachineStateTelemetryStream(BaseStream):
     # ------------------------------------------------------------------
 
     def _init_machines(self) -> None:
-        """Populate machine list (auto-discover or from config)."""
-        if self._machines:
+        """Build the fleet state (auto-discover or from config)."""
+        if self._fleet is not None:
             return
 
+        machines: List[Tuple[str, str, str, int]]
         if self._scfg.auto_discover:
-            for eqp_id, line, name, _ in iter_machines():
-                m = MachineRuntime(eqp_id=eqp_id, line_name=line, machine_name=name)
-                self._assign_initial_dwell(m)
-                self._machines.append(m)
+            machines = self.fleet_machines()
         else:
-            for line_cfg in self._scfg.lines:
-                for i in range(line_cfg.machines_per_line):
-                    eqp = fmt_eqp(line_cfg.equipment_id_start + i)
-                    from ..utils import machine_name as mk_name
-                    name = mk_name(line_cfg.name, i)
-                    m = MachineRuntime(eqp_id=eqp, line_name=line_cfg.name, machine_name=name)
-                    self._assign_initial_dwell(m)
-                    self._machines.append(m)
-
-        logger.info("Initialised %d machines across %d lines", len(self._machines),
-                     len({m.line_name for m in self._machines}))
-
-    def _assign_initial_dwell(self, m: MachineRuntime) -> None:
+            machines = [
+                (fmt_eqp(line_cfg.equipment_id_start + i), line_cfg.name, mk_name(line_cfg.name, i), i)
+                for line_cfg in self._scfg.lines
+                for i in range(line_cfg.machines_per_line)
+            ]
+
+        fleet = self._fleet = FleetState(machines)
         st = self._scfg.state_transition
-        m.dwell_remaining = rand_int(st.min_dwell_sec, st.max_dwell_sec)
+        fleet.dwell[:] = self._rng.integers(st.min_dwell_sec, st.max_dwell_sec + 1, len(fleet))
+
+        logger.info("Initialised %d machines across %d lines", len(fleet),
+                     len(set(fleet.line_names)))
 
     # ------------------------------------------------------------------
     # State transitions
     # ------------------------------------------------------------------
 
-    def _transition(self, m: MachineRuntime) -> None:
+    def _transition(self, rows: np.ndarray) -> None:
+        """Draw a new state, dwell and error code for every machine in *rows*."""
+        fleet, rng, n = self._fleet, self._rng, len(rows)
         st = self._scfg.state_transition
-        probs = st.probabilities
-        states = list(probs.keys())
-        weights = [probs[s] for s in states]
-        m.state = weighted_choice(states, weights)
-        m.dwell_remaining = rand_int(st.min_dwell_sec, st.max_dwell_sec)
-        m.duration_sec = 0
+        probs = self._override_probs or st.probabilities
+        codes = fleet.state_codes(probs)
+        weights = np.fromiter(probs.values(), dtype=np.float64, count=len(probs))
+
+        new_state = codes[rng.choice(len(codes), size=n, p=weights / weights.sum())]
+        fleet.state[rows] = new_state
+        fleet.dwell[rows] = rng.integers(st.min_dwell_sec, st.max_dwell_sec + 1, n)
+        fleet.duration[rows] = 0
 
         # Error codes only on Stopped/Blocked
-        if m.state in ("Stopped", "Blocked") and random.random() < st.error_probability:
-            m.error_code = random.choice(st.error_codes)
-        else:
-            m.error_code = "0"
+        error_prob = (
+            self._override_error_prob if self._override_error_prob is not None
+            else st.error_probability
+        )
+        faulted = np.isin(new_state, fleet.state_codes(("Stopped", "Blocked")))
+        faulted &= rng.random(n) < error_prob
+        fleet.error[rows] = fleet.error_codes((NO_ERROR,))[0]
+        if st.error_codes and faulted.any():
+            error_codes = fleet.error_codes(st.error_codes)
+            fleet.error[rows[faulted]] = error_codes[rng.integers(0, len(error_codes), int(faulted.sum()))]
 
     # ------------------------------------------------------------------
     # Overrides (anomaly injection support)
@@ -114,51 +110,65 @@ class MachineStateTelemetryStream(BaseStream):
 
     async def run(self) -> None:
         self._init_machines()
+        fleet = self._fleet
         tick = self.cfg.simulation.tick_interval_sec
         batches = self.cfg.simulation.active_batches
         batch_ids = [b.batch_id for b in batches] if batches else ["BTC-000"]
 
-        logger.info("MachineStateTelemetry started — %d machines, tick %ds", len(self._machines), tick)
+        logger.info("MachineStateTelemetry started — %d machines, tick %ds", len(fleet), tick)
 
         while True:
-            for m in self._machines:
-                m.dwell_remaining -= tick
-                m.duration_sec += tick
-
-                if m.dwell_remaining <= 0:
-                    self._transition(m)
-
-                    shift = current_shift(
-                        self.cfg.simulation.shifts.day_start,
-                        self.cfg.simulation.shifts.night_start,
-                    )
+            fleet.dwell -= tick
+            fleet.duration += tick
+            due = np.flatnonzero(fleet.dwell <= 0)
+
+            # Only machines that changed state are materialized into payloads
+            messages = []
+            if due.size:
+                self._transition(due)
+                timestamp = utcnow()
+                shift = current_shift(
+                    self.cfg.simulation.shifts.day_start,
+                    self.cfg.simulation.shifts.night_start,
+                )
+                for row, state_code, error_code, duration in zip(
+                    due.tolist(),
+                    fleet.state[due].tolist(),
+                    fleet.error[due].tolist(),
+                    fleet.duration[due].tolist(),
+                ):
+                    eqp_id = fleet.eqp_ids[row]
+                    line_name = fleet.line_names[row]
+                    state = fleet.state_names[state_code]
+                    error = fleet.error_names[error_code]
                     batch_id = random.choice(batch_ids)
 
                     payload = {
-                        "Timestamp": utcnow(),
-                        "EquipmentId": m.eqp_id,
-                        "LineName": m.line_name,
+                        "Timestamp": timestamp,
+                        "EquipmentId": eqp_id,
+                        "LineName": line_name,
                         "Shift": shift,
-                        "MachineState": m.state,
-                        "ErrorCode": m.error_code,
-                        "DurationSec": m.duration_sec,
+                        "MachineState": state,
+                        "ErrorCode": error,
+                        "DurationSec": duration,
                         "BatchId": batch_id,
                     }
 
                     # Publish state to shared registry for cross-stream correlation
                     self.registry.update_machine_state(
-                        eqp_id=m.eqp_id,
-                        state=m.state,
-                        error_code=m.error_code,
-                        line_name=m.line_name,
+                        eqp_id=eqp_id,
+                        state=state,
+                        error_code=error,
+                        line_name=line_name,
                         batch_id=batch_id,
                     )
 
-                    await self.publish(
-                        payload,
-                        equipment_id=m.eqp_id,
-                        line_name=m.line_name,
-                        machine_name=m.machine_name,
+                    topic = self.resolve_topic(
+                        equipment_id=eqp_id,
+                        line_name=line_name,
+                        machine_name=fleet.machine_names[row],
                     )
+                    messages.append((topic, payload))
 
-            await asyncio.sleep(tick)
+            await self.publish_many(messages)
+            await self.next_tick(tick)
@@ -12,7 +12,7 @@ from ..config import SimulatorConfig
 from ..mqtt_client import MqttClient
 from ..utils import (
     utcnow, utcnow_dt, random_id, rand_float, random_lot_number,
-    material_name, iter_machines,
+    material_name,
 )
 from .base import BaseStream
 
@@ -51,9 +51,9 @@ class MaterialConsumptionStream(BaseStream):
         batches = self.cfg.simulation.active_batches
         batch_ids = [b.batch_id for b in batches] if batches else ["BTC-000"]
 
-        # Build a quick eqp lookup for segments
-        machines = list(iter_machines())
-        eqp_pool = [m[0] for m in machines[:20]]  # first 20 machines as segment hosts
+        # Build a quick eqp lookup for segments — this replica's machines only;
+        # a shard that owns no lines publishes without equipment attribution
+        eqp_pool = [m[0] for m in self.fleet_machines()[:20]]  # first 20 machines as segment hosts
 
         logger.info("MaterialConsumptionStream started — %d segment types", len(scfg.materials))
 
@@ -73,7 +73,7 @@ class MaterialConsumptionStream(BaseStream):
             entry = random.choice(bom_entries)
             now = utcnow_dt()
             batch_id = random.choice(batch_ids)
-            eqp = random.choice(eqp_pool)
+            eqp = random.choice(eqp_pool) if eqp_pool else None
 
             # Quantity with variance
             var_range = self._variance_override or scfg.variance_pct_range
@@ -2,27 +2,20 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-import random
-from dataclasses import dataclass, field
-from typing import Dict, List
+
+import numpy as np
 
 from ..config import SimulatorConfig
+from ..fleet_state import FleetState
 from ..mqtt_client import MqttClient
-from ..utils import utcnow, rand_float, iter_machines
+from ..utils import iter_machines, utcnow
 from .base import BaseStream
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class MachineHealth:
-    eqp_id: str
-    line_name: str
-    machine_name: str
-    health_score: float = 1.0
-    degrading: bool = False
+# DegradationTrend by code: health < critical → 0, < warning → 1, else 2
+_TRENDS = ("critical", "degrading", "stable")
 
 
 class PredictiveMaintenanceStream(BaseStream):
@@ -31,13 +24,14 @@ class PredictiveMaintenanceStream(BaseStream):
     def __init__(self, cfg: SimulatorConfig, client: MqttClient, **kwargs) -> None:
         super().__init__(cfg, client, **kwargs)
         self._scfg = cfg.predictive_maintenance_signals
-        self._machines: List[MachineHealth] = []
+        self._fleet: FleetState | None = None
+        self._rng = np.random.default_rng()
 
     def is_enabled(self) -> bool:
         return self._scfg.enabled
 
     def _init_machines(self) -> None:
-        if self._machines:
+        if self._fleet is not None:
             return
         all_machines = list(iter_machines())
 
@@ -47,19 +41,19 @@ class PredictiveMaintenanceStream(BaseStream):
             id_set = set(self._scfg.machines) if isinstance(self._scfg.machines, list) else set()
             selected = [m for m in all_machines if m[0] in id_set] or all_machines
 
-        for eqp_id, line, name, _ in selected:
-            self._machines.append(MachineHealth(eqp_id=eqp_id, line_name=line, machine_name=name))
+        # Select against the whole fleet first, then keep this replica's share
+        fleet = self._fleet = FleetState(self.fleet_machines(selected))
 
         # Mark a subset as actively degrading
         deg = self._scfg.degradation
         if deg.enabled:
-            degrading = random.sample(self._machines, min(deg.machines_with_degradation, len(self._machines)))
-            for m in degrading:
-                m.degrading = True
-                m.health_score = rand_float(deg.warning_threshold, 1.0)
+            k = min(deg.machines_with_degradation, len(fleet))
+            degrading = self._rng.choice(len(fleet), size=k, replace=False)
+            fleet.degrading[degrading] = True
+            fleet.health[degrading] = np.round(self._rng.uniform(deg.warning_threshold, 1.0, k), 1)
 
         logger.info("PredictiveMaintenanceStream: %d machines (%d degrading)",
-                     len(self._machines), sum(1 for m in self._machines if m.degrading))
+                     len(fleet), int(fleet.degrading.sum()))
 
     # ------------------------------------------------------------------
     # Overrides (anomaly)
@@ -82,6 +76,7 @@ class PredictiveMaintenanceStream(BaseStream):
 
     async def run(self) -> None:
         self._init_machines()
+        fleet, rng = self._fleet, self._rng
         interval = self._scfg.interval_sec
         deg_cfg = self._scfg.degradation
         deg_rate = deg_cfg.degradation_rate_per_hour / (3600 / interval) if deg_cfg.enabled else 0
@@ -89,58 +84,74 @@ class PredictiveMaintenanceStream(BaseStream):
         logger.info("PredictiveMaintenanceStream started — every %ds", interval)
 
         while True:
-            for m in self._machines:
-                # B2: Reset health when machine enters Maintenance (cross-stream correlation)
-                if deg_cfg.enabled and deg_cfg.reset_on_maintenance:
-                    if self.registry.entered_maintenance(m.eqp_id) and m.health_score < 0.9:
-                        logger.info("Predictive maintenance: %s reset to healthy (Maintenance state detected)", m.eqp_id)
-                        m.health_score = 1.0
-                        m.degrading = False
-
-                # Degrade health
-                if m.degrading and deg_cfg.enabled:
-                    m.health_score = max(0.0, m.health_score - deg_rate)
-
-                # Determine trend
-                if m.health_score < deg_cfg.critical_threshold:
-                    trend = "critical"
-                elif m.health_score < deg_cfg.warning_threshold:
-                    trend = "degrading"
-                else:
-                    trend = "stable"
-
-                # Scale vibration / bearing temp inversely with health
-                health = self._health_override if self._health_override is not None else m.health_score
-                vr = self._vib_override or self._scfg.vibration_range
-                br = self._bearing_override or self._scfg.bearing_temp_range
-
-                # Higher vibration / temp for lower health
-                health_factor = max(0.1, health)
-                vib = rand_float(vr[0], vr[1] / health_factor)
-                bear_t = rand_float(br[0], br[1] / health_factor)
-
-                rul = max(0, int(m.health_score * 2000 + random.gauss(0, 50)))
-
+            n = len(fleet)
+
+            # B2: Reset health when machine enters Maintenance (cross-stream correlation)
+            if deg_cfg.enabled and deg_cfg.reset_on_maintenance:
+                rows = fleet.rows_for(self.registry.machines_in_maintenance())
+                rows = rows[fleet.health[rows] < 0.9]
+                for row in rows.tolist():
+                    logger.info("Predictive maintenance: %s reset to healthy (Maintenance state detected)",
+                                fleet.eqp_ids[row])
+                fleet.health[rows] = 1.0
+                fleet.degrading[rows] = False
+
+            # Degrade health
+            if deg_cfg.enabled:
+                d = fleet.degrading
+                fleet.health[d] = np.maximum(fleet.health[d] - deg_rate, 0.0)
+
+            trend = np.where(
+                fleet.health < deg_cfg.critical_threshold, 0,
+                np.where(fleet.health < deg_cfg.warning_threshold, 1, 2),
+            )
+
+            # Scale vibration / bearing temp inversely with health
+            health = (
+                np.full(n, self._health_override, dtype=np.float64)
+                if self._health_override is not None else fleet.health
+            )
+            vr = self._vib_override or self._scfg.vibration_range
+            br = self._bearing_override or self._scfg.bearing_temp_range
+
+            # Higher vibration / temp for lower health
+            health_factor = np.maximum(0.1, health)
+            vib = np.round(np.minimum(rng.uniform(vr[0], vr[1] / health_factor), 20.0), 1)
+            bear_t = np.round(np.minimum(rng.uniform(br[0], br[1] / health_factor), 150.0), 1)
+            acoustic = np.round(rng.uniform(*self._scfg.acoustic_db_range, n), 1)
+            current = np.round(rng.uniform(*self._scfg.motor_current_range, n), 1)
+            spindle = np.round(rng.uniform(*self._scfg.spindle_speed_range, n)).astype(np.int64)
+            rul = np.maximum(0, (fleet.health * 2000 + rng.normal(0, 50, n)).astype(np.int64))
+            health_score = np.round(fleet.health, 2)
+
+            timestamp = utcnow()
+            messages = []
+            for row, values in enumerate(zip(
+                vib.tolist(), bear_t.tolist(), acoustic.tolist(), current.tolist(),
+                spindle.tolist(), rul.tolist(), health_score.tolist(), trend.tolist(),
+            )):
+                v, b, a, c, s, r, h, t = values
                 payload = {
-                    "Timestamp": utcnow(),
-                    "EquipmentId": m.eqp_id,
-                    "LineName": m.line_name,
-                    "MachineName": m.machine_name,
-                    "VibrationMmS": round(min(vib, 20.0), 1),
-                    "BearingTemperatureC": round(min(bear_t, 150.0), 1),
-                    "AcousticDB": rand_float(self._scfg.acoustic_db_range[0], self._scfg.acoustic_db_range[1]),
-                    "MotorCurrentA": rand_float(self._scfg.motor_current_range[0], self._scfg.motor_current_range[1]),
-                    "SpindleSpeedRPM": round(rand_float(self._scfg.spindle_speed_range[0], self._scfg.spindle_speed_range[1], 0)),
-                    "RemainingUsefulLifeHrs": rul,
-                    "HealthScore": round(m.health_score, 2),
-                    "DegradationTrend": trend,
+                    "Timestamp": timestamp,
+                    "EquipmentId": fleet.eqp_ids[row],
+                    "LineName": fleet.line_names[row],
+                    "MachineName": fleet.machine_names[row],
+                    "VibrationMmS": v,
+                    "BearingTemperatureC": b,
+                    "AcousticDB": a,
+                    "MotorCurrentA": c,
+                    "SpindleSpeedRPM": s,
+                    "RemainingUsefulLifeHrs": r,
+                    "HealthScore": h,
+                    "DegradationTrend": _TRENDS[t],
                 }
 
-                await self.publish(
-                    payload,
-                    equipment_id=m.eqp_id,
-                    line_name=m.line_name,
-                    machine_name=m.machine_name,
+                topic = self.resolve_topic(
+                    equipment_id=fleet.eqp_ids[row],
+                    line_name=fleet.line_names[row],
+                    machine_name=fleet.machine_names[row],
                 )
+                messages.append((topic, payload))
 
-            await asyncio.sleep(interval)
+            await self.publish_many(messages)
+            await self.next_tick(interval)
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import random
 
 from ..config import SimulatorConfig
 from ..mqtt_client import MqttClient
 from ..utils import utcnow, rand_float
+from ..sharding import owns_position
 from .base import BaseStream
 
 logger = logging.getLogger(__name__)
@@ -43,6 +43,8 @@ class ProcessSegmentTelemetryStream(BaseStream):
         ag = self._scfg.auto_generate
         if ag.enabled:
             for i in range(ag.count):
+                if not owns_position(self.cfg.sharding, i):
+                    continue
                 seg_id = f"SEG-{100 + i:03d}"
                 seg_type = random.choice(ag.types)
                 self._segments.append({
@@ -86,4 +88,4 @@ class ProcessSegmentTelemetryStream(BaseStream):
                 }
                 await self.publish(payload, equipment_id=None)
 
-            await asyncio.sleep(interval)
+            await self.next_tick(interval)
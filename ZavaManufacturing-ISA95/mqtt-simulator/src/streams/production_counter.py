@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import random
 from dataclasses import dataclass
@@ -12,7 +11,7 @@ from ..config import SimulatorConfig
 from ..mqtt_client import MqttClient
 from ..utils import (
     utcnow, current_shift, rand_float, rand_int,
-    iter_machines, equipment_id as fmt_eqp, machine_name as mk_name,
+    equipment_id as fmt_eqp, machine_name as mk_name,
 )
 from .base import BaseStream
 
@@ -46,7 +45,7 @@ class ProductionCounterTelemetryStream(BaseStream):
         # if machine-state uses explicit lines, production counter does too.
         ms_cfg = self.cfg.machine_state_telemetry
         if ms_cfg.auto_discover:
-            machines = list(iter_machines())
+            machines = self.fleet_machines()
         else:
             machines = []
             for line_cfg in ms_cfg.lines:
@@ -95,6 +94,7 @@ class ProductionCounterTelemetryStream(BaseStream):
                      len(self._counters), interval)
 
         while True:
+            messages = []
             shift = current_shift(
                 self.cfg.simulation.shifts.day_start,
                 self.cfg.simulation.shifts.night_start,
@@ -144,11 +144,12 @@ class ProductionCounterTelemetryStream(BaseStream):
                     "BatchId": batch_id,
                 }
 
-                await self.publish(
-                    payload,
+                topic = self.resolve_topic(
                     equipment_id=c.eqp_id,
                     line_name=c.line_name,
                     machine_name=c.machine_name,
                 )
+                messages.append((topic, payload))
 
-            await asyncio.sleep(interval)
+            await self.publish_many(messages)
+            await self.next_tick(interval)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import random
 from typing import Dict, List
@@ -57,6 +56,7 @@ class QualityVisionStream(BaseStream):
                      len(scfg.stations), scfg.interval_sec)
 
         while True:
+            messages = []
             for station in scfg.stations:
                 now = utcnow_dt()
                 batch_id = random.choice(batch_ids)
@@ -113,11 +113,12 @@ class QualityVisionStream(BaseStream):
                     "ModelVersion": scfg.model_version,
                 }
 
-                await self.publish(
-                    payload,
+                topic = self.resolve_topic(
                     equipment_id=station.equipment_id,
                     line_name=station.line_name,
                     station_id=station.id,
                 )
+                messages.append((topic, payload))
 
-            await asyncio.sleep(scfg.interval_sec)
+            await self.publish_many(messages)
+            await self.next_tick(scfg.interval_sec)
@@ -233,6 +233,58 @@ def resolve_uns_topic(
     return f"{enterprise}/{category}/{stream_slug}"
 
 
+class UnsTopicIndex:
+    """O(1) UNS topic lookup for one config.
+
+    A topic depends only on the UNS hierarchy and the entity it is published
+    for, so each distinct ``(stream_slug, equipment_id, line, machine,
+    station, shipment)`` key is resolved with :func:`resolve_uns_topic` once
+    and served from a dict afterwards.  Build a new index whenever the config
+    is (re)loaded.
+    """
+
+    def __init__(self, uns: UnsConfig) -> None:
+        self._uns = uns
+        # stream slug → category; first match wins, as in resolve_uns_topic
+        self._categories: Dict[str, str] = {}
+        for cat, slugs in [
+            ("telemetry", uns.categories.telemetry),
+            ("events", uns.categories.events),
+            ("state", uns.categories.state),
+        ]:
+            for slug in slugs:
+                self._categories.setdefault(slug, cat)
+        self._topics: Dict[tuple, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+    def topic(
+        self,
+        stream_slug: str,
+        *,
+        equipment_id: str | None = None,
+        line_name: str | None = None,
+        machine_name: str | None = None,
+        station_id: str | None = None,
+        shipment_id: str | None = None,
+    ) -> str:
+        key = (stream_slug, equipment_id, line_name, machine_name, station_id, shipment_id)
+        topic = self._topics.get(key)
+        if topic is None:
+            topic = self._topics[key] = resolve_uns_topic(
+                self._uns,
+                stream_slug=stream_slug,
+                category=self._categories.get(stream_slug, "telemetry"),
+                equipment_id_val=equipment_id,
+                line_name=line_name,
+                machine_name_val=machine_name,
+                station_id=station_id,
+                shipment_id=shipment_id,
+            )
+        return topic
+
+
 def _slug(val: str) -> str:
     """Lowercase, replace spaces/underscores with hyphens."""
     return val.lower().replace(" ", "-").replace("_", "-")
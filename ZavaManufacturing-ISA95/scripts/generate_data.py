@@ -5,25 +5,122 @@ Generate all Lakehouse CSVs and transform Eventhouse seeds for ZavaManufacturing
 Domain: Zava Inc. — Smart Textiles / Smart Fiber Manufacturing
 Products: ZavaCore™ smart mesh units
 ISA-95: Site → Area → WorkCenter → WorkUnit
+
+The tables below are the 1x dataset. With --scale N the Lakehouse tables are
+replicated N times: replica r gets equipment, batches, segments, orders,
+tests and shipments of its own (IDs offset by r × the 1x count, e.g. BTC-021
+is BTC-001 of replica 2), and every foreign key and edge is remapped into the
+same replica, so referential integrity holds at any scale. Materials and
+suppliers are shared master data. Rows are streamed to disk one at a time.
+
+Usage:
+    python3 scripts/generate_data.py [--scale N] [--format csv|parquet] [--output DIR]
+
+Parquet output requires pyarrow (pip install pyarrow).
 """
+import argparse
+import concurrent.futures
 import csv
+import itertools
 import os
 import re
+from functools import lru_cache
 
 BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-LH = os.path.join(BASE, "Data", "Lakehouse")
-EH = os.path.join(BASE, "Data", "Eventhouse")
 TEA_EH = os.path.join(os.path.dirname(BASE), "TeaManufacturing-ISA95", "Data", "Eventhouse")
 
-os.makedirs(LH, exist_ok=True)
-os.makedirs(EH, exist_ok=True)
-
-def write_csv(path, header, rows):
-    with open(path, "w", newline="") as f:
-        w = csv.writer(f)
-        w.writerow(header)
-        w.writerows(rows)
-    print(f"  ✓ {os.path.basename(path)}: {len(rows)} rows")
+# Rows buffered per Parquet row group
+PARQUET_BATCH_ROWS = 50_000
+
+# Rows per chunk when transforming Eventhouse seeds
+EVENTHOUSE_CHUNK_ROWS = 50_000
+
+
+class CsvTableWriter:
+    """Stream rows to a CSV file."""
+
+    extension = ".csv"
+
+    def __init__(self, path, header):
+        self._file = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(header)
+
+    def write(self, row):
+        self._writer.writerow(row)
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetTableWriter:
+    """Stream rows to a Parquet file in row groups of PARQUET_BATCH_ROWS."""
+
+    extension = ".parquet"
+
+    def __init__(self, path, header, types):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet output requires pyarrow: pip install pyarrow")
+        self._pa = pa
+        arrow_types = {int: pa.int64(), float: pa.float64(), str: pa.string()}
+        self._schema = pa.schema([(name, arrow_types[t]) for name, t in zip(header, types)])
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._columns = [[] for _ in header]
+
+    def write(self, row):
+        for column, value in zip(self._columns, row):
+            column.append(value)
+        if len(self._columns[0]) >= PARQUET_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self):
+        if self._columns[0]:
+            self._writer.write_table(self._pa.Table.from_arrays(self._columns, schema=self._schema))
+            self._columns = [[] for _ in self._columns]
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+
+def column_types(rows, width):
+    """Parquet type per column: int, float or str (from the 1x rows)."""
+    types = []
+    for i in range(width):
+        values = [row[i] for row in rows]
+        if all(isinstance(v, int) for v in values):
+            types.append(int)
+        elif all(isinstance(v, (int, float)) for v in values):
+            types.append(float)
+        else:
+            types.append(str)
+    return types
+
+
+def write_table(out_dir, fmt, name, header, base_rows, rows):
+    """Stream `rows` to {out_dir}/{name}.csv|.parquet (types inferred from base_rows)."""
+    if fmt == "parquet":
+        path = os.path.join(out_dir, name + ParquetTableWriter.extension)
+        types = column_types(base_rows, len(header))
+        writer = ParquetTableWriter(path, header, types)
+        cast = [float if t is float else None for t in types]
+        rows = ([c(v) if c else v for c, v in zip(cast, row)] for row in rows)
+    else:
+        path = os.path.join(out_dir, name + CsvTableWriter.extension)
+        writer = CsvTableWriter(path, header)
+
+    count = 0
+    try:
+        for row in rows:
+            writer.write(row)
+            count += 1
+    finally:
+        writer.close()
+    print(f"  ✓ {os.path.basename(path)}: {count} rows")
+    return count
 
 # =============================================================================
 # 1) DimProductBatch  (20 rows)
@@ -50,9 +147,6 @@ products = [
     ("BTC-019", "ZavaCore Field Slim",      "ZF-SLM-01", 12000, "Planned",   "",                    "EQP-002"),
     ("BTC-020", "ZavaCore Field Standard",  "ZF-STD-01", 20000, "Planned",   "",                    "EQP-002"),
 ]
-write_csv(os.path.join(LH, "DimProductBatch.csv"),
-          ["BatchId","Batch_Product","Batch_MeshSpec","Batch_Quantity","Batch_Status","Batch_CompletionDate","EquipmentId"],
-          products)
 
 # =============================================================================
 # 2) DimProcessSegment  (30 rows)
@@ -88,9 +182,6 @@ for b_idx, batch in enumerate(["BTC-011", "BTC-012"]):
     segments.append((s, "Coating", sc, "InProgress", start, batch))
     seg_id += 1
 
-write_csv(os.path.join(LH, "DimProcessSegment.csv"),
-          ["SegmentId","Segment_Type","Segment_Code","Segment_Status","Segment_StartDate","BatchId"],
-          segments)
 
 # =============================================================================
 # 3) DimMaterial  (25 rows)
@@ -122,9 +213,6 @@ materials = [
     ("MAT-024", "Calibration Certificate Card", "CCC-024", "PackagingMaterial",  0.12,  8, "SUP-006"),
     ("MAT-025", "Tamper-Evident Seal",          "TES-025", "PackagingMaterial",  0.05,  5, "SUP-005"),
 ]
-write_csv(os.path.join(LH, "DimMaterial.csv"),
-          ["MaterialId","Material_Name","Material_PartNumber","Material_Class","Material_UnitCost","Material_LeadTimeDays","SupplierId"],
-          materials)
 
 # =============================================================================
 # 4) DimSupplier  (10 rows)
@@ -141,9 +229,6 @@ suppliers = [
     ("SUP-009", "PackSafe Industries",        1, "USA",         4.2, "true", "EQP-010"),
     ("SUP-010", "ShieldTech Corp",            2, "USA",         4.0, "true", "EQP-002"),
 ]
-write_csv(os.path.join(LH, "DimSupplier.csv"),
-          ["SupplierId","Supplier_Name","Supplier_Tier","Supplier_Country","Supplier_Rating","Supplier_Certified","EquipmentId"],
-          suppliers)
 
 # =============================================================================
 # 5) DimEquipment  (160 rows)
@@ -220,40 +305,44 @@ for i, name in enumerate(line_names):
     line_equipment.append((eid, f"WeaveLine-{name}", "WorkCenter", "Weaving", "Portland OR USA", 20000000))
 
 # WorkUnit machines (EQP-016 to EQP-149): read from tea and transform
-tea_equip_path = os.path.join(os.path.dirname(BASE), "TeaManufacturing-ISA95", "Data", "Lakehouse", "DimEquipment.csv")
-work_units = []
-with open(tea_equip_path, "r") as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        eid = row["EquipmentId"]
-        # Only transform WorkUnit machines (EQP-016 to EQP-149)
-        num = int(eid.split("-")[1])
-        if num < 16 or num > 149:
-            continue
-        old_name = row["Equipment_Name"]
-        old_type = row["Equipment_Type"]
-
-        # Parse: {LineLetter}-{MachineType}-{Number}
-        parts = old_name.split("-", 1)
-        line_letter = parts[0]  # e.g. "Bravo"
-        rest = parts[1] if len(parts) > 1 else ""
-        # Find machine type and number
-        new_rest = rest
-        for old_mt, new_mt in MACHINE_MAP.items():
-            if old_mt in rest:
-                new_rest = rest.replace(old_mt, new_mt)
-                break
-        new_name = f"{line_letter}-{new_rest}"
-        new_type = ETYPE_MAP.get(old_type, old_type)
-        work_units.append((eid, new_name, "WorkUnit", new_type, "Portland OR USA", 0))
+TEA_EQUIPMENT = os.path.join(os.path.dirname(BASE), "TeaManufacturing-ISA95", "Data", "Lakehouse", "DimEquipment.csv")
 
-all_equipment = fixed_equipment + line_equipment + work_units
-# Sort by EQP number for deterministic output
-all_equipment.sort(key=lambda x: int(x[0].split("-")[1]))
 
-write_csv(os.path.join(LH, "DimEquipment.csv"),
-          ["EquipmentId","Equipment_Name","Equipment_Level","Equipment_Type","Equipment_Location","Equipment_Capacity"],
-          all_equipment)
+def load_work_units():
+    work_units = []
+    with open(TEA_EQUIPMENT, "r") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            eid = row["EquipmentId"]
+            # Only transform WorkUnit machines (EQP-016 to EQP-149)
+            num = int(eid.split("-")[1])
+            if num < 16 or num > 149:
+                continue
+            old_name = row["Equipment_Name"]
+            old_type = row["Equipment_Type"]
+
+            # Parse: {LineLetter}-{MachineType}-{Number}
+            parts = old_name.split("-", 1)
+            line_letter = parts[0]  # e.g. "Bravo"
+            rest = parts[1] if len(parts) > 1 else ""
+            # Find machine type and number
+            new_rest = rest
+            for old_mt, new_mt in MACHINE_MAP.items():
+                if old_mt in rest:
+                    new_rest = rest.replace(old_mt, new_mt)
+                    break
+            new_name = f"{line_letter}-{new_rest}"
+            new_type = ETYPE_MAP.get(old_type, old_type)
+            work_units.append((eid, new_name, "WorkUnit", new_type, "Portland OR USA", 0))
+    return work_units
+
+
+def load_equipment():
+    all_equipment = fixed_equipment + line_equipment + load_work_units()
+    # Sort by EQP number for deterministic output
+    all_equipment.sort(key=lambda x: int(x[0].split("-")[1]))
+    return all_equipment
+
 
 # =============================================================================
 # 6) DimProductionOrder  (20 rows)
@@ -280,9 +369,6 @@ orders = [
     ("ORD-019", "WO-2025-3019", 12000, "Normal", "2025-12-05T00:00:00", "Planned",    "BTC-019"),
     ("ORD-020", "WO-2025-3020", 20000, "Rush",   "2025-12-07T00:00:00", "Planned",    "BTC-020"),
 ]
-write_csv(os.path.join(LH, "DimProductionOrder.csv"),
-          ["OrderId","Order_Number","Order_Quantity","Order_Priority","Order_DueDate","Order_Status","BatchId"],
-          orders)
 
 # =============================================================================
 # 7) FactQualityTest  (30 rows)
@@ -319,9 +405,6 @@ tests = [
     ("TST-029", "Audit",               "Pass",            "Annual supplier raw material traceability audit",                    "2025-11-22T10:00:00", "Certified",                             "SEG-008"),
     ("TST-030", "MeshGaugeCheck",      "Pass",            "Final carton gauge verification",                                   "2025-11-20T12:00:00", "Approved",                              "SEG-028"),
 ]
-write_csv(os.path.join(LH, "FactQualityTest.csv"),
-          ["TestId","Test_Type","Test_Result","Test_Description","Test_Timestamp","Test_Resolution","SegmentId"],
-          tests)
 
 # =============================================================================
 # 8) FactShipment  (25 rows)
@@ -353,9 +436,6 @@ shipments = [
     ("SHP-024", "TRK-2025-5024", "Pending",    "2025-11-28T06:00:00", "2025-11-28T14:00:00", "Pacific Northwest Trucking",  "EQP-002", "EQP-003"),
     ("SHP-025", "TRK-2025-5025", "Delivered",  "2025-11-02T06:00:00", "2025-11-09T14:00:00", "KoreaLogistics Express",      "EQP-010", "EQP-001"),
 ]
-write_csv(os.path.join(LH, "FactShipment.csv"),
-          ["ShipmentId","Shipment_TrackingNum","Shipment_Status","Shipment_DepartureDate","Shipment_ArrivalDate","Shipment_Carrier","OriginEquipmentId","DestEquipmentId"],
-          shipments)
 
 # =============================================================================
 # 9) EdgeSegmentMaterial  (same structure as tea — 97 rows)
@@ -407,9 +487,6 @@ edge_seg_mat = [
     ("SEG-024","MAT-015"), ("SEG-024","MAT-016"), ("SEG-024","MAT-019"), ("SEG-024","MAT-020"), ("SEG-024","MAT-018"),
     ("SEG-028","MAT-015"), ("SEG-028","MAT-016"), ("SEG-028","MAT-019"), ("SEG-028","MAT-020"), ("SEG-028","MAT-018"),
 ]
-write_csv(os.path.join(LH, "EdgeSegmentMaterial.csv"),
-          ["SegmentId","MaterialId"],
-          edge_seg_mat)
 
 # =============================================================================
 # 10) EdgeShipmentMaterial  (same FK structure — 58 rows)
@@ -441,9 +518,6 @@ edge_ship_mat = [
     ("SHP-024","MAT-016"), ("SHP-024","MAT-018"),
     ("SHP-025","MAT-002"), ("SHP-025","MAT-007"),
 ]
-write_csv(os.path.join(LH, "EdgeShipmentMaterial.csv"),
-          ["ShipmentId","MaterialId"],
-          edge_ship_mat)
 
 # =============================================================================
 # 11) EdgeShipmentOrigin  (25 rows — same EQP FKs)
@@ -459,9 +533,6 @@ edge_ship_orig = [
     ("SHP-022","EQP-002"), ("SHP-023","EQP-002"), ("SHP-024","EQP-002"),
     ("SHP-025","EQP-010"),
 ]
-write_csv(os.path.join(LH, "EdgeShipmentOrigin.csv"),
-          ["ShipmentId","EquipmentId"],
-          edge_ship_orig)
 
 # =============================================================================
 # 12) EdgeShipmentDestination  (25 rows — same EQP FKs)
@@ -477,14 +548,96 @@ edge_ship_dest = [
     ("SHP-022","EQP-003"), ("SHP-023","EQP-003"), ("SHP-024","EQP-003"),
     ("SHP-025","EQP-001"),
 ]
-write_csv(os.path.join(LH, "EdgeShipmentDestination.csv"),
-          ["ShipmentId","EquipmentId"],
-          edge_ship_dest)
+
+# =============================================================================
+# SCALING
+# =============================================================================
+# Entities replicated per scale unit, keyed by ID prefix → IDs per replica
+ID_STRIDE = {
+    "EQP": 160,
+    "BTC": len(products),
+    "SEG": len(segments),
+    "ORD": len(orders),
+    "TST": len(tests),
+    "SHP": len(shipments),
+}
+SCALED_ID = re.compile(r"^(EQP|BTC|SEG|ORD|TST|SHP)-(\d+)$")
+
+# Columns made unique per replica with a "-{replica}" suffix
+REPLICA_LABELS = {"Equipment_Name", "Segment_Code", "Order_Number", "Shipment_TrackingNum"}
+
+
+def scale_id(value, replica):
+    """EQP-002 in replica 2 → EQP-322 (IDs of other entities are unchanged)."""
+    match = SCALED_ID.match(value) if replica and isinstance(value, str) else None
+    if not match:
+        return value
+    prefix, num = match.groups()
+    return f"{prefix}-{int(num) + replica * ID_STRIDE[prefix]:03d}"
+
+
+def replicate(header, base_rows, scale, scaled=True):
+    """Yield base_rows for every replica with IDs and labels remapped."""
+    if not scaled:
+        yield from base_rows
+        return
+    labels = [name in REPLICA_LABELS for name in header]
+    for replica in range(scale):
+        for row in base_rows:
+            if replica == 0:
+                yield row
+                continue
+            yield tuple(
+                f"{value}-{replica + 1}" if label else scale_id(value, replica)
+                for value, label in zip(row, labels)
+            )
+
+
+# (table, header, 1x rows, replicated per scale unit)
+LAKEHOUSE_TABLES = [
+    ("DimProductBatch",
+     ["BatchId","Batch_Product","Batch_MeshSpec","Batch_Quantity","Batch_Status","Batch_CompletionDate","EquipmentId"],
+     lambda: products, True),
+    ("DimProcessSegment",
+     ["SegmentId","Segment_Type","Segment_Code","Segment_Status","Segment_StartDate","BatchId"],
+     lambda: segments, True),
+    ("DimMaterial",
+     ["MaterialId","Material_Name","Material_PartNumber","Material_Class","Material_UnitCost","Material_LeadTimeDays","SupplierId"],
+     lambda: materials, False),
+    ("DimSupplier",
+     ["SupplierId","Supplier_Name","Supplier_Tier","Supplier_Country","Supplier_Rating","Supplier_Certified","EquipmentId"],
+     lambda: suppliers, False),
+    ("DimEquipment",
+     ["EquipmentId","Equipment_Name","Equipment_Level","Equipment_Type","Equipment_Location","Equipment_Capacity"],
+     load_equipment, True),
+    ("DimProductionOrder",
+     ["OrderId","Order_Number","Order_Quantity","Order_Priority","Order_DueDate","Order_Status","BatchId"],
+     lambda: orders, True),
+    ("FactQualityTest",
+     ["TestId","Test_Type","Test_Result","Test_Description","Test_Timestamp","Test_Resolution","SegmentId"],
+     lambda: tests, True),
+    ("FactShipment",
+     ["ShipmentId","Shipment_TrackingNum","Shipment_Status","Shipment_DepartureDate","Shipment_ArrivalDate","Shipment_Carrier","OriginEquipmentId","DestEquipmentId"],
+     lambda: shipments, True),
+    ("EdgeSegmentMaterial", ["SegmentId","MaterialId"], lambda: edge_seg_mat, True),
+    ("EdgeShipmentMaterial", ["ShipmentId","MaterialId"], lambda: edge_ship_mat, True),
+    ("EdgeShipmentOrigin", ["ShipmentId","EquipmentId"], lambda: edge_ship_orig, True),
+    ("EdgeShipmentDestination", ["ShipmentId","EquipmentId"], lambda: edge_ship_dest, True),
+]
+
+
+def generate_lakehouse(lh_dir, scale=1, fmt="csv"):
+    for name, header, load_rows, scaled in LAKEHOUSE_TABLES:
+        base_rows = load_rows()
+        if scaled and name == "DimEquipment":
+            # Replicas must not overlap: one stride covers every 1x equipment ID
+            assert int(base_rows[-1][0].split("-")[1]) <= ID_STRIDE["EQP"]
+        write_table(lh_dir, fmt, name, header, base_rows, replicate(header, base_rows, scale, scaled))
+
 
 # =============================================================================
 # EVENTHOUSE SEED TRANSFORMS
 # =============================================================================
-print("\n--- Eventhouse Seeds ---")
 
 # SKU mapping: anything starting with "GL " → "ZC " + Zava product name
 SKU_MAP = {
@@ -500,12 +653,14 @@ SKU_MAP = {
     "GL Nilgiri Frost":        "ZC Systems Compact",
 }
 
+@lru_cache(maxsize=None)
 def transform_line_name(val):
     """PackLine-X → WeaveLine-X"""
     if val and val.startswith("PackLine-"):
         return val.replace("PackLine-", "WeaveLine-")
     return val
 
+@lru_cache(maxsize=None)
 def transform_sku(val):
     """GL xxx → ZC xxx"""
     if not val:
@@ -528,38 +683,86 @@ HEADER_MAP = {
 }
 
 def transform_eventhouse(src_file, dst_file):
-    """Read tea Eventhouse seed, transform headers+values, write Zava seed."""
-    with open(src_file, "r") as f:
-        reader = csv.DictReader(f)
-        old_headers = reader.fieldnames
-        new_headers = [HEADER_MAP.get(h, h) for h in old_headers]
-
-        rows = []
-        for row in reader:
-            new_row = []
-            for h in old_headers:
-                val = row[h]
-                if h == "LineName":
-                    val = transform_line_name(val)
-                elif h == "SKU":
-                    val = transform_sku(val)
-                new_row.append(val)
-            rows.append(new_row)
-
-    with open(dst_file, "w", newline="") as f:
-        w = csv.writer(f)
-        w.writerow(new_headers)
-        w.writerows(rows)
-    print(f"  ✓ {os.path.basename(dst_file)}: {len(rows)} rows (transformed)")
-
-# Transform all 4 Eventhouse seeds
-for fname in ["EquipmentTelemetry.csv", "MachineStateTelemetry.csv",
-              "ProcessSegmentTelemetry.csv", "ProductionCounterTelemetry.csv"]:
-    src = os.path.join(TEA_EH, fname)
-    dst = os.path.join(EH, fname)
-    if os.path.exists(src):
-        transform_eventhouse(src, dst)
-    else:
-        print(f"  ⚠ {fname}: source not found at {src}")
-
-print("\n✅ All Zava data files generated successfully!")
+    """Stream a tea Eventhouse seed through the header+value transforms into a Zava seed.
+
+    Rows are processed in chunks of EVENTHOUSE_CHUNK_ROWS, so memory stays
+    bounded for the multi-million-row Tea telemetry files.
+    """
+    rows = 0
+    with open(src_file, "r", newline="") as fin, open(dst_file, "w", newline="") as fout:
+        reader = filter(None, csv.reader(fin))  # skip blank lines
+        old_headers = next(reader, [])
+        width = len(old_headers)
+        w = csv.writer(fout)
+        w.writerow([HEADER_MAP.get(h, h) for h in old_headers])
+
+        column_transforms = [
+            (old_headers.index(h), fn)
+            for h, fn in (("LineName", transform_line_name), ("SKU", transform_sku))
+            if h in old_headers
+        ]
+        while True:
+            chunk = list(itertools.islice(reader, EVENTHOUSE_CHUNK_ROWS))
+            if not chunk:
+                break
+            for i, row in enumerate(chunk):
+                if len(row) != width:
+                    chunk[i] = (row + [""] * width)[:width]
+            for idx, fn in column_transforms:
+                for row in chunk:
+                    row[idx] = fn(row[idx])
+            w.writerows(chunk)
+            rows += len(chunk)
+    print(f"  ✓ {os.path.basename(dst_file)}: {rows} rows (transformed)")
+    return rows
+
+
+def generate_eventhouse(eh_dir):
+    """Transform all 4 Eventhouse seeds, one worker process per file."""
+    jobs = []
+    for fname in ["EquipmentTelemetry.csv", "MachineStateTelemetry.csv",
+                  "ProcessSegmentTelemetry.csv", "ProductionCounterTelemetry.csv"]:
+        src = os.path.join(TEA_EH, fname)
+        if os.path.exists(src):
+            jobs.append((src, os.path.join(eh_dir, fname)))
+        else:
+            print(f"  ⚠ {fname}: source not found at {src}")
+    if not jobs:
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+        for future in [pool.submit(transform_eventhouse, src, dst) for src, dst in jobs]:
+            future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the ZavaManufacturing-ISA95 dataset")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="Replicate equipment, batches, shipments and their edges N times (default: 1)")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv",
+                        help="Lakehouse table format (default: csv)")
+    parser.add_argument("--output", default=os.path.join(BASE, "Data"),
+                        help="Output folder with Lakehouse/ and Eventhouse/ (default: Data/)")
+    parser.add_argument("--skip-eventhouse", action="store_true",
+                        help="Only generate the Lakehouse tables")
+    args = parser.parse_args()
+    if args.scale < 1:
+        parser.error("--scale must be at least 1")
+
+    lh_dir = os.path.join(args.output, "Lakehouse")
+    eh_dir = os.path.join(args.output, "Eventhouse")
+    os.makedirs(lh_dir, exist_ok=True)
+    os.makedirs(eh_dir, exist_ok=True)
+
+    print(f"--- Lakehouse Tables (scale {args.scale}x, {args.format}) ---")
+    generate_lakehouse(lh_dir, args.scale, args.format)
+
+    if not args.skip_eventhouse:
+        print("\n--- Eventhouse Seeds ---")
+        generate_eventhouse(eh_dir)
+
+    print("\n✅ All Zava data files generated successfully!")
+
+
+if __name__ == "__main__":
+    main()